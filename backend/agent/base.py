@@ -62,6 +62,7 @@ class Agent(ABC, dspy.Module, metaclass=_AgentModuleMeta):
             {"event": "tool_error",          "data": {"id": str, "name": str, "error": str}}
             {"event": "done",                "data": {"content": str}}   # full accumulated text
             {"event": "error",               "data": {"message": str}}   # fatal error
+            {"event": "cancelled",           "data": {"reason": str}}    # stopped via cancel_token
             {"event": "search_result_added", "data": {SearchResult dict}}  # from add_search_result tool
         """
         ...
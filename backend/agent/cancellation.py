@@ -0,0 +1,102 @@
+"""Cooperative cancellation for agent runs.
+
+Each agent owns a ``CancelToken`` and hands it to the stages and workflows
+it drives.  Cancelling the token doesn't interrupt anything by itself: the
+agent code calls ``check()`` at safe points (between ReAct iterations,
+workflow steps and evaluation batches, and while reading streamed LLM
+chunks), which raises ``RunCancelled`` once the token is cancelled.
+
+Workflows that fan LLM calls out over a thread pool use
+``CancellableThreadPool``: it checks the token before every submit and
+while waiting for results, and on cancellation drops the calls that
+haven't started instead of running them to completion.
+
+The run registry cancels a run's token when the user asks
+(``POST /api/chat/runs/<run_id>/cancel``) or when its client has gone away
+and not reattached (see ``backend/agent_runs.py``).
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+from collections.abc import Iterable, Iterator
+
+# How often CancellableThreadPool.as_completed() checks the token while
+# no call finishes
+CANCEL_POLL_SECONDS = 0.5
+
+
+class RunCancelled(Exception):
+    """Raised at a cancellation check once the run's token is cancelled."""
+
+
+class CancelToken:
+    """Thread-safe, one-way cancellation flag shared by a run's threads."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: str | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel the token; the first reason given is kept."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Sleep until the token is cancelled or *timeout* passes; return ``cancelled``."""
+        return self._event.wait(timeout)
+
+    def check(self) -> None:
+        """Raise ``RunCancelled`` if the token has been cancelled."""
+        if self._event.is_set():
+            raise RunCancelled(self.reason)
+
+
+class CancellableThreadPool:
+    """``ThreadPoolExecutor`` whose submits and waits honour a ``CancelToken``.
+
+    Used as a context manager.  If ``RunCancelled`` leaves the ``with``
+    block, futures that haven't started are cancelled and the pool is shut
+    down without waiting for calls already running; their results are
+    discarded.
+    """
+
+    def __init__(self, cancel_token: CancelToken, max_workers: int | None = None):
+        self.cancel_token = cancel_token
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self) -> CancellableThreadPool:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        cancelled = exc_type is not None and issubclass(exc_type, RunCancelled)
+        self._pool.shutdown(wait=not cancelled, cancel_futures=cancelled)
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        """``ThreadPoolExecutor.submit`` after a cancellation check."""
+        self.cancel_token.check()
+        return self._pool.submit(fn, *args, **kwargs)
+
+    def as_completed(self, futures: Iterable[concurrent.futures.Future]) -> Iterator[concurrent.futures.Future]:
+        """Like ``concurrent.futures.as_completed``, checking the token as it waits.
+
+        The token is checked before each future is yielded, every
+        ``CANCEL_POLL_SECONDS`` while none finishes, and once more after
+        the last one, so the step that follows doesn't start either.
+        """
+        pending = set(futures)
+        while pending:
+            self.cancel_token.check()
+            done, pending = concurrent.futures.wait(
+                pending, timeout=CANCEL_POLL_SECONDS, return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                self.cancel_token.check()
+                yield future
+        self.cancel_token.check()
@@ -0,0 +1,282 @@
+"""Token-budgeted context window for the chat agents.
+
+Keeps the prompt a ReAct loop sends each iteration near a fixed token
+budget, counted with the active model's tokenizer via
+``litellm.token_counter``:
+
+- ``build()`` turns the stored history into LLM messages.  Turns that no
+  longer fit are folded into a rolling summary on the ``Conversation``
+  row (``context_summary`` / ``context_summary_through``), and the
+  summary is appended to the system prompt.  Later requests start from the
+  summary, so their size stays roughly constant however long the
+  conversation gets.
+- ``cap_tool_result()`` truncates one oversized tool result.
+- ``fit()`` condenses older tool results in place when the tool calls of
+  the current turn push the prompt over budget.
+
+Settings live under ``agent.context`` in config.json.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import litellm
+
+from backend.config_manager import get_int_config_value
+from backend.database import db
+from backend.llm.llm_factory import LLMConfig
+from backend.models.chat import Conversation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET_TOKENS = 24000
+DEFAULT_TOOL_RESULT_MAX_TOKENS = 4000
+DEFAULT_SUMMARY_MAX_TOKENS = 600
+
+# Characters of one message, and of the whole transcript, sent to the summarizer
+_SUMMARY_MESSAGE_CHARS = 4000
+_SUMMARY_TRANSCRIPT_CHARS = 48000
+
+# Characters kept from a tool result condensed by fit()
+_CONDENSED_PREVIEW_CHARS = 300
+
+SUMMARY_PROMPT = """\
+You maintain a running summary of a conversation between a job seeker and \
+their job-search assistant. Merge the existing summary (if any) with the new \
+transcript into one updated summary.
+
+Keep: the user's goals and preferences, decisions made, jobs, companies and \
+search results discussed (with IDs where given), tasks created or completed, \
+and open questions. Drop pleasantries and anything superseded.
+
+Write plain prose or short bullet points, under {max_words} words. Output \
+only the summary."""
+
+
+def _setting(key: str, default: int) -> int:
+    return get_int_config_value(f"agent.context.{key}", default)
+
+
+class ContextWindow:
+    """Fits an agent's messages into a token budget for one model."""
+
+    def __init__(
+        self,
+        llm_config: LLMConfig,
+        budget_tokens: int = DEFAULT_BUDGET_TOKENS,
+        tool_result_max_tokens: int = DEFAULT_TOOL_RESULT_MAX_TOKENS,
+        summary_max_tokens: int = DEFAULT_SUMMARY_MAX_TOKENS,
+    ):
+        self.llm_config = llm_config
+        self.budget_tokens = budget_tokens
+        self.tool_result_max_tokens = tool_result_max_tokens
+        self.summary_max_tokens = summary_max_tokens
+
+    @classmethod
+    def from_config(cls, llm_config: LLMConfig) -> ContextWindow:
+        """Create a window using the ``agent.context`` settings."""
+        return cls(
+            llm_config,
+            budget_tokens=_setting("budget_tokens", DEFAULT_BUDGET_TOKENS),
+            tool_result_max_tokens=_setting("tool_result_max_tokens", DEFAULT_TOOL_RESULT_MAX_TOKENS),
+            summary_max_tokens=_setting("summary_max_tokens", DEFAULT_SUMMARY_MAX_TOKENS),
+        )
+
+    # ------------------------------------------------------------------
+    # Token counting
+    # ------------------------------------------------------------------
+
+    def count(self, messages: list[dict]) -> int:
+        """Count the prompt tokens of *messages* with the model's tokenizer."""
+        try:
+            return litellm.token_counter(model=self.llm_config.model, messages=messages)
+        except Exception:
+            # Unknown tokenizer or odd content: ~4 characters per token
+            return len(json.dumps(messages, default=str)) // 4
+
+    def _text_tokens(self, text: str) -> int:
+        try:
+            return litellm.token_counter(model=self.llm_config.model, text=text)
+        except Exception:
+            return len(text) // 4
+
+    # ------------------------------------------------------------------
+    # History
+    # ------------------------------------------------------------------
+
+    def build(self, system_prompt: str, history: list[dict],
+              conversation_id: int | None = None) -> list[dict]:
+        """Return ``[system, *turns]`` for *history* within the budget.
+
+        *history* is ``[{id, role, content}]`` oldest first; only user and
+        assistant turns are used.  Turns already covered by the stored
+        summary are skipped.  If the rest still exceed the budget, the
+        oldest are folded into a new summary, which is saved on the
+        conversation.  The newest message is always kept, and the kept
+        turns start with a user message.
+        """
+        summary, through = self._load_summary(conversation_id)
+        turns = [
+            {"role": m["role"], "content": m["content"] or "", "id": m.get("id")}
+            for m in history
+            if m["role"] in ("user", "assistant")
+            and (through is None or m.get("id") is None or m["id"] > through)
+        ]
+        sizes = [self.count([{"role": t["role"], "content": t["content"]}]) for t in turns]
+        available = self.budget_tokens - self.count([self._system_message(system_prompt, summary)])
+
+        if turns and sum(sizes) > available:
+            start = self._first_kept(turns, sizes, available - self.summary_max_tokens)
+            dropped, turns = turns[:start], turns[start:]
+            new_summary = self._summarize(summary, dropped) if dropped else None
+            if new_summary:
+                summary = new_summary
+                # Unsaved turns have no id; the summary then covers up to
+                # the newest dropped turn that has one (not saved if none do)
+                through = next((t["id"] for t in reversed(dropped) if t["id"] is not None), None)
+                self._save_summary(conversation_id, summary, through)
+
+        return [self._system_message(system_prompt, summary)] + [
+            {"role": t["role"], "content": t["content"]} for t in turns
+        ]
+
+    @staticmethod
+    def _first_kept(turns: list[dict], sizes: list[int], room: int) -> int:
+        """Index of the oldest turn kept when only *room* tokens are left."""
+        start = len(turns) - 1
+        used = sizes[start]
+        while start > 0 and used + sizes[start - 1] <= room:
+            start -= 1
+            used += sizes[start]
+        # Don't open the window on an assistant reply to a dropped question
+        first_user = next((i for i in range(start, len(turns)) if turns[i]["role"] == "user"), start)
+        return first_user
+
+    @staticmethod
+    def _system_message(system_prompt: str, summary: str | None) -> dict:
+        if not summary:
+            return {"role": "system", "content": system_prompt}
+        return {
+            "role": "system",
+            "content": (
+                f"{system_prompt}\n\n"
+                "Earlier parts of this conversation are summarized below; refer to "
+                "them as needed.\n"
+                f"<conversation_summary>\n{summary}\n</conversation_summary>"
+            ),
+        }
+
+    # ------------------------------------------------------------------
+    # Rolling summary
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _load_summary(conversation_id: int | None) -> tuple[str | None, int | None]:
+        if conversation_id is None:
+            return None, None
+        row = db.session.execute(
+            db.select(Conversation.context_summary, Conversation.context_summary_through)
+            .where(Conversation.id == conversation_id)
+        ).first()
+        return (row.context_summary, row.context_summary_through) if row else (None, None)
+
+    @staticmethod
+    def _save_summary(conversation_id: int | None, summary: str, through: int | None) -> None:
+        if conversation_id is None or through is None:
+            return
+        # Keep updated_at so summarizing doesn't reorder the conversation list
+        db.session.execute(
+            db.update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values(context_summary=summary, context_summary_through=through,
+                    updated_at=Conversation.updated_at)
+        )
+        db.session.commit()
+
+    def _summarize(self, previous: str | None, dropped: list[dict]) -> str | None:
+        """Fold *dropped* turns into *previous*; ``None`` if the LLM call fails."""
+        lines = []
+        for turn in dropped:
+            content = turn["content"]
+            if len(content) > _SUMMARY_MESSAGE_CHARS:
+                content = content[:_SUMMARY_MESSAGE_CHARS] + " [...]"
+            lines.append(f"{turn['role'].upper()}: {content}")
+        transcript = "\n\n".join(lines)
+        if len(transcript) > _SUMMARY_TRANSCRIPT_CHARS:
+            # Older turns matter least; keep the end
+            transcript = "[earlier turns omitted]\n\n" + transcript[-_SUMMARY_TRANSCRIPT_CHARS:]
+
+        user_content = (
+            f"Existing summary:\n{previous or '(none)'}\n\n"
+            f"New transcript:\n{transcript}"
+        )
+        kwargs = {"model": self.llm_config.model, "max_tokens": self.summary_max_tokens}
+        if self.llm_config.api_key:
+            kwargs["api_key"] = self.llm_config.api_key
+        if self.llm_config.api_base:
+            kwargs["api_base"] = self.llm_config.api_base
+        try:
+            response = litellm.completion(
+                messages=[
+                    {"role": "system",
+                     "content": SUMMARY_PROMPT.format(max_words=self.summary_max_tokens * 3 // 4)},
+                    {"role": "user", "content": user_content},
+                ],
+                **kwargs,
+            )
+            summary = (response.choices[0].message.content or "").strip()
+        except Exception:
+            logger.exception("Conversation summary failed; dropping %d old turns unsummarized",
+                             len(dropped))
+            return None
+        return summary or None
+
+    # ------------------------------------------------------------------
+    # Tool results
+    # ------------------------------------------------------------------
+
+    def cap_tool_result(self, content: str) -> str:
+        """Truncate a serialized tool result to ``tool_result_max_tokens``."""
+        tokens = self._text_tokens(content)
+        if tokens <= self.tool_result_max_tokens:
+            return content
+        keep = int(len(content) * self.tool_result_max_tokens / tokens)
+        return (
+            content[:keep]
+            + f"\n[truncated: result was about {tokens} tokens; "
+            f"only the first {self.tool_result_max_tokens} are shown]"
+        )
+
+    def fit(self, llm_messages: list[dict]) -> None:
+        """Condense older tool results in place until *llm_messages* fit.
+
+        Results from the latest batch of tool calls are left alone; earlier
+        ones are cut to a short preview, oldest first.
+        """
+        sizes = [self.count([m]) for m in llm_messages]
+        total = sum(sizes)
+        if total <= self.budget_tokens:
+            return
+        latest_call = max(
+            (i for i, m in enumerate(llm_messages) if m["role"] == "assistant" and m.get("tool_calls")),
+            default=len(llm_messages),
+        )
+        for i in range(latest_call):
+            if total <= self.budget_tokens:
+                break
+            message = llm_messages[i]
+            if message["role"] != "tool" or len(message["content"]) <= _CONDENSED_PREVIEW_CHARS:
+                continue
+            condensed = {
+                **message,
+                "content": (
+                    message["content"][:_CONDENSED_PREVIEW_CHARS]
+                    + f"\n[condensed: about {sizes[i]} tokens of earlier tool output omitted]"
+                ),
+            }
+            new_size = self.count([condensed])
+            llm_messages[i] = condensed
+            total += new_size - sizes[i]
+            sizes[i] = new_size
@@ -4,21 +4,37 @@ Uses LiteLLM's ``completion()`` with streaming and tool calling to run a
 tool-calling loop: each iteration streams an LLM response; if the response
 includes tool calls they are executed and the results fed back, then the
 loop continues.
+
+When one response contains several tool calls, consecutive read-only calls
+run concurrently on a small thread pool (see ``_execute_tool_calls``).
+Read-only calls are started while the response is still streaming, as soon
+as their arguments are complete (see ``_StreamingToolCalls``).
+
+The prompt is kept within a token budget by ``ContextWindow``: old turns
+are folded into a rolling conversation summary and oversized tool results
+are truncated or condensed.
+
+The loop checks ``cancel_token`` between iterations, tool calls and
+streamed chunks, and ends with a ``cancelled`` event once it is cancelled.
 """
 
 import json
 import logging
 import threading
 import uuid
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from concurrent.futures import Future
 
 import litellm
 
 from backend.agent.base import Agent
+from backend.agent.cancellation import CancelToken, RunCancelled
+from backend.agent.context_window import ContextWindow
 from backend.agent.event_bus import EventBus
 from backend.agent.tools import AgentTools
 from backend.agent.user_profile import read_profile
-from backend.llm.llm_factory import LLMConfig
+from backend.llm.llm_factory import LLMConfig, prompt_cache_kwargs
+from backend.telemetry.context import TracedThreadPoolExecutor
 
 from .prompts import AGENT_SYSTEM_PROMPT
 
@@ -26,6 +42,9 @@ logger = logging.getLogger(__name__)
 
 MAX_ITERATIONS = 15
 
+# Upper bound on read-only tool calls from one response running at once
+MAX_PARALLEL_TOOLS = 4
+
 
 def _build_openai_tools(agent_tools: AgentTools) -> list[dict]:
     """Convert AgentTools definitions into OpenAI function-calling format."""
@@ -88,6 +107,72 @@ def _accumulate_tool_calls(tool_call_chunks: dict[int, dict], delta_tool_calls:
                 entry["arguments"] += tc_delta.function.arguments
 
 
+def _complete_arguments(entry: dict) -> dict | None:
+    """Return a streamed call's arguments once they form a JSON object."""
+    if not entry["name"] or not entry["arguments"]:
+        return None
+    try:
+        args = json.loads(entry["arguments"])
+    except json.JSONDecodeError:
+        return None
+    return args if isinstance(args, dict) else None
+
+
+class _StreamingToolCalls:
+    """Assemble streamed tool calls, starting read-only ones as they complete.
+
+    Fragments are accumulated with ``_accumulate_tool_calls``.  After each
+    chunk, every call whose arguments already parse as a JSON object is
+    handed to *dispatch* if it is read-only and no earlier call in the
+    response is mutating, unknown or still unnamed, so calls that must run
+    alone never overlap with the ones after them.
+
+    ``finish()`` returns the calls exactly as the non-streaming path built
+    them, plus the futures of eagerly started calls whose final arguments
+    match what was dispatched.
+    """
+
+    def __init__(self, is_mutating: Callable[[str], bool], dispatch: Callable[[dict], Future]):
+        self.chunks: dict[int, dict] = {}
+        self._is_mutating = is_mutating
+        self._dispatch = dispatch
+        # index -> (call as dispatched, future)
+        self._started: dict[int, tuple[dict, Future]] = {}
+
+    def add(self, delta_tool_calls: list) -> None:
+        _accumulate_tool_calls(self.chunks, delta_tool_calls)
+        for idx in sorted(self.chunks):
+            entry = self.chunks[idx]
+            if not entry["name"] or self._is_mutating(entry["name"]):
+                break
+            if idx in self._started:
+                continue
+            args = _complete_arguments(entry)
+            if args is None:
+                continue
+            call = {"id": entry["id"] or str(uuid.uuid4()), "name": entry["name"], "args": args}
+            self._started[idx] = (call, self._dispatch(call))
+
+    def finish(self) -> tuple[list[dict], dict[str, Future]]:
+        """Return ``(tool_calls, futures by call ID)`` once the stream ends."""
+        tool_calls = []
+        futures: dict[str, Future] = {}
+        for idx in sorted(self.chunks):
+            tc = self.chunks[idx]
+            try:
+                args = json.loads(tc["arguments"]) if tc["arguments"] else {}
+            except json.JSONDecodeError:
+                args = {}
+            started, future = self._started.get(idx, (None, None))
+            if started is not None and started["name"] == tc["name"] and started["args"] == args:
+                call_id = started["id"]
+                futures[call_id] = future
+            else:
+                call_id = tc["id"] or str(uuid.uuid4())
+            tool_calls.append({"id": call_id, "name": tc["name"], "args": args})
+        return tool_calls, futures
+
+
 class DefaultAgent(Agent):
     """Main chat agent — monolithic ReAct loop with tool calling."""
 
@@ -101,12 +186,15 @@ class DefaultAgent(Agent):
         self.llm_config = llm_config
         self.conversation_id = conversation_id
         self.event_bus = EventBus()
+        self.cancel_token = CancelToken()
+        self.context = ContextWindow.from_config(llm_config)
 
         self.tools = AgentTools(
             search_api_key=search_api_key,
             rapidapi_key=rapidapi_key,
             conversation_id=conversation_id,
             event_bus=self.event_bus,
+            cancel_token=self.cancel_token,
         )
         self.openai_tools = _build_openai_tools(self.tools)
 
@@ -123,6 +211,7 @@ class DefaultAgent(Agent):
             kwargs["api_base"] = self.llm_config.api_base
         if self.openai_tools:
             kwargs["tools"] = self.openai_tools
+        kwargs.update(prompt_cache_kwargs(self.llm_config, stream=True, rolling=True))
         return kwargs
 
     def run(self, messages: list[dict]) -> Generator[dict, None, None]:
@@ -141,37 +230,97 @@ class DefaultAgent(Agent):
             try:
                 full_text = self._react_loop(messages)
                 self.event_bus.emit("done", {"content": full_text})
+            except RunCancelled:
+                logger.info("DefaultAgent cancelled (%s)", self.cancel_token.reason)
+                self.event_bus.emit("cancelled", {"reason": self.cancel_token.reason})
             except Exception as exc:
                 logger.exception("DefaultAgent error")
                 self.event_bus.emit("error", {"message": str(exc)})
             finally:
                 self.event_bus.close()
 
+    def _execute_tool(self, tc: dict) -> dict:
+        self.cancel_token.check()
+        return self.tools.execute(tc["name"], tc["args"])
+
+    def _execute_tool_in_app_context(self, app, tc: dict) -> dict:
+        with app.app_context():
+            return self._execute_tool(tc)
+
+    def _execute_tool_calls(self, tool_calls: list[dict],
+                            started: dict[str, Future] | None = None) -> list[dict]:
+        """Execute one response's tool calls and return results in call order.
+
+        Runs of consecutive read-only calls execute concurrently, each worker
+        in its own app context (and so its own database session).  Mutating
+        tools run alone once every earlier call has finished, so calls after
+        them see their writes.  Calls whose IDs are in *started* were already
+        dispatched while the response streamed; their futures are awaited
+        instead.
+        """
+        from flask import current_app
+        app = current_app._get_current_object()
+        started = started or {}
+
+        results: list[dict | None] = [None] * len(tool_calls)
+        batch: list[int] = []
+        execute = self._execute_tool
+
+        def run_batch():
+            fresh = [i for i in batch if tool_calls[i]["id"] not in started]
+            if len(fresh) == 1:
+                results[fresh[0]] = execute(tool_calls[fresh[0]])
+            elif fresh:
+                workers = min(MAX_PARALLEL_TOOLS, len(fresh))
+                with TracedThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = {i: pool.submit(self._execute_tool_in_app_context, app, tool_calls[i])
+                               for i in fresh}
+                    for i, future in futures.items():
+                        results[i] = future.result()
+            for i in batch:
+                if tool_calls[i]["id"] in started:
+                    results[i] = started[tool_calls[i]["id"]].result()
+            batch.clear()
+
+        for i, tc in enumerate(tool_calls):
+            if self.tools.is_mutating(tc["name"]):
+                run_batch()
+                results[i] = execute(tc)
+            else:
+                batch.append(i)
+        run_batch()
+        return results
+
     def _react_loop(self, messages):
         # Build the message list
         profile_content = read_profile()
         system_prompt = AGENT_SYSTEM_PROMPT.format(user_profile=profile_content)
 
-        llm_messages: list[dict] = [{"role": "system", "content": system_prompt}]
-        for msg in messages:
-            if msg["role"] == "user":
-                llm_messages.append({"role": "user", "content": msg["content"]})
-            elif msg["role"] == "assistant":
-                llm_messages.append({"role": "assistant", "content": msg["content"]})
+        llm_messages = self.context.build(system_prompt, messages, self.conversation_id)
 
+        from flask import current_app
+        app = current_app._get_current_object()
         full_text = ""
 
         for _iteration in range(MAX_ITERATIONS):
+            self.cancel_token.check()
+            # Runs read-only calls started while the response is streaming
+            eager_pool = TracedThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOLS)
             try:
                 collected_content = ""
-                tool_call_chunks: dict[int, dict] = {}
+                streamed_calls = _StreamingToolCalls(
+                    self.tools.is_mutating,
+                    lambda tc: eager_pool.submit(self._execute_tool_in_app_context, app, tc),
+                )
 
+                self.context.fit(llm_messages)
                 response = litellm.completion(
                     messages=llm_messages,
                     **self._completion_kwargs(),
                 )
 
                 for chunk in response:
+                    self.cancel_token.check()
                     delta = chunk.choices[0].delta
 
                     if delta.content:
@@ -179,23 +328,12 @@ class DefaultAgent(Agent):
                         self.event_bus.emit("text_delta", {"content": delta.content})
 
                     if delta.tool_calls:
-                        _accumulate_tool_calls(tool_call_chunks, delta.tool_calls)
+                        streamed_calls.add(delta.tool_calls)
 
                 full_text += collected_content
 
                 # Build completed tool calls from accumulated fragments
-                tool_calls = []
-                for idx in sorted(tool_call_chunks.keys()):
-                    tc = tool_call_chunks[idx]
-                    try:
-                        args = json.loads(tc["arguments"]) if tc["arguments"] else {}
-                    except json.JSONDecodeError:
-                        args = {}
-                    tool_calls.append({
-                        "id": tc["id"] or str(uuid.uuid4()),
-                        "name": tc["name"],
-                        "args": args,
-                    })
+                tool_calls, started = streamed_calls.finish()
 
                 # No tool calls — we're done
                 if not tool_calls:
@@ -223,17 +361,18 @@ class DefaultAgent(Agent):
                     "tool_calls": assistant_tool_calls,
                 })
 
-                # Execute each tool call — events are auto-emitted by execute()
-                for tc in tool_calls:
-                    result = self.tools.execute(tc["name"], tc["args"])
-
-                    # Add tool result to history
+                # Execute the tool calls — events are auto-emitted by execute()
+                results = self._execute_tool_calls(tool_calls, started)
+                for tc, result in zip(tool_calls, results):
+                    # Add tool results to history in call order
                     llm_messages.append({
                         "role": "tool",
                         "tool_call_id": tc["id"],
-                        "content": json.dumps(result),
+                        "content": self.context.cap_tool_result(json.dumps(result)),
                     })
 
+            except RunCancelled:
+                raise
             except Exception as exc:
                 logger.exception("DefaultAgent error on iteration %d", _iteration)
 
@@ -244,5 +383,7 @@ class DefaultAgent(Agent):
                     raise
                 logger.info("Retrying after error on iteration %d", _iteration)
                 continue
+            finally:
+                eager_pool.shutdown(wait=True)
 
         return full_text
@@ -14,10 +14,11 @@ from collections.abc import Generator
 import litellm
 
 from backend.agent.base import OnboardingAgent
+from backend.agent.cancellation import CancelToken, RunCancelled
 from backend.agent.event_bus import EventBus
 from backend.agent.tools import AgentTools
 from backend.agent.user_profile import set_onboarded
-from backend.llm.llm_factory import LLMConfig
+from backend.llm.llm_factory import LLMConfig, prompt_cache_kwargs
 
 from .agent import _accumulate_tool_calls, _build_openai_tools
 from .prompts import ONBOARDING_SYSTEM_PROMPT
@@ -33,9 +34,11 @@ class DefaultOnboardingAgent(OnboardingAgent):
     def __init__(self, llm_config: LLMConfig):
         self.llm_config = llm_config
         self.event_bus = EventBus()
+        self.cancel_token = CancelToken()
 
         self.tools = AgentTools(
             event_bus=self.event_bus,
+            cancel_token=self.cancel_token,
         )
         self.openai_tools = _build_openai_tools(self.tools)
 
@@ -52,6 +55,7 @@ class DefaultOnboardingAgent(OnboardingAgent):
             kwargs["api_base"] = self.llm_config.api_base
         if self.openai_tools:
             kwargs["tools"] = self.openai_tools
+        kwargs.update(prompt_cache_kwargs(self.llm_config, stream=True, rolling=True))
         return kwargs
 
     def run(self, messages: list[dict]) -> Generator[dict, None, None]:
@@ -76,6 +80,9 @@ class DefaultOnboardingAgent(OnboardingAgent):
                     self.event_bus.emit("onboarding_complete", {})
 
                 self.event_bus.emit("done", {"content": full_text})
+            except RunCancelled:
+                logger.info("DefaultOnboardingAgent cancelled (%s)", self.cancel_token.reason)
+                self.event_bus.emit("cancelled", {"reason": self.cancel_token.reason})
             except Exception as exc:
                 logger.exception("DefaultOnboardingAgent error")
                 self.event_bus.emit("error", {"message": str(exc)})
@@ -93,6 +100,7 @@ class DefaultOnboardingAgent(OnboardingAgent):
         full_text = ""
 
         for _iteration in range(MAX_ITERATIONS):
+            self.cancel_token.check()
             try:
                 collected_content = ""
                 tool_call_chunks: dict[int, dict] = {}
@@ -103,6 +111,7 @@ class DefaultOnboardingAgent(OnboardingAgent):
                 )
 
                 for chunk in response:
+                    self.cancel_token.check()
                     delta = chunk.choices[0].delta
 
                     if delta.content:
@@ -156,6 +165,7 @@ class DefaultOnboardingAgent(OnboardingAgent):
 
                 # Execute each tool call — events are auto-emitted by execute()
                 for tc in tool_calls:
+                    self.cancel_token.check()
                     result = self.tools.execute(tc["name"], tc["args"])
 
                     llm_messages.append({
@@ -164,6 +174,8 @@ class DefaultOnboardingAgent(OnboardingAgent):
                         "content": json.dumps(result),
                     })
 
+            except RunCancelled:
+                raise
             except Exception as exc:
                 logger.exception("DefaultOnboardingAgent error on iteration %d", _iteration)
                 if collected_content:
@@ -11,11 +11,13 @@ job applications.
 
 <tools>
 You have tools to:
-- **Search**: web_search, job_search (job board APIs), scrape_url
-- **Tracker**: create_job, list_jobs, edit_job, remove_job
+- **Search**: web_search, job_search (job board APIs), scrape_url, scrape_urls (batch)
+- **Tracker**: create_job, list_jobs, edit_job, remove_job, edit_jobs, remove_jobs (batch)
 - **Todos**: list_job_todos, add_job_todo, edit_job_todo, remove_job_todo
 - **Profile**: read_user_profile, update_user_profile, read_resume
 - **Results panel**: add_search_result (displays a result card to the user)
+- **Saved data**: search_saved_data (full-text search over tracked jobs, past \
+search results, chat history and saved documents)
 </tools>
 
 <rules>
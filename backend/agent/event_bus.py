@@ -2,14 +2,38 @@
 
 Producers call emit() from any thread (agent workers, tool execution).
 The consumer drains events via drain_blocking() from the Flask response
-generator.
+generator.  Both sides share one condition variable: the consumer sleeps
+until an event arrives, held text falls due, or the bus is closed.
+
+Consecutive ``text_delta`` events are coalesced: their text is held back
+and merged into one event once ``coalesce_ms`` have passed since the first
+held piece or ``coalesce_bytes`` have accumulated.  Held text is always
+flushed before any other event and on close(), so event order is
+preserved.  Settings live under ``agent.streaming`` in config.json; a zero
+for either disables coalescing.
+
+The queue itself is unbounded.  Its consumer is the thread driving an
+``AgentRun``, which moves each event straight into the run's replay
+buffer; the slow-consumer policy for SSE clients lives in that buffer
+(``backend/agent_runs.py``).
 """
 
 from __future__ import annotations
 
-import queue
+import threading
+import time
+from collections import deque
+
+from backend.config_manager import get_int_config_value
+
+_CLOSED = object()
+
+DEFAULT_COALESCE_MS = 25
+DEFAULT_COALESCE_BYTES = 1024
 
-_SENTINEL = object()
+
+def _is_plain_text(event_type: str, data: dict) -> bool:
+    return event_type == "text_delta" and data.keys() == {"content"}
 
 
 class EventBus:
@@ -19,29 +43,87 @@ class EventBus:
     .drain_blocking(). One bus per agent.run() invocation.
     """
 
-    def __init__(self):
-        self._queue: queue.Queue = queue.Queue()
+    def __init__(self, coalesce_ms: int | None = None, coalesce_bytes: int | None = None):
+        if coalesce_ms is None:
+            coalesce_ms = get_int_config_value("agent.streaming.coalesce_ms", DEFAULT_COALESCE_MS)
+        if coalesce_bytes is None:
+            coalesce_bytes = get_int_config_value("agent.streaming.coalesce_bytes", DEFAULT_COALESCE_BYTES)
+        self._coalesce = coalesce_ms > 0 and coalesce_bytes > 0
+        self._max_age = coalesce_ms / 1000
+        self._max_bytes = coalesce_bytes
+        # Guards everything below; flushes happen under it so they stay
+        # ordered with the events that trigger them
+        self._cond = threading.Condition()
+        self._events: deque[dict] = deque()
+        self._closed = False
+        # Held-back text_delta content, logically after every queued event
+        self._pending: list[str] = []
+        self._pending_bytes = 0
+        self._pending_since = 0.0
 
     def emit(self, event_type: str, data: dict) -> None:
         """Push an event onto the bus (thread-safe)."""
-        self._queue.put({"event": event_type, "data": data})
+        with self._cond:
+            if self._closed:
+                return
+            if _is_plain_text(event_type, data):
+                was_empty = not self._pending
+                if was_empty:
+                    self._pending_since = time.monotonic()
+                self._pending.append(data["content"])
+                self._pending_bytes += len(data["content"])
+                if (not self._coalesce or self._pending_bytes >= self._max_bytes
+                        or time.monotonic() - self._pending_since >= self._max_age):
+                    self._flush_locked()
+                    self._cond.notify()
+                elif was_empty:
+                    # Wake the consumer so it can time the flush
+                    self._cond.notify()
+                return
+            self._flush_locked()
+            self._events.append({"event": event_type, "data": data})
+            self._cond.notify()
+
+    def _flush_locked(self) -> None:
+        """Queue held text as one ``text_delta``."""
+        if not self._pending:
+            return
+        self._events.append({"event": "text_delta", "data": {"content": "".join(self._pending)}})
+        self._pending = []
+        self._pending_bytes = 0
+
+    def _next_locked(self):
+        """Wait for and return the next event, or ``_CLOSED``."""
+        while True:
+            if self._events:
+                return self._events.popleft()
+            timeout = None
+            if self._pending:
+                timeout = self._pending_since + self._max_age - time.monotonic()
+                if not self._coalesce or timeout <= 0:
+                    self._flush_locked()
+                    continue
+            elif self._closed:
+                return _CLOSED
+            self._cond.wait(timeout)
 
     def drain_blocking(self):
         """Yield events until close() is called.
 
-        Blocks on each queue.get() with a 0.5s timeout. When an item
-        is available, it returns immediately — the timeout only applies
-        when the queue is empty (waiting for slow LLM responses).
+        Sleeps on the bus's condition variable between events, so there is
+        no polling: emit() and close() wake the consumer, and held-back
+        text wakes it when its coalescing window ends.
         """
         while True:
-            try:
-                item = self._queue.get(timeout=0.5)
-            except queue.Empty:
-                continue
-            if item is _SENTINEL:
+            with self._cond:
+                item = self._next_locked()
+            if item is _CLOSED:
                 break
             yield item
 
     def close(self):
-        """Signal that no more events will be produced."""
-        self._queue.put(_SENTINEL)
+        """Flush held-back text and signal that no more events will be produced."""
+        with self._cond:
+            self._flush_locked()
+            self._closed = True
+            self._cond.notify_all()
@@ -20,6 +20,7 @@ from collections.abc import Generator
 import dspy
 
 from backend.agent.base import Agent
+from backend.agent.cancellation import CancelToken, RunCancelled
 from backend.agent.event_bus import EventBus
 from backend.agent.tools import AgentTools
 from backend.agent.user_profile import read_profile
@@ -60,6 +61,7 @@ class MicroAgentsV1Agent(Agent):
         self.llm_config = llm_config
         self.conversation_id = conversation_id
         self.event_bus = EventBus()
+        self.cancel_token = CancelToken()
 
         # Shared tool interface
         self.tools = AgentTools(
@@ -67,13 +69,16 @@ class MicroAgentsV1Agent(Agent):
             rapidapi_key=rapidapi_key,
             conversation_id=conversation_id,
             event_bus=self.event_bus,
+            cancel_token=self.cancel_token,
         )
 
         # Pipeline stages
         self.outcome_planner = OutcomePlanner(llm_config)
         self.workflow_mapper = WorkflowMapper(llm_config)
-        self.workflow_executor = WorkflowExecutor(self.tools, llm_config, self.event_bus)
-        self.result_collator = ResultCollator(llm_config, self.event_bus)
+        self.workflow_executor = WorkflowExecutor(self.tools, llm_config, self.event_bus,
+                                                  cancel_token=self.cancel_token)
+        self.result_collator = ResultCollator(llm_config, self.event_bus,
+                                              cancel_token=self.cancel_token)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -103,6 +108,9 @@ class MicroAgentsV1Agent(Agent):
         with app.app_context():
             try:
                 self._pipeline(messages)
+            except RunCancelled:
+                logger.info("MicroAgentsV1Agent cancelled (%s)", self.cancel_token.reason)
+                self.event_bus.emit("cancelled", {"reason": self.cancel_token.reason})
             except Exception as exc:
                 logger.exception("MicroAgentsV1Agent error")
                 self.event_bus.emit("error", {"message": str(exc)})
@@ -131,6 +139,7 @@ class MicroAgentsV1Agent(Agent):
             )
 
             # --- Stage 2: Workflow Mapping ---
+            self.cancel_token.check()
             assignments = self.workflow_mapper.map(
                 outcomes=outcomes,
                 user_message=user_message,
@@ -158,9 +167,11 @@ class MicroAgentsV1Agent(Agent):
                     assignment.params["conversation_context"] = context_str
 
             # --- Stage 3: Workflow Execution ---
+            self.cancel_token.check()
             results = self.workflow_executor.execute(assignments)
 
             # --- Stage 4: Result Collation ---
+            self.cancel_token.check()
             collated_text = self.result_collator.collate(
                 results, user_message, assignments=assignments,
                 user_profile=user_profile,
@@ -22,6 +22,7 @@ import dspy
 from backend.telemetry.context import telemetry_run
 
 from backend.agent.base import OnboardingAgent
+from backend.agent.cancellation import CancelToken, RunCancelled
 from backend.agent.event_bus import EventBus
 from backend.agent.tools import AgentTools
 from backend.agent.user_profile import (
@@ -163,9 +164,11 @@ class MicroAgentsV1OnboardingAgent(OnboardingAgent):
         dspy.Module.__init__(self)
         self.llm_config = llm_config
         self.event_bus = EventBus()
+        self.cancel_token = CancelToken()
 
         self.tools = AgentTools(
             event_bus=self.event_bus,
+            cancel_token=self.cancel_token,
         )
 
         # Build the DSPy ReAct module with onboarding tools only
@@ -216,6 +219,9 @@ class MicroAgentsV1OnboardingAgent(OnboardingAgent):
                     response_text = prediction.response
                     is_complete = prediction.is_complete
 
+                # A cancelled turn is dropped, not shown or acted on
+                self.cancel_token.check()
+
                 # Emit the response text
                 if response_text:
                     self.event_bus.emit("text_delta", {"content": response_text})
@@ -226,6 +232,9 @@ class MicroAgentsV1OnboardingAgent(OnboardingAgent):
                     self.event_bus.emit("onboarding_complete", {})
 
                 self.event_bus.emit("done", {"content": response_text or ""})
+            except RunCancelled:
+                logger.info("MicroAgentsV1OnboardingAgent cancelled (%s)", self.cancel_token.reason)
+                self.event_bus.emit("cancelled", {"reason": self.cancel_token.reason})
             except Exception as exc:
                 logger.exception("MicroAgentsV1OnboardingAgent error")
                 self.event_bus.emit("error", {"message": str(exc)})
@@ -16,8 +16,9 @@ import logging
 
 import litellm
 
+from backend.agent.cancellation import CancelToken
 from backend.agent.event_bus import EventBus
-from backend.llm.llm_factory import LLMConfig
+from backend.llm.llm_factory import LLMConfig, prompt_cache_kwargs
 
 from ..stages.workflow_mapper import WorkflowAssignment
 from ..workflows.registry import WorkflowResult, get_workflow
@@ -55,9 +56,11 @@ class ResultCollator:
     incrementally instead of waiting for the full response.
     """
 
-    def __init__(self, llm_config: LLMConfig, event_bus: EventBus | None = None):
+    def __init__(self, llm_config: LLMConfig, event_bus: EventBus | None = None,
+                 cancel_token: CancelToken | None = None):
         self.llm_config = llm_config
         self.event_bus = event_bus
+        self.cancel_token = cancel_token or CancelToken()
 
     # ------------------------------------------------------------------
     # Helpers
@@ -111,6 +114,7 @@ class ResultCollator:
             kwargs["api_key"] = self.llm_config.api_key
         if self.llm_config.api_base:
             kwargs["api_base"] = self.llm_config.api_base
+        kwargs.update(prompt_cache_kwargs(self.llm_config, stream=True))
         return kwargs
 
     # ------------------------------------------------------------------
@@ -169,6 +173,7 @@ class ResultCollator:
 
         full_text = ""
         for chunk in response:
+            self.cancel_token.check()
             delta = chunk.choices[0].delta
             if delta.content:
                 if self.event_bus:
@@ -11,7 +11,8 @@ Mapper, the executor:
 4. Collects :class:`WorkflowResult` objects for downstream stages.
 
 The executor is a deterministic orchestrator — only the deferred-param
-resolution step uses an LLM (via DSPy).
+resolution step uses an LLM (via DSPy).  It checks the run's cancel token
+before each step and hands the token to every workflow.
 """
 
 from __future__ import annotations
@@ -22,6 +23,7 @@ from graphlib import TopologicalSorter
 
 import dspy
 
+from backend.agent.cancellation import CancelToken
 from backend.agent.event_bus import EventBus
 from backend.agent.tools import AgentTools
 from backend.llm.llm_factory import LLMConfig
@@ -183,7 +185,7 @@ class _CachedTools:
 
     # Tools that mutate job data → invalidate list_jobs cache
     _JOB_MUTATING = frozenset({
-        "create_job", "edit_job", "remove_job",
+        "create_job", "edit_job", "remove_job", "edit_jobs", "remove_jobs",
     })
     # Tools that mutate profile → invalidate read_user_profile cache
     _PROFILE_MUTATING = frozenset({
@@ -239,10 +241,12 @@ class WorkflowExecutor:
     """
 
     def __init__(self, tools: AgentTools, llm_config: LLMConfig,
-                 event_bus: EventBus | None = None):
+                 event_bus: EventBus | None = None,
+                 cancel_token: CancelToken | None = None):
         self.tools = tools
         self.llm_config = llm_config
         self.event_bus = event_bus
+        self.cancel_token = cancel_token or CancelToken()
         self.param_extractor = DeferredParamExtractor(llm_config)
 
     # ------------------------------------------------------------------
@@ -369,6 +373,7 @@ class WorkflowExecutor:
         )
 
         for assignment in ordered:
+            self.cancel_token.check()
             outcome_id = assignment.outcome.id
             wf_name = assignment.workflow_name
 
@@ -421,6 +426,7 @@ class WorkflowExecutor:
                 llm_config=self.llm_config,
                 outcome_description=assignment.outcome.description,
                 event_bus=self.event_bus,
+                cancel_token=self.cancel_token,
             )
 
             # Execute — plain method call
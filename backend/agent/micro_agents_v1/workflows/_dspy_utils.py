@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any
 import dspy
 
 from backend.agent.tools import AgentTools
+from backend.llm.llm_factory import prompt_cache_kwargs
 
 if TYPE_CHECKING:
     from backend.llm.llm_factory import LLMConfig
@@ -24,13 +25,16 @@ def build_lm(llm_config: "LLMConfig") -> dspy.LM:
     """Build a ``dspy.LM`` from the project's ``LLMConfig``.
 
     Centralised here so every DSPy module and workflow avoids
-    duplicating this construction logic.
+    duplicating this construction logic.  Signature instructions go in the
+    system message, so with prompt caching enabled they are cached across
+    calls and runs.
     """
     kwargs: dict = {}
     if llm_config.api_key:
         kwargs["api_key"] = llm_config.api_key
     if llm_config.api_base:
         kwargs["api_base"] = llm_config.api_base
+    kwargs.update(prompt_cache_kwargs(llm_config))
     return dspy.LM(
         model=llm_config.model,
         max_tokens=llm_config.max_tokens,
@@ -32,6 +32,8 @@ import logging
 
 import dspy
 
+from backend.agent.cancellation import CancellableThreadPool
+
 from ._dspy_utils import build_lm, load_job_context, load_user_context
 from .registry import BaseWorkflow, WorkflowResult, register_workflow
 
@@ -307,7 +309,7 @@ class EditCoverLetterWorkflow(BaseWorkflow):
         self.event_bus.emit("text_delta", {"content": "Analysing your cover letter...\n"})
         lm = build_lm(self.llm_config)
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        with CancellableThreadPool(self.cancel_token, max_workers=3) as pool:
             futures: dict[concurrent.futures.Future, str] = {
                 pool.submit(
                     self._analyze_structure, lm, cover_letter, job_context,
@@ -321,7 +323,7 @@ class EditCoverLetterWorkflow(BaseWorkflow):
             }
 
             analysis_results: dict[str, dict] = {}
-            for future in concurrent.futures.as_completed(futures):
+            for future in pool.as_completed(futures):
                 name = futures[future]
                 exc = future.exception()
                 if exc:
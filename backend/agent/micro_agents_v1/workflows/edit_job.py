@@ -1,11 +1,15 @@
 """Edit Job workflow — modify a tracked job's fields.
 
 Pipeline:
-1. A ``JobResolver`` identifies which job in the tracker the user is
-   referring to.
+1. A ``JobResolver`` identifies which job(s) in the tracker the user may
+   be referring to, unless the caller passes explicit ``job_ids``.
 2. A DSPy module extracts the fields to be modified and their new values
-   from the user's request.
-3. The job is programmatically updated via ``edit_job``.
+   from the user's request and, when the resolver matched several jobs,
+   which of them the user wants changed.  Only the top match is edited
+   unless that structured output names several.
+3. The job(s) are updated together via ``edit_jobs`` (one transaction).
+   Batch edits never rewrite the fields that identify a posting
+   (company, title, url).
 """
 
 from __future__ import annotations
@@ -60,7 +64,8 @@ class ExtractJobEditsSig(dspy.Signature):
     """Extract job field updates from the user's message.
 
     Given the user's request and the current state of a job, determine
-    which fields should be changed and to what values.
+    which fields should be changed and to what values, and which of the
+    candidate jobs the change applies to.
 
     Guidelines:
     - Only include fields the user explicitly or implicitly wants changed.
@@ -70,20 +75,52 @@ class ExtractJobEditsSig(dspy.Signature):
     - For salary fields, extract numeric values (salary_min, salary_max).
     - For job_fit, use an integer 0-5.
     - Preserve existing data — only change what the user asks for.
+    - target_job_ids is usually just the job the user means.  List several
+      candidates only when the user asks for this same change on each of
+      them (e.g. "mark the Acme one and the Globex one as applied").  A
+      candidate that merely resembles the intended job is not a target.
     """
 
     user_message: str = dspy.InputField(desc="The user's edit request")
     current_job: str = dspy.InputField(
         desc="JSON of the current job record being edited"
     )
+    candidate_jobs: str = dspy.InputField(
+        desc="JSON list of the tracker jobs the request may refer to, best match first"
+    )
     updates: list[JobFieldUpdate] = dspy.OutputField(
         desc="List of field updates to apply"
     )
+    target_job_ids: list[int] = dspy.OutputField(
+        desc="IDs of the candidate jobs to apply the updates to"
+    )
 
 
 # Integer fields that need type coercion
 _INT_FIELDS = {"salary_min", "salary_max", "job_fit"}
 
+# Fields that identify one posting; never copied across several jobs
+_IDENTITY_FIELDS = {"company", "title", "url"}
+
+# Candidate fields shown to the extractor for choosing targets
+_CANDIDATE_FIELDS = ("id", "company", "title", "status", "location")
+
+
+def select_targets(candidates: list[dict], target_job_ids: list[int] | None) -> list[dict]:
+    """Pick the jobs to edit from the resolver's *candidates* (best first).
+
+    *target_job_ids* is the extractor's structured choice.  Candidates it
+    names are edited, in candidate order; if it names none of them, only
+    the top match is.
+    """
+    chosen = set(target_job_ids or ())
+    targets = [job for job in candidates if job["id"] in chosen]
+    if not targets:
+        return candidates[:1]
+    if len(targets) < len(candidates):
+        logger.info("edit_job: editing %d of %d matched jobs", len(targets), len(candidates))
+    return targets
+
 
 # ---------------------------------------------------------------------------
 # Workflow
@@ -92,10 +129,11 @@ _INT_FIELDS = {"salary_min", "salary_max", "job_fit"}
 
 @register_workflow("edit_job")
 class EditJobWorkflow(BaseWorkflow):
-    """Update fields on an existing tracked job — use for status changes, salary edits, adding notes or tags, changing location, or any field modification."""
+    """Update fields on one or more existing tracked jobs — use for status changes, salary edits, adding notes or tags, changing location, or any field modification."""
 
     OUTPUTS = {
-        "job": "dict — the updated job record",
+        "job": "dict — the updated job record (the first, when several were edited)",
+        "jobs": "list[dict] — every updated job record",
         "changes": "list[dict] — each with field, old_value, new_value",
     }
 
@@ -103,35 +141,37 @@ class EditJobWorkflow(BaseWorkflow):
         user_message = self.outcome_description or self.params.get("user_message", "")
         conversation_context = self.params.get("conversation_context", "")
 
-        # 1. Resolve the target job
+        # 1. Resolve the target job(s)
         self.event_bus.emit("text_delta", {"content": "Identifying which job to edit...\n"})
 
         job_id = self.params.get("job_id")
-        job = None
+        job_ids = self.params.get("job_ids") or []
+        targets: list[dict] = []
+        candidates: list[dict] = []
 
         jobs_resp = self.tools.execute("list_jobs", {"limit": 50})
         tracker_jobs = jobs_resp.get("jobs", []) if "error" not in jobs_resp else []
+        job_by_id = {j["id"]: j for j in tracker_jobs}
 
-        if job_id:
-            for j in tracker_jobs:
-                if j["id"] == int(job_id):
-                    job = j
-                    break
+        if job_ids:
+            targets = [job_by_id[int(i)] for i in dict.fromkeys(job_ids) if int(i) in job_by_id]
+        elif job_id and int(job_id) in job_by_id:
+            targets = [job_by_id[int(job_id)]]
 
-        if job is None and tracker_jobs:
+        if not targets and tracker_jobs:
             resolver = JobResolver(self.llm_config)
             resolved = resolver.resolve(
                 user_message=user_message,
                 jobs=tracker_jobs,
                 conversation_context=conversation_context,
             )
-            if resolved:
-                for j in tracker_jobs:
-                    if j["id"] == resolved[0].job_id:
-                        job = j
-                        break
+            for match in resolved:
+                job = job_by_id.get(match.job_id)
+                if job is not None and job not in candidates:
+                    candidates.append(job)
+            targets = candidates[:1]
 
-        if job is None:
+        if not targets:
             msg = "Couldn't determine which job to edit. Please be more specific.\n"
             self.event_bus.emit("text_delta", {"content": msg})
             return WorkflowResult(
@@ -141,18 +181,25 @@ class EditJobWorkflow(BaseWorkflow):
                 summary=msg.strip(),
             )
 
-        job_label = f"{job['title']} at {job['company']}"
-        self.event_bus.emit("text_delta", {"content": f"Editing **{job_label}**...\n"})
+        job = targets[0]
 
-        # 2. Extract field updates
+        # 2. Extract field updates (and, among several matches, the targets)
         extractor = dspy.ChainOfThought(ExtractJobEditsSig)
 
         with dspy.context(lm=build_lm(self.llm_config)):
             result = extractor(
                 user_message=user_message,
                 current_job=json.dumps(job, default=str),
+                candidate_jobs=json.dumps(
+                    [{k: j.get(k) for k in _CANDIDATE_FIELDS} for j in candidates or targets], default=str,
+                ),
             )
 
+        if len(candidates) > 1:
+            targets = select_targets(candidates, result.target_job_ids)
+        job_label = ", ".join(f"{j['title']} at {j['company']}" for j in targets)
+        self.event_bus.emit("text_delta", {"content": f"Editing **{job_label}**...\n"})
+
         if not result.updates:
             msg = "Couldn't determine what changes to make. Please be more specific.\n"
             self.event_bus.emit("text_delta", {"content": msg})
@@ -163,11 +210,15 @@ class EditJobWorkflow(BaseWorkflow):
                 summary=msg.strip(),
             )
 
-        # 3. Build edit_job kwargs and apply
-        edit_kwargs: dict = {"job_id": job["id"]}
+        # 3. Build edit_jobs kwargs and apply to every target at once
+        edit_kwargs: dict = {"job_ids": [j["id"] for j in targets]}
+        applied = []
         for update in result.updates:
             field = update.field.strip()
             value = update.value
+            if len(targets) > 1 and field in _IDENTITY_FIELDS:
+                logger.warning("Not applying %s to %d jobs at once, skipping", field, len(targets))
+                continue
             # Coerce integer fields
             if field in _INT_FIELDS:
                 try:
@@ -176,8 +227,19 @@ class EditJobWorkflow(BaseWorkflow):
                     logger.warning("Could not coerce %s=%r to int, skipping", field, value)
                     continue
             edit_kwargs[field] = value
+            applied.append(update)
+
+        if not applied:
+            msg = f"Couldn't apply those changes to {job_label}. Please edit them one job at a time.\n"
+            self.event_bus.emit("text_delta", {"content": msg})
+            return WorkflowResult(
+                outcome_id=self.outcome_id,
+                success=False,
+                data={"error": "No applicable field updates", "job": job},
+                summary=msg.strip(),
+            )
 
-        edit_result = self.tools.execute("edit_job", edit_kwargs)
+        edit_result = self.tools.execute("edit_jobs", edit_kwargs)
 
         if "error" in edit_result:
             self.event_bus.emit("text_delta", {"content": f"Error: {edit_result['error']}\n"})
@@ -188,11 +250,10 @@ class EditJobWorkflow(BaseWorkflow):
                 summary=f"Failed to edit {job_label}: {edit_result['error']}",
             )
 
-        updated_job = edit_result.get("job", {})
-        changed_fields = edit_result.get("updated_fields", list(edit_kwargs.keys()))
+        updated_jobs = edit_result.get("jobs", [])
 
         changes_desc = ", ".join(
-            f"{u.field} → {u.value}" for u in result.updates
+            f"{u.field} → {u.value}" for u in applied
         )
         summary = f"Updated {job_label}: {changes_desc}."
 
@@ -202,8 +263,9 @@ class EditJobWorkflow(BaseWorkflow):
             outcome_id=self.outcome_id,
             success=True,
             data={
-                "job": updated_job,
-                "changes": [u.model_dump() for u in result.updates],
+                "job": updated_jobs[0] if updated_jobs else {},
+                "jobs": updated_jobs,
+                "changes": [u.model_dump() for u in applied],
             },
             summary=summary,
         )
@@ -30,6 +30,7 @@ import dspy
 import requests as http_requests
 from pydantic import BaseModel, Field
 
+from backend import http_client
 from backend.agent.tools import AgentTools
 from backend.llm.llm_factory import LLMConfig
 
@@ -323,11 +324,13 @@ def _check_url_liveness(url: str) -> tuple[bool, str]:
     empty string on failure.
 
     This does NOT use Tavily — it's a direct HTTP request, so it's free.
+    It goes through the pooled ``backend.http_client`` sessions, so checks
+    of several listings on one job board reuse a connection.
     """
     if not url:
         return False, ""
     try:
-        resp = http_requests.get(
+        resp = http_client.get(
             url,
             timeout=_LIVENESS_TIMEOUT,
             headers={
@@ -414,6 +417,7 @@ class JobSearchWorkflow(BaseWorkflow):
         all_results: list[dict] = []
 
         for i, q in enumerate(queries, 1):
+            self.cancel_token.check()
             # Throttle to avoid 429 rate-limit errors from JSearch/RapidAPI
             if i > 1:
                 time.sleep(1)
@@ -493,6 +497,7 @@ class JobSearchWorkflow(BaseWorkflow):
         scored_jobs: list[dict] = []
 
         for batch_start in range(0, len(jobs), batch_size):
+            self.cancel_token.check()
             batch_jobs = jobs[batch_start : batch_start + batch_size]
             batch_trimmed = trimmed[batch_start : batch_start + batch_size]
 
@@ -590,20 +595,21 @@ class JobSearchWorkflow(BaseWorkflow):
             ),
         })
 
-        # Scrape aggregator pages for direct links
+        # Scrape all aggregator pages for direct links in one batch
+        urls = [jobs[i].get("url") for i in aggregator_indices if jobs[i].get("url")]
+        scraped: dict[str, dict] = {}
+        if urls:
+            scrape_resp = self.tools.execute("scrape_urls", {
+                "urls": urls,
+                "query": "careers apply direct application link",
+            })
+            scraped = scrape_resp.get("results", {})
+
         jobs_for_verification: list[dict] = []
         for i in aggregator_indices:
             job = jobs[i]
             url = job.get("url") or ""
-            scraped_content = ""
-
-            if url:
-                scrape_resp = self.tools.execute("scrape_url", {
-                    "url": url,
-                    "query": f"{job.get('title', '')} {job.get('company', '')} careers apply",
-                })
-                if "error" not in scrape_resp:
-                    scraped_content = scrape_resp.get("content", "")
+            scraped_content = scraped.get(url, {}).get("content", "")
 
             jobs_for_verification.append({
                 "index": i,
@@ -823,6 +829,7 @@ class JobSearchWorkflow(BaseWorkflow):
             )
 
         # 6. Verify/fix URLs
+        self.cancel_token.check()
         self.event_bus.emit("text_delta", {"content": "\nVerifying job listing URLs...\n"})
         verified = self._verify_urls(qualifying)
 
@@ -837,6 +844,7 @@ class JobSearchWorkflow(BaseWorkflow):
             )
 
         # 7. Add as search results
+        self.cancel_token.check()
         self.event_bus.emit("text_delta", {"content": f"\nAdding {len(verified)} job(s) to search results...\n"})
         added_count = self._add_search_results(verified)
 
@@ -47,6 +47,7 @@ import logging
 import dspy
 from pydantic import BaseModel, Field
 
+from backend.agent.cancellation import CancellableThreadPool
 from backend.llm.llm_factory import LLMConfig
 
 from ._dspy_utils import build_dspy_tools, build_lm, load_job_context, load_user_context
@@ -100,9 +101,9 @@ class AnalyseInterviewSig(dspy.Signature):
 class CompanyBriefSig(dspy.Signature):
     """Research a company and produce an interview-prep brief.
 
-    You have access to web_search and scrape_url tools.  Use them to find
-    current, accurate information about the company — do NOT rely solely on
-    your training data.
+    You have access to web_search, scrape_url and scrape_urls tools.  Use
+    them to find current, accurate information about the company — do NOT
+    rely solely on your training data.
 
     Steps:
     1. Search for the company name + recent news, mission, culture, and
@@ -333,7 +334,7 @@ class PrepInterviewWorkflow(BaseWorkflow):
     # -- Parallel sub-module runners ----------------------------------------
 
     # Tools exposed to the company brief ReAct module for live research.
-    _COMPANY_BRIEF_TOOL_NAMES = frozenset({"web_search", "scrape_url"})
+    _COMPANY_BRIEF_TOOL_NAMES = frozenset({"web_search", "scrape_url", "scrape_urls"})
 
     def _run_company_brief(
         self,
@@ -584,7 +585,7 @@ class PrepInterviewWorkflow(BaseWorkflow):
             "interviewer_qs": "Questions for the Interviewer",
         }
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as pool:
+        with CancellableThreadPool(self.cancel_token, max_workers=5) as pool:
             futures: dict[concurrent.futures.Future, str] = {
                 pool.submit(
                     self._run_company_brief,
@@ -611,7 +612,7 @@ class PrepInterviewWorkflow(BaseWorkflow):
 
             # Wait for all futures to complete.  Tool events are
             # auto-emitted by AgentTools.execute() via the event bus.
-            for future in concurrent.futures.as_completed(futures):
+            for future in pool.as_completed(futures):
                 key = futures[future]
                 label = section_labels[key]
                 exc = future.exception()
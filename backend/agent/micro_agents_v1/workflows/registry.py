@@ -22,6 +22,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from backend.agent.cancellation import CancelToken
 from backend.telemetry.decorators import traced_workflow
 
 if TYPE_CHECKING:
@@ -60,6 +61,11 @@ class BaseWorkflow(ABC):
     progress events (text_delta, etc.) to the user.  Tool events are
     auto-emitted by ``AgentTools.execute()``.
 
+    Long-running workflows call ``self.cancel_token.check()`` between
+    steps so a cancelled run stops early, and fan parallel LLM calls out
+    through ``CancellableThreadPool(self.cancel_token)`` so calls that
+    haven't started are dropped.
+
     Telemetry: ``__init_subclass__`` auto-wraps ``run()`` with the
     ``@traced_workflow`` decorator so all workflows are traced without
     any per-workflow code changes.
@@ -78,6 +84,7 @@ class BaseWorkflow(ABC):
         llm_config: "LLMConfig",
         outcome_description: str = "",
         event_bus: "EventBus | None" = None,
+        cancel_token: CancelToken | None = None,
     ):
         self.outcome_id = outcome_id
         self.params = params
@@ -85,6 +92,7 @@ class BaseWorkflow(ABC):
         self.llm_config = llm_config
         self.outcome_description = outcome_description
         self.event_bus = event_bus
+        self.cancel_token = cancel_token or CancelToken()
 
     @abstractmethod
     def run(self) -> WorkflowResult:
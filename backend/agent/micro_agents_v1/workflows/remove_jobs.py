@@ -3,7 +3,7 @@
 Pipeline:
 1. A ``JobResolver`` identifies which job(s) in the tracker the user
    wants to remove.
-2. Matched jobs are programmatically deleted via ``remove_job``.
+2. Matched jobs are deleted together via ``remove_jobs`` (one transaction).
 """
 
 from __future__ import annotations
@@ -76,28 +76,37 @@ class RemoveJobsWorkflow(BaseWorkflow):
 
         job_by_id = {j["id"]: j for j in tracker_jobs}
 
-        # 3. Remove each matched job
+        # 3. Remove the matched jobs in one batch
         removed = []
         failed = []
+        targets = []
 
         for match in resolved:
             job = job_by_id.get(match.job_id)
             if job is None:
                 failed.append({"job_id": match.job_id, "reason": "not found"})
-                continue
+            elif job not in targets:
+                targets.append(job)
 
-            job_label = f"{job['title']} at {job['company']}"
-            self.event_bus.emit("text_delta", {"content": f"Removing **{job_label}**...\n"})
+        if targets:
+            for job in targets:
+                job_label = f"{job['title']} at {job['company']}"
+                self.event_bus.emit("text_delta", {"content": f"Removing **{job_label}**...\n"})
 
-            result = self.tools.execute("remove_job", {"job_id": job["id"]})
+            result = self.tools.execute("remove_jobs", {"job_ids": [j["id"] for j in targets]})
 
             if "error" in result:
-                logger.error("Failed to remove job %d: %s", job["id"], result["error"])
-                failed.append({"job_id": job["id"], "label": job_label, "reason": result["error"]})
+                logger.error("Failed to remove jobs %s: %s", [j["id"] for j in targets], result["error"])
+                for job in targets:
+                    failed.append({
+                        "job_id": job["id"],
+                        "label": f"{job['title']} at {job['company']}",
+                        "reason": result["error"],
+                    })
                 self.event_bus.emit("text_delta", {"content": f"  Failed: {result['error']}\n"})
             else:
-                removed.append(job)
-                logger.info("Removed job %d: %s", job["id"], job_label)
+                removed = targets
+                logger.info("Removed jobs %s", [j["id"] for j in removed])
 
         # 4. Summary
         if removed:
@@ -30,6 +30,7 @@ import json
 import logging
 import dspy
 
+from backend.agent.cancellation import CancellableThreadPool
 from backend.llm.llm_factory import LLMConfig
 
 from ._dspy_utils import build_lm, load_job_context, load_user_context
@@ -451,8 +452,8 @@ class SpecializeResumeWorkflow(BaseWorkflow):
         self.event_bus.emit("text_delta", {"content": "Evaluating each section against the job requirements...\n"})
 
         critiques: dict[int, dict] = {}
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=min(4, max(1, len(sections)))
+        with CancellableThreadPool(
+            self.cancel_token, max_workers=min(4, max(1, len(sections)))
         ) as pool:
             futures: dict[concurrent.futures.Future, tuple[int, str]] = {
                 pool.submit(
@@ -461,7 +462,7 @@ class SpecializeResumeWorkflow(BaseWorkflow):
                 ): (idx, section.title)
                 for idx, section in enumerate(sections)
             }
-            for future in concurrent.futures.as_completed(futures):
+            for future in pool.as_completed(futures):
                 idx, title = futures[future]
                 exc = future.exception()
                 if exc:
@@ -481,8 +482,8 @@ class SpecializeResumeWorkflow(BaseWorkflow):
         self.event_bus.emit("text_delta", {"content": "\nApplying revisions to each section...\n"})
 
         revised: dict[int, dict] = {}
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=min(4, max(1, len(sections)))
+        with CancellableThreadPool(
+            self.cancel_token, max_workers=min(4, max(1, len(sections)))
         ) as pool:
             futures_rev: dict[concurrent.futures.Future, tuple[int, str]] = {
                 pool.submit(
@@ -491,7 +492,7 @@ class SpecializeResumeWorkflow(BaseWorkflow):
                 ): (idx, critiques[idx]["title"])
                 for idx in range(len(sections))
             }
-            for future in concurrent.futures.as_completed(futures_rev):
+            for future in pool.as_completed(futures_rev):
                 idx, title = futures_rev[future]
                 exc = future.exception()
                 if exc:
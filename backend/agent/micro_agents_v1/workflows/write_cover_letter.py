@@ -21,6 +21,7 @@ import logging
 import dspy
 from pydantic import BaseModel, Field
 
+from backend.agent.cancellation import CancellableThreadPool
 from backend.llm.llm_factory import LLMConfig
 
 from ._dspy_utils import build_lm, load_job_context, load_user_context
@@ -276,8 +277,8 @@ class WriteCoverLetterWorkflow(BaseWorkflow):
         self.event_bus.emit("text_delta", {"content": "Drafting sections in parallel...\n"})
 
         section_drafts: dict[int, str] = {}
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=min(4, max(1, len(sections)))
+        with CancellableThreadPool(
+            self.cancel_token, max_workers=min(4, max(1, len(sections)))
         ) as pool:
             futures: dict[concurrent.futures.Future, tuple[int, str]] = {
                 pool.submit(
@@ -292,7 +293,7 @@ class WriteCoverLetterWorkflow(BaseWorkflow):
                 for idx, section in enumerate(sections)
             }
 
-            for future in concurrent.futures.as_completed(futures):
+            for future in pool.as_completed(futures):
                 idx, title = futures[future]
                 exc = future.exception()
                 if exc:
@@ -11,18 +11,21 @@ Module layout:
     _registry.py        agent_tool decorator + _TOOL_REGISTRY
     web_search.py       web_search, web_research
     job_search.py       job_search
-    scrape_url.py       scrape_url
-    jobs.py             create_job, list_jobs, edit_job, remove_job, list_job_todos, add_job_todo, edit_job_todo, remove_job_todo
+    scrape_url.py       scrape_url, scrape_urls
+    jobs.py             create_job, list_jobs, edit_job, edit_jobs, remove_job, remove_jobs, list_job_todos, add_job_todo, edit_job_todo, remove_job_todo
     profile.py          read_user_profile, update_user_profile
     resume.py           read_resume
     search_results.py   add_search_result, list_search_results
     job_documents.py    save_job_document, get_job_document
+    full_text_search.py search_saved_data
 
 Key methods on AgentTools:
     execute(tool_name, arguments) -> dict
         Dispatch a tool call by name. Returns result dict or {"error": str}.
+    is_mutating(tool_name) -> bool
+        Whether a tool writes user data (unknown tools count as mutating).
     get_tool_definitions() -> list[dict]
-        Return tool metadata (name, description, args_schema) for all
+        Return tool metadata (name, description, args_schema, mutating) for all
         registered tools. Agent implementations use this to adapt tools
         to their specific LLM framework.
 """
@@ -31,6 +34,7 @@ import logging
 import time
 import uuid
 
+from backend.agent.cancellation import CancelToken, RunCancelled
 from backend.agent.event_bus import EventBus
 
 # Mixin imports must come before AgentTools so that the @agent_tool
@@ -44,6 +48,7 @@ from .resume import ResumeMixin
 from .scrape_url import ScrapeUrlMixin
 from .search_results import SearchResultsMixin
 from .job_documents import JobDocumentsMixin
+from .full_text_search import FullTextSearchMixin
 from .web_search import WebSearchMixin
 
 logger = logging.getLogger(__name__)
@@ -58,6 +63,7 @@ class AgentTools(
     ResumeMixin,
     SearchResultsMixin,
     JobDocumentsMixin,
+    FullTextSearchMixin,
 ):
     """Collection of tools available to agents.
 
@@ -66,14 +72,17 @@ class AgentTools(
         rapidapi_key:      RapidAPI key (for JSearch, Active Jobs DB, LinkedIn Jobs)
         conversation_id:   Current conversation ID
         event_bus:         EventBus for auto-emitting tool_start/tool_result/tool_error
+        cancel_token:      The run's CancelToken, for tools that wait (web_research)
     """
 
     def __init__(self, search_api_key="", rapidapi_key="",
-                 conversation_id=None, event_bus: EventBus | None = None):
+                 conversation_id=None, event_bus: EventBus | None = None,
+                 cancel_token: CancelToken | None = None):
         self.search_api_key = search_api_key
         self.rapidapi_key = rapidapi_key
         self.conversation_id = conversation_id
         self.event_bus = event_bus
+        self.cancel_token = cancel_token or CancelToken()
 
     def execute(self, tool_name, arguments=None):
         """Execute a tool by name with error handling.
@@ -152,10 +161,20 @@ class AgentTools(
             else:
                 validated = schema(**arguments)
                 return method(**validated.model_dump())
+        except RunCancelled as e:
+            # The agent's next cancellation check ends the run
+            return {"error": f"Cancelled: {e}"}
         except Exception as e:
             logger.exception("Tool %s raised an exception", tool_name)
             return {"error": str(e)}
 
+    def is_mutating(self, tool_name):
+        """Return True if *tool_name* writes user data or is not a known tool."""
+        method = getattr(self, tool_name, None)
+        if method is None or not hasattr(method, "_tool_description"):
+            return True
+        return getattr(method, "_tool_mutating", False)
+
     def get_tool_definitions(self):
         """Return metadata for all registered tools.
 
@@ -163,6 +182,7 @@ class AgentTools(
             - name: str — tool method name
             - description: str — LLM-facing description
             - args_schema: Pydantic BaseModel class or None
+            - mutating: bool — tool writes user data (see ``is_mutating``)
 
         Agent implementations use this to adapt tools to their specific
         LLM framework (e.g. OpenAI function-calling format).
@@ -176,5 +196,6 @@ class AgentTools(
                 "name": name,
                 "description": getattr(method, "_tool_description", ""),
                 "args_schema": getattr(method, "_tool_args_schema", None),
+                "mutating": getattr(method, "_tool_mutating", False),
             })
         return definitions
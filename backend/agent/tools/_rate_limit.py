@@ -0,0 +1,120 @@
+"""Per-host token buckets for outbound API calls.
+
+Every thread that calls a host draws from that host's one bucket, so
+concurrent provider queries (and concurrent agent runs) respect the
+host's rate limit together.  A 429's ``Retry-After`` pauses the host's
+bucket for all of them, not only for the thread that received it.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from backend.config_manager import get_int_config_value
+
+# Longest Retry-After honoured; anything larger is treated as this
+MAX_RETRY_AFTER_SECONDS = 60
+
+
+class TokenBucket:
+    """Thread-safe token bucket: *rate* tokens per second, up to *burst* stored.
+
+    A *rate* of 0 disables limiting, though ``pause()`` still applies.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return 0, or return the seconds until one is due."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self.rate <= 0:
+                return 0.0
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, deadline: float | None = None) -> bool:
+        """Block until a token is taken; return False instead if that would
+        pass *deadline* (a ``time.monotonic()`` value)."""
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for *seconds*, then start again from empty."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._tokens = 0.0
+                self._updated = until
+
+
+class HostRateLimiter:
+    """Lazily created ``TokenBucket`` per host.
+
+    Rate and burst are read from ``<config_prefix>.requests_per_second`` and
+    ``<config_prefix>.burst`` when a host's bucket is created.
+    """
+
+    def __init__(self, config_prefix: str, default_rate: int, default_burst: int):
+        self.config_prefix = config_prefix
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(
+                    get_int_config_value(f"{self.config_prefix}.requests_per_second", self.default_rate),
+                    get_int_config_value(f"{self.config_prefix}.burst", self.default_burst),
+                )
+                self._buckets[host] = bucket
+            return bucket
+
+    def reset(self) -> None:
+        """Forget every bucket (they are recreated from config on next use)."""
+        with self._lock:
+            self._buckets.clear()
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delay seconds or HTTP date).
+
+    Returns None if the header is missing or unparseable; caps the delay at
+    ``MAX_RETRY_AFTER_SECONDS``.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
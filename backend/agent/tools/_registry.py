@@ -3,12 +3,17 @@
 _TOOL_REGISTRY: list[str] = []
 
 
-def agent_tool(description: str, args_schema=None):
-    """Mark a method as an agent tool with an LLM-facing description."""
+def agent_tool(description: str, args_schema=None, mutating: bool = False):
+    """Mark a method as an agent tool with an LLM-facing description.
+
+    ``mutating`` marks tools that write user data (the database or profile
+    files); agents never run these concurrently with other tool calls.
+    """
 
     def decorator(method):
         method._tool_description = description
         method._tool_args_schema = args_schema
+        method._tool_mutating = mutating
         _TOOL_REGISTRY.append(method.__name__)
         return method
 
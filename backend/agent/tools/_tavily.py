@@ -0,0 +1,272 @@
+"""Shared ``TavilyClient`` instances and the Tavily response cache.
+
+``TavilyClient`` puts its API key in its session's headers, so clients
+with different keys can't share a session.  Each key gets one long-lived
+client on its own pooled, retrying session from ``backend.http_client``,
+so repeated searches and extracts reuse the same TLS connection.
+
+Search, extract and research responses are kept in the persistent
+response cache (``backend/response_cache.py``, namespace ``tavily``) for
+``integrations.tavily.cache.ttl_seconds.<operation>`` seconds.  Searches
+are keyed on the normalized query and search options, research on the
+question and model (once the research task has finished), and extracts
+on each normalized URL plus extract depth and re-ranking query, so the
+same company page or posting is scraped once however many workflows ask
+for it.
+
+Tavily itself has no conditional requests, so extracted pages carry their
+own revalidation metadata: the time they were fetched.  When an extract
+expires, it is kept for ``integrations.tavily.cache.max_stale_seconds``
+more, and the next request for it first asks the origin server with
+``If-Modified-Since``.  A 304 (or a ``Last-Modified`` no later than the
+fetch) renews the cached content without spending Tavily credits;
+anything else extracts the page again.  The origin checks for one call run
+concurrently, ``REVALIDATE_WORKERS`` at a time, and any still unanswered
+after ``REVALIDATE_DEADLINE_SECONDS`` count as changed.
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from tavily import TavilyClient
+
+from backend import http_client, response_cache
+from backend.agent.cancellation import CancelToken
+from backend.response_cache import CacheEntry
+from backend.config_manager import get_int_config_value
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_MAX_MEGABYTES = 100
+DEFAULT_CACHE_TTL_SECONDS = {
+    "search": 6 * 60 * 60,
+    "extract": 24 * 60 * 60,
+    "research": 3 * 24 * 60 * 60,
+}
+DEFAULT_MAX_STALE_SECONDS = 7 * 24 * 60 * 60
+
+# research() only starts a task; its report is polled for until it is done
+RESEARCH_POLL_SECONDS = 2
+DEFAULT_RESEARCH_TIMEOUT_SECONDS = 300
+_RESEARCH_DONE = frozenset({"completed", "failed"})
+
+# Most URLs Tavily accepts in one extract request
+MAX_EXTRACT_URLS = 20
+
+# The origin check must be much cheaper than the extract it saves
+REVALIDATE_TIMEOUT = (3, 5)
+REVALIDATE_WORKERS = 8
+REVALIDATE_DEADLINE_SECONDS = 6
+
+# Query parameters that identify a visit, not the page
+_TRACKING_PARAMS = frozenset({"gclid", "fbclid", "mc_cid", "mc_eid", "ref", "ref_src"})
+
+_lock = threading.Lock()
+_clients: dict[str, TavilyClient] = {}
+
+_CACHE = response_cache.get_cache("tavily", "integrations.tavily.cache", DEFAULT_CACHE_MAX_MEGABYTES)
+
+
+def tavily_client(api_key: str) -> TavilyClient:
+    """Return the shared client for *api_key*."""
+    with _lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = TavilyClient(api_key=api_key, session=http_client.create_session())
+        return client
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of *url* for cache keys.
+
+    Lowercases the scheme and host, drops default ports, fragments,
+    trailing slashes and tracking parameters (``utm_*``, ``gclid``, …), and
+    sorts the remaining query parameters.  The path keeps its case.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, parts.path.rstrip("/") or "/", urlencode(query), ""))
+
+
+def _ttl(operation: str) -> int:
+    return get_int_config_value(f"integrations.tavily.cache.ttl_seconds.{operation}",
+                                DEFAULT_CACHE_TTL_SECONDS[operation])
+
+
+def _max_stale() -> int:
+    return get_int_config_value("integrations.tavily.cache.max_stale_seconds", DEFAULT_MAX_STALE_SECONDS)
+
+
+def cached_search(api_key: str, query: str, **options) -> dict:
+    """``TavilyClient.search`` through the cache."""
+    key = response_cache.cache_key("search", query, options)
+    response = _CACHE.get(key)
+    if response is None:
+        response = tavily_client(api_key).search(query=query, **options)
+        _CACHE.set(key, response, _ttl("search"))
+    return response
+
+
+def _await_research(client: TavilyClient, task: dict, cancel_token: CancelToken) -> dict:
+    """Poll ``get_research`` until *task* finishes; return the finished result.
+
+    Raises ``TimeoutError`` after ``integrations.tavily.research_timeout_seconds``,
+    ``RuntimeError`` if the task fails, and ``RunCancelled`` as soon as
+    *cancel_token* is cancelled.
+    """
+    timeout = get_int_config_value("integrations.tavily.research_timeout_seconds",
+                                   DEFAULT_RESEARCH_TIMEOUT_SECONDS)
+    deadline = time.monotonic() + timeout
+    result = task
+    while result.get("status") not in _RESEARCH_DONE and not result.get("response"):
+        if time.monotonic() + RESEARCH_POLL_SECONDS >= deadline:
+            raise TimeoutError(f"Tavily research did not finish within {timeout}s")
+        cancel_token.wait(RESEARCH_POLL_SECONDS)
+        cancel_token.check()
+        result = client.get_research(task["request_id"])
+    if result.get("status") == "failed":
+        raise RuntimeError(f"Tavily research failed: {result.get('error') or 'unknown error'}")
+    return result
+
+
+def cached_research(api_key: str, query: str, model: str,
+                    cancel_token: CancelToken | None = None) -> dict:
+    """``TavilyClient.research`` through the cache, waiting for the report.
+
+    Only finished research with a non-empty ``response`` is cached; the
+    pending task ``research()`` returns never is.  The wait ends early when
+    *cancel_token* (the run's) is cancelled.
+    """
+    key = response_cache.cache_key("research", query, model)
+    response = _CACHE.get(key)
+    if response is None:
+        client = tavily_client(api_key)
+        response = _await_research(client, client.research(input=query, model=model),
+                                   cancel_token or CancelToken())
+        if response.get("response"):
+            _CACHE.set(key, response, _ttl("research"))
+    return response
+
+
+def _extract_key(url: str, extract_depth: str, query: str | None) -> str:
+    query = " ".join(query.split()).casefold() if query else None
+    return response_cache.cache_key("extract", normalize_url(url), extract_depth, query, fold_case=False)
+
+
+def _unchanged_since_fetch(url: str, meta: dict | None) -> bool:
+    """Ask the origin whether *url* changed since it was fetched (see module docstring)."""
+    fetched_at = (meta or {}).get("fetched_at")
+    if not fetched_at:
+        return False
+    try:
+        resp = http_client.get(
+            url, headers={"If-Modified-Since": formatdate(fetched_at, usegmt=True)},
+            timeout=REVALIDATE_TIMEOUT, stream=True,
+        )
+        resp.close()
+    except requests.exceptions.RequestException as e:
+        logger.debug("Revalidating %s failed: %s", url, e)
+        return False
+    if resp.status_code == 304:
+        return True
+    if resp.status_code != 200 or not resp.headers.get("Last-Modified"):
+        return False
+    try:
+        return parsedate_to_datetime(resp.headers["Last-Modified"]).timestamp() <= fetched_at
+    except (TypeError, ValueError):
+        return False
+
+
+def _revalidate(stale: dict[str, dict | None]) -> set[str]:
+    """Check the stale pages in *stale* (URL -> meta) concurrently; return those unchanged.
+
+    Checks still running at the deadline are abandoned, not waited for.
+    """
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(REVALIDATE_WORKERS, len(stale)))
+    futures = {pool.submit(_unchanged_since_fetch, url, meta): url for url, meta in stale.items()}
+    done, not_done = concurrent.futures.wait(futures, timeout=REVALIDATE_DEADLINE_SECONDS)
+    pool.shutdown(wait=False, cancel_futures=True)
+    if not_done:
+        logger.debug("Revalidating %d page(s) ran out of time", len(not_done))
+    return {futures[f] for f in done if f.exception() is None and f.result()}
+
+
+def cached_extract(api_key: str, urls: list[str], extract_depth: str = "advanced",
+                   query: str | None = None) -> tuple[dict[str, dict], dict[str, str]]:
+    """``TavilyClient.extract`` for *urls*, through the cache.
+
+    Pages that are cached (or revalidate) are served locally; the rest are
+    extracted ``MAX_EXTRACT_URLS`` per Tavily request.  Returns
+    ``(results, failures)``, both keyed by the URLs as given: each result is
+    Tavily's per-URL result dict (``url``, ``raw_content``, …), each failure
+    an error message.  A request that fails outright fails only its own URLs.
+    """
+    results: dict[str, dict] = {}
+    stale: dict[str, CacheEntry] = {}
+    misses: list[str] = []
+    for url in dict.fromkeys(urls):
+        entry = _CACHE.lookup(_extract_key(url, extract_depth, query))
+        if entry is None:
+            misses.append(url)
+        elif entry.fresh:
+            results[url] = entry.value
+        elif (entry.meta or {}).get("fetched_at"):
+            stale[url] = entry
+        else:
+            misses.append(url)
+
+    unchanged = _revalidate({url: entry.meta for url, entry in stale.items()}) if stale else set()
+    for url, entry in stale.items():
+        if url in unchanged:
+            _CACHE.renew(_extract_key(url, extract_depth, query), _ttl("extract"), _max_stale())
+            results[url] = entry.value
+        else:
+            misses.append(url)
+
+    pending: dict[str, list[str]] = {}  # normalized URL -> URLs as given
+    for url in misses:
+        pending.setdefault(normalize_url(url), []).append(url)
+
+    kwargs = {"extract_depth": extract_depth}
+    if query:
+        kwargs["query"] = query
+    failures: dict[str, str] = {}
+    batches = list(pending.items())
+    for start in range(0, len(batches), MAX_EXTRACT_URLS):
+        batch = dict(batches[start:start + MAX_EXTRACT_URLS])
+        fetched_at = time.time()
+        try:
+            response = tavily_client(api_key).extract(urls=[given[0] for given in batch.values()], **kwargs)
+        except Exception as e:
+            logger.warning("Tavily extract of %d URL(s) failed: %s", len(batch), e)
+            for given in batch.values():
+                failures.update(dict.fromkeys(given, str(e)))
+            continue
+        returned = response.get("results", [])
+        for result in returned:
+            given = batch.pop(normalize_url(result.get("url", "")), None)
+            if given is None and len(batch) == 1 and len(returned) == 1:
+                # A lone page may come back under its redirect target
+                given = batch.popitem()[1]
+            if given is None:
+                continue
+            results.update(dict.fromkeys(given, result))
+            _CACHE.set(_extract_key(given[0], extract_depth, query), result, _ttl("extract"),
+                       meta={"fetched_at": fetched_at}, stale_seconds=_max_stale())
+        errors = {normalize_url(f.get("url", "")): f.get("error") or "extraction failed"
+                  for f in response.get("failed_results", [])}
+        for norm, given in batch.items():
+            failures.update(dict.fromkeys(given, errors.get(norm, "no content returned")))
+    return results, failures
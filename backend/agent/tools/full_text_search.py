@@ -0,0 +1,43 @@
+"""Full-text search tool — search_saved_data."""
+
+import logging
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from backend.search import SCOPES, search
+from ._registry import agent_tool
+
+logger = logging.getLogger(__name__)
+
+
+class SearchSavedDataInput(BaseModel):
+    query: str = Field(description="Words to search for")
+    scopes: Optional[list[str]] = Field(
+        default=None,
+        description="Where to search: any of jobs, search_results, messages, job_documents (default: all)",
+    )
+    limit: int = Field(default=10, description="Max results per scope")
+
+
+class FullTextSearchMixin:
+    @agent_tool(
+        description=(
+            "Full-text search over the user's saved data: tracker jobs (including "
+            "notes and requirements), job search results from any conversation, "
+            "past chat messages, and saved cover letters/resumes. Returns the best "
+            "matches per scope with highlighted snippets."
+        ),
+        args_schema=SearchSavedDataInput,
+    )
+    def search_saved_data(self, query, scopes=None, limit=10):
+        unknown = [s for s in (scopes or []) if s not in SCOPES]
+        if unknown:
+            return {"error": f"Invalid scope '{unknown[0]}'. Must be one of: {', '.join(SCOPES)}"}
+        if not (1 <= limit <= 50):
+            return {"error": "limit must be between 1 and 50"}
+
+        results = search(query, scopes or None, limit=limit)
+        total = sum(len(v) for v in results.values())
+        logger.info("search_saved_data: scopes=%s hits=%d", ",".join(results), total)
+        return {"results": results, "count": total}
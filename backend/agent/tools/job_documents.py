@@ -36,6 +36,7 @@ class JobDocumentsMixin:
             "Creates a new version — previous versions are preserved as history."
         ),
         args_schema=SaveJobDocumentInput,
+        mutating=True,
     )
     def save_job_document(self, job_id, doc_type, content, edit_summary=None):
         from backend.database import db
@@ -4,19 +4,53 @@ Supports three RapidAPI-based providers (all share the same API key):
   - JSearch: aggregated job listings from Google, Indeed, LinkedIn, etc.
   - Active Jobs DB (Fantastic.jobs): ATS/career-site jobs from 170k+ companies
   - LinkedIn Job Search (Fantastic.jobs): LinkedIn job postings
+
+Providers are queried concurrently.  Requests draw from a per-host token
+bucket shared by all threads (``integrations.job_search.requests_per_second``
+and ``.burst``), and a 429 pauses its host for the ``Retry-After`` delay.
+Results are merged once every provider has answered or
+``integrations.job_search.deadline_seconds`` have passed, whichever is
+first; providers still running by then are reported in ``warnings``.
+
+Successful provider responses are kept in the persistent response cache
+(``backend/response_cache.py``), keyed on the provider and its normalized
+request parameters, for ``integrations.job_search.cache.ttl_seconds.<provider>``
+seconds.  ``bypass_cache=True`` skips the lookup and refreshes the entry.
 """
 
 import logging
 import time
+from concurrent.futures import wait
 from typing import Optional
 
 import requests
 from pydantic import BaseModel, Field
 
+from backend import http_client, response_cache
+from backend.config_manager import get_int_config_value
+from backend.telemetry.context import TracedThreadPoolExecutor
+
+from ._rate_limit import HostRateLimiter, retry_after_seconds
 from ._registry import agent_tool
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DEADLINE_SECONDS = 20
+DEFAULT_HOST_REQUESTS_PER_SECOND = 2
+DEFAULT_HOST_BURST = 2
+
+# Job board results turn over within hours, not minutes
+DEFAULT_CACHE_TTL_SECONDS = 6 * 60 * 60
+DEFAULT_CACHE_MAX_MEGABYTES = 20
+
+# Shared by every job_search call in the process
+_RATE_LIMITER = HostRateLimiter(
+    "integrations.job_search", DEFAULT_HOST_REQUESTS_PER_SECOND, DEFAULT_HOST_BURST,
+)
+_CACHE = response_cache.get_cache(
+    "job_search", "integrations.job_search.cache", DEFAULT_CACHE_MAX_MEGABYTES,
+)
+
 
 class JobSearchInput(BaseModel):
     query: str = Field(description="Job search keywords")
@@ -29,6 +63,7 @@ class JobSearchInput(BaseModel):
     date_posted: Optional[str] = Field(default=None, description="Recency filter: 'today', '3days', 'week', 'month'")
     employment_type: Optional[str] = Field(default=None, description="'fulltime', 'parttime', 'contract', 'temporary'")
     sort_by: Optional[str] = Field(default=None, description="'relevance' or 'date'")
+    bypass_cache: Optional[bool] = Field(default=False, description="Skip cached results and query the providers again")
 
 
 # Maps our employment_type values to JSearch's expected format
@@ -65,32 +100,54 @@ def _normalize_result(result):
     }
 
 
-def _rapidapi_request(url, api_key, host, params, *, max_retries=3, timeout=30):
-    """Make a RapidAPI GET request with retry on 429 and timeouts."""
+class _DeadlineExceeded(requests.exceptions.Timeout):
+    """The job search deadline passed before the request could be made."""
+
+
+def _rapidapi_request(url, api_key, host, params, *, max_retries=3, timeout=30, deadline=None):
+    """Make a rate-limited RapidAPI GET request with retry on 429 and timeouts.
+
+    Requests go through the pooled ``backend.http_client`` session for
+    *host*, which also retries connection errors and 5xx responses.
+
+    Each attempt first takes a token from *host*'s bucket.  A 429 pauses
+    the bucket for the response's ``Retry-After`` delay (exponential
+    backoff if it has none) before the retry.  *deadline* is a
+    ``time.monotonic()`` value: attempts that can't start before it are
+    abandoned, and the request timeout is shortened to fit.
+    """
     headers = {
         "X-RapidAPI-Key": api_key,
         "X-RapidAPI-Host": host,
     }
+    bucket = _RATE_LIMITER.bucket(host)
     resp = None
     for attempt in range(max_retries + 1):
+        if not bucket.acquire(deadline):
+            raise _DeadlineExceeded(f"{host}: job search deadline reached while rate-limited")
+        attempt_timeout = timeout
+        if deadline is not None:
+            attempt_timeout = min(timeout, max(deadline - time.monotonic(), 0.1))
         try:
-            resp = requests.get(url, headers=headers, params=params, timeout=timeout)
+            resp = http_client.get(url, headers=headers, params=params, timeout=attempt_timeout)
             if resp.status_code == 429:
                 if attempt < max_retries:
-                    wait = 2 ** attempt  # 1s, 2s, 4s
+                    delay = retry_after_seconds(resp.headers.get("Retry-After"))
+                    if delay is None:
+                        delay = 2 ** attempt  # 1s, 2s, 4s
                     logger.warning(
-                        "%s 429 rate-limited (attempt %d/%d), retrying in %ds…",
-                        host, attempt + 1, max_retries, wait,
+                        "%s 429 rate-limited (attempt %d/%d), retrying in %.1fs…",
+                        host, attempt + 1, max_retries, delay,
                     )
-                    time.sleep(wait)
+                    bucket.pause(delay)
                     continue
             resp.raise_for_status()
             return resp
         except requests.exceptions.ReadTimeout:
-            if attempt < max_retries:
+            if attempt < max_retries and (deadline is None or time.monotonic() + 1 < deadline):
                 logger.warning("%s timeout (attempt %d/%d), retrying…",
                                host, attempt + 1, max_retries)
-                time.sleep(1)
+                bucket.pause(1)
                 continue
             raise
     # All retries exhausted — raise for the last response
@@ -99,19 +156,46 @@ def _rapidapi_request(url, api_key, host, params, *, max_retries=3, timeout=30):
     raise requests.exceptions.ConnectionError(f"Failed after {max_retries + 1} attempts to {host}")
 
 
-def _check_rapidapi_error(data):
-    """Check if a RapidAPI JSON response is an error/unsubscribed message.
+def _is_rapidapi_error(data):
+    """Whether a RapidAPI JSON response is an error/unsubscribed message.
 
     Some RapidAPI endpoints return HTTP 200 with a JSON body like
     ``{"message": "You are not subscribed..."}`` instead of an HTTP
-    error code.  Detect these and raise so callers treat them as failures.
+    error code.
     """
-    if isinstance(data, dict) and "message" in data and not any(
+    return isinstance(data, dict) and "message" in data and not any(
         k in data for k in ("data", "results", "jobs")
-    ):
+    )
+
+
+def _check_rapidapi_error(data):
+    """Raise if a RapidAPI JSON response is an error message, so callers
+    treat it as a failure."""
+    if _is_rapidapi_error(data):
         raise RuntimeError(f"RapidAPI error: {data['message']}")
 
 
+def _cached_rapidapi_json(provider, url, api_key, host, params, *, deadline=None, bypass_cache=False):
+    """Return *provider*'s JSON response for *params*, from the cache if fresh.
+
+    Misses (and every call with *bypass_cache*) go through
+    ``_rapidapi_request``; the response is stored unless it is an error
+    message.
+    """
+    key = response_cache.cache_key(provider, url, params)
+    if not bypass_cache:
+        data = _CACHE.get(key)
+        if data is not None:
+            logger.info("%s: serving cached response", provider)
+            return data
+    data = _rapidapi_request(url, api_key, host, params, deadline=deadline).json()
+    if not _is_rapidapi_error(data):
+        ttl = get_int_config_value(f"integrations.job_search.cache.ttl_seconds.{provider}",
+                                   DEFAULT_CACHE_TTL_SECONDS)
+        _CACHE.set(key, data, ttl)
+    return data
+
+
 def _parse_fantastic_jobs(jobs, source_name, num_results):
     """Parse results from Fantastic.jobs APIs (Active Jobs DB / LinkedIn Job Search).
 
@@ -172,7 +256,8 @@ class JobSearchMixin:
 
     def _search_jsearch(self, query, location=None, remote_only=False,
                         salary_min=None, salary_max=None, num_results=10,
-                        date_posted=None, employment_type=None, sort_by=None):
+                        date_posted=None, employment_type=None, sort_by=None,
+                        deadline=None, bypass_cache=False):
         """Query the JSearch (RapidAPI) job search API."""
         search_query = query
         if location:
@@ -189,11 +274,11 @@ class JobSearchMixin:
         if employment_type and employment_type in _JSEARCH_EMPLOYMENT_MAP:
             params["employment_types"] = _JSEARCH_EMPLOYMENT_MAP[employment_type]
 
-        resp = _rapidapi_request(
-            "https://jsearch.p.rapidapi.com/search",
+        data = _cached_rapidapi_json(
+            "jsearch", "https://jsearch.p.rapidapi.com/search",
             self.rapidapi_key, "jsearch.p.rapidapi.com", params,
-        )
-        data = resp.json().get("data", [])
+            deadline=deadline, bypass_cache=bypass_cache,
+        ).get("data", [])
 
         results = []
         for job in data:
@@ -229,7 +314,8 @@ class JobSearchMixin:
 
     def _search_active_jobs_db(self, query, location=None, remote_only=False,
                                salary_min=None, salary_max=None, num_results=10,
-                               date_posted=None, employment_type=None, sort_by=None):
+                               date_posted=None, employment_type=None, sort_by=None,
+                               deadline=None, bypass_cache=False):
         """Query the Active Jobs DB (Fantastic.jobs) API on RapidAPI."""
         params = {
             "title_filter": f'"{query}"',
@@ -243,11 +329,11 @@ class JobSearchMixin:
         if employment_type and employment_type in _FANTASTIC_EMPLOYMENT_MAP:
             params["ai_employment_type_filter"] = _FANTASTIC_EMPLOYMENT_MAP[employment_type]
 
-        resp = _rapidapi_request(
-            "https://active-jobs-db.p.rapidapi.com/active-ats-7d",
+        data = _cached_rapidapi_json(
+            "activejobs", "https://active-jobs-db.p.rapidapi.com/active-ats-7d",
             self.rapidapi_key, "active-jobs-db.p.rapidapi.com", params,
+            deadline=deadline, bypass_cache=bypass_cache,
         )
-        data = resp.json()
         _check_rapidapi_error(data)
         jobs = data if isinstance(data, list) else data.get("data", data.get("results", []))
         return _parse_fantastic_jobs(jobs, "activejobs", num_results)
@@ -256,7 +342,8 @@ class JobSearchMixin:
 
     def _search_linkedin_jobs(self, query, location=None, remote_only=False,
                               salary_min=None, salary_max=None, num_results=10,
-                              date_posted=None, employment_type=None, sort_by=None):
+                              date_posted=None, employment_type=None, sort_by=None,
+                              deadline=None, bypass_cache=False):
         """Query the LinkedIn Job Search (Fantastic.jobs) API on RapidAPI."""
         params = {
             "title_filter": f'"{query}"',
@@ -270,11 +357,11 @@ class JobSearchMixin:
         if employment_type and employment_type in _FANTASTIC_EMPLOYMENT_MAP:
             params["type_filter"] = _FANTASTIC_EMPLOYMENT_MAP[employment_type]
 
-        resp = _rapidapi_request(
-            "https://linkedin-job-search-api.p.rapidapi.com/active-jb-7d",
+        data = _cached_rapidapi_json(
+            "linkedin", "https://linkedin-job-search-api.p.rapidapi.com/active-jb-7d",
             self.rapidapi_key, "linkedin-job-search-api.p.rapidapi.com", params,
+            deadline=deadline, bypass_cache=bypass_cache,
         )
-        data = resp.json()
         _check_rapidapi_error(data)
         jobs = data if isinstance(data, list) else data.get("data", data.get("results", []))
         return _parse_fantastic_jobs(jobs, "linkedin", num_results)
@@ -301,7 +388,7 @@ class JobSearchMixin:
     def job_search(self, query, location=None, remote_only=False,
                    salary_min=None, salary_max=None, num_results=10,
                    provider=None, date_posted=None, employment_type=None,
-                   sort_by=None):
+                   sort_by=None, bypass_cache=False):
         num_results = min(num_results, 20)
 
         if not self.rapidapi_key:
@@ -319,27 +406,45 @@ class JobSearchMixin:
             salary_min=salary_min, salary_max=salary_max,
             num_results=num_results, date_posted=date_posted,
             employment_type=employment_type, sort_by=sort_by,
+            bypass_cache=bool(bypass_cache),
         )
 
         all_results = []
         warnings = []
         provider_used = []
 
-        for i, prov in enumerate(providers_to_use):
-            # Stagger provider calls to reduce 429 rate-limit risk
-            if i > 0:
-                time.sleep(0.5)
+        deadline_seconds = get_int_config_value("integrations.job_search.deadline_seconds",
+                                                DEFAULT_DEADLINE_SECONDS)
+        search_kwargs["deadline"] = time.monotonic() + deadline_seconds
+
+        def query_provider(prov):
             method_name, display_name = self._PROVIDERS[prov]
-            method = getattr(self, method_name)
+            logger.info("Querying %s for '%s'%s", display_name, query,
+                        f" in {location}" if location else "")
+            results = getattr(self, method_name)(**search_kwargs)
+            logger.info("%s returned %d result(s)", display_name, len(results))
+            return results
+
+        # Don't wait for stragglers on exit; they give up at the deadline
+        pool = TracedThreadPoolExecutor(max_workers=len(providers_to_use))
+        try:
+            futures = {prov: pool.submit(query_provider, prov) for prov in providers_to_use}
+            wait(futures.values(), timeout=deadline_seconds)
+        finally:
+            pool.shutdown(wait=False)
+
+        # Merge in provider order, whatever order they finished in
+        for prov, future in futures.items():
+            display_name = self._PROVIDERS[prov][1]
+            if not future.done():
+                logger.warning("%s did not answer within %ds", display_name, deadline_seconds)
+                warnings.append(f"{display_name} timed out after {deadline_seconds}s")
+                continue
             try:
-                logger.info("Querying %s for '%s'%s", display_name, query,
-                            f" in {location}" if location else "")
-                results = method(**search_kwargs)
-                logger.info("%s returned %d result(s)", display_name, len(results))
-                all_results.extend(results)
+                all_results.extend(future.result())
                 provider_used.append(prov)
             except Exception as e:
-                logger.exception("%s API error", display_name)
+                logger.error("%s API error: %s", display_name, e, exc_info=e)
                 warnings.append(f"{display_name} failed: {e}")
 
         if not provider_used:
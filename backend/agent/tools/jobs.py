@@ -1,10 +1,11 @@
-"""Job tracker tools — create_job, list_jobs, edit_job, remove_job."""
+"""Job tracker tools — create_job, list_jobs, edit_job(s), remove_job(s)."""
 
 import logging
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from backend.search import combine, match_all_terms, match_phrase, ranked_matches
 from backend.validation import VALID_STATUSES, VALID_REMOTE_TYPES, VALID_TODO_CATEGORIES
 from ._registry import agent_tool
 
@@ -39,10 +40,12 @@ class CreateJobInput(BaseModel):
 
 
 class ListJobsInput(BaseModel):
+    query: Optional[str] = Field(default=None, description="Full-text search across company, title, URL, location, tags, notes, requirements and nice-to-haves; results are ranked by relevance")
     status: Optional[str] = Field(default=None, description="Filter by status (saved, applied, interviewing, offer, rejected)")
-    company: Optional[str] = Field(default=None, description="Filter by company (case-insensitive substring match)")
-    title: Optional[str] = Field(default=None, description="Filter by title (case-insensitive substring match)")
-    url: Optional[str] = Field(default=None, description="Filter by URL (case-insensitive substring match)")
+    company: Optional[str] = Field(default=None, description="Filter by company (case-insensitive word/prefix match)")
+    title: Optional[str] = Field(default=None, description="Filter by title (case-insensitive word/prefix match)")
+    url: Optional[str] = Field(default=None, description="Filter by URL (case-insensitive word/prefix match)")
+    tags: Optional[str] = Field(default=None, description="Filter by tags, comma-separated (case-insensitive); jobs must have every tag")
     limit: int = Field(default=20, description="Max results")
 
 
@@ -70,6 +73,30 @@ class RemoveJobInput(BaseModel):
     job_id: int = Field(description="ID of the job to remove")
 
 
+class EditJobsInput(BaseModel):
+    job_ids: list[int] = Field(description="IDs of the jobs to edit; every job receives the same changes")
+    company: Optional[str] = Field(default=None, description="Updated company name")
+    title: Optional[str] = Field(default=None, description="Updated job title")
+    url: Optional[str] = Field(default=None, description="Updated job posting URL")
+    status: Optional[str] = Field(default=None, description="Updated status (saved, applied, interviewing, offer, rejected)")
+    notes: Optional[str] = Field(default=None, description="Updated notes")
+    salary_min: Optional[int] = Field(default=None, description="Updated minimum salary")
+    salary_max: Optional[int] = Field(default=None, description="Updated maximum salary")
+    location: Optional[str] = Field(default=None, description="Updated job location")
+    remote_type: Optional[str] = Field(default=None, description="Updated remote type (onsite, hybrid, remote)")
+    tags: Optional[str] = Field(default=None, description="Updated comma-separated tags")
+    contact_name: Optional[str] = Field(default=None, description="Updated contact name")
+    contact_email: Optional[str] = Field(default=None, description="Updated contact email")
+    source: Optional[str] = Field(default=None, description="Updated job source")
+    requirements: Optional[str] = Field(default=None, description="Updated requirements (newline-separated)")
+    nice_to_haves: Optional[str] = Field(default=None, description="Updated nice-to-haves (newline-separated)")
+    job_fit: Optional[int] = Field(default=None, description="Updated job fit rating 0-5")
+
+
+class RemoveJobsInput(BaseModel):
+    job_ids: list[int] = Field(description="IDs of the jobs to remove")
+
+
 
 
 
@@ -104,6 +131,7 @@ class JobsMixin:
     @agent_tool(
         description="Add a new job application to the tracker.",
         args_schema=CreateJobInput,
+        mutating=True,
     )
     def create_job(self, company, title, url=None, status=None, notes=None,
                    salary_min=None, salary_max=None, location=None,
@@ -144,24 +172,41 @@ class JobsMixin:
         return {"job": job.to_dict()}
 
     @agent_tool(
-        description="List and search jobs in the tracker database. Returns jobs sorted by newest first.",
+        description=(
+            "List and search jobs in the tracker database. Returns jobs sorted by "
+            "newest first, or by relevance when a full-text query is given."
+        ),
         args_schema=ListJobsInput,
     )
-    def list_jobs(self, limit=20, status=None, company=None, title=None, url=None):
+    def list_jobs(self, limit=20, query=None, status=None, company=None, title=None, url=None,
+                  tags=None):
         from backend.models.job import Job
+        from backend.models.job_tag import jobs_with_all_tags
 
-        query = Job.query
+        q = Job.query
         if status:
             if status not in VALID_STATUSES:
                 return {"error": f"Invalid status '{status}'. Must be one of: {', '.join(sorted(VALID_STATUSES))}"}
-            query = query.filter(Job.status == status)
-        if company:
-            query = query.filter(Job.company.ilike(f"%{company}%"))
-        if title:
-            query = query.filter(Job.title.ilike(f"%{title}%"))
-        if url:
-            query = query.filter(Job.url.ilike(f"%{url}%"))
-        jobs = query.order_by(Job.created_at.desc()).limit(limit).all()
+            q = q.filter(Job.status == status)
+        if tags and tags.strip(", "):
+            q = q.filter(Job.id.in_(jobs_with_all_tags([tags])))
+
+        # Text filters go through the FTS5 index instead of LIKE scans
+        expression = combine(
+            match_all_terms(query),
+            match_phrase(company, "company"),
+            match_phrase(title, "title"),
+            match_phrase(url, "url"),
+        )
+        if expression:
+            matches = ranked_matches("jobs", expression)
+            q = q.join(matches, matches.c.rowid == Job.id)
+
+        if expression and query:
+            q = q.order_by(matches.c.score, Job.created_at.desc())
+        else:
+            q = q.order_by(Job.created_at.desc())
+        jobs = q.limit(limit).all()
         return {"jobs": [j.to_dict() for j in jobs], "count": len(jobs)}
 
     @agent_tool(
@@ -170,6 +215,7 @@ class JobsMixin:
             "provide will be updated; omitted fields remain unchanged."
         ),
         args_schema=EditJobInput,
+        mutating=True,
     )
     def edit_job(self, job_id, company=None, title=None, url=None, status=None,
                  notes=None, salary_min=None, salary_max=None, location=None,
@@ -210,6 +256,7 @@ class JobsMixin:
     @agent_tool(
         description="Remove a job application from the tracker. This permanently deletes the job and its associated application todos.",
         args_schema=RemoveJobInput,
+        mutating=True,
     )
     def remove_job(self, job_id):
         from backend.database import db
@@ -237,6 +284,64 @@ class JobsMixin:
         logger.info("remove_job: id=%d company=%s title=%s", job_id, job_summary["company"], job_summary["title"])
         return {"deleted": job_summary}
 
+    @agent_tool(
+        description=(
+            "Apply the same changes to several jobs at once (e.g. mark them all "
+            "as applied). All jobs are updated in one transaction: if any job is "
+            "missing or a value is invalid, nothing is changed."
+        ),
+        args_schema=EditJobsInput,
+        mutating=True,
+    )
+    def edit_jobs(self, job_ids, **changes):
+        from backend.job_batch import apply_job_updates, missing_job_ids, validate_job_updates
+
+        updates = {f: changes[f] for f in _EDITABLE_FIELDS if changes.get(f) is not None}
+        if not updates:
+            return {"error": "No fields to update — provide at least one field to change"}
+        job_ids = list(dict.fromkeys(job_ids))
+        if not job_ids:
+            return {"error": "job_ids must not be empty"}
+
+        cleaned, errors = validate_job_updates([{"id": job_id, **updates} for job_id in job_ids])
+        if errors:
+            messages = dict.fromkeys(m for e in errors for m in e["errors"])
+            return {"error": "; ".join(messages)}
+        missing = missing_job_ids(job_ids)
+        if missing:
+            return {"error": f"Jobs not found: {', '.join(map(str, missing))}"}
+
+        jobs = apply_job_updates(cleaned)
+        logger.info("edit_jobs: ids=%s updated_fields=%s", job_ids, list(updates.keys()))
+        return {
+            "jobs": [j.to_dict() for j in jobs],
+            "updated_fields": list(updates.keys()),
+            "count": len(jobs),
+        }
+
+    @agent_tool(
+        description=(
+            "Remove several job applications from the tracker in one transaction. "
+            "Permanently deletes the jobs and their todos and documents; if any "
+            "job is missing, nothing is deleted."
+        ),
+        args_schema=RemoveJobsInput,
+        mutating=True,
+    )
+    def remove_jobs(self, job_ids):
+        from backend.job_batch import delete_jobs, missing_job_ids, validate_job_ids
+
+        job_ids, errors = validate_job_ids(list(dict.fromkeys(job_ids)))
+        if errors:
+            return {"error": "; ".join(errors)}
+        missing = missing_job_ids(job_ids)
+        if missing:
+            return {"error": f"Jobs not found: {', '.join(map(str, missing))}"}
+
+        deleted = delete_jobs(job_ids)
+        logger.info("remove_jobs: ids=%s", job_ids)
+        return {"deleted": deleted, "count": len(deleted)}
+
     # ------------------------------------------------------------------
     # Application Todo tools
     # ------------------------------------------------------------------
@@ -267,6 +372,7 @@ class JobsMixin:
     @agent_tool(
         description="Add an application todo item to a job (e.g. documents to prepare, questions to research, assessments to complete).",
         args_schema=AddJobTodoInput,
+        mutating=True,
     )
     def add_job_todo(self, job_id, title, category=None, description=None, completed=None):
         from backend.database import db
@@ -302,6 +408,7 @@ class JobsMixin:
     @agent_tool(
         description="Edit an existing application todo item. Only provided fields are updated.",
         args_schema=EditJobTodoInput,
+        mutating=True,
     )
     def edit_job_todo(self, job_id, todo_id, title=None, category=None,
                       description=None, completed=None, sort_order=None):
@@ -348,6 +455,7 @@ class JobsMixin:
     @agent_tool(
         description="Remove an application todo item from a job.",
         args_schema=RemoveJobTodoInput,
+        mutating=True,
     )
     def remove_job_todo(self, job_id, todo_id):
         from backend.database import db
@@ -42,6 +42,7 @@ class ProfileMixin:
             "without overwriting the rest. Omit 'section' to replace the entire profile."
         ),
         args_schema=UpdateUserProfileInput,
+        mutating=True,
     )
     def update_user_profile(self, content: str, section: Optional[str] = None):
         from backend.agent.user_profile import write_profile, write_profile_section, read_profile
@@ -1,11 +1,19 @@
-"""scrape_url tool — fetch and return plain text from a web page."""
+"""scrape_url and scrape_urls tools — fetch and return plain text from web pages.
+
+Extracts are cached on disk and revalidated against the page (see ``_tavily.py``).
+``scrape_urls`` sends every uncached URL to Tavily in as few extract
+requests as its per-request limit allows, instead of one request per page.
+"""
 
 from typing import Optional
 
 from pydantic import BaseModel, Field
-from tavily import TavilyClient
 
 from ._registry import agent_tool
+from ._tavily import cached_extract
+
+# Characters of page text returned per URL
+MAX_CONTENT_CHARS = 6000
 
 
 class ScrapeUrlInput(BaseModel):
@@ -16,6 +24,14 @@ class ScrapeUrlInput(BaseModel):
     )
 
 
+class ScrapeUrlsInput(BaseModel):
+    urls: list[str] = Field(description="The URLs to scrape")
+    query: Optional[str] = Field(
+        default=None,
+        description="Optional query used to re-rank every page's extracted content for relevance",
+    )
+
+
 class ScrapeUrlMixin:
     @agent_tool(
         description="Scrape a web page and return its text content.",
@@ -24,15 +40,30 @@ class ScrapeUrlMixin:
     def scrape_url(self, url, query=None):
         if not self.search_api_key:
             return {"error": "No Tavily API key configured. Set SEARCH_API_KEY or configure it in Settings."}
-        client = TavilyClient(api_key=self.search_api_key)
-        kwargs = {"extract_depth": "advanced"}
-        if query:
-            kwargs["query"] = query
-        response = client.extract(urls=url, **kwargs)
-        results = response.get("results", [])
-        if not results:
-            return {"error": f"Failed to extract content from {url}"}
-        content = results[0].get("raw_content", "")
-        if len(content) > 6000:
-            content = content[:6000]
+        results, failures = cached_extract(self.search_api_key, [url], "advanced", query)
+        if url not in results:
+            return {"error": f"Failed to extract content from {url}: {failures.get(url)}"}
+        content = (results[url].get("raw_content") or "")[:MAX_CONTENT_CHARS]
         return {"content": content, "url": url}
+
+    @agent_tool(
+        description=(
+            "Scrape several web pages at once and return each one's text content. "
+            "Prefer this over repeated scrape_url calls when you have more than one URL."
+        ),
+        args_schema=ScrapeUrlsInput,
+    )
+    def scrape_urls(self, urls, query=None):
+        if not self.search_api_key:
+            return {"error": "No Tavily API key configured. Set SEARCH_API_KEY or configure it in Settings."}
+        urls = [u for u in dict.fromkeys(urls) if u]
+        if not urls:
+            return {"error": "No URLs given"}
+        results, failures = cached_extract(self.search_api_key, urls, "advanced", query)
+        return {
+            "results": {
+                url: {"content": (results[url].get("raw_content") or "")[:MAX_CONTENT_CHARS]}
+                for url in urls if url in results
+            },
+            "failed": failures,
+        }
@@ -5,6 +5,7 @@ from typing import Annotated, Optional
 
 from pydantic import BaseModel, BeforeValidator, Field
 
+from backend.search import match_all_terms, ranked_matches
 from backend.validation import VALID_REMOTE_TYPES
 from ._registry import agent_tool
 
@@ -45,6 +46,7 @@ class AddSearchResultInput(BaseModel):
 
 class ListSearchResultsInput(BaseModel):
     min_fit: CoercedOptionalInt = Field(default=None, description="Minimum fit rating 0-5")
+    query: Optional[str] = Field(default=None, description="Full-text search across company, title, location, description, requirements and fit reason")
 
 
 class SearchResultsMixin:
@@ -54,6 +56,7 @@ class SearchResultsMixin:
             "rated >=3/5 stars. Include structured data and a fit_reason."
         ),
         args_schema=AddSearchResultInput,
+        mutating=True,
     )
     def add_search_result(self, company, title, job_fit, url=None,
                           salary_min=None, salary_max=None, location=None,
@@ -107,23 +110,30 @@ class SearchResultsMixin:
         description="List job search results from the current conversation.",
         args_schema=ListSearchResultsInput,
     )
-    def list_search_results(self, min_fit=None):
+    def list_search_results(self, min_fit=None, query=None):
         from backend.models.search_result import SearchResult
 
         if not self.conversation_id:
             return {"error": "No conversation context — cannot query search results"}
 
-        query = SearchResult.query.filter_by(conversation_id=self.conversation_id)
+        q = SearchResult.query.filter_by(conversation_id=self.conversation_id)
 
         if min_fit is not None:
             if not (0 <= min_fit <= 5):
                 return {"error": "min_fit must be between 0 and 5"}
-            query = query.filter(SearchResult.job_fit >= min_fit)
+            q = q.filter(SearchResult.job_fit >= min_fit)
 
-        results = query.order_by(SearchResult.created_at.desc()).all()
+        expression = match_all_terms(query)
+        if expression:
+            matches = ranked_matches("search_results", expression)
+            q = q.join(matches, matches.c.rowid == SearchResult.id)
+            q = q.order_by(matches.c.score, SearchResult.created_at.desc())
+        else:
+            q = q.order_by(SearchResult.created_at.desc())
+        results = q.all()
 
         logger.info(
-            "list_search_results: conversation_id=%d count=%d min_fit=%s",
-            self.conversation_id, len(results), min_fit,
+            "list_search_results: conversation_id=%d count=%d min_fit=%s query=%s",
+            self.conversation_id, len(results), min_fit, bool(expression),
         )
         return {"results": [r.to_dict() for r in results], "count": len(results)}
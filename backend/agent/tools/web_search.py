@@ -1,9 +1,12 @@
-"""web_search and web_research tools — Tavily web search and research."""
+"""web_search and web_research tools — Tavily web search and research.
+
+Responses are cached on disk (see ``_tavily.py``).
+"""
 
 from pydantic import BaseModel, Field
-from tavily import TavilyClient
 
 from ._registry import agent_tool
+from ._tavily import cached_research, cached_search
 
 
 class WebSearchInput(BaseModel):
@@ -28,9 +31,8 @@ class WebSearchMixin:
     def web_search(self, query, num_results=5):
         if not self.search_api_key:
             return {"error": "No Tavily API key configured. Set SEARCH_API_KEY or configure it in Settings."}
-        client = TavilyClient(api_key=self.search_api_key)
-        response = client.search(
-            query=query,
+        response = cached_search(
+            self.search_api_key, query,
             max_results=min(num_results, 10),
             include_answer="advanced",
         )
@@ -60,11 +62,7 @@ class WebSearchMixin:
     def web_research(self, query):
         if not self.search_api_key:
             return {"error": "No Tavily API key configured. Set SEARCH_API_KEY or configure it in Settings."}
-        client = TavilyClient(api_key=self.search_api_key)
-        response = client.research(
-            input=query,
-            model="mini",
-        )
+        response = cached_research(self.search_api_key, query, model="mini", cancel_token=self.cancel_token)
         return {
             "report": response.get("response", ""),
             "sources": response.get("sources", []),
@@ -0,0 +1,385 @@
+"""Agent runs with numbered, replayable event streams.
+
+Each chat or onboarding request starts an ``AgentRun``.  A background
+thread drives the agent and appends every event to the run's replay
+buffer, numbered from 1.  SSE responses tail that buffer instead of
+the agent itself.  A client whose connection drops (tab reload, proxy
+timeout) can therefore reattach with ``GET /api/chat/runs/<run_id>/events``
+and ``Last-Event-ID``, and receive the events it missed while the agent
+kept working.
+
+The buffer is the only queue between the agent and a slow client, so its
+slow-consumer policy lives here.  Once it holds more than ``max_events``
+events, every run of adjacent plain ``text_delta`` events is merged into
+one event carrying the last ID of the run; a client whose cursor falls
+inside a merged run receives only the text after it.  Control events
+(``tool_start``, ``done``, ``error``, ...) are never merged or dropped, so
+no event is lost and only control events and the text between them can
+take the buffer past the limit.
+
+Runs live in ``app.extensions["agent_runs"]``.  Finished runs stay
+reattachable for ``RUN_RETENTION_SECONDS``.
+
+The registry is also the app's agent executor.  At most
+``agent.runs.max_concurrent`` runs execute at once.  Further runs wait in a
+FIFO queue and receive ``queued`` events with their position.  Two runs of
+the same conversation never execute at the same time: a queued run is
+skipped, without blocking the runs behind it, until its conversation's
+current run finishes.
+
+While a run is quiet (a long tool call, a slow model), its streams send an
+SSE comment every ``agent.streaming.heartbeat_seconds`` so idle-timeout
+proxies keep the connection open.
+
+A run shares its agent's ``CancelToken``.  ``cancel()`` (behind
+``POST /api/chat/runs/<run_id>/cancel``) cancels it directly.  When the
+last attached stream goes away before the run ends, the run is cancelled
+unless a client reattaches within ``agent.streaming.disconnect_grace_seconds``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import uuid
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Callable, Generator
+
+from flask import current_app
+
+from backend.agent.cancellation import CancelToken
+from backend.config_manager import get_int_config_value
+from backend.database import db
+
+logger = logging.getLogger(__name__)
+
+# Events kept per run before adjacent text deltas are merged
+RUN_BUFFER_EVENTS = 5000
+
+# How long a finished run can still be reattached to
+RUN_RETENTION_SECONDS = 300
+
+DEFAULT_HEARTBEAT_SECONDS = 15
+
+DEFAULT_MAX_CONCURRENT_RUNS = 4
+
+# Seconds a run without attached streams waits for a reattach before it is
+# cancelled; negative disables cancelling on disconnect
+DEFAULT_DISCONNECT_GRACE_SECONDS = 30
+
+# SSE comment line; EventSource and our fetch reader both ignore it
+HEARTBEAT_FRAME = ": keepalive\n\n"
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def _is_plain_text(event_type: str, data: dict) -> bool:
+    return event_type == "text_delta" and data.keys() == {"content"}
+
+
+def sse_frame(event_type: str, data: dict, event_id: int | None = None) -> str:
+    """Format one Server-Sent Events message."""
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event_type}\ndata: {json.dumps(data)}\n\n"
+
+
+class AgentRun:
+    """One agent invocation and its buffer of numbered events."""
+
+    def __init__(self, conversation_id: int | None, max_events: int = RUN_BUFFER_EVENTS,
+                 cancel_token: CancelToken | None = None,
+                 on_cancel: Callable[[AgentRun], None] | None = None):
+        self.id = uuid.uuid4().hex
+        self.conversation_id = conversation_id
+        self.created_at = time.time()
+        # Set when the run leaves the queue and starts executing
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.queue_position: int | None = None
+        self.cancel_token = cancel_token or CancelToken()
+        self._on_cancel = on_cancel
+        self._events: deque[tuple[int, str, dict]] = deque()
+        self._max_events = max(1, max_events)
+        self._compact_at = self._max_events
+        # Merged text_delta ID -> (ID, content offset) of each event merged into it
+        self._merged: dict[int, list[tuple[int, int]]] = {}
+        self._last_id = 0
+        self._streams = 0
+        self._cond = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    @property
+    def status(self) -> str:
+        if self.finished_at is not None:
+            return "finished"
+        return "running" if self.started_at is not None else "queued"
+
+    @property
+    def last_event_id(self) -> int:
+        return self._last_id
+
+    def emit(self, event_type: str, data: dict) -> int:
+        """Append an event and wake any attached streams; return its ID."""
+        with self._cond:
+            self._last_id += 1
+            self._events.append((self._last_id, event_type, data))
+            if len(self._events) > self._compact_at:
+                self._compact_locked()
+            self._cond.notify_all()
+            return self._last_id
+
+    def _compact_locked(self) -> None:
+        """Merge each run of adjacent plain ``text_delta`` events into one.
+
+        If control events alone keep the buffer past the limit, the next
+        compaction waits until it has doubled, so emit() stays cheap.
+        """
+        compacted: deque[tuple[int, str, dict]] = deque()
+        for event in self._events:
+            event_id, event_type, data = event
+            if compacted and _is_plain_text(event_type, data) and _is_plain_text(*compacted[-1][1:]):
+                prev_id, _, prev = compacted.pop()
+                segments = self._merged.pop(prev_id, None) or [(prev_id, 0)]
+                offset = len(prev["content"])
+                merged = self._merged.pop(event_id, None) or [(event_id, 0)]
+                segments.extend((i, offset + o) for i, o in merged)
+                self._merged[event_id] = segments
+                event = (event_id, "text_delta", {"content": prev["content"] + data["content"]})
+            compacted.append(event)
+        self._events = compacted
+        self._compact_at = max(self._max_events, 2 * len(compacted))
+
+    def _slice_locked(self, event: tuple[int, str, dict], last_event_id: int) -> tuple[int, str, dict]:
+        """The part of *event* after *last_event_id*, for a cursor inside a merged run."""
+        segments = self._merged.get(event[0])
+        if not segments or segments[0][0] > last_event_id:
+            return event
+        offset = segments[bisect_right(segments, (last_event_id, float("inf")))][1]
+        return event[0], event[1], {"content": event[2]["content"][offset:]}
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Ask the agent to stop at its next cancellation check."""
+        self.cancel_token.cancel(reason)
+        if self._on_cancel is not None:
+            self._on_cancel(self)
+
+    def finish(self) -> None:
+        """Mark the run complete; attached streams end after the last event."""
+        with self._cond:
+            if self.finished_at is None:
+                self.finished_at = time.time()
+            self._cond.notify_all()
+
+    def events_after(self, last_event_id: int, timeout: float | None = None) -> list[tuple[int, str, dict]]:
+        """Return buffered events newer than *last_event_id*.
+
+        Waits up to *timeout* seconds for one to arrive if there are none
+        and the run is still going.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._last_id > last_event_id or self.finished, timeout)
+            return [self._slice_locked(e, last_event_id) for e in self._events if e[0] > last_event_id]
+
+    def stream(self, last_event_id: int = 0, heartbeat_seconds: float | None = None,
+               disconnect_grace_seconds: float | None = None) -> Generator[str, None, None]:
+        """Yield SSE frames for events after *last_event_id* until the run ends.
+
+        Events that are ready together are written as one chunk, and a
+        heartbeat comment is written after *heartbeat_seconds* without any.
+
+        If the stream is closed early (the client went away) and no other
+        stream is attached, the run is cancelled after
+        *disconnect_grace_seconds* unless a client reattaches first.
+        """
+        if heartbeat_seconds is None:
+            heartbeat_seconds = get_int_config_value("agent.streaming.heartbeat_seconds",
+                                                     DEFAULT_HEARTBEAT_SECONDS)
+        if disconnect_grace_seconds is None:
+            disconnect_grace_seconds = get_int_config_value("agent.streaming.disconnect_grace_seconds",
+                                                            DEFAULT_DISCONNECT_GRACE_SECONDS)
+        timeout = heartbeat_seconds if heartbeat_seconds > 0 else None
+        with self._cond:
+            self._streams += 1
+        try:
+            cursor = last_event_id
+            while True:
+                events = self.events_after(cursor, timeout=timeout)
+                if events:
+                    frames = [sse_frame(event_type, data, event_id) for event_id, event_type, data in events]
+                    cursor = events[-1][0]
+                    yield "".join(frames)
+                elif self.finished and cursor >= self._last_id:
+                    return
+                else:
+                    yield HEARTBEAT_FRAME
+        finally:
+            with self._cond:
+                self._streams -= 1
+                orphaned = self._streams == 0 and not self.finished
+            if orphaned and disconnect_grace_seconds >= 0:
+                self._cancel_if_orphaned_after(disconnect_grace_seconds)
+
+    def _cancel_if_orphaned_after(self, delay: float) -> None:
+        def cancel_if_orphaned():
+            with self._cond:
+                orphaned = self._streams == 0 and not self.finished
+            if orphaned:
+                logger.info("Cancelling agent run %s: client disconnected", self.id)
+                self.cancel("client disconnected")
+
+        if delay == 0:
+            cancel_if_orphaned()
+            return
+        timer = threading.Timer(delay, cancel_if_orphaned)
+        timer.daemon = True
+        timer.start()
+
+    def to_dict(self) -> dict:
+        return {
+            "run_id": self.id,
+            "conversation_id": self.conversation_id,
+            "status": self.status,
+            "queue_position": self.queue_position,
+            "finished": self.finished,
+            "cancelled": self.cancel_token.cancelled,
+            "last_event_id": self.last_event_id,
+        }
+
+
+class RunRegistry:
+    """Thread-safe map of run ID -> ``AgentRun`` that also schedules runs.
+
+    Runs execute on their own threads, at most *max_concurrent* at once and
+    one per conversation; the rest wait in FIFO order.  Expired runs are
+    pruned on access.
+    """
+
+    def __init__(self, retention_seconds: float = RUN_RETENTION_SECONDS,
+                 max_concurrent: int = DEFAULT_MAX_CONCURRENT_RUNS):
+        self.retention_seconds = retention_seconds
+        self.max_concurrent = max(1, max_concurrent)
+        self._lock = threading.Lock()
+        self._runs: dict[str, AgentRun] = {}
+        self._queue: deque[tuple[AgentRun, Callable[[AgentRun], None], object]] = deque()
+        self._active: dict[str, AgentRun] = {}
+        self._busy_conversations: set[int] = set()
+
+    def start(self, conversation_id: int | None, target: Callable[[AgentRun], None],
+              cancel_token: CancelToken | None = None) -> AgentRun:
+        """Register a run and call ``target(run)`` on a background thread.
+
+        The call happens as soon as a slot is free and no other run of the
+        conversation is executing; until then the run is queued.  *target*
+        runs inside an app context and emits the run's events; the run is
+        finished when it returns or raises.  *cancel_token* is the token the
+        run's agent checks.
+        """
+        app = current_app._get_current_object()
+        run = AgentRun(conversation_id, cancel_token=cancel_token, on_cancel=self._drop_if_queued)
+        with self._lock:
+            self._prune()
+            self._runs[run.id] = run
+            self._queue.append((run, target, app))
+            self._dispatch_locked()
+        return run
+
+    def _dispatch_locked(self) -> None:
+        """Start every queued run that may run now; renumber the rest."""
+        i = 0
+        while i < len(self._queue) and len(self._active) < self.max_concurrent:
+            run, target, app = self._queue[i]
+            if run.conversation_id is not None and run.conversation_id in self._busy_conversations:
+                i += 1
+                continue
+            del self._queue[i]
+            self._active[run.id] = run
+            if run.conversation_id is not None:
+                self._busy_conversations.add(run.conversation_id)
+            run.started_at = time.time()
+            run.queue_position = None
+            threading.Thread(
+                target=self._drive, args=(app, run, target), daemon=True,
+                name=f"agent-run-{run.id[:8]}",
+            ).start()
+        for position, (run, _, _) in enumerate(self._queue, 1):
+            if run.queue_position != position:
+                run.queue_position = position
+                run.emit("queued", {"position": position})
+
+    def _drive(self, app, run: AgentRun, target: Callable[[AgentRun], None]) -> None:
+        with app.app_context():
+            try:
+                target(run)
+            except Exception:
+                logger.exception("Agent run %s failed", run.id)
+                run.emit("error", {"message": "An unexpected error occurred. Please try again."})
+            finally:
+                run.finish()
+                db.session.remove()
+                with self._lock:
+                    self._active.pop(run.id, None)
+                    self._busy_conversations.discard(run.conversation_id)
+                    self._dispatch_locked()
+
+    def _drop_if_queued(self, run: AgentRun) -> None:
+        """End a cancelled run that never started."""
+        with self._lock:
+            entries = [entry for entry in self._queue if entry[0] is run]
+            if not entries:
+                return
+            self._queue.remove(entries[0])
+            run.queue_position = None
+            run.emit("cancelled", {"reason": run.cancel_token.reason})
+            run.finish()
+            self._dispatch_locked()
+
+    def stats(self) -> dict:
+        """Gauges: executing and queued runs, the limit, and retained runs."""
+        with self._lock:
+            self._prune()
+            return {
+                "active": len(self._active),
+                "queued": len(self._queue),
+                "max_concurrent": self.max_concurrent,
+                "retained": len(self._runs),
+            }
+
+    def get(self, run_id: str) -> AgentRun | None:
+        with self._lock:
+            self._prune()
+            return self._runs.get(run_id)
+
+    def for_conversation(self, conversation_id: int) -> list[AgentRun]:
+        """Retained runs of a conversation, oldest first."""
+        with self._lock:
+            self._prune()
+            runs = [r for r in self._runs.values() if r.conversation_id == conversation_id]
+        return sorted(runs, key=lambda r: r.created_at)
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention_seconds
+        expired = [rid for rid, r in self._runs.items()
+                   if r.finished_at is not None and r.finished_at < cutoff]
+        for rid in expired:
+            del self._runs[rid]
+
+
+def init_app(app):
+    """Attach an empty run registry to *app*."""
+    app.extensions["agent_runs"] = RunRegistry(
+        max_concurrent=get_int_config_value("agent.runs.max_concurrent", DEFAULT_MAX_CONCURRENT_RUNS),
+    )
+
+
+def get_runs() -> RunRegistry:
+    """Return the current app's run registry."""
+    return current_app.extensions["agent_runs"]
@@ -8,13 +8,15 @@ from werkzeug.exceptions import HTTPException
 
 from backend.config import Config
 from backend.data_dir import get_data_dir
-from backend.database import db
+from backend import agent_runs, job_stats, table_versions
+from backend.database import configure_sqlite, db
 from backend.routes.jobs import jobs_bp
 from backend.routes.chat import chat_bp
 from backend.routes.profile import profile_bp
 from backend.routes.config import config_bp
 from backend.routes.resume import resume_bp
 from backend.routes.job_documents import job_documents_bp
+from backend.routes.search import search_bp
 
 migrate = Migrate(render_as_batch=True)
 
@@ -76,9 +78,13 @@ def create_app(config_class=Config):
 
     _setup_logging(app.config.get("LOG_LEVEL", "INFO"))
 
-    CORS(app)
+    CORS(app, expose_headers=["X-Next-Cursor", "ETag", "X-Run-Id"])
+    configure_sqlite(app.config.get("SQLITE_PROFILE"), app.config.get("SQLITE_PRAGMAS"))
     db.init_app(app)
     migrate.init_app(app, db)
+    table_versions.init_app(app)
+    job_stats.init_app(app)
+    agent_runs.init_app(app)
 
     with app.app_context():
         _apply_migrations(app)
@@ -91,6 +97,7 @@ def create_app(config_class=Config):
     app.register_blueprint(config_bp)
     app.register_blueprint(resume_bp)
     app.register_blueprint(job_documents_bp)
+    app.register_blueprint(search_bp)
 
     # Initialize telemetry (if enabled)
     _init_telemetry()
@@ -124,7 +131,9 @@ def _apply_migrations(app):
 
     inspector = db.inspect(db.engine)
     existing_tables = set(inspector.get_table_names())
-    has_app_tables = bool(existing_tables - {"alembic_version"})
+    # Only model tables count — FTS index tables can outlive their content
+    # tables when a database is partially wiped.
+    has_app_tables = bool(existing_tables & set(db.metadata.tables))
 
     # Check if Alembic is already tracking this database
     has_version = False
@@ -17,3 +17,8 @@ class Config:
 
     # Logging level — read by create_app() in app.py
     LOG_LEVEL = get_config_value("logging.level", "INFO")
+
+    # SQLite pragma profile and per-pragma overrides — applied by
+    # configure_sqlite() in create_app() (see backend/database.py)
+    SQLITE_PROFILE = get_config_value("database.sqlite_profile", "performance")
+    SQLITE_PRAGMAS = get_config_value("database.pragmas", {})
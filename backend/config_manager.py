@@ -28,7 +28,8 @@ DEFAULT_CONFIG = {
     "llm": {
         "provider": "anthropic",
         "api_key": "",
-        "model": ""
+        "model": "",
+        "prompt_caching": False
     },
     "onboarding_llm": {
         "provider": "",
@@ -51,15 +52,64 @@ DEFAULT_CONFIG = {
             "provider": "",
             "api_key": "",
             "model": ""
+        },
+        "context": {
+            "budget_tokens": 24000,
+            "tool_result_max_tokens": 4000,
+            "summary_max_tokens": 600
+        },
+        "streaming": {
+            "coalesce_ms": 25,
+            "coalesce_bytes": 1024,
+            "heartbeat_seconds": 15,
+            "disconnect_grace_seconds": 30
+        },
+        "runs": {
+            "max_concurrent": 4
         }
     },
     "integrations": {
         "search_api_key": "",
-        "rapidapi_key": ""
+        "rapidapi_key": "",
+        "job_search": {
+            "deadline_seconds": 20,
+            "requests_per_second": 2,
+            "burst": 2,
+            "cache": {
+                "max_megabytes": 20,
+                "ttl_seconds": {
+                    "jsearch": 21600,
+                    "activejobs": 21600,
+                    "linkedin": 21600
+                }
+            }
+        },
+        "tavily": {
+            "research_timeout_seconds": 300,
+            "cache": {
+                "max_megabytes": 100,
+                "max_stale_seconds": 604800,
+                "ttl_seconds": {
+                    "search": 21600,
+                    "extract": 86400,
+                    "research": 259200
+                }
+            }
+        }
+    },
+    "http": {
+        "pool_maxsize": 8,
+        "max_retries": 2,
+        "connect_timeout_seconds": 5,
+        "read_timeout_seconds": 30
     },
     "logging": {
         "level": "INFO"
     },
+    "database": {
+        "sqlite_profile": "performance",
+        "pragmas": {}
+    },
     "telemetry": {
         "enabled": True,
         "retention_days": 90
@@ -146,6 +196,19 @@ def get_config_value(key_path: str, default: Any = None) -> Any:
     return value if value != "" else default
 
 
+def get_int_config_value(key_path: str, default: int) -> int:
+    """
+    Get an integer configuration value, falling back to *default*.
+
+    Environment overrides arrive as strings; values that don't parse as
+    integers are ignored.
+    """
+    try:
+        return int(get_config_value(key_path, default))
+    except (TypeError, ValueError):
+        return default
+
+
 def update_config_value(key_path: str, value: Any) -> bool:
     """
     Update a configuration value by dot-separated path.
@@ -187,6 +250,19 @@ def get_llm_config() -> Dict[str, Optional[str]]:
     }
 
 
+def get_prompt_caching_enabled() -> bool:
+    """
+    Whether provider-side prompt caching (``llm.prompt_caching``) is on.
+
+    Applies to every LLM config the app builds; see
+    ``backend/llm/llm_factory.py`` for how each provider is handled.
+    """
+    value = get_config_value("llm.prompt_caching", False)
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
 def get_onboarding_llm_config() -> Dict[str, Optional[str]]:
     """
     Get onboarding LLM configuration with fallback to main LLM config.
@@ -1,16 +1,139 @@
+import json
+import logging
+
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 from flask_sqlalchemy import SQLAlchemy
 
+logger = logging.getLogger(__name__)
+
 db = SQLAlchemy()
 
+# ---------------------------------------------------------------------------
+# SQLite pragma profiles
+# ---------------------------------------------------------------------------
+
+# Pragmas a profile (or a config override) may set.  Values are interpolated
+# into PRAGMA statements, so both names and values are validated.
+_ALLOWED_PRAGMAS = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+    "cache_size": int,     # pages if positive, KiB if negative
+    "mmap_size": int,      # bytes
+    "busy_timeout": int,   # milliseconds
+}
+
+SQLITE_PROFILES: dict[str, dict] = {
+    # Stock SQLite behaviour: rollback journal, fsync on every commit.
+    # journal_mode is set explicitly so switching back from WAL works.
+    "default": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+    },
+    # WAL lets dashboard reads proceed while agent threads commit; NORMAL
+    # sync is durable across app crashes (only an OS crash can lose the
+    # last commits).
+    "wal": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+    },
+    # WAL plus a larger page cache, memory-mapped reads and in-memory temp
+    # tables for sorts/GROUP BYs.
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -32000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+}
+
+DEFAULT_SQLITE_PROFILE = "performance"
+
+# Pragmas applied by _set_sqlite_pragma on every new connection
+_active_pragmas: dict = dict(SQLITE_PROFILES[DEFAULT_SQLITE_PROFILE])
+
+
+def resolve_sqlite_pragmas(profile: str | None, overrides: dict | None = None) -> dict:
+    """Return the validated pragma dict for *profile* with *overrides* applied.
+
+    Raises ValueError for an unknown profile, pragma name or value.
+    """
+    profile = profile or DEFAULT_SQLITE_PROFILE
+    overrides = overrides or {}
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLite profile '{profile}'. "
+            f"Must be one of: {', '.join(SQLITE_PROFILES)}"
+        )
+    pragmas = dict(SQLITE_PROFILES[profile])
+
+    # Env var overrides (DATABASE_PRAGMAS) arrive as a JSON string
+    if isinstance(overrides, str):
+        overrides = json.loads(overrides) if overrides.strip() else {}
+    if not isinstance(overrides, dict):
+        raise ValueError("database.pragmas must be an object")
+
+    for name, value in overrides.items():
+        allowed = _ALLOWED_PRAGMAS.get(name)
+        if allowed is None:
+            raise ValueError(f"Unsupported pragma '{name}'")
+        if allowed is int:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Pragma {name} must be an integer")
+        else:
+            value = str(value).upper()
+            if value not in allowed:
+                raise ValueError(
+                    f"Invalid value for pragma {name}. "
+                    f"Must be one of: {', '.join(sorted(allowed))}"
+                )
+        pragmas[name] = value
+    return pragmas
+
+
+def configure_sqlite(profile: str | None, overrides: dict | None = None) -> dict:
+    """Select the pragma profile applied to new SQLite connections.
+
+    Falls back to the default profile (with a warning) if the configured
+    profile or overrides are invalid, so a typo in config.json can't stop
+    the app from starting.
+    """
+    global _active_pragmas
+    try:
+        pragmas = resolve_sqlite_pragmas(profile, overrides)
+    except ValueError as e:
+        logger.warning("Invalid SQLite configuration (%s) — using '%s' profile",
+                       e, DEFAULT_SQLITE_PROFILE)
+        pragmas = dict(SQLITE_PROFILES[DEFAULT_SQLITE_PROFILE])
+    _active_pragmas = pragmas
+    return pragmas
+
 
 @event.listens_for(Engine, "connect")
 def _set_sqlite_pragma(dbapi_connection, connection_record):
-    """Enable foreign key enforcement for every SQLite connection."""
+    """Enable foreign keys and apply the active pragma profile on every SQLite connection."""
     import sqlite3
 
     if isinstance(dbapi_connection, sqlite3.Connection):
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        for name, value in _active_pragmas.items():
+            if name == "journal_mode":
+                # journal_mode is persistent; switching it needs exclusive
+                # access, so only attempt it when the mode actually differs.
+                current = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+                if current.upper() == value:
+                    continue
+                try:
+                    cursor.execute(f"PRAGMA journal_mode={value}")
+                except sqlite3.OperationalError as e:
+                    logger.warning("Could not switch SQLite journal_mode to %s: %s", value, e)
+                continue
+            cursor.execute(f"PRAGMA {name}={value}")
         cursor.close()
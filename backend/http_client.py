@@ -0,0 +1,132 @@
+"""Shared, pooled HTTP client for outbound tool traffic.
+
+Every tool request used to go through a bare ``requests.get``, which opens
+(and TLS-handshakes) a new connection each time.  This module keeps one
+``requests.Session`` per scheme and host, each with a keep-alive
+connection pool capped at ``http.pool_maxsize`` connections.  Threads
+calling the same host wait for a free connection rather than opening more.
+At most ``MAX_HOST_SESSIONS`` host sessions are kept; the least recently
+used one is closed when a new host needs a slot.
+
+All sessions share one retry policy: connection errors, and 502/503/504
+responses to idempotent requests, are retried ``http.max_retries`` times
+with exponential backoff (honouring ``Retry-After``).  Read timeouts are
+not retried, since the server may have acted on the request and a retry
+doubles an already long wait; callers that want that retry it themselves.
+429s are also left to the caller, which may need to coordinate the pause
+across threads (see ``backend/agent/tools/_rate_limit.py``).  Calls that
+don't pass a timeout get ``(http.connect_timeout_seconds,
+http.read_timeout_seconds)``.
+
+Consumers:
+    - backend/agent/tools/job_search.py            RapidAPI job boards
+    - backend/agent/tools/_tavily.py                Tavily (one session per API key)
+    - backend/agent/micro_agents_v1/workflows/job_search.py   URL liveness checks
+    - backend/llm/model_listing.py                  Ollama model listing
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from backend.config_manager import get_int_config_value
+
+DEFAULT_POOL_MAXSIZE = 8
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 5
+DEFAULT_READ_TIMEOUT_SECONDS = 30
+
+# Delay before retry n is RETRY_BACKOFF_FACTOR * 2 ** (n - 1) seconds
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+MAX_HOST_SESSIONS = 64
+
+_lock = threading.Lock()
+_sessions: OrderedDict[str, requests.Session] = OrderedDict()
+
+
+def _retry_policy() -> Retry:
+    return Retry(
+        total=get_int_config_value("http.max_retries", DEFAULT_MAX_RETRIES),
+        read=0,
+        status_forcelist=RETRY_STATUSES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        respect_retry_after_header=True,
+        # Hand the last 5xx back to the caller instead of raising RetryError
+        raise_on_status=False,
+    )
+
+
+def create_session() -> requests.Session:
+    """Return a new session with the shared pool size and retry policy.
+
+    For clients that set credentials on the session itself (such as
+    ``TavilyClient``) and so can't share the per-host sessions.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=max(1, get_int_config_value("http.pool_maxsize", DEFAULT_POOL_MAXSIZE)),
+        pool_block=True,
+        max_retries=_retry_policy(),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def session_for(url: str) -> requests.Session:
+    """Return the pooled session for *url*'s scheme and host."""
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}".lower()
+    evicted = None
+    with _lock:
+        session = _sessions.get(key)
+        if session is not None:
+            _sessions.move_to_end(key)
+            return session
+        session = _sessions[key] = create_session()
+        if len(_sessions) > MAX_HOST_SESSIONS:
+            _, evicted = _sessions.popitem(last=False)
+    if evicted is not None:
+        evicted.close()
+    return session
+
+
+def default_timeout() -> tuple[int, int]:
+    """``(connect, read)`` timeout in seconds for calls that don't pass one."""
+    return (
+        get_int_config_value("http.connect_timeout_seconds", DEFAULT_CONNECT_TIMEOUT_SECONDS),
+        get_int_config_value("http.read_timeout_seconds", DEFAULT_READ_TIMEOUT_SECONDS),
+    )
+
+
+def request(method: str, url: str, *, timeout=None, **kwargs) -> requests.Response:
+    """Send a request on *url*'s pooled session; arguments are as for ``requests.request``."""
+    if timeout is None:
+        timeout = default_timeout()
+    return session_for(url).request(method, url, timeout=timeout, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def close_all() -> None:
+    """Close every pooled session (they are recreated on next use)."""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
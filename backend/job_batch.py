@@ -0,0 +1,134 @@
+"""Batch updates and deletions of tracked jobs, each in a single transaction.
+
+Every update in a batch is validated before anything is written, and
+all referenced jobs must exist.  If any check fails, nothing is changed.
+
+Consumers:
+    - backend/routes/jobs.py        PATCH/DELETE /api/jobs/batch
+    - backend/agent/tools/jobs.py   edit_jobs, remove_jobs
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from backend.database import db
+from backend.models.job import Job
+from backend.models.search_result import SearchResult
+from backend.validation import validate_job_data
+
+# Largest number of jobs one batch request may touch
+MAX_BATCH_SIZE = 500
+
+# Fields a batch update may set (validate_job_data may also return these)
+_UPDATABLE_FIELDS = (
+    "company", "title", "url", "status", "notes",
+    "salary_min", "salary_max", "location", "remote_type",
+    "tags", "contact_name", "contact_email", "source",
+    "job_fit", "requirements", "nice_to_haves", "applied_date",
+)
+
+
+def validate_job_ids(ids) -> tuple[list[int], list[str]]:
+    """Check a list of job IDs for a batch.  Returns ``(ids, errors)``."""
+    if not isinstance(ids, list) or not ids:
+        return [], ["ids must be a non-empty list of job IDs"]
+    if len(ids) > MAX_BATCH_SIZE:
+        return [], [f"A batch may contain at most {MAX_BATCH_SIZE} jobs"]
+    if not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+        return [], ["ids must be integers"]
+    if len(set(ids)) != len(ids):
+        return [], ["ids must not contain duplicates"]
+    return ids, []
+
+
+def validate_job_updates(updates) -> tuple[list[tuple[int, dict]], list[dict]]:
+    """Validate a batch of ``{"id": ..., <fields>}`` updates.
+
+    Returns ``(cleaned, errors)``.  *cleaned* is a list of
+    ``(job_id, fields)`` pairs ready for ``apply_job_updates``; *errors*
+    holds ``{"index", "id", "errors"}`` entries for the invalid updates.
+    """
+    if not isinstance(updates, list) or not updates:
+        return [], [{"index": None, "id": None, "errors": ["updates must be a non-empty list"]}]
+    if len(updates) > MAX_BATCH_SIZE:
+        return [], [{"index": None, "id": None,
+                     "errors": [f"A batch may contain at most {MAX_BATCH_SIZE} jobs"]}]
+
+    cleaned = []
+    errors = []
+    seen = set()
+    for index, update in enumerate(updates):
+        if not isinstance(update, dict):
+            errors.append({"index": index, "id": None, "errors": ["update must be an object"]})
+            continue
+        job_id = update.get("id")
+        row_errors = []
+        if not isinstance(job_id, int) or isinstance(job_id, bool):
+            row_errors.append("id must be an integer")
+        elif job_id in seen:
+            row_errors.append("id appears more than once in the batch")
+        seen.add(job_id)
+
+        fields, field_errors = validate_job_data(update, require_company_title=False)
+        row_errors.extend(field_errors)
+        # Caught here rather than as a NOT NULL failure that aborts the batch
+        for field in ("company", "title"):
+            if field not in update:
+                continue
+            value = update[field]
+            if value is None or (isinstance(value, str) and not value.strip()):
+                row_errors.append(f"{field} cannot be empty")
+        if "applied_date" in fields:
+            applied = fields["applied_date"]
+            try:
+                fields["applied_date"] = date.fromisoformat(applied) if applied else None
+            except (ValueError, TypeError):
+                row_errors.append("applied_date must be a valid ISO date (YYYY-MM-DD)")
+
+        if row_errors:
+            errors.append({"index": index, "id": job_id, "errors": row_errors})
+        else:
+            cleaned.append((job_id, {k: v for k, v in fields.items() if k in _UPDATABLE_FIELDS}))
+    return cleaned, errors
+
+
+def missing_job_ids(ids) -> list[int]:
+    """Return the IDs in *ids* that have no job, in their original order."""
+    found = set(db.session.scalars(db.select(Job.id).where(Job.id.in_(ids))))
+    return [i for i in ids if i not in found]
+
+
+def apply_job_updates(cleaned: list[tuple[int, dict]]) -> list[Job]:
+    """Apply validated updates in one transaction; return jobs in batch order.
+
+    Jobs are loaded with a single query and changed through the ORM, so tag
+    rows stay in sync.  Every job must exist (see ``missing_job_ids``).
+    """
+    ids = [job_id for job_id, _ in cleaned]
+    jobs = {job.id: job for job in Job.query.filter(Job.id.in_(ids))}
+    for job_id, fields in cleaned:
+        job = jobs[job_id]
+        for field, value in fields.items():
+            setattr(job, field, value)
+    db.session.commit()
+    return [jobs[job_id] for job_id in ids]
+
+
+def delete_jobs(ids: list[int]) -> list[dict]:
+    """Delete jobs in one transaction; return ``{id, company, title}`` for each.
+
+    Todos, documents and tag rows go with them through ``ON DELETE CASCADE``.
+    Search results promoted to these jobs are unlinked and lose their
+    ``added_to_tracker`` flag.
+    """
+    rows = db.session.execute(
+        db.select(Job.id, Job.company, Job.title).where(Job.id.in_(ids))
+    ).all()
+    by_id = {row.id: {"id": row.id, "company": row.company, "title": row.title} for row in rows}
+    SearchResult.query.filter(SearchResult.tracker_job_id.in_(ids)).update(
+        {"tracker_job_id": None, "added_to_tracker": False}, synchronize_session=False,
+    )
+    db.session.execute(db.delete(Job).where(Job.id.in_(ids)))
+    db.session.commit()
+    return [by_id[i] for i in ids if i in by_id]
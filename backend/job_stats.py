@@ -0,0 +1,119 @@
+"""Pipeline analytics for the job tracker, computed in SQL and cached in memory.
+
+``get_job_stats()`` runs a handful of GROUP BY queries over ``jobs``:
+status counts, a salary histogram, a job-fit histogram, and applications
+and additions per month.  The result is cached per app together with the
+``jobs`` table version from ``backend/table_versions.py``.  It is reused
+until a committed transaction writes to ``jobs`` and bumps that version.
+
+Consumers:
+    - backend/routes/jobs.py   GET /api/jobs/stats
+"""
+
+from __future__ import annotations
+
+import threading
+
+from flask import current_app, has_app_context
+
+from backend.database import db
+from backend.models.job import Job
+from backend.table_versions import table_version
+from backend.validation import VALID_STATUSES
+
+# Width of each salary histogram bucket (bucketed on the range midpoint)
+SALARY_BUCKET_SIZE = 25_000
+
+
+class JobStatsCache:
+    """Single-entry cache tagged with the ``jobs`` version it was computed at.
+
+    The version is read before computing, so a result that may have missed
+    a concurrent commit is labelled with the older version and recomputed
+    on the next call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._value = None
+
+    def get(self, compute):
+        version = table_version(Job.__tablename__)
+        with self._lock:
+            if self._version == version:
+                return self._value
+        value = compute()
+        with self._lock:
+            self._version, self._value = version, value
+        return value
+
+
+def init_app(app):
+    """Attach a fresh stats cache to *app*."""
+    app.extensions["job_stats"] = JobStatsCache()
+
+
+def _cache() -> JobStatsCache | None:
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("job_stats")
+
+
+# ---------------------------------------------------------------------------
+# Aggregates
+# ---------------------------------------------------------------------------
+
+
+def _monthly(column) -> list[dict]:
+    month = db.func.strftime("%Y-%m", column).label("month")
+    rows = (db.session.query(month, db.func.count())
+            .filter(column.isnot(None))
+            .group_by(month).order_by(month).all())
+    return [{"month": m, "count": n} for m, n in rows]
+
+
+def compute_job_stats() -> dict:
+    """Compute pipeline aggregates with SQL GROUP BYs (uncached)."""
+    total = db.session.query(db.func.count(Job.id)).scalar()
+
+    by_status = dict.fromkeys(sorted(VALID_STATUSES), 0)
+    for status, n in db.session.query(Job.status, db.func.count()).group_by(Job.status):
+        by_status[status or "saved"] = by_status.get(status or "saved", 0) + n
+
+    job_fit = {str(i): 0 for i in range(6)}
+    job_fit["unrated"] = 0
+    for fit, n in db.session.query(Job.job_fit, db.func.count()).group_by(Job.job_fit):
+        job_fit["unrated" if fit is None else str(fit)] += n
+
+    # One-sided ranges count at their single known value
+    low = db.func.coalesce(Job.salary_min, Job.salary_max)
+    high = db.func.coalesce(Job.salary_max, Job.salary_min)
+    bucket = ((low + high) // 2 // SALARY_BUCKET_SIZE * SALARY_BUCKET_SIZE).label("bucket")
+    salary_rows = (db.session.query(bucket, db.func.count())
+                   .filter(low.isnot(None))
+                   .group_by(bucket).order_by(bucket).all())
+    salary = {
+        "bucket_size": SALARY_BUCKET_SIZE,
+        "count": sum(n for _, n in salary_rows),
+        "buckets": [
+            {"min": b, "max": b + SALARY_BUCKET_SIZE, "count": n} for b, n in salary_rows
+        ],
+    }
+
+    return {
+        "total": total,
+        "status": by_status,
+        "job_fit": job_fit,
+        "salary": salary,
+        "applied_by_month": _monthly(Job.applied_date),
+        "created_by_month": _monthly(Job.created_at),
+    }
+
+
+def get_job_stats() -> dict:
+    """Return pipeline aggregates, from the app's cache when still valid."""
+    cache = _cache()
+    if cache is None:
+        return compute_job_stats()
+    return cache.get(compute_job_stats)
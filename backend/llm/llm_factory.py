@@ -1,7 +1,8 @@
 """LiteLLM model factory.
 
 Builds LiteLLM model identifiers and provides a thin config wrapper
-for passing to litellm.completion().
+for passing to litellm.completion().  Also holds the per-provider prompt
+caching strategy (``prompt_cache_kwargs``).
 """
 
 import logging
@@ -17,6 +18,20 @@ DEFAULT_MODELS = {
     "ollama": "llama3.1",
 }
 
+# How each provider caches repeated prompt prefixes (opt-in through
+# ``llm.prompt_caching``).  ``markers``: only prefixes tagged with
+# ``cache_control`` are cached, and litellm injects the tags.  Otherwise the
+# provider caches long repeated prefixes on its own (OpenAI from 1024
+# tokens, Gemini 2.5 implicit caching), so a byte-stable system prompt and
+# tool list is all it needs.  ``stream_usage``: streamed responses only
+# report usage (and so cached tokens) when asked.  Providers not listed do
+# no caching.
+PROMPT_CACHING = {
+    "anthropic": {"markers": True, "stream_usage": False},
+    "openai": {"markers": False, "stream_usage": True},
+    "gemini": {"markers": False, "stream_usage": False},
+}
+
 
 @dataclass
 class LLMConfig:
@@ -26,10 +41,12 @@ class LLMConfig:
     api_base: str | None = None
     max_tokens: int = 4096
     extra_kwargs: dict = field(default_factory=dict)
+    provider: str = ""
+    prompt_caching: bool = False
 
 
 def create_llm_config(
-    provider_name: str, api_key: str, model: str = ""
+    provider_name: str, api_key: str, model: str = "", prompt_caching: bool = False
 ) -> LLMConfig:
     """Create an LLMConfig for the given provider.
 
@@ -37,6 +54,8 @@ def create_llm_config(
         provider_name: One of "anthropic", "openai", "gemini", "ollama"
         api_key: API key for the provider (ignored for Ollama)
         model: Optional model override; each provider has a sensible default
+        prompt_caching: Enable provider-side prompt caching (see
+            ``prompt_cache_kwargs``)
 
     Returns:
         An LLMConfig dataclass with the litellm model string and credentials.
@@ -64,6 +83,8 @@ def create_llm_config(
         model=litellm_model,
         api_key=api_key,
         api_base="http://localhost:11434" if provider_name == "ollama" else None,
+        provider=provider_name,
+        prompt_caching=prompt_caching,
     )
 
     logger.info(
@@ -72,3 +93,35 @@ def create_llm_config(
         litellm_model,
     )
     return config
+
+
+def prompt_cache_kwargs(
+    llm_config: LLMConfig, *, stream: bool = False, rolling: bool = False
+) -> dict:
+    """Return extra litellm.completion() kwargs for prompt caching.
+
+    Empty unless caching is enabled and the provider supports it.  For
+    marker-based providers the system message (which follows the tool
+    definitions, so both are cached) is always marked; ``rolling=True``
+    also marks the last message, so each iteration of a tool-calling loop
+    reads the previous iteration's prefix from cache.  ``stream=True`` asks
+    for usage on streamed responses where the provider needs it, so cached
+    tokens reach telemetry.
+
+    Args:
+        llm_config: The config the call is made with
+        stream: The call streams its response
+        rolling: The call is one step of a growing multi-turn exchange
+    """
+    strategy = PROMPT_CACHING.get(llm_config.provider) if llm_config.prompt_caching else None
+    if strategy is None:
+        return {}
+    kwargs: dict = {}
+    if strategy["markers"]:
+        points = [{"location": "message", "role": "system"}]
+        if rolling:
+            points.append({"location": "message", "index": -1})
+        kwargs["cache_control_injection_points"] = points
+    if stream and strategy["stream_usage"]:
+        kwargs["stream_options"] = {"include_usage": True}
+    return kwargs
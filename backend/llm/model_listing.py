@@ -7,7 +7,7 @@ to enumerate models without depending on the agent code.
 
 import logging
 
-import requests
+from backend import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +82,7 @@ def list_ollama_models(api_key: str = "", **kwargs) -> list[dict]:
         List of dicts with ``id`` keys.
     """
     base_url = kwargs.get("base_url", "http://localhost:11434").rstrip("/")
-    resp = requests.get(f"{base_url}/api/tags", timeout=10)
+    resp = http_client.get(f"{base_url}/api/tags", timeout=10)
     resp.raise_for_status()
     data = resp.json()
     models = []
@@ -102,7 +102,7 @@ def is_ollama_running(base_url: str = "http://localhost:11434") -> bool:
         ``True`` if the server responds, ``False`` otherwise.
     """
     try:
-        resp = requests.get(f"{base_url.rstrip('/')}/api/tags", timeout=5)
+        resp = http_client.get(f"{base_url.rstrip('/')}/api/tags", timeout=5)
         return resp.ok
     except Exception:
         return False
@@ -1,7 +1,8 @@
 from backend.models.job import Job
+from backend.models.job_tag import JobTag
 from backend.models.chat import Conversation, Message
 from backend.models.search_result import SearchResult
 from backend.models.application_todo import ApplicationTodo
 from backend.models.job_document import JobDocument
 
-__all__ = ["Job", "Conversation", "Message", "SearchResult", "ApplicationTodo", "JobDocument"]
+__all__ = ["Job", "JobTag", "Conversation", "Message", "SearchResult", "ApplicationTodo", "JobDocument"]
@@ -9,8 +9,13 @@ class Conversation(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), default="New Chat")
     created_at = db.Column(db.DateTime, server_default=db.func.now())
-    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
-    messages = db.relationship("Message", backref="conversation", cascade="all, delete-orphan", order_by="Message.created_at")
+    # Indexed for the conversation list's (updated_at, id) keyset; see routes/chat.py
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now(), index=True)
+    # Rolling summary of turns older than the agent's context budget, and the
+    # id of the last message it covers (see backend/agent/context_window.py)
+    context_summary = db.Column(db.Text)
+    context_summary_through = db.Column(db.Integer)
+    messages = db.relationship("Message", backref="conversation", cascade="all, delete-orphan", order_by="[Message.created_at, Message.id]")
     search_results = db.relationship("SearchResult", backref="conversation", cascade="all, delete-orphan", order_by="SearchResult.created_at")
 
     def to_dict(self, include_messages=False):
@@ -27,9 +32,13 @@ class Conversation(db.Model):
 
 class Message(db.Model):
     __tablename__ = "messages"
+    # History is paged per conversation on (created_at, id); see routes/chat.py
+    __table_args__ = (
+        db.Index("ix_messages_conversation_id_created_at", "conversation_id", "created_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    conversation_id = db.Column(db.Integer, db.ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False, index=True)
+    conversation_id = db.Column(db.Integer, db.ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
     role = db.Column(db.String(20), nullable=False)  # "user" or "assistant"
     content = db.Column(db.Text, default="")
     tool_calls = db.Column(db.Text)  # JSON string of tool call data
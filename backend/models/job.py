@@ -1,4 +1,7 @@
+from sqlalchemy import event
+
 from backend.database import db
+from backend.models.job_tag import JobTag, normalize_tags
 
 
 class Job(db.Model):
@@ -25,6 +28,9 @@ class Job(db.Model):
     created_at = db.Column(db.DateTime, server_default=db.func.now(), index=True)
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
 
+    # Normalized copy of ``tags`` for indexed filtering and facet counts
+    tag_rows = db.relationship(JobTag, cascade="all, delete-orphan", passive_deletes=True)
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -48,3 +54,10 @@ class Job(db.Model):
             "created_at": (self.created_at.isoformat() + "+00:00") if self.created_at else None,
             "updated_at": (self.updated_at.isoformat() + "+00:00") if self.updated_at else None,
         }
+
+
+@event.listens_for(Job.tags, "set")
+def _sync_tag_rows(job, value, oldvalue, initiator):
+    """Keep ``job.tag_rows`` matching the comma-separated ``tags`` string."""
+    existing = {row.tag: row for row in job.tag_rows}
+    job.tag_rows = [existing.get(tag) or JobTag(tag=tag) for tag in normalize_tags(value)]
@@ -0,0 +1,58 @@
+from backend.database import db
+
+# Longest single tag kept in job_tags (Job.tags itself allows 500 chars)
+MAX_TAG_LENGTH = 100
+
+
+def normalize_tags(text) -> list[str]:
+    """Split a comma-separated tags string into normalized, de-duplicated tags.
+
+    Tags are trimmed, lowercased and have internal whitespace collapsed, so
+    ``"Python, remote ,python"`` becomes ``["python", "remote"]``.
+    """
+    if not text:
+        return []
+    tags = []
+    for part in str(text).split(","):
+        tag = " ".join(part.split()).lower()[:MAX_TAG_LENGTH]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+class JobTag(db.Model):
+    """One normalized tag on a job — an indexed copy of ``Job.tags``.
+
+    ``Job.tags`` remains the user-facing string; rows here are kept in sync
+    by the ``Job.tags`` set listener in ``backend/models/job.py`` (and by
+    bulk import, which inserts through Core).  Writes to ``jobs.tags`` that
+    bypass the ORM must call ``JobTag.rows_for`` themselves.
+    """
+
+    __tablename__ = "job_tags"
+    __table_args__ = (
+        db.Index("ix_job_tags_tag_job_id", "tag", "job_id"),
+    )
+
+    job_id = db.Column(db.Integer, db.ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    tag = db.Column(db.String(MAX_TAG_LENGTH), primary_key=True)
+
+    @staticmethod
+    def rows_for(job_id: int, text) -> list[dict]:
+        """Return ``job_tags`` insert values for one job's tags string."""
+        return [{"job_id": job_id, "tag": tag} for tag in normalize_tags(text)]
+
+
+def jobs_with_all_tags(tags):
+    """Return a subquery of ids of jobs carrying every tag in *tags*.
+
+    *tags* is a list of raw tag strings (normalized here).  The query reads
+    only the ``(tag, job_id)`` index.
+    """
+    tags = normalize_tags(",".join(tags))
+    return (
+        db.select(JobTag.job_id)
+        .where(JobTag.tag.in_(tags))
+        .group_by(JobTag.job_id)
+        .having(db.func.count() == len(tags))
+    )
@@ -0,0 +1,287 @@
+"""Persistent cache for third-party API responses.
+
+Agents often repeat the same upstream queries within a session or a day
+(the same job search, the same page extract), and each repeat costs API
+quota and seconds.  ``ResponseCache`` stores JSON responses in
+``response_cache.db`` in the data directory, keyed on a namespace (the
+provider) plus normalized request parameters, so the repeat is answered
+locally until the entry's TTL runs out.
+
+Each namespace is capped at ``<config_prefix>.max_megabytes`` of stored
+JSON; past that, the least recently used entries are evicted.  Expired
+entries are dropped when they are looked up or when the namespace is
+written to, unless they were stored with revalidation metadata and a
+``stale_seconds`` grace period: those stay (still subject to LRU eviction)
+so the caller can check whether the upstream content changed and
+``renew()`` the entry instead of fetching it again.
+
+Hit, miss, store, eviction and revalidation counters are kept per
+namespace since process start; ``stats()`` reports them alongside each
+namespace's size (served under ``response_cache`` by
+``GET /api/telemetry/stats``).
+
+Consumers:
+    - backend/agent/tools/job_search.py   RapidAPI job boards
+    - backend/agent/tools/_tavily.py      Tavily search, extract and research
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from backend.config_manager import get_int_config_value
+from backend.data_dir import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "response_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    namespace  TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    value      TEXT NOT NULL,
+    size       INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used  REAL NOT NULL,
+    meta       TEXT,
+    keep_until REAL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_responses_lru ON responses(namespace, last_used);
+"""
+
+# Columns added after the table was first created, with their types
+_ADDED_COLUMNS = {"meta": "TEXT", "keep_until": "REAL"}
+
+_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+_conn_path: Path | None = None
+_caches: dict[str, ResponseCache] = {}
+
+
+def _connection() -> sqlite3.Connection:
+    """Open (once per data dir) the shared cache database.  Call with ``_lock`` held."""
+    global _conn, _conn_path
+    path = get_data_dir() / DB_FILENAME
+    if _conn is None or path != _conn_path:
+        if _conn is not None:
+            _conn.close()
+        _conn = sqlite3.connect(str(path), timeout=5, check_same_thread=False, isolation_level=None)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.executescript(_SCHEMA)
+        existing = {row[1] for row in _conn.execute("PRAGMA table_info(responses)")}
+        for column, column_type in _ADDED_COLUMNS.items():
+            if column not in existing:
+                _conn.execute(f"ALTER TABLE responses ADD COLUMN {column} {column_type}")
+        _conn_path = path
+    return _conn
+
+
+def _normalize(value: Any) -> Any:
+    """Case- and whitespace-fold strings and drop unset values, recursively."""
+    if isinstance(value, str):
+        return " ".join(value.split()).casefold()
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items() if v is not None and v != ""}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def cache_key(*parts: Any, fold_case: bool = True) -> str:
+    """Stable digest of *parts* after normalization.
+
+    Requests that differ only in letter case, surrounding or repeated
+    whitespace, parameter order, or unset (None/empty) parameters share a
+    key.  Pass ``fold_case=False`` for parts that are case-sensitive, such
+    as URLs, and normalize them beforehand.
+    """
+    normalized = _normalize(list(parts)) if fold_case else list(parts)
+    canonical = json.dumps(normalized, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    meta: dict | None
+    fresh: bool
+
+
+class ResponseCache:
+    """One namespace of the shared response cache."""
+
+    def __init__(self, namespace: str, config_prefix: str, default_max_megabytes: int):
+        self.namespace = namespace
+        self.config_prefix = config_prefix
+        self.default_max_megabytes = default_max_megabytes
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "revalidations": 0}
+
+    @property
+    def max_bytes(self) -> int:
+        return get_int_config_value(f"{self.config_prefix}.max_megabytes",
+                                    self.default_max_megabytes) * 1024 * 1024
+
+    def _count(self, name: str, n: int = 1) -> None:
+        self._counters[name] += n
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        """Return the entry for *key*, fresh or stale, or None if there is none.
+
+        A fresh entry counts as a hit; anything else as a miss.  Stale
+        entries are only returned while inside their ``stale_seconds``
+        grace period.
+        """
+        now = time.time()
+        try:
+            with _lock:
+                conn = _connection()
+                row = conn.execute(
+                    "SELECT value, meta, expires_at, COALESCE(keep_until, expires_at) "
+                    "FROM responses WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                ).fetchone()
+                if row is None or row[3] <= now:
+                    if row is not None:
+                        conn.execute("DELETE FROM responses WHERE namespace = ? AND key = ?",
+                                     (self.namespace, key))
+                    self._count("misses")
+                    return None
+                fresh = row[2] > now
+                if fresh:
+                    conn.execute("UPDATE responses SET last_used = ? WHERE namespace = ? AND key = ?",
+                                 (now, self.namespace, key))
+                self._count("hits" if fresh else "misses")
+        except sqlite3.Error as e:
+            logger.warning("Response cache read failed (%s): %s", self.namespace, e)
+            return None
+        return CacheEntry(json.loads(row[0]), json.loads(row[1]) if row[1] else None, fresh)
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for *key*, or None if absent or expired."""
+        entry = self.lookup(key)
+        return entry.value if entry is not None and entry.fresh else None
+
+    def renew(self, key: str, ttl_seconds: float, stale_seconds: float = 0) -> None:
+        """Mark a stale entry as revalidated: fresh for another *ttl_seconds*."""
+        now = time.time()
+        try:
+            with _lock:
+                updated = _connection().execute(
+                    "UPDATE responses SET expires_at = ?, keep_until = ?, last_used = ? "
+                    "WHERE namespace = ? AND key = ?",
+                    (now + ttl_seconds, now + ttl_seconds + stale_seconds, now, self.namespace, key),
+                ).rowcount
+                if updated:
+                    self._count("revalidations")
+        except sqlite3.Error as e:
+            logger.warning("Response cache write failed (%s): %s", self.namespace, e)
+
+    def set(self, key: str, value: Any, ttl_seconds: float, *,
+            meta: dict | None = None, stale_seconds: float = 0) -> None:
+        """Store *value* (JSON-serializable) under *key* for *ttl_seconds*.
+
+        *meta* is revalidation metadata returned with the entry by
+        ``lookup()``; the entry stays available to ``lookup()`` for
+        *stale_seconds* after it expires.  A TTL of 0 or less stores
+        nothing.  Values larger than the namespace's whole size cap are not
+        stored either.
+        """
+        if ttl_seconds <= 0:
+            return
+        payload = json.dumps(value, separators=(",", ":"))
+        size = len(payload.encode())
+        max_bytes = self.max_bytes
+        if size > max_bytes:
+            return
+        now = time.time()
+        try:
+            with _lock:
+                conn = _connection()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses "
+                        "(namespace, key, value, size, created_at, expires_at, last_used, meta, keep_until) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (self.namespace, key, payload, size, now, now + ttl_seconds, now,
+                         json.dumps(meta) if meta else None, now + ttl_seconds + stale_seconds),
+                    )
+                    self._count("stores")
+                    self._evict(conn, now, max_bytes)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            logger.warning("Response cache write failed (%s): %s", self.namespace, e)
+
+    def _evict(self, conn: sqlite3.Connection, now: float, max_bytes: int) -> None:
+        """Drop expired entries, then least recently used ones past *max_bytes*."""
+        conn.execute("DELETE FROM responses WHERE namespace = ? AND COALESCE(keep_until, expires_at) <= ?",
+                     (self.namespace, now))
+        evicted = conn.execute(
+            """
+            DELETE FROM responses WHERE namespace = ? AND key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY last_used DESC, key) AS running
+                    FROM responses WHERE namespace = ?
+                ) WHERE running > ?
+            )
+            """,
+            (self.namespace, self.namespace, max_bytes),
+        ).rowcount
+        if evicted:
+            self._count("evictions", evicted)
+            logger.debug("Response cache %s evicted %d entr(ies)", self.namespace, evicted)
+
+    def clear(self) -> None:
+        """Delete every entry in the namespace; counters are kept."""
+        with _lock:
+            _connection().execute("DELETE FROM responses WHERE namespace = ?", (self.namespace,))
+
+    def stats(self) -> dict:
+        """Counters since process start plus the namespace's current size."""
+        with _lock:
+            entries, size = _connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "hit_rate": round(counters["hits"] / lookups, 3) if lookups else None,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+        }
+
+
+def get_cache(namespace: str, config_prefix: str, default_max_megabytes: int) -> ResponseCache:
+    """Return the process-wide ``ResponseCache`` for *namespace*, creating it on first use."""
+    with _lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            cache = _caches[namespace] = ResponseCache(namespace, config_prefix, default_max_megabytes)
+        return cache
+
+
+def stats() -> dict:
+    """``ResponseCache.stats()`` for every namespace used since process start."""
+    with _lock:
+        caches = list(_caches.values())
+    try:
+        return {cache.namespace: cache.stats() for cache in caches}
+    except sqlite3.Error as e:
+        logger.warning("Response cache stats failed: %s", e)
+        return {}
@@ -1,27 +1,151 @@
+import base64
+import binascii
 import json
 import logging
 
-from flask import Blueprint, Response, current_app, request, stream_with_context
+from flask import Blueprint, Response, request, stream_with_context
 
 from backend.agent import get_agent_classes
+from backend.agent_runs import SSE_HEADERS, get_runs
 from backend.agent.user_profile import is_onboarding_in_progress, set_onboarding_in_progress
-from backend.config_manager import get_llm_config, get_onboarding_llm_config, get_integration_config, get_active_mode_llm_config
+from backend.config_manager import (
+    get_llm_config, get_onboarding_llm_config, get_integration_config, get_active_mode_llm_config,
+    get_prompt_caching_enabled,
+)
 from backend.database import db
 from backend.llm.llm_factory import create_llm_config
 from backend.log_sanitizer import sanitize_error
 from backend.models.chat import Conversation, Message
 from backend.models.job import Job
 from backend.models.search_result import SearchResult
+from backend.serialization import RowSerializer, json_response, raw_column
+from backend.table_versions import conditional
+from backend.validation import validate_conversation_list_params, validate_message_page_params
 
 logger = logging.getLogger(__name__)
 
 chat_bp = Blueprint("chat", __name__, url_prefix="/api/chat")
 
+# Column-tuple serializers for list payloads (same output as to_dict())
+_MESSAGE_ROWS = RowSerializer(Message, json_fields=("tool_calls",))
+_SEARCH_RESULT_ROWS = RowSerializer(SearchResult)
+_CONVERSATION_ROWS = RowSerializer(Conversation)
+_CONVERSATION_FIELDS = ("id", "title", "created_at", "updated_at")
+
+# Characters of the latest message included in the conversation list
+CONVERSATION_PREVIEW_CHARS = 120
+
+
+def _encode_conversation_cursor(updated_at, convo_id):
+    """Encode the keyset position of a page's last conversation as an opaque token.
+
+    *updated_at* is the stored timestamp text, so the next page compares
+    against exactly what SQLite sorts on.
+    """
+    raw = json.dumps([updated_at, convo_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_conversation_cursor(token):
+    """Decode a cursor token into ``(updated_at, id)``; raise ValueError if malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        updated_at, convo_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("cursor is malformed")
+    if not isinstance(convo_id, int) or not isinstance(updated_at, (str, type(None))):
+        raise ValueError("cursor is malformed")
+    return updated_at, convo_id
+
+
+def _conversation_list_query():
+    """Select the listed columns plus per-conversation aggregates in one statement.
+
+    The aggregates are correlated subqueries, each answered from an index:
+    ``ix_messages_conversation_id_created_at`` for the message count and the
+    latest message, ``ix_search_results_conversation_id`` for the result
+    count.  Only the conversations on the page are ever aggregated.
+    """
+    message_count = (
+        db.select(db.func.count())
+        .where(Message.conversation_id == Conversation.id)
+        .correlate(Conversation)
+        .scalar_subquery()
+    )
+    last_message = (
+        db.select(db.func.substr(Message.content, 1, CONVERSATION_PREVIEW_CHARS))
+        .where(Message.conversation_id == Conversation.id)
+        .order_by(Message.created_at.desc(), Message.id.desc())
+        .limit(1)
+        .correlate(Conversation)
+        .scalar_subquery()
+    )
+    search_result_count = (
+        db.select(db.func.count())
+        .where(SearchResult.conversation_id == Conversation.id)
+        .correlate(Conversation)
+        .scalar_subquery()
+    )
+    return db.select(
+        *_CONVERSATION_ROWS.columns(_CONVERSATION_FIELDS),
+        message_count.label("message_count"),
+        last_message.label("last_message"),
+        search_result_count.label("search_result_count"),
+    )
+
+
+def _conversation_keyset_filter(updated_at, convo_id):
+    """Select conversations strictly after ``(updated_at, id)`` in newest-first order.
+
+    ``updated_at`` always has a server default, so the row-value comparison
+    is a range seek on ``ix_conversations_updated_at``.  It is compared
+    against the stored text, as message paging does.
+    """
+    if updated_at is None:
+        return db.and_(Conversation.updated_at.is_(None), Conversation.id < convo_id)
+    return (db.tuple_(Conversation.updated_at, Conversation.id)
+            < db.tuple_(db.literal(updated_at, db.String), convo_id))
+
 
 @chat_bp.route("/conversations", methods=["GET"])
+@conditional("conversations", "messages", "search_results")
 def list_conversations():
-    convos = Conversation.query.order_by(Conversation.updated_at.desc()).all()
-    return [c.to_dict() for c in convos]
+    """List conversations, most recently updated first.
+
+    Each entry adds ``message_count``, ``last_message`` (the first
+    ``CONVERSATION_PREVIEW_CHARS`` characters of the latest message) and
+    ``search_result_count``.  Without ``limit`` every conversation is
+    returned.  With ``limit`` the response holds at most that many and, if
+    more exist, an ``X-Next-Cursor`` header whose value is passed back as
+    ``?cursor=``.
+    """
+    params, errors = validate_conversation_list_params(request.args)
+    if errors:
+        return {"error": "; ".join(errors)}, 400
+    limit = params["limit"]
+
+    query = _conversation_list_query()
+    if params["cursor"]:
+        try:
+            updated_at, last_id = _decode_conversation_cursor(params["cursor"])
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        query = query.where(_conversation_keyset_filter(updated_at, last_id))
+    query = query.order_by(Conversation.updated_at.desc(), Conversation.id.desc())
+    if limit is not None:
+        query = query.limit(limit + 1)
+    rows = db.session.execute(query).all()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_conversation_cursor(rows[-1].updated_at, rows[-1].id)
+
+    fields = (*_CONVERSATION_FIELDS, "message_count", "last_message", "search_result_count")
+    response = json_response(_CONVERSATION_ROWS.serialize(rows, fields))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
 
 
 @chat_bp.route("/conversations", methods=["POST"])
@@ -33,12 +157,165 @@ def create_conversation():
     return convo.to_dict(), 201
 
 
+def _message_page(convo_id, before_id, limit):
+    """Return ``(messages, has_more)`` for one page of history, oldest first.
+
+    Pages walk back from the newest message, or from just before
+    ``before_id``, in ``(created_at, id)`` order, which is a range scan on
+    ``ix_messages_conversation_id_created_at``.  Returns None if
+    ``before_id`` is not a message in this conversation.
+    """
+    query = _MESSAGE_ROWS.select().where(Message.conversation_id == convo_id)
+    if before_id is not None:
+        anchor = db.session.execute(
+            db.select(raw_column(Message.created_at))
+            .where(Message.id == before_id, Message.conversation_id == convo_id)
+        ).first()
+        if anchor is None:
+            return None
+        # Compare against the stored text so second- and microsecond-precision
+        # timestamps order the same way SQLite sorts them
+        query = query.where(
+            db.tuple_(Message.created_at, Message.id)
+            < db.tuple_(db.literal(anchor[0], db.String), before_id)
+        )
+    rows = db.session.execute(
+        query.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit + 1)
+    ).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    rows.reverse()
+    return _MESSAGE_ROWS.serialize(rows), has_more
+
+
+def _llm_history(convo_id):
+    """Return the conversation as ``[{id, role, content}]``, oldest first.
+
+    Reads only the columns the agents use, so tool-call payloads are never
+    loaded or decoded.  ``id`` lets the context window skip turns already
+    covered by the conversation's rolling summary.
+    """
+    rows = db.session.execute(
+        db.select(Message.id, Message.role, Message.content)
+        .where(Message.conversation_id == convo_id)
+        .order_by(Message.created_at, Message.id)
+    )
+    return [{"id": msg_id, "role": role, "content": content} for msg_id, role, content in rows]
+
+
+def _run_response(run, last_event_id=0):
+    """Stream *run*'s events as SSE, starting after *last_event_id*."""
+    return Response(
+        stream_with_context(run.stream(last_event_id)),
+        mimetype="text/event-stream",
+        headers={**SSE_HEADERS, "X-Run-Id": run.id},
+    )
+
+
+def _start_agent_run(agent, llm_messages, convo_id, *, label, error_message, clean_text=None,
+                     reload_history=False):
+    """Run *agent* in the background and return the SSE response for the run.
+
+    The run may wait in the executor's queue, behind other runs of the
+    conversation.  With *reload_history*, the conversation history is read
+    again when the run starts, so it includes replies saved in the meantime.
+
+    The run outlives the request: if the client disconnects, the agent
+    keeps going, the assistant reply is still saved, and the client can
+    reattach through ``GET /runs/<run_id>/events``.  The reply is saved
+    before ``done`` is emitted, so clients that reload history on ``done``
+    see it.  A cancelled run saves whatever text it streamed before
+    emitting ``cancelled``.
+    """
+    def save_reply(content, tool_calls_log):
+        try:
+            db.session.add(Message(
+                conversation_id=convo_id,
+                role="assistant",
+                content=content,
+                tool_calls=json.dumps(tool_calls_log) if tool_calls_log else None,
+            ))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            logger.exception("Failed to save %s reply — conversation=%d", label, convo_id)
+
+    def drive(run):
+        full_text = ""
+        tool_calls_log = []
+        try:
+            messages = _llm_history(convo_id) if reload_history else llm_messages
+            for event in agent.run(messages):
+                event_type = event["event"]
+                if event_type == "text_delta":
+                    full_text += event["data"]["content"]
+                elif event_type in ("tool_start", "tool_result", "tool_error"):
+                    tool_calls_log.append(event["data"])
+                elif event_type == "done":
+                    content = clean_text(full_text) if clean_text else full_text
+                    logger.info("%s complete — conversation=%d text_len=%d tool_calls=%d",
+                                label, convo_id, len(content), len(tool_calls_log))
+                    save_reply(content, tool_calls_log)
+                elif event_type == "cancelled":
+                    content = clean_text(full_text) if clean_text else full_text
+                    logger.info("%s cancelled — conversation=%d text_len=%d",
+                                label, convo_id, len(content))
+                    if content or tool_calls_log:
+                        save_reply(content, tool_calls_log)
+                run.emit(event_type, event["data"])
+        except Exception:
+            logger.exception("Agent error during %s — conversation=%d", label, convo_id)
+            run.emit("error", {"message": error_message})
+
+    run = get_runs().start(convo_id, drive, cancel_token=getattr(agent, "cancel_token", None))
+    logger.info("%s run started — conversation=%d run=%s", label, convo_id, run.id)
+    return _run_response(run)
+
+
+def _strip_onboarding_marker(text):
+    return text.replace("[ONBOARDING_COMPLETE]", "").rstrip()
+
+
 @chat_bp.route("/conversations/<int:convo_id>", methods=["GET"])
+@conditional("conversations", "messages")
 def get_conversation(convo_id):
+    """Return the conversation with its latest page of messages.
+
+    ``?limit=`` sets the page size.  ``message_count`` is the total number
+    of messages; older pages come from ``GET .../messages?before_id=``.
+    """
+    params, errors = validate_message_page_params(request.args)
+    if errors:
+        return {"error": "; ".join(errors)}, 400
     convo = db.session.get(Conversation, convo_id)
     if not convo:
         return {"error": "Conversation not found"}, 404
-    return convo.to_dict(include_messages=True)
+    messages, has_more = _message_page(convo_id, None, params["limit"])
+    message_count = db.session.scalar(
+        db.select(db.func.count()).where(Message.conversation_id == convo_id)
+    )
+    return json_response({
+        **convo.to_dict(),
+        "messages": messages,
+        "message_count": message_count,
+        "has_more": has_more,
+    })
+
+
+@chat_bp.route("/conversations/<int:convo_id>/messages", methods=["GET"])
+@conditional("conversations", "messages")
+def list_messages(convo_id):
+    """Return one page of messages older than ``?before_id=`` (oldest first)."""
+    params, errors = validate_message_page_params(request.args)
+    if errors:
+        return {"error": "; ".join(errors)}, 400
+    if not db.session.get(Conversation, convo_id):
+        return {"error": "Conversation not found"}, 404
+    page = _message_page(convo_id, params["before_id"], params["limit"])
+    if page is None:
+        return {"error": "Message not found"}, 404
+    messages, has_more = page
+    return json_response({"messages": messages, "has_more": has_more})
 
 
 @chat_bp.route("/conversations/<int:convo_id>", methods=["DELETE"])
@@ -70,16 +347,14 @@ def send_message(convo_id):
     db.session.add(user_msg)
     db.session.commit()
 
+    # Build message history for LLM
+    llm_messages = _llm_history(convo_id)
+
     # Update conversation title from first message
-    if len(convo.messages) == 1:
+    if len(llm_messages) == 1:
         convo.title = data["content"][:100]
         db.session.commit()
 
-    # Build message history for LLM
-    llm_messages = []
-    for msg in convo.messages:
-        llm_messages.append({"role": msg.role, "content": msg.content})
-
     # Get config dynamically from config manager (not Flask's static config)
     llm_config = get_active_mode_llm_config()
     integration_config = get_integration_config()
@@ -110,6 +385,7 @@ def send_message(convo_id):
             llm_config["provider"],
             llm_config["api_key"],
             llm_config["model"],
+            prompt_caching=get_prompt_caching_enabled(),
         )
     except Exception as e:
         logger.error("Failed to create LLM config: %s", sanitize_error(e))
@@ -139,63 +415,83 @@ def send_message(convo_id):
         conversation_id=convo_id,
     )
 
-    def generate():
-        full_text = ""
-        tool_calls_log = []
+    return _start_agent_run(
+        agent, llm_messages, convo_id, label="Chat response",
+        error_message="An unexpected error occurred while generating a response. Please try again.",
+        reload_history=True,
+    )
 
-        try:
-            for event in agent.run(llm_messages):
-                event_type = event["event"]
-                event_data = json.dumps(event["data"])
-                yield f"event: {event_type}\ndata: {event_data}\n\n"
 
-                if event_type == "text_delta":
-                    full_text += event["data"]["content"]
-                elif event_type in ("tool_start", "tool_result", "tool_error"):
-                    tool_calls_log.append(event["data"])
-                elif event_type == "done":
-                    # Save assistant message
-                    logger.info("Chat response complete — conversation=%d text_len=%d tool_calls=%d",
-                                convo_id, len(full_text), len(tool_calls_log))
-                    try:
-                        with current_app.app_context():
-                            assistant_msg = Message(
-                                conversation_id=convo_id,
-                                role="assistant",
-                                content=full_text,
-                                tool_calls=json.dumps(tool_calls_log) if tool_calls_log else None,
-                            )
-                            db.session.add(assistant_msg)
-                            db.session.commit()
-                    except Exception:
-                        logger.exception("Failed to save assistant message — conversation=%d", convo_id)
-        except Exception:
-            logger.exception("Agent error during chat streaming — conversation=%d", convo_id)
-            error_data = json.dumps({"message": "An unexpected error occurred while generating a response. Please try again."})
-            yield f"event: error\ndata: {error_data}\n\n"
+@chat_bp.route("/runs/<run_id>/events", methods=["GET"])
+def run_events(run_id):
+    """Reattach to an agent run's event stream.
 
-    return Response(
-        stream_with_context(generate()),
-        mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    Replays the events after ``Last-Event-ID`` (header, or the
+    ``last_event_id`` query parameter for clients that cannot set headers),
+    then follows the run until it finishes.  Runs are kept for a few
+    minutes after they finish.
+    """
+    run = get_runs().get(run_id)
+    if run is None:
+        return {"error": "Run not found"}, 404
+    raw = request.headers.get("Last-Event-ID") or request.args.get("last_event_id") or "0"
+    try:
+        last_event_id = int(raw)
+    except ValueError:
+        return {"error": "Last-Event-ID must be an integer"}, 400
+    if last_event_id < 0:
+        return {"error": "Last-Event-ID must be an integer"}, 400
+    return _run_response(run, last_event_id)
+
+
+@chat_bp.route("/runs/stats", methods=["GET"])
+def run_stats():
+    """Agent executor gauges: executing and queued runs, and the limit."""
+    return get_runs().stats()
+
+
+@chat_bp.route("/runs/<run_id>/cancel", methods=["POST"])
+def cancel_run(run_id):
+    """Ask a running agent to stop.
+
+    Cancellation is cooperative: the agent stops at its next check (between
+    iterations, steps or streamed chunks), saves the text streamed so far
+    and ends the stream with a ``cancelled`` event.  A queued run is
+    dropped from the queue straight away.
+    """
+    run = get_runs().get(run_id)
+    if run is None:
+        return {"error": "Run not found"}, 404
+    if run.finished:
+        return {"error": "Run already finished"}, 409
+    run.cancel("cancelled by user")
+    logger.info("Run cancel requested — run=%s", run_id)
+    return run.to_dict()
+
+
+@chat_bp.route("/conversations/<int:convo_id>/runs", methods=["GET"])
+def list_conversation_runs(convo_id):
+    """List the conversation's retained agent runs, oldest first.
+
+    Lets a reloaded page find a run that is still streaming.
+    """
+    if db.session.get(Conversation, convo_id) is None:
+        return {"error": "Conversation not found"}, 404
+    return {"runs": [run.to_dict() for run in get_runs().for_conversation(convo_id)]}
 
 
 @chat_bp.route("/conversations/<int:convo_id>/search-results", methods=["GET"])
+@conditional("conversations", "search_results")
 def get_search_results(convo_id):
     convo = db.session.get(Conversation, convo_id)
     if not convo:
         return {"error": "Conversation not found"}, 404
-    results = (
-        SearchResult.query
-        .filter_by(conversation_id=convo_id)
+    rows = db.session.execute(
+        _SEARCH_RESULT_ROWS.select()
+        .where(SearchResult.conversation_id == convo_id)
         .order_by(SearchResult.job_fit.desc(), SearchResult.created_at)
-        .all()
     )
-    return [r.to_dict() for r in results]
+    return json_response(_SEARCH_RESULT_ROWS.serialize(rows))
 
 
 @chat_bp.route("/conversations/<int:convo_id>/search-results/<int:result_id>/add-to-tracker", methods=["POST"])
@@ -301,7 +597,8 @@ def _get_onboarding_llm_config():
     if not api_key and provider_name != "ollama":
         raise ValueError("LLM is not configured. Please configure your API key in Settings.")
 
-    return create_llm_config(provider_name, api_key, model)
+    return create_llm_config(provider_name, api_key, model,
+                             prompt_caching=get_prompt_caching_enabled())
 
 
 @chat_bp.route("/onboarding/conversations", methods=["POST"])
@@ -328,9 +625,7 @@ def send_onboarding_message(convo_id):
     db.session.commit()
 
     # Build message history for LLM
-    llm_messages = []
-    for msg in convo.messages:
-        llm_messages.append({"role": msg.role, "content": msg.content})
+    llm_messages = _llm_history(convo_id)
 
     try:
         llm_config = _get_onboarding_llm_config()
@@ -359,49 +654,11 @@ def send_onboarding_message(convo_id):
 
     logger.info("Onboarding message received — conversation=%d", convo_id)
 
-    def generate():
-        full_text = ""
-        tool_calls_log = []
-
-        try:
-            for event in agent.run(llm_messages):
-                event_type = event["event"]
-                event_data = json.dumps(event["data"])
-                yield f"event: {event_type}\ndata: {event_data}\n\n"
-
-                if event_type == "text_delta":
-                    full_text += event["data"]["content"]
-                elif event_type in ("tool_start", "tool_result", "tool_error"):
-                    tool_calls_log.append(event["data"])
-                elif event_type == "done":
-                    # Strip the onboarding marker from persisted text
-                    clean_text = full_text.replace("[ONBOARDING_COMPLETE]", "").rstrip()
-                    logger.info("Onboarding response complete — conversation=%d text_len=%d",
-                                convo_id, len(clean_text))
-                    try:
-                        with current_app.app_context():
-                            assistant_msg = Message(
-                                conversation_id=convo_id,
-                                role="assistant",
-                                content=clean_text,
-                                tool_calls=json.dumps(tool_calls_log) if tool_calls_log else None,
-                            )
-                            db.session.add(assistant_msg)
-                            db.session.commit()
-                    except Exception:
-                        logger.exception("Failed to save onboarding message — conversation=%d", convo_id)
-        except Exception:
-            logger.exception("Agent error during onboarding streaming — conversation=%d", convo_id)
-            error_data = json.dumps({"message": "An unexpected error occurred during onboarding. Please try again."})
-            yield f"event: error\ndata: {error_data}\n\n"
-
-    return Response(
-        stream_with_context(generate()),
-        mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
+    return _start_agent_run(
+        agent, llm_messages, convo_id, label="Onboarding response",
+        error_message="An unexpected error occurred during onboarding. Please try again.",
+        reload_history=True,
+        clean_text=_strip_onboarding_marker,
     )
 
 
@@ -466,46 +723,8 @@ def kick_onboarding():
 
     logger.info("Onboarding kick — conversation=%d", convo_id)
 
-    def generate():
-        full_text = ""
-        tool_calls_log = []
-
-        try:
-            for event in agent.run(llm_messages):
-                event_type = event["event"]
-                event_data = json.dumps(event["data"])
-                yield f"event: {event_type}\ndata: {event_data}\n\n"
-
-                if event_type == "text_delta":
-                    full_text += event["data"]["content"]
-                elif event_type in ("tool_start", "tool_result", "tool_error"):
-                    tool_calls_log.append(event["data"])
-                elif event_type == "done":
-                    clean_text = full_text.replace("[ONBOARDING_COMPLETE]", "").rstrip()
-                    logger.info("Onboarding kick complete — conversation=%d text_len=%d",
-                                convo_id, len(clean_text))
-                    try:
-                        with current_app.app_context():
-                            assistant_msg = Message(
-                                conversation_id=convo_id,
-                                role="assistant",
-                                content=clean_text,
-                                tool_calls=json.dumps(tool_calls_log) if tool_calls_log else None,
-                            )
-                            db.session.add(assistant_msg)
-                            db.session.commit()
-                    except Exception:
-                        logger.exception("Failed to save onboarding kick message — conversation=%d", convo_id)
-        except Exception:
-            logger.exception("Agent error during onboarding kick — conversation=%d", convo_id)
-            error_data = json.dumps({"message": "An unexpected error occurred during onboarding. Please try again."})
-            yield f"event: error\ndata: {error_data}\n\n"
-
-    return Response(
-        stream_with_context(generate()),
-        mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
+    return _start_agent_run(
+        agent, llm_messages, convo_id, label="Onboarding kick",
+        error_message="An unexpected error occurred during onboarding. Please try again.",
+        clean_text=_strip_onboarding_marker,
     )
@@ -334,11 +334,18 @@ def get_providers():
 
 @config_bp.route('/api/telemetry/stats', methods=['GET'])
 def telemetry_stats():
-    """Get telemetry database summary statistics."""
+    """Get telemetry database summary statistics.
+
+    ``response_cache`` holds the API response cache's hit/miss counters
+    and size per namespace.
+    """
+    from backend import response_cache
     from backend.data_dir import get_data_dir
     from backend.telemetry.export import get_stats
     db_path = get_data_dir() / "telemetry.db"
-    return jsonify(get_stats(db_path)), 200
+    stats = get_stats(db_path)
+    stats["response_cache"] = response_cache.stats()
+    return jsonify(stats), 200
 
 
 @config_bp.route('/api/telemetry/export', methods=['GET'])
@@ -7,6 +7,7 @@ from flask import Blueprint, jsonify, request
 from backend.database import db
 from backend.models.job import Job
 from backend.models.job_document import JobDocument
+from backend.table_versions import conditional
 from backend.validation import VALID_DOC_TYPES, validate_document_data
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,7 @@ job_documents_bp = Blueprint(
 
 
 @job_documents_bp.route("/<int:job_id>/documents", methods=["GET"])
+@conditional("jobs", "job_documents")
 def get_latest_document(job_id):
     """Get the latest version of a document.  Requires ``?type=`` query param."""
     db.get_or_404(Job, job_id)
@@ -32,6 +34,7 @@ def get_latest_document(job_id):
 
 
 @job_documents_bp.route("/<int:job_id>/documents/history", methods=["GET"])
+@conditional("jobs", "job_documents")
 def get_document_history(job_id):
     """Get all versions of a document.  Requires ``?type=`` query param."""
     db.get_or_404(Job, job_id)
@@ -1,13 +1,23 @@
+import base64
+import binascii
+import csv
+import io
+import json
 import logging
-from datetime import date
+from datetime import date, datetime
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 
 from backend.database import db
+from backend.job_batch import apply_job_updates, delete_jobs, missing_job_ids, validate_job_ids, validate_job_updates
+from backend.job_stats import get_job_stats
 from backend.models.job import Job
+from backend.models.job_tag import JobTag, jobs_with_all_tags
 from backend.models.application_todo import ApplicationTodo
 from backend.models.search_result import SearchResult
-from backend.validation import validate_job_data, validate_todo_data
+from backend.serialization import RowSerializer, json_response
+from backend.table_versions import conditional
+from backend.validation import validate_job_data, validate_job_list_params, validate_todo_data
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +32,203 @@ _JOB_FIELDS = (
 )
 
 
+# Bulk import: rows validated and inserted per transaction
+BULK_CHUNK_SIZE = 500
+
+# Bulk import: per-row errors included in the response (the count is always exact)
+MAX_BULK_ERRORS = 1000
+
+# Bulk import/export formats -> response mimetype
+_BULK_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# Export: rows fetched from SQLite per round trip
+_EXPORT_BATCH_SIZE = 1000
+
+
+# Columns that GET /api/jobs can sort on — only indexed ones, so keyset
+# pagination stays an index range scan instead of a sort over the table.
+_SORTABLE_COLUMNS = {
+    c.name for c in Job.__table__.columns if c.index or c.primary_key
+}
+
+# Fields that can be requested via ``?fields=`` projection
+_PROJECTABLE_FIELDS = set(Job.__table__.columns.keys())
+
+# Column-tuple serializer for listings (same output as Job.to_dict())
+_JOB_ROWS = RowSerializer(Job)
+
+
+def _encode_cursor(sort, order, value, job_id):
+    """Encode the keyset position of the last row on a page as an opaque token.
+
+    Date and DateTime values are the stored text (listings select them raw),
+    so the next page compares against exactly what SQLite sorts on.
+    """
+    raw = json.dumps([sort, order, value, job_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(token, sort, order):
+    """Decode a cursor token into ``(value, id)``.
+
+    Raises ValueError if the token is malformed or was issued for a
+    different sort/order than the current request.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        c_sort, c_order, value, job_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("cursor is malformed")
+    if not isinstance(job_id, int) or not isinstance(value, (str, int, float, type(None))):
+        raise ValueError("cursor is malformed")
+    if c_sort != sort or c_order != order:
+        raise ValueError("cursor does not match the requested sort order")
+    return value, job_id
+
+
+def _keyset_filter(column, order, value, job_id):
+    """Build the WHERE clause selecting rows strictly after ``(value, id)``.
+
+    SQLite sorts NULL as the smallest value, so NULLs come last in
+    descending order and first in ascending order.  Date and DateTime
+    columns are compared against the stored text, as message paging does,
+    so second- and microsecond-precision timestamps order the same way
+    SQLite sorts them.
+    """
+    if value is None:
+        if order == "desc":
+            return db.and_(column.is_(None), Job.id < job_id)
+        return db.or_(column.isnot(None), db.and_(column.is_(None), Job.id > job_id))
+    if isinstance(column.type, (db.DateTime, db.Date)):
+        value = db.literal(value, db.String)
+    if order == "desc":
+        return db.or_(db.tuple_(column, Job.id) < db.tuple_(value, job_id), column.is_(None))
+    return db.tuple_(column, Job.id) > db.tuple_(value, job_id)
+
+
+def _apply_job_filters(query, params):
+    """Apply the validated server-side filters from ``validate_job_list_params``."""
+    if "status" in params:
+        query = query.filter(Job.status.in_(params["status"]))
+    if "remote_type" in params:
+        query = query.filter(Job.remote_type.in_(params["remote_type"]))
+    if "source" in params:
+        query = query.filter(db.func.lower(Job.source).in_([s.lower() for s in params["source"]]))
+    if "tag" in params:
+        query = query.filter(Job.id.in_(jobs_with_all_tags(params["tag"])))
+    # Salary filters match jobs whose advertised range overlaps the requested one
+    if params.get("min_salary") is not None:
+        query = query.filter(db.func.coalesce(Job.salary_max, Job.salary_min) >= params["min_salary"])
+    if params.get("max_salary") is not None:
+        query = query.filter(db.func.coalesce(Job.salary_min, Job.salary_max) <= params["max_salary"])
+    if params.get("min_fit") is not None:
+        query = query.filter(Job.job_fit >= params["min_fit"])
+    if params.get("max_fit") is not None:
+        query = query.filter(Job.job_fit <= params["max_fit"])
+    return query
+
+
+def _serialize_value(value):
+    """Format a raw column value the same way ``Job.to_dict()`` does."""
+    if isinstance(value, datetime):
+        return value.isoformat() + "+00:00"
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
 @jobs_bp.route("", methods=["GET"])
+@conditional("jobs", "job_tags")
 def list_jobs():
-    jobs = Job.query.order_by(Job.created_at.desc()).all()
-    return jsonify([job.to_dict() for job in jobs])
+    """List jobs, optionally filtered, sorted, projected and paginated.
+
+    Without ``limit`` the full (filtered) list is returned.  With ``limit``
+    the response holds at most that many jobs and, if more rows exist, an
+    ``X-Next-Cursor`` header whose value is passed back as ``?cursor=``.
+    """
+    params, errors = validate_job_list_params(
+        request.args, sortable=_SORTABLE_COLUMNS, projectable=_PROJECTABLE_FIELDS,
+    )
+    if errors:
+        return jsonify({"error": "; ".join(errors)}), 400
+
+    sort, order, limit = params["sort"], params["order"], params["limit"]
+    sort_col = Job.__table__.columns[sort]
+    fields = params["fields"] or _JOB_ROWS.fields
+
+    # Select plain column tuples instead of hydrating Job instances; the
+    # keyset columns are always selected (after *fields*) so a cursor can
+    # be built.
+    extras = [c for c in ("id", sort) if c not in fields]
+    query = db.session.query(*_JOB_ROWS.columns([*fields, *extras]))
+
+    query = _apply_job_filters(query, params)
+
+    if params["cursor"]:
+        try:
+            value, last_id = _decode_cursor(params["cursor"], sort, order)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        query = query.filter(_keyset_filter(sort_col, order, value, last_id))
+
+    if order == "desc":
+        query = query.order_by(sort_col.desc(), Job.id.desc())
+    else:
+        query = query.order_by(sort_col.asc(), Job.id.asc())
+
+    if limit is not None:
+        query = query.limit(limit + 1)
+    rows = query.all()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = _encode_cursor(sort, order, getattr(last, sort), last.id)
+
+    response = json_response(_JOB_ROWS.serialize(rows, fields))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
+
+@jobs_bp.route("/stats", methods=["GET"])
+@conditional("jobs")
+def job_stats():
+    """Return pipeline aggregates (status, salary, fit and monthly counts).
+
+    Computed with SQL GROUP BYs and cached until a job is next committed.
+    """
+    return jsonify(get_job_stats())
+
+
+@jobs_bp.route("/tags", methods=["GET"])
+@conditional("jobs", "job_tags")
+def tag_facets():
+    """Return ``[{tag, count}, ...]`` for jobs matching the listing filters.
+
+    Counts come from a single GROUP BY over ``job_tags``, most-used first.
+    With a ``tag`` filter the counts cover jobs carrying all of those tags,
+    so they drill down like facets.
+    """
+    params, errors = validate_job_list_params(
+        request.args, sortable=_SORTABLE_COLUMNS, projectable=_PROJECTABLE_FIELDS,
+    )
+    if errors:
+        return jsonify({"error": "; ".join(errors)}), 400
+
+    count = db.func.count().label("count")
+    query = db.session.query(JobTag.tag, count)
+    filters = {k for k in params if k not in ("sort", "order", "limit", "cursor", "fields")}
+    if filters - {"tag"}:
+        query = _apply_job_filters(query.join(Job, Job.id == JobTag.job_id), params)
+    elif "tag" in params:
+        query = query.filter(JobTag.job_id.in_(jobs_with_all_tags(params["tag"])))
+    rows = query.group_by(JobTag.tag).order_by(count.desc(), JobTag.tag).all()
+    return jsonify([{"tag": tag, "count": n} for tag, n in rows])
 
 
 @jobs_bp.route("", methods=["POST"])
@@ -66,6 +269,7 @@ def create_job():
 
 
 @jobs_bp.route("/<int:job_id>", methods=["GET"])
+@conditional("jobs")
 def get_job(job_id):
     job = db.get_or_404(Job, job_id)
     return jsonify(job.to_dict())
@@ -105,12 +309,236 @@ def delete_job(job_id):
     return "", 204
 
 
+# ---------------------------------------------------------------------------
+# Batch update / delete
+# ---------------------------------------------------------------------------
+
+
+def _missing_response(missing):
+    return jsonify({
+        "error": "Jobs not found: " + ", ".join(map(str, missing)),
+        "missing": missing,
+    }), 404
+
+
+@jobs_bp.route("/batch", methods=["PATCH"])
+def batch_update_jobs():
+    """Apply ``{"updates": [{"id": ..., <fields>}, ...]}`` in one transaction.
+
+    Every update is validated and every job must exist before anything is
+    written; otherwise nothing changes and the response lists the problems.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body is required"}), 400
+    cleaned, errors = validate_job_updates(data.get("updates"))
+    if errors:
+        return jsonify({"error": "Batch rejected; no jobs were changed", "errors": errors}), 400
+    missing = missing_job_ids([job_id for job_id, _ in cleaned])
+    if missing:
+        return _missing_response(missing)
+
+    jobs = apply_job_updates(cleaned)
+    return jsonify({"jobs": [job.to_dict() for job in jobs]})
+
+
+@jobs_bp.route("/batch", methods=["DELETE"])
+def batch_delete_jobs():
+    """Delete ``{"ids": [...]}`` in one transaction (all or nothing)."""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body is required"}), 400
+    ids, errors = validate_job_ids(data.get("ids"))
+    if errors:
+        return jsonify({"error": "; ".join(errors)}), 400
+    missing = missing_job_ids(ids)
+    if missing:
+        return _missing_response(missing)
+
+    deleted = delete_jobs(ids)
+    return jsonify({"deleted": [job["id"] for job in deleted]})
+
+
+# ---------------------------------------------------------------------------
+# Bulk import / export
+# ---------------------------------------------------------------------------
+
+
+def _bulk_format():
+    """Return the bulk format from ``?format=`` or the Content-Type, or None."""
+    fmt = request.args.get("format")
+    if fmt is None:
+        fmt = "csv" if request.mimetype == "text/csv" else "ndjson"
+    return fmt if fmt in _BULK_FORMATS else None
+
+
+def _iter_bulk_rows(fmt):
+    """Yield ``(row_number, data)`` from the request body without buffering it.
+
+    NDJSON rows are numbered by line; CSV rows by record (header excluded).
+    ``data`` is the decoded object, or an error string for lines that are
+    not JSON objects.  Empty CSV cells become None.
+    """
+    stream = io.TextIOWrapper(request.stream, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        for number, record in enumerate(csv.DictReader(stream), start=1):
+            yield number, {k: (v if v != "" else None) for k, v in record.items() if k}
+        return
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield number, "line is not valid JSON"
+            continue
+        yield number, data if isinstance(data, dict) else "line must be a JSON object"
+
+
+def _bulk_insert_values(data):
+    """Validate one import row into a full column dict for ``insert(Job)``.
+
+    Returns ``(values, errors)``.  Every row gets the same keys so a chunk
+    can be sent to SQLite as a single executemany.
+    """
+    if not isinstance(data, dict):
+        return None, [data]
+    cleaned, errors = validate_job_data(data, require_company_title=True)
+    applied = cleaned.get("applied_date")
+    try:
+        applied_date = date.fromisoformat(applied) if applied else None
+    except (ValueError, TypeError):
+        errors.append("applied_date must be a valid ISO date (YYYY-MM-DD)")
+    if errors:
+        return None, errors
+
+    values = {field: cleaned.get(field) for field in _JOB_FIELDS}
+    values["status"] = values["status"] or "saved"
+    values["applied_date"] = applied_date
+    return values, []
+
+
+@jobs_bp.route("/bulk", methods=["POST"])
+def bulk_import_jobs():
+    """Import jobs from a streamed NDJSON or CSV body.
+
+    Rows are validated and inserted in chunks of ``BULK_CHUNK_SIZE``, one
+    transaction per chunk.  Invalid rows are skipped and reported by row
+    number; valid rows are still imported.  The format comes from
+    ``?format=ndjson|csv`` or the Content-Type (``text/csv``), defaulting
+    to NDJSON.
+    """
+    fmt = _bulk_format()
+    if fmt is None:
+        return jsonify({"error": f"format must be one of: {', '.join(_BULK_FORMATS)}"}), 400
+
+    inserted = 0
+    failed = 0
+    errors = []
+    chunk = []
+
+    def flush():
+        nonlocal inserted
+        if chunk:
+            job_ids = db.session.execute(
+                db.insert(Job).returning(Job.id, sort_by_parameter_order=True), chunk,
+            ).scalars().all()
+            tag_rows = [
+                row
+                for job_id, values in zip(job_ids, chunk)
+                for row in JobTag.rows_for(job_id, values["tags"])
+            ]
+            if tag_rows:
+                db.session.execute(db.insert(JobTag), tag_rows)
+            db.session.commit()
+            inserted += len(chunk)
+            chunk.clear()
+
+    try:
+        for number, data in _iter_bulk_rows(fmt):
+            values, row_errors = _bulk_insert_values(data)
+            if row_errors:
+                failed += 1
+                if len(errors) < MAX_BULK_ERRORS:
+                    errors.append({"row": number, "errors": row_errors})
+                continue
+            chunk.append(values)
+            if len(chunk) >= BULK_CHUNK_SIZE:
+                flush()
+        flush()
+    except (UnicodeDecodeError, csv.Error) as e:
+        db.session.rollback()
+        logger.warning("Bulk job import aborted after %d rows: %s", inserted, e)
+        return jsonify({
+            "error": "Request body could not be parsed as " + fmt.upper(),
+            "inserted": inserted,
+            "failed": failed,
+            "errors": errors,
+        }), 400
+
+    return jsonify({"inserted": inserted, "failed": failed, "errors": errors})
+
+
+def _export_lines(fmt, fields, statement):
+    """Yield the export body line by line, fetching rows in batches."""
+    result = db.session.execute(statement.execution_options(yield_per=_EXPORT_BATCH_SIZE))
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def line(values):
+            writer.writerow(values)
+            text = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return text
+
+        yield line(fields)
+        for row in result:
+            yield line("" if v is None else _serialize_value(v) for v in row)
+        return
+    for row in result:
+        yield json.dumps(dict(zip(fields, map(_serialize_value, row)))) + "\n"
+
+
+@jobs_bp.route("/export", methods=["GET"])
+def export_jobs():
+    """Stream all matching jobs as NDJSON (default) or CSV.
+
+    Accepts the listing filters, ``sort``/``order`` and ``fields`` of
+    ``GET /api/jobs``; rows are streamed as they are read instead of being
+    built into one list.  The output can be fed back to ``POST /bulk``.
+    """
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in _BULK_FORMATS:
+        return jsonify({"error": f"format must be one of: {', '.join(_BULK_FORMATS)}"}), 400
+    params, errors = validate_job_list_params(
+        request.args, sortable=_SORTABLE_COLUMNS, projectable=_PROJECTABLE_FIELDS,
+    )
+    if errors:
+        return jsonify({"error": "; ".join(errors)}), 400
+
+    fields = params["fields"] or list(Job.__table__.columns.keys())
+    sort_col = Job.__table__.columns[params["sort"]]
+    order_by = (sort_col.desc(), Job.id.desc()) if params["order"] == "desc" else (sort_col.asc(), Job.id.asc())
+    statement = _apply_job_filters(
+        db.select(*(Job.__table__.columns[f] for f in fields)), params,
+    ).order_by(*order_by)
+
+    return Response(
+        stream_with_context(_export_lines(fmt, fields, statement)),
+        mimetype=_BULK_FORMATS[fmt],
+        headers={"Content-Disposition": f"attachment; filename=jobs.{fmt}"},
+    )
+
+
 # ---------------------------------------------------------------------------
 # Application Todos (nested under /api/jobs/<job_id>/todos)
 # ---------------------------------------------------------------------------
 
 
 @jobs_bp.route("/<int:job_id>/todos", methods=["GET"])
+@conditional("jobs", "application_todos")
 def list_todos(job_id):
     db.get_or_404(Job, job_id)
     todos = (ApplicationTodo.query
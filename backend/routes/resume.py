@@ -112,7 +112,7 @@ def parse_resume_with_llm():
     Uses the configured LLM provider to clean up raw extracted text and
     return a structured representation of the resume.
     """
-    from backend.config_manager import get_llm_config
+    from backend.config_manager import get_llm_config, get_prompt_caching_enabled
     from backend.llm.llm_factory import create_llm_config
     from backend.agent import get_agent_classes
     _, _, ResumeParser = get_agent_classes()
@@ -132,6 +132,7 @@ def parse_resume_with_llm():
             llm_config["provider"],
             llm_config["api_key"],
             llm_config["model"],
+            prompt_caching=get_prompt_caching_enabled(),
         )
     except Exception as e:
         logger.error("Failed to create LLM config for resume parsing: %s", sanitize_error(e))
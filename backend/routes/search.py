@@ -0,0 +1,43 @@
+"""Search blueprint — ranked full-text search across the app database."""
+
+import logging
+
+from flask import Blueprint, jsonify, request
+
+from backend.search import SCOPES, search
+
+logger = logging.getLogger(__name__)
+
+search_bp = Blueprint("search", __name__, url_prefix="/api/search")
+
+MAX_SEARCH_LIMIT = 100
+
+
+@search_bp.route("", methods=["GET"])
+def full_text_search():
+    """Search jobs, search results, messages and job documents.
+
+    Query params: ``q`` (required), ``scope`` (comma-separated subset of
+    jobs, search_results, messages, job_documents; default all) and
+    ``limit`` (per scope, default 20).
+    """
+    q = (request.args.get("q") or "").strip()
+    if not q:
+        return jsonify({"error": "q query parameter is required"}), 400
+
+    scopes = [s.strip() for s in request.args.get("scope", "").split(",") if s.strip()]
+    unknown = [s for s in scopes if s not in SCOPES]
+    if unknown:
+        return jsonify({"error": f"Invalid scope '{unknown[0]}'. Must be one of: {', '.join(SCOPES)}"}), 400
+
+    try:
+        limit = int(request.args.get("limit", 20))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    if not 1 <= limit <= MAX_SEARCH_LIMIT:
+        return jsonify({"error": f"limit must be between 1 and {MAX_SEARCH_LIMIT}"}), 400
+
+    results = search(q, scopes or None, limit=limit)
+    logger.info("search: q_len=%d scopes=%s hits=%d",
+                len(q), ",".join(results), sum(len(v) for v in results.values()))
+    return jsonify({"query": q, "results": results})
@@ -0,0 +1,166 @@
+"""Full-text search over the app database using SQLite FTS5.
+
+The ``*_fts`` virtual tables and the triggers that keep them in sync with
+their content tables are created by migration ``dfa0164721f2``.  This
+module turns free-form user text into safe FTS5 MATCH expressions and runs
+ranked (bm25) queries against those indexes.
+
+Consumers:
+    - backend/routes/search.py   GET /api/search
+    - backend/agent/tools/       list_jobs, list_search_results, search_saved_data
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from backend.database import db
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Snippet markers — plain text so agents and the UI can both render them
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_TOKENS = 12
+
+
+@dataclass(frozen=True)
+class SearchScope:
+    """One searchable table: its FTS index and the columns returned per hit."""
+
+    table: str
+    columns: tuple[str, ...]           # indexed columns, in FTS declaration order
+    weights: tuple[float, ...]         # bm25 column weights (same order)
+    fields: tuple[str, ...]            # content-table columns returned with each hit
+
+    @property
+    def fts(self) -> str:
+        return f"{self.table}_fts"
+
+
+SCOPES: dict[str, SearchScope] = {
+    "jobs": SearchScope(
+        table="jobs",
+        columns=("company", "title", "url", "location", "tags",
+                 "notes", "requirements", "nice_to_haves"),
+        weights=(8.0, 10.0, 2.0, 2.0, 4.0, 1.0, 1.0, 1.0),
+        fields=("id", "company", "title", "status", "url"),
+    ),
+    "search_results": SearchScope(
+        table="search_results",
+        columns=("company", "title", "location",
+                 "description", "requirements", "nice_to_haves", "fit_reason"),
+        weights=(8.0, 10.0, 2.0, 1.0, 1.0, 1.0, 1.0),
+        fields=("id", "conversation_id", "company", "title", "job_fit", "url"),
+    ),
+    "messages": SearchScope(
+        table="messages",
+        columns=("content",),
+        weights=(1.0,),
+        fields=("id", "conversation_id", "role"),
+    ),
+    "job_documents": SearchScope(
+        table="job_documents",
+        columns=("content",),
+        weights=(1.0,),
+        fields=("id", "job_id", "doc_type", "version"),
+    ),
+}
+
+
+def _tokens(text: str | None) -> list[str]:
+    return _TOKEN_RE.findall(text or "")
+
+
+def match_all_terms(text: str | None) -> str | None:
+    """Build a MATCH expression requiring every word of *text* (prefix match).
+
+    User input is reduced to word tokens and each token is quoted, so FTS5
+    operators and punctuation in the input can never produce a syntax error.
+    Returns None if *text* contains no searchable words.
+    """
+    tokens = _tokens(text)
+    if not tokens:
+        return None
+    return " ".join(f'"{t}"*' for t in tokens)
+
+
+def match_phrase(text: str | None, column: str) -> str | None:
+    """Build a MATCH expression for *text* as a phrase within one column.
+
+    The last word is prefix-matched, so ``"greenhouse.io/acm"`` matches a
+    URL containing ``greenhouse.io/acme``.  Returns None if *text* contains
+    no searchable words.
+    """
+    tokens = _tokens(text)
+    if not tokens:
+        return None
+    return f'{column} : "{" ".join(tokens)}" *'
+
+
+def combine(*expressions: str | None) -> str | None:
+    """AND together the non-empty MATCH expressions."""
+    parts = [f"({e})" for e in expressions if e]
+    return " AND ".join(parts) or None
+
+
+def ranked_matches(scope_name: str, expression: str):
+    """Return a subquery of ``(rowid, score)`` for *expression*, best first.
+
+    ``score`` is the weighted bm25 rank — lower is better, as in FTS5.
+    Join it to the content table on ``rowid == id`` to filter or order.
+    """
+    scope = SCOPES[scope_name]
+    weights = ", ".join(str(w) for w in scope.weights)
+    stmt = db.text(
+        f"SELECT rowid, bm25({scope.fts}, {weights}) AS score "
+        f"FROM {scope.fts} WHERE {scope.fts} MATCH :expr"
+    ).bindparams(expr=expression).columns(
+        db.column("rowid", db.Integer), db.column("score", db.Float),
+    )
+    return stmt.subquery()
+
+
+def search(
+    query: str,
+    scopes: list[str] | None = None,
+    limit: int = 20,
+) -> dict[str, list[dict]]:
+    """Run a ranked full-text search across one or more scopes.
+
+    Returns ``{scope_name: [hit, ...]}`` where each hit holds the scope's
+    ``fields``, a bm25 ``score`` (lower is better) and a ``snippet`` with
+    matched terms wrapped in ``<mark>`` tags.  Scopes with no matches map
+    to an empty list.
+    """
+    expression = match_all_terms(query)
+    results: dict[str, list[dict]] = {}
+    for name in scopes or list(SCOPES):
+        scope = SCOPES[name]
+        if expression is None:
+            results[name] = []
+            continue
+        weights = ", ".join(str(w) for w in scope.weights)
+        field_sql = ", ".join(f"t.{f}" for f in scope.fields)
+        rows = db.session.execute(
+            db.text(
+                f"SELECT {field_sql}, "
+                f"bm25({scope.fts}, {weights}) AS score, "
+                f"snippet({scope.fts}, -1, :start, :end, :ellipsis, :tokens) AS snippet "
+                f"FROM {scope.fts} JOIN {scope.table} AS t ON t.id = {scope.fts}.rowid "
+                f"WHERE {scope.fts} MATCH :expr "
+                f"ORDER BY score LIMIT :limit"
+            ),
+            {
+                "expr": expression,
+                "start": SNIPPET_START,
+                "end": SNIPPET_END,
+                "ellipsis": SNIPPET_ELLIPSIS,
+                "tokens": SNIPPET_TOKENS,
+                "limit": limit,
+            },
+        ).mappings().all()
+        results[name] = [dict(row) for row in rows]
+    return results
@@ -0,0 +1,185 @@
+"""Fast JSON serialization for list endpoints.
+
+The ORM path (hydrate instances, call ``to_dict()``, encode with the
+stdlib encoder) costs most of a large list response.  This module instead
+selects plain column tuples with SQLAlchemy Core, formats only the columns
+that need it, and encodes with orjson when it is installed (it comes in
+with dspy; the stdlib encoder is used otherwise).
+
+Output is byte-identical to ``jsonify([obj.to_dict() for obj in ...])``
+under Flask's default JSON provider:
+
+- DateTime and Date columns are read as their stored SQLite text.  They
+  are rewritten into ``isoformat()`` form without building datetime
+  objects.
+- Keys are sorted.  orjson writes non-ASCII text as raw UTF-8 where
+  ``ensure_ascii`` escapes it.  Payloads whose orjson output is not pure
+  printable ASCII are therefore re-encoded with the stdlib C encoder,
+  which beats escaping orjson's output after the fact.
+- JSON text columns (``Message.tool_calls``) whose floats orjson would
+  format differently from ``repr()`` send the whole payload to the stdlib
+  encoder.
+
+When the app's JSON provider is configured differently (debug-mode
+indentation, for example), ``json_response`` defers to it.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import date, datetime
+
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+from backend.database import db
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with dspy
+    orjson = None
+
+# Float spellings where orjson and repr() disagree (negative exponents,
+# non-finite values); JSON text containing them is re-encoded by stdlib.
+_REPR_SENSITIVE_RE = re.compile(r"[eE]-|NaN|Infinity")
+
+
+class _StdlibOnly:
+    """Wraps a value orjson must not encode; its presence forces the stdlib path."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+def _unwrap(obj):
+    if isinstance(obj, _StdlibOnly):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(payload) -> str:
+    return json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(",", ":"),
+                      default=_unwrap)
+
+
+def dumps(payload) -> bytes:
+    """Encode *payload* exactly as Flask's default provider would (no newline)."""
+    if orjson is not None:
+        try:
+            out = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        except (orjson.JSONEncodeError, TypeError):
+            pass  # _StdlibOnly values, integers beyond 64 bits, lone surrogates
+        else:
+            # ensure_ascii also escapes DEL, which orjson leaves raw
+            if out.isascii() and b"\x7f" not in out:
+                return out
+    return _stdlib_dumps(payload).encode()
+
+
+def json_response(payload, status: int = 200):
+    """Return a JSON response for *payload*, using the fast encoder when safe."""
+    provider = current_app.json
+    compact = provider.compact if provider.compact is not None else not current_app.debug
+    if not (type(provider) is DefaultJSONProvider and compact
+            and provider.sort_keys and provider.ensure_ascii):
+        response = provider.response(payload)
+        response.status_code = status
+        return response
+    return current_app.response_class(
+        dumps(payload) + b"\n", status=status, mimetype=provider.mimetype,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Column formatting
+# ---------------------------------------------------------------------------
+
+
+def _utc_timestamp(raw):
+    """Format stored DateTime text like ``dt.isoformat() + "+00:00"``."""
+    if raw is None:
+        return None
+    # Stored as "YYYY-MM-DD HH:MM:SS" (CURRENT_TIMESTAMP) or with ".ffffff"
+    if len(raw) == 19 and raw[10] == " ":
+        return f"{raw[:10]}T{raw[11:]}+00:00"
+    if len(raw) == 26 and raw[10] == " ":
+        if raw.endswith(".000000"):
+            return f"{raw[:10]}T{raw[11:19]}+00:00"
+        return f"{raw[:10]}T{raw[11:]}+00:00"
+    return datetime.fromisoformat(raw).isoformat() + "+00:00"
+
+
+def _iso_date(raw):
+    """Format stored Date text like ``d.isoformat()``."""
+    if raw is None:
+        return None
+    if len(raw) == 10:
+        return raw
+    return date.fromisoformat(raw[:10]).isoformat()
+
+
+def _json_text(raw):
+    """Decode a JSON text column like ``json.loads(raw) if raw else None``."""
+    if not raw:
+        return None
+    if orjson is None:
+        return json.loads(raw)
+    if not _REPR_SENSITIVE_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. integers beyond 64 bits; let the stdlib decide
+    return _StdlibOnly(json.loads(raw))
+
+
+def _formatters(table) -> dict:
+    formatters = {}
+    for column in table.columns:
+        if isinstance(column.type, db.DateTime):
+            formatters[column.name] = _utc_timestamp
+        elif isinstance(column.type, db.Date):
+            formatters[column.name] = _iso_date
+    return formatters
+
+
+def raw_column(column):
+    """Select *column*, reading DateTime/Date values as their stored text."""
+    if isinstance(column.type, (db.DateTime, db.Date)):
+        return db.type_coerce(column, db.String).label(column.name)
+    return column
+
+
+class RowSerializer:
+    """Turns Core rows of one table into ``to_dict()``-equivalent dicts.
+
+    ``columns(fields)`` gives the select list; rows must start with those
+    columns in that order (extra trailing columns are ignored).
+    """
+
+    def __init__(self, model, json_fields: tuple[str, ...] = ()):
+        self.table = model.__table__
+        self.fields = tuple(self.table.columns.keys())
+        self._formatters = _formatters(self.table)
+        for name in json_fields:
+            self._formatters[name] = _json_text
+
+    def columns(self, fields=None) -> list:
+        return [raw_column(self.table.columns[f]) for f in (fields or self.fields)]
+
+    def serialize(self, rows, fields=None) -> list[dict]:
+        keys = tuple(fields or self.fields)
+        active = [(k, f) for k, f in self._formatters.items() if k in keys]
+        out = []
+        for row in rows:
+            item = dict(zip(keys, row))
+            for key, fmt in active:
+                item[key] = fmt(item[key])
+            out.append(item)
+        return out
+
+    def select(self, fields=None):
+        """Return a Core select of *fields* (default: every column)."""
+        return db.select(*self.columns(fields))
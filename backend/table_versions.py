@@ -0,0 +1,165 @@
+"""Per-table change counters and conditional GET (ETag / 304) support.
+
+Every app keeps a version number per database table in
+``app.extensions["table_versions"]``.  SQLAlchemy Session events record
+the tables a transaction writes to, whether through ORM flushes or Core
+DML such as bulk import.  When the transaction commits, those tables'
+versions are bumped.  Deletes also bump every table that the database
+cascades into (``ON DELETE CASCADE`` / ``SET NULL`` foreign keys).  Raw
+SQL (``db.text``) writes are not tracked.
+
+Read endpoints decorated with ``@conditional("jobs", ...)`` send a weak
+ETag built from the versions of the tables they read.  They answer a
+matching ``If-None-Match`` with ``304 Not Modified`` without querying the
+database.  ``backend/job_stats.py`` uses the same counters to invalidate
+its cache.
+"""
+
+from __future__ import annotations
+
+import functools
+import secrets
+import threading
+
+from flask import current_app, has_app_context, make_response, request
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from backend.database import db
+
+# Session.info key holding the table names written in the current transaction
+_WRITTEN_KEY = "written_tables"
+
+
+class TableVersions:
+    """Thread-safe map of table name -> version, starting at 0.
+
+    ``token`` is random per instance, so ETags issued before a restart
+    never match counters that restarted from zero.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions: dict[str, int] = {}
+        self.token = secrets.token_hex(4)
+
+    def get(self, table: str) -> int:
+        return self._versions.get(table, 0)
+
+    def bump(self, tables):
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def etag(self, tables) -> str:
+        return ".".join([self.token, *(str(self.get(t)) for t in tables)])
+
+
+def init_app(app):
+    """Attach fresh table versions to *app*."""
+    app.extensions["table_versions"] = TableVersions()
+
+
+def _versions() -> TableVersions | None:
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("table_versions")
+
+
+def table_version(table: str) -> int:
+    """Return the current version of *table* (0 outside an app context)."""
+    versions = _versions()
+    return versions.get(table) if versions is not None else 0
+
+
+# ---------------------------------------------------------------------------
+# Write tracking
+# ---------------------------------------------------------------------------
+
+
+@functools.cache
+def _cascade_targets(table: str) -> frozenset[str]:
+    """Tables whose rows the database changes when a *table* row is deleted."""
+    found: set[str] = set()
+    pending = [table]
+    while pending:
+        parent = pending.pop()
+        for child in db.metadata.tables.values():
+            if child.name in found:
+                continue
+            for fk in child.foreign_keys:
+                if fk.column.table.name == parent and fk.ondelete:
+                    found.add(child.name)
+                    pending.append(child.name)
+                    break
+    return frozenset(found)
+
+
+def _mark(session, table: str, deleted: bool = False):
+    written = session.info.setdefault(_WRITTEN_KEY, set())
+    written.add(table)
+    if deleted:
+        written.update(_cascade_targets(table))
+
+
+@event.listens_for(Session, "before_flush")
+def _mark_flushed(session, flush_context, instances):
+    for obj in (*session.new, *session.dirty):
+        _mark(session, inspect(obj).mapper.local_table.name)
+    for obj in session.deleted:
+        _mark(session, inspect(obj).mapper.local_table.name, deleted=True)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        name = getattr(table, "name", None)
+        if name:
+            _mark(orm_execute_state.session, name, deleted=orm_execute_state.is_delete)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session):
+    written = session.info.pop(_WRITTEN_KEY, None)
+    if written:
+        versions = _versions()
+        if versions is not None:
+            versions.bump(written)
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session):
+    session.info.pop(_WRITTEN_KEY, None)
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET
+# ---------------------------------------------------------------------------
+
+
+def conditional(*tables: str):
+    """Decorate a GET view whose response depends only on *tables*.
+
+    Successful responses carry a weak ETag and ``Cache-Control: no-cache``,
+    so clients revalidate on every poll.  A request whose ``If-None-Match``
+    matches the current ETag gets an empty 304 without running the view.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            versions = _versions()
+            if versions is None:
+                return view(*args, **kwargs)
+            etag = versions.etag(tables)
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+        return wrapper
+    return decorator
@@ -188,14 +188,19 @@ class TelemetryCollector:
         self, run_id: str | None, module_trace_id: str | None,
         model: str | None, tokens_in: int | None,
         tokens_out: int | None, latency_ms: int | None,
-        cost_usd: float | None,
+        cost_usd: float | None, tokens_in_cached: int | None = None,
     ) -> None:
+        tokens_in_uncached = None
+        if tokens_in is not None and tokens_in_cached is not None:
+            tokens_in_uncached = max(tokens_in - tokens_in_cached, 0)
         self._enqueue("llm_call", {
             "id": _uuid_short(),
             "run_id": run_id,
             "module_trace_id": module_trace_id,
             "model": model,
             "tokens_in": tokens_in,
+            "tokens_in_cached": tokens_in_cached,
+            "tokens_in_uncached": tokens_in_uncached,
             "tokens_out": tokens_out,
             "latency_ms": latency_ms,
             "cost_usd": cost_usd,
@@ -346,10 +351,11 @@ class TelemetryCollector:
         elif event_type == "llm_call":
             self._conn.execute(
                 "INSERT INTO llm_calls "
-                "(id, run_id, module_trace_id, model, tokens_in, tokens_out, "
-                "latency_ms, cost_usd, called_at) "
+                "(id, run_id, module_trace_id, model, tokens_in, tokens_in_cached, "
+                "tokens_in_uncached, tokens_out, latency_ms, cost_usd, called_at) "
                 "VALUES (:id, :run_id, :module_trace_id, :model, :tokens_in, "
-                ":tokens_out, :latency_ms, :cost_usd, :called_at)",
+                ":tokens_in_cached, :tokens_in_uncached, :tokens_out, :latency_ms, "
+                ":cost_usd, :called_at)",
                 data,
             )
         elif event_type == "user_signal":
@@ -124,6 +124,9 @@ class TracedThreadPoolExecutor:
     def submit(self, fn: Callable, *args: Any, **kwargs: Any):
         return self._executor.submit(copy_telemetry_context(fn), *args, **kwargs)
 
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
     def __enter__(self):
         self._executor.__enter__()
         return self
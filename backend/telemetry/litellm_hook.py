@@ -1,8 +1,9 @@
 """LiteLLM callback for capturing per-LLM-call metrics.
 
-Automatically records model, token counts, latency, and cost for every
-LLM call made through litellm.completion() — including calls from DSPy
-modules and raw litellm usage (e.g., the result collator).
+Automatically records model, token counts (with prompt tokens split into
+cached and uncached), latency, and cost for every LLM call made through
+litellm.completion() — including calls from DSPy modules and raw litellm
+usage (e.g., the result collator).
 
 Register once at app startup:
     from backend.telemetry.litellm_hook import register_litellm_callback
@@ -22,6 +23,19 @@ from backend.telemetry.context import current_run_id, current_trace_id
 logger = logging.getLogger(__name__)
 
 
+def _cached_prompt_tokens(usage) -> int | None:
+    """Prompt tokens served from the provider's cache, if reported.
+
+    litellm normalizes OpenAI/Gemini ``cached_tokens`` and Anthropic
+    ``cache_read_input_tokens`` into ``prompt_tokens_details.cached_tokens``.
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) if details else None
+    if cached is None:
+        cached = getattr(usage, "cache_read_input_tokens", None)
+    return cached if isinstance(cached, int) else None
+
+
 class TelemetryLiteLLMCallback(CustomLogger):
     """LiteLLM callback that records LLM call metrics to telemetry."""
 
@@ -35,6 +49,7 @@ class TelemetryLiteLLMCallback(CustomLogger):
             usage = getattr(response_obj, "usage", None)
             tokens_in = getattr(usage, "prompt_tokens", None) if usage else None
             tokens_out = getattr(usage, "completion_tokens", None) if usage else None
+            tokens_in_cached = _cached_prompt_tokens(usage) if usage else None
 
             # Latency
             latency_ms = None
@@ -55,6 +70,7 @@ class TelemetryLiteLLMCallback(CustomLogger):
                 tokens_out=tokens_out,
                 latency_ms=latency_ms,
                 cost_usd=cost_usd,
+                tokens_in_cached=tokens_in_cached,
             )
         except Exception:
             logger.debug("Telemetry: failed to record LLM call", exc_info=True)
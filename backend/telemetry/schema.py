@@ -11,7 +11,7 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 2
 
 _SCHEMA_SQL = """
 -- Schema metadata
@@ -87,6 +87,8 @@ CREATE TABLE IF NOT EXISTS llm_calls (
     module_trace_id TEXT REFERENCES module_traces(id),
     model           TEXT,
     tokens_in       INTEGER,
+    tokens_in_cached   INTEGER,  -- prompt tokens read from the provider's prompt cache
+    tokens_in_uncached INTEGER,  -- tokens_in minus tokens_in_cached
     tokens_out      INTEGER,
     latency_ms      INTEGER,
     cost_usd        REAL,
@@ -149,8 +151,8 @@ def init_db(db_path: Path) -> sqlite3.Connection:
 def _migrate_db(conn: sqlite3.Connection) -> None:
     """Run any pending schema migrations.
 
-    Currently a no-op since we're at schema_version 1. Future migrations
-    will check the stored version and apply ALTER TABLE statements as needed.
+    Checks the stored schema_version and applies the ALTER TABLE steps
+    between it and ``SCHEMA_VERSION``.
     """
     row = conn.execute(
         "SELECT value FROM _meta WHERE key = 'schema_version'"
@@ -163,10 +165,18 @@ def _migrate_db(conn: sqlite3.Connection) -> None:
             "Migrating telemetry DB from v%d to v%d",
             stored_version, SCHEMA_VERSION,
         )
-        # Future migrations go here:
-        # if stored_version < 2: _migrate_v1_to_v2(conn)
+        if stored_version < 2:
+            _migrate_v1_to_v2(conn)
         conn.execute(
             "UPDATE _meta SET value = ? WHERE key = 'schema_version'",
             (str(SCHEMA_VERSION),),
         )
         conn.commit()
+
+
+def _migrate_v1_to_v2(conn: sqlite3.Connection) -> None:
+    """v2: split prompt tokens into cached and uncached on ``llm_calls``."""
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(llm_calls)")}
+    for column in ("tokens_in_cached", "tokens_in_uncached"):
+        if column not in columns:
+            conn.execute(f"ALTER TABLE llm_calls ADD COLUMN {column} INTEGER")
@@ -189,6 +189,180 @@ def validate_job_data(
     return cleaned, errors
 
 
+# ---------------------------------------------------------------------------
+# Job listing query parameters
+# ---------------------------------------------------------------------------
+
+# Page size bounds for GET /api/jobs (unpaginated when ``limit`` is omitted)
+MAX_PAGE_SIZE = 500
+
+VALID_SORT_ORDERS = {"asc", "desc"}
+
+
+def _split_csv(value) -> list[str]:
+    """Split a comma-separated query value into non-empty, stripped parts."""
+    if not value:
+        return []
+    return [part.strip() for part in str(value).split(",") if part.strip()]
+
+
+def validate_job_list_params(
+    args,
+    *,
+    sortable: set[str],
+    projectable: set[str],
+) -> tuple[dict, list[str]]:
+    """Validate query parameters for the job listing endpoint.
+
+    Parameters
+    ----------
+    args : Mapping
+        ``request.args`` (or any str -> str mapping).
+    sortable : set[str]
+        Column names the caller accepts for ``sort``.
+    projectable : set[str]
+        Field names the caller accepts in ``fields``.
+
+    Returns
+    -------
+    (cleaned, errors) where *cleaned* always contains ``sort``, ``order``,
+    ``limit`` (None = unpaginated), ``cursor``, ``fields`` (None = all) and
+    one key per filter that was supplied.
+    """
+    errors: list[str] = []
+    cleaned: dict = {
+        "sort": "created_at",
+        "order": "desc",
+        "limit": None,
+        "cursor": args.get("cursor") or None,
+        "fields": None,
+    }
+
+    # --- Sorting --------------------------------------------------------
+    sort = args.get("sort")
+    if sort:
+        if sort not in sortable:
+            errors.append(
+                f"Invalid sort '{sort}'. Must be one of: {', '.join(sorted(sortable))}"
+            )
+        else:
+            cleaned["sort"] = sort
+
+    order = args.get("order")
+    if order:
+        val = _validate_enum(order, "order", VALID_SORT_ORDERS, errors)
+        if val:
+            cleaned["order"] = val
+
+    # --- Paging ---------------------------------------------------------
+    if "limit" in args:
+        cleaned["limit"] = _validate_int(args.get("limit"), "limit", 1, MAX_PAGE_SIZE, errors)
+
+    # --- Projection -----------------------------------------------------
+    if "fields" in args:
+        fields = _split_csv(args.get("fields"))
+        unknown = [f for f in fields if f not in projectable]
+        if unknown:
+            errors.append(f"Unknown fields: {', '.join(unknown)}")
+        elif not fields:
+            errors.append("fields must list at least one field")
+        else:
+            cleaned["fields"] = fields
+
+    # --- Filters --------------------------------------------------------
+    statuses = _split_csv(args.get("status"))
+    for status in statuses:
+        _validate_enum(status, "status", VALID_STATUSES, errors)
+    if statuses:
+        cleaned["status"] = statuses
+
+    remote_types = _split_csv(args.get("remote_type"))
+    for remote_type in remote_types:
+        _validate_enum(remote_type, "remote_type", VALID_REMOTE_TYPES, errors)
+    if remote_types:
+        cleaned["remote_type"] = remote_types
+
+    sources = _split_csv(args.get("source"))
+    if sources:
+        cleaned["source"] = sources
+
+    tags = _split_csv(args.get("tag"))
+    if tags:
+        cleaned["tag"] = tags
+
+    for key, max_val in (("min_salary", MAX_SALARY), ("max_salary", MAX_SALARY),
+                         ("min_fit", 5), ("max_fit", 5)):
+        if args.get(key) not in (None, ""):
+            cleaned[key] = _validate_int(args.get(key), key, 0, max_val, errors)
+
+    if cleaned.get("min_salary") is not None and cleaned.get("max_salary") is not None \
+            and cleaned["min_salary"] > cleaned["max_salary"]:
+        errors.append("min_salary must not exceed max_salary")
+    if cleaned.get("min_fit") is not None and cleaned.get("max_fit") is not None \
+            and cleaned["min_fit"] > cleaned["max_fit"]:
+        errors.append("min_fit must not exceed max_fit")
+
+    return cleaned, errors
+
+
+# ---------------------------------------------------------------------------
+# Message history paging
+# ---------------------------------------------------------------------------
+
+# Messages per page when opening a conversation or paging back through it
+DEFAULT_MESSAGE_PAGE_SIZE = 50
+MAX_MESSAGE_PAGE_SIZE = 200
+
+
+def validate_message_page_params(args) -> tuple[dict, list[str]]:
+    """Validate ``before_id`` / ``limit`` query parameters for message history.
+
+    Returns
+    -------
+    (cleaned, errors) where *cleaned* always contains ``before_id`` (None =
+    start from the newest message) and ``limit``.
+    """
+    errors: list[str] = []
+    cleaned: dict = {"before_id": None, "limit": DEFAULT_MESSAGE_PAGE_SIZE}
+
+    if args.get("before_id") not in (None, ""):
+        cleaned["before_id"] = _validate_int(args.get("before_id"), "before_id", 1, None, errors)
+    if args.get("limit") not in (None, ""):
+        limit = _validate_int(args.get("limit"), "limit", 1, MAX_MESSAGE_PAGE_SIZE, errors)
+        if limit is not None:
+            cleaned["limit"] = limit
+
+    return cleaned, errors
+
+
+# ---------------------------------------------------------------------------
+# Conversation list paging
+# ---------------------------------------------------------------------------
+
+MAX_CONVERSATION_PAGE_SIZE = 200
+
+
+def validate_conversation_list_params(args) -> tuple[dict, list[str]]:
+    """Validate ``limit`` / ``cursor`` query parameters for the conversation list.
+
+    Returns
+    -------
+    (cleaned, errors) where *cleaned* always contains ``limit`` (None = no
+    pagination) and ``cursor`` (None = first page).
+    """
+    errors: list[str] = []
+    cleaned: dict = {"limit": None, "cursor": None}
+
+    if args.get("limit") not in (None, ""):
+        cleaned["limit"] = _validate_int(args.get("limit"), "limit", 1, MAX_CONVERSATION_PAGE_SIZE, errors)
+    if args.get("cursor"):
+        if cleaned["limit"] is None:
+            errors.append("cursor requires limit")
+        cleaned["cursor"] = args.get("cursor")
+
+    return cleaned, errors
+
+
 # ---------------------------------------------------------------------------
 # Document validation
 # ---------------------------------------------------------------------------
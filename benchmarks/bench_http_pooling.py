@@ -0,0 +1,138 @@
+"""Benchmark: a new connection per request vs. the pooled ``backend.http_client``.
+
+Starts a local stub server (plain HTTP, and HTTPS with a throwaway
+self-signed certificate when ``openssl`` is available) and makes N
+sequential GETs to it two ways:
+
+* ``per-request`` — bare ``requests.get``, as the tools used to
+* ``pooled``      — ``backend.http_client.get``, reusing keep-alive connections
+
+and reports the connections the server accepted and the latency per
+request.  On localhost the difference is the TCP (and TLS) handshake and
+connection setup alone; over the internet each avoided handshake also
+saves one or two round trips.
+
+Usage::
+
+    uv run python -m benchmarks.bench_http_pooling [--requests 200] [--repeat 3] [--no-tls]
+"""
+
+import argparse
+import os
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Keep config.json, logs and telemetry out of the real data directory
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="shortlist-bench-"))
+
+import requests  # noqa: E402
+
+from backend import http_client  # noqa: E402
+
+BODY = b'{"data": []}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this, Nagle plus the
+    # client's delayed ACK adds ~40ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def _self_signed_cert(directory):
+    """Write a localhost certificate and key; return their paths, or None without openssl."""
+    if not shutil.which("openssl"):
+        return None
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-keyout", key, "-out", cert, "-subj", "/CN=127.0.0.1",
+         "-addext", "subjectAltName=IP:127.0.0.1"],
+        check=True, capture_output=True,
+    )
+    return cert, key
+
+
+def _start_server(cert=None):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    scheme = "http"
+    if cert:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(*cert)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"{scheme}://127.0.0.1:{server.server_address[1]}/search"
+
+
+def run_once(get, server, url, n, verify):
+    """Make *n* GETs from an empty pool; return (connections accepted, wall seconds)."""
+    http_client.close_all()
+    before = server.connections
+    started = time.perf_counter()
+    for _ in range(n):
+        get(url, timeout=10, verify=verify).raise_for_status()
+    wall = time.perf_counter() - started
+    return server.connections - before, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-tls", action="store_true", help="skip the HTTPS server")
+    args = parser.parse_args()
+
+    servers = [("http", None)]
+    if not args.no_tls:
+        cert = _self_signed_cert(tempfile.mkdtemp(prefix="shortlist-bench-tls-"))
+        if cert:
+            servers.append(("https", cert))
+        else:
+            print("openssl not found; skipping HTTPS")
+
+    clients = [("per-request", requests.get), ("pooled", http_client.get)]
+
+    header = f"{'scheme':<6} {'client':<12} {'requests':>8} {'conns':>6} {'wall':>9} {'per req':>10} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for scheme, cert in servers:
+        server, url = _start_server(cert)
+        verify = cert[0] if cert else True
+        baseline = None
+        for name, get in clients:
+            results = [run_once(get, server, url, args.requests, verify) for _ in range(args.repeat)]
+            conns = results[-1][0]
+            wall = min(r[1] for r in results)
+            baseline = baseline or wall
+            print(f"{scheme:<6} {name:<12} {args.requests:>8} {conns:>6} {wall * 1000:>7.0f}ms "
+                  f"{wall / args.requests * 1e6:>8.0f}us {baseline / wall:>7.1f}x")
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark: ORM ``to_dict()`` listing vs. the column-tuple serialization path.
+
+Seeds an in-memory app.db with N jobs and N chat messages (a third of the
+messages carry ``tool_calls`` JSON), then times building the full JSON
+response both ways:
+
+* ``orm``  — query model instances, ``to_dict()`` each, ``jsonify``
+* ``fast`` — Core column tuples + ``backend.serialization`` (orjson)
+
+Each case asserts the two bodies are byte-identical before timing.
+
+Usage::
+
+    uv run python -m benchmarks.bench_serialization [--rows 10000 100000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+# Keep config.json, logs and telemetry out of the real data directory
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="shortlist-bench-"))
+
+import backend.app as app_module  # noqa: E402
+from backend.config import Config  # noqa: E402
+from backend.database import db  # noqa: E402
+from backend.models.chat import Conversation, Message  # noqa: E402
+from backend.models.job import Job  # noqa: E402
+from backend.serialization import RowSerializer, json_response  # noqa: E402
+
+TOOL_CALLS = json.dumps([
+    {"name": "list_jobs", "args": {"status": "applied", "limit": 20},
+     "result": {"count": 3, "jobs": [{"id": i, "company": f"Company {i}"} for i in range(3)]}},
+])
+
+
+def _make_app():
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+        LOG_LEVEL = "WARNING"
+
+    app_module._init_telemetry = lambda: None
+    return app_module.create_app(config_class=BenchConfig)
+
+
+def _seed(n):
+    db.session.execute(db.insert(Job), [
+        {"company": f"Company {i}", "title": f"Senior Engineer {i}", "status": "applied",
+         "url": f"https://jobs.example.com/{i}", "salary_min": 100_000 + i, "salary_max": 150_000,
+         "location": "Zürich", "remote_type": "hybrid", "tags": "python,remote",
+         "notes": "Recruiter call went well. " * 4, "requirements": "Python\nSQL\nAWS",
+         "job_fit": i % 6}
+        for i in range(n)
+    ])
+    convo = Conversation(title="bench")
+    db.session.add(convo)
+    db.session.flush()
+    db.session.execute(db.insert(Message), [
+        {"conversation_id": convo.id, "role": "assistant" if i % 2 else "user",
+         "content": f"Message {i}: here are the roles I found for you. " * 3,
+         "tool_calls": TOOL_CALLS if i % 3 == 0 else None}
+        for i in range(n)
+    ])
+    db.session.commit()
+    return convo.id
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        db.session.expunge_all()
+        t0 = time.perf_counter()
+        body = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, body
+
+
+def run(n, repeat):
+    app = _make_app()
+    results = []
+    with app.test_request_context():
+        convo_id = _seed(n)
+        jobs = RowSerializer(Job)
+        messages = RowSerializer(Message, json_fields=("tool_calls",))
+
+        cases = {
+            "jobs": (
+                lambda: app.json.response(
+                    [j.to_dict() for j in Job.query.order_by(Job.created_at.desc(), Job.id.desc())]
+                ).get_data(),
+                lambda: json_response(jobs.serialize(db.session.execute(
+                    jobs.select().order_by(Job.created_at.desc(), Job.id.desc())
+                ))).get_data(),
+            ),
+            "messages": (
+                lambda: app.json.response(
+                    [m.to_dict() for m in Message.query.filter_by(conversation_id=convo_id)
+                     .order_by(Message.created_at)]
+                ).get_data(),
+                lambda: json_response(messages.serialize(db.session.execute(
+                    messages.select().where(Message.conversation_id == convo_id)
+                    .order_by(Message.created_at)
+                ))).get_data(),
+            ),
+        }
+        for name, (orm_fn, fast_fn) in cases.items():
+            orm_s, orm_body = _time(orm_fn, repeat)
+            fast_s, fast_body = _time(fast_fn, repeat)
+            assert orm_body == fast_body, f"{name}: output differs"
+            results.append((name, n, len(orm_body), orm_s, fast_s))
+        db.session.remove()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    header = f"{'payload':<10} {'rows':>8} {'bytes':>12} {'orm':>9} {'fast':>9} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for n in args.rows:
+        for name, rows, size, orm_s, fast_s in run(n, args.repeat):
+            print(f"{name:<10} {rows:>8} {size:>12} {orm_s * 1000:>7.0f}ms {fast_s * 1000:>7.0f}ms "
+                  f"{orm_s / fast_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
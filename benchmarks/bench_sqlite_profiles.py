@@ -0,0 +1,144 @@
+"""Benchmark: concurrent agent-run commits vs. dashboard reads per SQLite profile.
+
+Simulates the app's real write/read mix against a file-backed app.db:
+
+* *writers* stand in for SSE agent runs — each thread repeatedly saves a
+  chat message and edits a tracked job, committing after each (the same
+  pattern as tool calls plus the assistant-message save in routes/chat.py).
+* *readers* stand in for dashboard polling — each thread repeatedly calls
+  ``GET /api/jobs?fields=...&limit=50`` through the Flask test client.
+
+For every profile in ``backend.database.SQLITE_PROFILES`` it reports write
+throughput, read latency percentiles and "database is locked" failures.
+
+Usage::
+
+    uv run python -m benchmarks.bench_sqlite_profiles [--seconds 5] [--writers 4] [--readers 4]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Keep config.json, logs and telemetry out of the real data directory
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="shortlist-bench-"))
+
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+import backend.app as app_module  # noqa: E402
+from backend.config import Config  # noqa: E402
+from backend.database import SQLITE_PROFILES, db  # noqa: E402
+from backend.models.chat import Conversation, Message  # noqa: E402
+from backend.models.job import Job  # noqa: E402
+
+SEED_JOBS = 2_000
+
+
+def _make_app(db_path: Path, profile: str):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+        SQLITE_PROFILE = profile
+        SQLITE_PRAGMAS = {}
+        LOG_LEVEL = "WARNING"
+
+    app_module._init_telemetry = lambda: None
+    return app_module.create_app(config_class=BenchConfig)
+
+
+def _seed(app):
+    with app.app_context():
+        db.session.add_all(
+            Job(company=f"Company {i}", title=f"Role {i}", status="saved",
+                requirements="Python\nSQL\n" * 20)
+            for i in range(SEED_JOBS)
+        )
+        db.session.add(Conversation(title="bench"))
+        db.session.commit()
+
+
+def _writer(app, stop, stats, idx):
+    with app.app_context():
+        convo_id = Conversation.query.first().id
+        n = 0
+        while not stop.is_set():
+            try:
+                db.session.add(Message(conversation_id=convo_id, role="assistant",
+                                       content=f"writer {idx} message {n} " * 20))
+                db.session.commit()
+                job = db.session.get(Job, (idx * 97 + n) % SEED_JOBS + 1)
+                job.notes = f"touched by writer {idx} at {n}"
+                db.session.commit()
+                stats["commits"] += 2
+            except OperationalError:
+                db.session.rollback()
+                stats["lock_errors"] += 1
+            n += 1
+        db.session.remove()
+
+
+def _reader(app, stop, latencies, stats):
+    client = app.test_client()
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        resp = client.get("/api/jobs?fields=id,company,title,status,updated_at&limit=50")
+        latencies.append((time.perf_counter() - t0) * 1000)
+        if resp.status_code != 200:
+            stats["read_errors"] += 1
+
+
+def run_profile(profile: str, seconds: float, writers: int, readers: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        app = _make_app(Path(tmp) / "app.db", profile)
+        _seed(app)
+
+        stop = threading.Event()
+        stats = {"commits": 0, "lock_errors": 0, "read_errors": 0}
+        latencies: list[float] = []
+        threads = [threading.Thread(target=_writer, args=(app, stop, stats, i)) for i in range(writers)]
+        threads += [threading.Thread(target=_reader, args=(app, stop, latencies, stats)) for _ in range(readers)]
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        with app.app_context():
+            db.engine.dispose()
+
+    latencies.sort()
+    return {
+        "profile": profile,
+        "commits_per_s": stats["commits"] / seconds,
+        "reads_per_s": len(latencies) / seconds,
+        "read_p50_ms": statistics.median(latencies) if latencies else float("nan"),
+        "read_p95_ms": latencies[int(len(latencies) * 0.95)] if latencies else float("nan"),
+        "lock_errors": stats["lock_errors"],
+        "read_errors": stats["read_errors"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{args.writers} writer / {args.readers} reader threads, {args.seconds:.0f}s per profile, "
+          f"{SEED_JOBS} seeded jobs\n")
+    header = f"{'profile':<12} {'commits/s':>10} {'reads/s':>9} {'read p50':>9} {'read p95':>9} {'locked':>7} {'read err':>9}"
+    print(header)
+    print("-" * len(header))
+    for profile in SQLITE_PROFILES:
+        r = run_profile(profile, args.seconds, args.writers, args.readers)
+        print(f"{r['profile']:<12} {r['commits_per_s']:>10.0f} {r['reads_per_s']:>9.0f} "
+              f"{r['read_p50_ms']:>7.1f}ms {r['read_p95_ms']:>7.1f}ms {r['lock_errors']:>7} {r['read_errors']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark: SSE frames and CPU per answer with and without text_delta coalescing.
+
+Streams one synthetic answer of N short tokens (about 4 characters each,
+like an LLM's stream) through the same path as a chat request:
+
+    producer thread -> EventBus -> run thread -> AgentRun -> run.stream()
+
+and counts what the client receives.  Each setting is run with coalescing
+off (``0``) and with a few ``coalesce_ms``/``coalesce_bytes`` pairs.
+
+* ``frames``  — SSE messages the client parses
+* ``writes``  — chunks yielded to the WSGI server
+* ``cpu``     — process CPU time (all threads) per answer
+
+Usage::
+
+    uv run python -m benchmarks.bench_sse_coalescing [--tokens 2000] [--delay-ms 0 1] [--repeat 3]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+# Keep config.json, logs and telemetry out of the real data directory
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="shortlist-bench-"))
+
+from backend.agent.event_bus import EventBus  # noqa: E402
+from backend.agent_runs import AgentRun  # noqa: E402
+
+# (coalesce_ms, coalesce_bytes); (0, 0) is the uncoalesced baseline
+SETTINGS = [(0, 0), (10, 512), (25, 1024), (50, 4096)]
+
+TOKENS = ["The ", "role", " is ", "a se", "nior", " Rus", "t en", "gine", "er; ", "remo", "te. "]
+
+
+def _answer(bus, tokens, delay):
+    for i in range(tokens):
+        bus.emit("text_delta", {"content": TOKENS[i % len(TOKENS)]})
+        if delay:
+            time.sleep(delay)
+    bus.emit("done", {"content": ""})
+    bus.close()
+
+
+def _relay(bus, run):
+    for event in bus.drain_blocking():
+        run.emit(event["event"], event["data"])
+    run.finish()
+
+
+def run_once(coalesce_ms, coalesce_bytes, tokens, delay):
+    """Stream one answer; return (frames, writes, bytes, wall seconds, cpu seconds)."""
+    bus = EventBus(coalesce_ms=coalesce_ms, coalesce_bytes=coalesce_bytes)
+    run = AgentRun(conversation_id=None, max_events=tokens + 10)
+    wall, cpu = time.perf_counter(), time.process_time()
+    threads = [threading.Thread(target=_answer, args=(bus, tokens, delay)),
+               threading.Thread(target=_relay, args=(bus, run))]
+    for t in threads:
+        t.start()
+    frames = writes = size = 0
+    for chunk in run.stream():
+        writes += 1
+        frames += chunk.count("\n\n")
+        size += len(chunk)
+    for t in threads:
+        t.join()
+    return frames, writes, size, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def run(tokens, delay_ms, repeat):
+    """Yield (setting, frames, writes, bytes, wall, cpu), best of *repeat* runs."""
+    for ms, nbytes in SETTINGS:
+        results = [run_once(ms, nbytes, tokens, delay_ms / 1000) for _ in range(repeat)]
+        frames, writes, size, _, _ = results[-1]
+        wall = min(r[3] for r in results)
+        cpu = min(r[4] for r in results)
+        setting = "off" if ms == 0 else f"{ms}ms/{nbytes}B"
+        yield setting, frames, writes, size, wall, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--delay-ms", type=float, nargs="+", default=[0, 1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    header = (f"{'delay':>6} {'setting':<12} {'frames':>7} {'writes':>7} {'bytes':>8} "
+              f"{'wall':>9} {'frames/s':>10} {'cpu':>9}")
+    print(header)
+    print("-" * len(header))
+    for delay in args.delay_ms:
+        for setting, frames, writes, size, wall, cpu in run(args.tokens, delay, args.repeat):
+            print(f"{delay:>4.1f}ms {setting:<12} {frames:>7} {writes:>7} {size:>8} "
+                  f"{wall * 1000:>7.0f}ms {frames / wall:>10.0f} {cpu * 1000:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,12 +12,29 @@ const PROFILE_BASE = `${API_BASE}/api/profile`;
 const CONFIG_BASE = `${API_BASE}/api/config`;
 const RESUME_BASE = `${API_BASE}/api/resume`;
 
-export async function fetchJobs() {
-  const res = await fetch(BASE);
+export async function fetchJobs(params = {}) {
+  const query = new URLSearchParams(params).toString();
+  const res = await fetch(query ? `${BASE}?${query}` : BASE);
   if (!res.ok) throw new Error("Failed to fetch jobs");
   return res.json();
 }
 
+// Fetch one keyset page of jobs. Pass the returned nextCursor back as
+// params.cursor to get the following page; nextCursor is null on the last page.
+export async function fetchJobsPage(params = {}) {
+  const query = new URLSearchParams(params).toString();
+  const res = await fetch(`${BASE}?${query}`);
+  if (!res.ok) throw new Error("Failed to fetch jobs");
+  return { jobs: await res.json(), nextCursor: res.headers.get("X-Next-Cursor") };
+}
+
+// Pipeline aggregates: {total, status, job_fit, salary, applied_by_month, created_by_month}
+export async function fetchJobStats() {
+  const res = await fetch(`${BASE}/stats`);
+  if (!res.ok) throw new Error("Failed to fetch job stats");
+  return res.json();
+}
+
 export async function createJob(data) {
   const res = await fetch(BASE, {
     method: "POST",
@@ -84,6 +101,16 @@ export async function fetchConversations() {
   return res.json();
 }
 
+// Fetch one keyset page of conversations (newest first), each with
+// message_count, last_message and search_result_count. Pass the returned
+// nextCursor back as params.cursor; it is null on the last page.
+export async function fetchConversationsPage(params = {}) {
+  const query = new URLSearchParams(params).toString();
+  const res = await fetch(`${CHAT_BASE}/conversations?${query}`);
+  if (!res.ok) throw new Error("Failed to fetch conversations");
+  return { conversations: await res.json(), nextCursor: res.headers.get("X-Next-Cursor") };
+}
+
 export async function createConversation(title) {
   const res = await fetch(`${CHAT_BASE}/conversations`, {
     method: "POST",
@@ -94,12 +121,23 @@ export async function createConversation(title) {
   return res.json();
 }
 
+// Conversation with its latest page of messages, plus message_count and has_more
 export async function fetchConversation(id) {
   const res = await fetch(`${CHAT_BASE}/conversations/${id}`);
   if (!res.ok) throw new Error("Failed to fetch conversation");
   return res.json();
 }
 
+// Older messages: {messages (oldest first), has_more}
+export async function fetchMessages(conversationId, { beforeId, limit } = {}) {
+  const params = new URLSearchParams();
+  if (beforeId != null) params.set("before_id", beforeId);
+  if (limit != null) params.set("limit", limit);
+  const res = await fetch(`${CHAT_BASE}/conversations/${conversationId}/messages?${params}`);
+  if (!res.ok) throw new Error("Failed to fetch messages");
+  return res.json();
+}
+
 export async function deleteConversation(id) {
   const res = await fetch(`${CHAT_BASE}/conversations/${id}`, {
     method: "DELETE",
@@ -122,7 +160,49 @@ export async function streamMessage(conversationId, content, onEvent, { signal }
   return _readSSE(res, onEvent, signal);
 }
 
+// Reattach attempts after a dropped agent stream, and the delay between them
+const RUN_REATTACH_ATTEMPTS = 3;
+const RUN_REATTACH_DELAY_MS = 1000;
+
+const TERMINAL_EVENTS = new Set(["done", "error", "cancelled"]);
+
+// Asks the server to stop an agent run; it ends with a "cancelled" event
+export async function cancelRun(runId) {
+  const res = await fetch(`${CHAT_BASE}/runs/${runId}/cancel`, { method: "POST" });
+  if (!res.ok && res.status !== 409) throw new Error("Failed to cancel run");
+}
+
+// Reads an agent run's SSE stream.  If the connection drops before the run
+// ends, reattaches via GET /runs/:id/events with Last-Event-ID so no events
+// are lost or repeated.  Aborting *signal* (the stop button) cancels the run.
 async function _readSSE(res, onEvent, signal) {
+  const runId = res.headers.get("X-Run-Id");
+  const state = { lastEventId: 0, finished: false };
+  if (signal && runId) {
+    signal.addEventListener("abort", () => {
+      if (!state.finished) cancelRun(runId).catch((e) => console.error(e));
+    }, { once: true });
+  }
+
+  for (let attempt = 0; ; attempt++) {
+    try {
+      await _readSSEBody(res, onEvent, signal, state);
+      if (state.finished || !runId) return;
+    } catch (e) {
+      if (e.name === "AbortError" || signal?.aborted) return;
+      if (!runId || attempt >= RUN_REATTACH_ATTEMPTS) throw e;
+    }
+    if (attempt >= RUN_REATTACH_ATTEMPTS) return;
+    await new Promise((resolve) => setTimeout(resolve, RUN_REATTACH_DELAY_MS));
+    res = await fetch(`${CHAT_BASE}/runs/${runId}/events`, {
+      headers: { "Last-Event-ID": String(state.lastEventId) },
+      signal,
+    });
+    if (!res.ok) return; // run expired; the saved reply is in the history
+  }
+}
+
+async function _readSSEBody(res, onEvent, signal, state) {
   const reader = res.body.getReader();
   const decoder = new TextDecoder();
   let buffer = "";
@@ -132,33 +212,34 @@ async function _readSSE(res, onEvent, signal) {
     signal.addEventListener("abort", () => reader.cancel(), { once: true });
   }
 
-  try {
-    while (true) {
-      const { done, value } = await reader.read();
-      if (done) break;
-
-      buffer += decoder.decode(value, { stream: true });
-      const lines = buffer.split("\n");
-      buffer = lines.pop() || "";
-
-      let currentEvent = null;
-      for (const line of lines) {
-        if (line.startsWith("event: ")) {
-          currentEvent = line.slice(7).trim();
-        } else if (line.startsWith("data: ") && currentEvent) {
-          try {
-            const data = JSON.parse(line.slice(6));
-            onEvent({ event: currentEvent, data });
-          } catch (e) {
-            console.error("Failed to parse SSE data:", e);
-          }
-          currentEvent = null;
+  let currentEvent = null;
+  let currentId = null;
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split("\n");
+    buffer = lines.pop() || "";
+
+    for (const line of lines) {
+      if (line.startsWith("id: ")) {
+        currentId = Number(line.slice(4));
+      } else if (line.startsWith("event: ")) {
+        currentEvent = line.slice(7).trim();
+      } else if (line.startsWith("data: ") && currentEvent) {
+        try {
+          const data = JSON.parse(line.slice(6));
+          onEvent({ event: currentEvent, data });
+        } catch (e) {
+          console.error("Failed to parse SSE data:", e);
         }
+        if (currentId) state.lastEventId = currentId;
+        if (TERMINAL_EVENTS.has(currentEvent)) state.finished = true;
+        currentEvent = null;
+        currentId = null;
       }
     }
-  } catch (e) {
-    if (e.name === "AbortError") return;
-    throw e;
   }
 }
 
@@ -4,9 +4,10 @@ import remarkGfm from "remark-gfm";
 import useResizablePanel from "../hooks/useResizablePanel";
 import SearchResultsPanel from "./SearchResultsPanel";
 import {
-  fetchConversations,
+  fetchConversationsPage,
   createConversation,
   fetchConversation,
+  fetchMessages,
   deleteConversation,
   streamMessage,
   createOnboardingConversation,
@@ -18,19 +19,28 @@ import {
 } from "../api";
 import { useAppContext } from "../contexts/AppContext";
 
+// Conversations fetched per page of the conversation list
+const CONVERSATION_PAGE_SIZE = 50;
+
 // Tool names that modify job data — when these complete, notify parent to refresh
-const JOB_MUTATING_TOOLS = new Set(["create_job", "edit_job", "remove_job", "add_job_todo", "edit_job_todo", "remove_job_todo", "save_job_document"]);
+const JOB_MUTATING_TOOLS = new Set(["create_job", "edit_job", "remove_job", "edit_jobs", "remove_jobs", "add_job_todo", "edit_job_todo", "remove_job_todo", "save_job_document"]);
 
 function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete, onJobsChanged, onError }) {
   const { notifyDocumentSaved } = useAppContext();
   const [conversations, setConversations] = useState([]);
+  const [conversationsCursor, setConversationsCursor] = useState(null);
+  const [loadingMoreConversations, setLoadingMoreConversations] = useState(false);
   const [currentConversation, setCurrentConversation] = useState(null);
   const [messages, setMessages] = useState([]);
   const [input, setInput] = useState("");
   const [isStreaming, setIsStreaming] = useState(false);
+  // Position in the server's agent queue while the run waits to start
+  const [queuePosition, setQueuePosition] = useState(null);
   const [expandedErrors, setExpandedErrors] = useState(new Set());
   const [messageFeedback, setMessageFeedback] = useState({});
+  const [loadingEarlier, setLoadingEarlier] = useState(false);
   const messagesEndRef = useRef(null);
+  const skipScrollRef = useRef(false);
   const inputRef = useRef(null);
   const abortControllerRef = useRef(null);
   const { width, isDragging, handleMouseDown } = useResizablePanel("chatPanelWidth", 512);
@@ -102,6 +112,7 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
 
           await kickOnboarding(convo.id, (event) => {
             if (cancelled) return;
+            setQueuePosition(event.event === "queued" ? event.data.position : null);
             if (event.event === "error") {
               if (onError) onError(event.data.message);
               pushUpdate();
@@ -129,7 +140,7 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
               pushUpdate();
             } else if (event.event === "onboarding_complete") {
               onboardingDone = true;
-            } else if (event.event === "done") {
+            } else if (event.event === "done" || event.event === "cancelled") {
               pushUpdate();
             }
           }, { signal: abortController.signal });
@@ -168,6 +179,11 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
   }, [isOpen, onboarding]);
 
   useEffect(() => {
+    // Prepending older messages should not jump to the bottom
+    if (skipScrollRef.current) {
+      skipScrollRef.current = false;
+      return;
+    }
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" });
   }, [messages]);
 
@@ -179,13 +195,28 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
 
   async function loadConversations() {
     try {
-      const data = await fetchConversations();
-      setConversations(data);
+      const page = await fetchConversationsPage({ limit: CONVERSATION_PAGE_SIZE });
+      setConversations(page.conversations);
+      setConversationsCursor(page.nextCursor);
     } catch (e) {
       console.error("Failed to load conversations:", e);
     }
   }
 
+  async function loadMoreConversations() {
+    if (!conversationsCursor) return;
+    setLoadingMoreConversations(true);
+    try {
+      const page = await fetchConversationsPage({ limit: CONVERSATION_PAGE_SIZE, cursor: conversationsCursor });
+      setConversations((prev) => [...prev, ...page.conversations]);
+      setConversationsCursor(page.nextCursor);
+    } catch (e) {
+      console.error("Failed to load more conversations:", e);
+    } finally {
+      setLoadingMoreConversations(false);
+    }
+  }
+
   async function selectConversation(id) {
     try {
       const data = await fetchConversation(id);
@@ -207,6 +238,25 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
     }
   }
 
+  async function loadEarlierMessages() {
+    const oldest = messages.find((m) => m.id);
+    if (!currentConversation || !oldest) return;
+    const convoId = currentConversation.id;
+    setLoadingEarlier(true);
+    try {
+      const page = await fetchMessages(convoId, { beforeId: oldest.id });
+      skipScrollRef.current = true;
+      setMessages((prev) => [...page.messages, ...prev]);
+      setCurrentConversation((prev) =>
+        prev?.id === convoId ? { ...prev, has_more: page.has_more } : prev
+      );
+    } catch (e) {
+      console.error("Failed to load earlier messages:", e);
+    } finally {
+      setLoadingEarlier(false);
+    }
+  }
+
   async function handleNewChat() {
     try {
       const convo = await createConversation();
@@ -226,6 +276,7 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
       abortControllerRef.current = null;
     }
     setIsStreaming(false);
+    setQueuePosition(null);
   }
 
   async function handleDeleteConversation(id, e) {
@@ -322,6 +373,7 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
     let aborted = false;
     try {
       await streamer(convo.id, userMessage.content, (event) => {
+        setQueuePosition(event.event === "queued" ? event.data.position : null);
         // Handle search-related events
         handleSearchEvent(event);
         handleDocumentEvent(event);
@@ -359,7 +411,7 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
             segments[idx] = { ...segments[idx], status: "error", error: event.data.error };
           }
           pushUpdate();
-        } else if (event.event === "done") {
+        } else if (event.event === "done" || event.event === "cancelled") {
           pushUpdate();
         } else if (event.event === "onboarding_complete") {
           onboardingDone = true;
@@ -381,6 +433,7 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
     } finally {
       abortControllerRef.current = null;
       setIsStreaming(false);
+      setQueuePosition(null);
     }
 
     if (aborted) return;
@@ -501,8 +554,14 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
                     >
                       <div className="min-w-0 flex-1">
                         <p className="font-medium text-gray-900 truncate">{c.title}</p>
+                        {c.last_message && (
+                          <p className="text-sm text-gray-600 truncate">{c.last_message}</p>
+                        )}
                         <p className="text-xs text-gray-500">
                           {new Date(c.updated_at).toLocaleDateString()}
+                          {" · "}
+                          {c.message_count} {c.message_count === 1 ? "message" : "messages"}
+                          {c.search_result_count > 0 && ` · ${c.search_result_count} results`}
                         </p>
                       </div>
                       <button
@@ -515,6 +574,17 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
                       </button>
                     </div>
                   ))}
+                  {conversationsCursor && (
+                    <div className="flex justify-center">
+                      <button
+                        onClick={loadMoreConversations}
+                        disabled={loadingMoreConversations}
+                        className="text-xs text-blue-600 hover:text-blue-800 disabled:text-gray-400"
+                      >
+                        {loadingMoreConversations ? "Loading..." : "Load more conversations"}
+                      </button>
+                    </div>
+                  )}
                 </div>
               )}
             </div>
@@ -522,6 +592,17 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
             /* Chat view */
             <>
               <div className="flex-1 overflow-y-auto p-4 space-y-4">
+                {currentConversation?.has_more && (
+                  <div className="flex justify-center">
+                    <button
+                      onClick={loadEarlierMessages}
+                      disabled={loadingEarlier}
+                      className="text-xs text-blue-600 hover:text-blue-800 disabled:text-gray-400"
+                    >
+                      {loadingEarlier ? "Loading..." : "Load earlier messages"}
+                    </button>
+                  </div>
+                )}
                 {messages.map((msg, i) => (
                   <div key={i}>
                     {msg.role === "assistant" && msg.segments && msg.segments.length > 0 ? (
@@ -637,7 +718,9 @@ function ChatPanel({ isOpen, onClose, onboarding = false, onOnboardingComplete,
                       <span className="w-2 h-2 bg-gray-400 rounded-full animate-bounce" style={{ animationDelay: "0ms" }} />
                       <span className="w-2 h-2 bg-gray-400 rounded-full animate-bounce" style={{ animationDelay: "150ms" }} />
                       <span className="w-2 h-2 bg-gray-400 rounded-full animate-bounce" style={{ animationDelay: "300ms" }} />
-                      <span className="ml-2 text-sm text-gray-500">Thinking...</span>
+                      <span className="ml-2 text-sm text-gray-500">
+                        {queuePosition ? `Waiting for a free agent (#${queuePosition} in queue)...` : "Thinking..."}
+                      </span>
                     </div>
                   </div>
                 )}
@@ -1,6 +1,6 @@
 import { useState, useEffect } from "react";
 import { Link } from "react-router-dom";
-import { fetchJobs, fetchHealth } from "../api";
+import { fetchJobs, fetchJobStats, fetchHealth } from "../api";
 import { useAppContext } from "../contexts/AppContext";
 
 const STATUS_COLORS = {
@@ -14,15 +14,18 @@ const STATUS_COLORS = {
 export default function HomePage() {
   const { setChatOpen, healthVersion } = useAppContext();
   const [jobs, setJobs] = useState([]);
+  const [stats, setStats] = useState(null);
   const [health, setHealth] = useState(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     Promise.all([
-      fetchJobs().catch(() => []),
+      fetchJobs({ fields: "id,company,title,status,updated_at" }).catch(() => []),
+      fetchJobStats().catch(() => null),
       fetchHealth().catch(() => null),
-    ]).then(([jobsData, healthData]) => {
+    ]).then(([jobsData, statsData, healthData]) => {
       setJobs(jobsData);
+      setStats(statsData);
       setHealth(healthData);
       setLoading(false);
     });
@@ -37,10 +40,7 @@ export default function HomePage() {
     .sort((a, b) => new Date(b.updated_at) - new Date(a.updated_at))
     .slice(0, 5);
 
-  const statusCounts = jobs.reduce((acc, j) => {
-    acc[j.status] = (acc[j.status] || 0) + 1;
-    return acc;
-  }, {});
+  const statusCounts = stats?.status ?? {};
 
   const llmConfigured = health?.llm?.configured;
 
@@ -60,7 +60,7 @@ export default function HomePage() {
       <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
         <div className="bg-white rounded-lg shadow-sm p-4">
           <p className="text-sm text-gray-500">Total Jobs</p>
-          <p className="text-2xl font-bold text-gray-900">{jobs.length}</p>
+          <p className="text-2xl font-bold text-gray-900">{stats?.total ?? jobs.length}</p>
         </div>
         <div className="bg-white rounded-lg shadow-sm p-4">
           <p className="text-sm text-gray-500">Applied</p>
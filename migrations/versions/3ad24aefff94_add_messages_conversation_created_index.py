@@ -0,0 +1,31 @@
+"""add composite index on messages (conversation_id, created_at)
+
+Message history is paged newest-first per conversation with a
+``(created_at, id)`` keyset.  The composite index serves that as a range
+scan (SQLite appends the rowid to every index entry, so ties on
+``created_at`` are ordered by ``id`` too).  It also makes the
+single-column ``conversation_id`` index redundant, so that one is dropped.
+
+Revision ID: 3ad24aefff94
+Revises: c14b1b1bb368
+Create Date: 2026-10-17 15:42:10.318204
+
+"""
+from alembic import op
+
+
+revision = '3ad24aefff94'
+down_revision = 'c14b1b1bb368'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_messages_conversation_id_created_at', 'messages',
+                    ['conversation_id', 'created_at'], unique=False)
+    op.drop_index('ix_messages_conversation_id', table_name='messages')
+
+
+def downgrade():
+    op.create_index('ix_messages_conversation_id', 'messages', ['conversation_id'], unique=False)
+    op.drop_index('ix_messages_conversation_id_created_at', table_name='messages')
@@ -0,0 +1,32 @@
+"""add rolling context summary to conversations
+
+``context_summary`` holds an LLM-written summary of the older turns of a
+conversation that no longer fit the agent's token budget;
+``context_summary_through`` is the id of the last message it covers.
+Both are maintained by ``backend/agent/context_window.py``.
+
+Revision ID: 867d96bbee37
+Revises: 3ad24aefff94
+Create Date: 2026-10-17 16:20:41.527310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '867d96bbee37'
+down_revision = '3ad24aefff94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('conversations', sa.Column('context_summary', sa.Text(), nullable=True))
+    op.add_column('conversations', sa.Column('context_summary_through', sa.Integer(), nullable=True))
+
+
+def downgrade():
+    # Plain DROP COLUMN (SQLite 3.35+); batch mode would recreate the table
+    # and cascade-delete its messages
+    op.drop_column('conversations', 'context_summary_through')
+    op.drop_column('conversations', 'context_summary')
@@ -0,0 +1,56 @@
+"""add job_tags table
+
+Normalized, indexed copy of the comma-separated ``jobs.tags`` column: one
+row per (job, tag), with tags trimmed and lowercased.  The composite index
+on (tag, job_id) serves tag filters and facet counts without touching
+``jobs``.  Existing jobs are backfilled from ``jobs.tags``.
+
+Revision ID: c14b1b1bb368
+Revises: dfa0164721f2
+Create Date: 2026-10-17 13:05:27.904113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'c14b1b1bb368'
+down_revision = 'dfa0164721f2'
+branch_labels = None
+depends_on = None
+
+
+# Mirrors backend.models.job_tag.normalize_tags at the time of this
+# migration (kept inline so later changes to the app can't alter it).
+def _normalize(text):
+    tags = []
+    for part in (text or '').split(','):
+        tag = ' '.join(part.split()).lower()[:100]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def upgrade():
+    job_tags = op.create_table(
+        'job_tags',
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('tag', sa.String(length=100), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('job_id', 'tag'),
+    )
+    op.create_index('ix_job_tags_tag_job_id', 'job_tags', ['tag', 'job_id'], unique=False)
+
+    rows = op.get_bind().execute(
+        sa.text("SELECT id, tags FROM jobs WHERE tags IS NOT NULL AND tags != ''")
+    )
+    op.bulk_insert(job_tags, [
+        {'job_id': job_id, 'tag': tag}
+        for job_id, tags in rows
+        for tag in _normalize(tags)
+    ])
+
+
+def downgrade():
+    op.drop_index('ix_job_tags_tag_job_id', table_name='job_tags')
+    op.drop_table('job_tags')
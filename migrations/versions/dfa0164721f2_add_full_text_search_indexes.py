@@ -0,0 +1,87 @@
+"""add full-text search indexes
+
+Creates SQLite FTS5 external-content tables over the searchable text of
+jobs, search results, chat messages and job documents, plus triggers that
+keep each index in sync with its content table on INSERT/UPDATE/DELETE
+(including rows removed by ON DELETE CASCADE).  Existing rows are indexed
+with the FTS5 'rebuild' command.
+
+Note: triggers are attached to their content table, so any future migration
+that recreates one of these tables (rename-and-copy) must recreate its
+triggers too.
+
+Revision ID: dfa0164721f2
+Revises: 108aac5da60d
+Create Date: 2026-10-17 09:12:44.318204
+
+"""
+from alembic import op
+
+
+revision = 'dfa0164721f2'
+down_revision = '108aac5da60d'
+branch_labels = None
+depends_on = None
+
+
+# content table -> indexed columns (order matters: bm25 weights in
+# backend/search.py are positional)
+_FTS_TABLES = {
+    'jobs': [
+        'company', 'title', 'url', 'location', 'tags',
+        'notes', 'requirements', 'nice_to_haves',
+    ],
+    'search_results': [
+        'company', 'title', 'location',
+        'description', 'requirements', 'nice_to_haves', 'fit_reason',
+    ],
+    'messages': ['content'],
+    'job_documents': ['content'],
+}
+
+
+def _create_fts(table, columns):
+    fts = f'{table}_fts'
+    cols = ', '.join(columns)
+    new_cols = ', '.join(f'new.{c}' for c in columns)
+    old_cols = ', '.join(f'old.{c}' for c in columns)
+
+    op.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{table}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols});
+        END
+    ''')
+    op.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+        END
+    ''')
+    op.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+            INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols});
+        END
+    ''')
+    op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def _drop_fts(table):
+    fts = f'{table}_fts'
+    for suffix in ('ai', 'ad', 'au'):
+        op.execute(f'DROP TRIGGER IF EXISTS {fts}_{suffix}')
+    op.execute(f'DROP TABLE IF EXISTS {fts}')
+
+
+def upgrade():
+    for table, columns in _FTS_TABLES.items():
+        _create_fts(table, columns)
+
+
+def downgrade():
+    for table in reversed(list(_FTS_TABLES)):
+        _drop_fts(table)
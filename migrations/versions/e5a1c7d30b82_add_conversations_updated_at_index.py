@@ -0,0 +1,27 @@
+"""add index on conversations.updated_at
+
+The conversation list is paged newest-first with an ``(updated_at, id)``
+keyset.  The index serves each page as a range scan (SQLite appends the
+rowid to every index entry, so ties on ``updated_at`` are ordered by
+``id`` too) instead of sorting the whole table.
+
+Revision ID: e5a1c7d30b82
+Revises: 867d96bbee37
+Create Date: 2026-10-17 18:05:12.734415
+
+"""
+from alembic import op
+
+
+revision = 'e5a1c7d30b82'
+down_revision = '867d96bbee37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_conversations_updated_at', 'conversations', ['updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_conversations_updated_at', table_name='conversations')
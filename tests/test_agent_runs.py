@@ -0,0 +1,443 @@
+"""Tests for agent runs and resumable SSE streams.
+
+Covers:
+1. AgentRun replay buffer (numbering, Last-Event-ID cursor, slow-consumer
+   compaction, retention)
+2. Chat routes: run IDs, reattaching with Last-Event-ID, replies saved
+   when the client goes away
+3. Cancelling runs by request and after the client disconnects, and
+   inside a workflow's thread pool
+4. Executor: concurrency cap, FIFO queue positions, one run per conversation
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.agent import cancellation
+from backend.agent.cancellation import CancellableThreadPool, CancelToken, RunCancelled
+from backend.agent.micro_agents_v1.workflows.edit_cover_letter import EditCoverLetterWorkflow
+from backend.agent_runs import HEARTBEAT_FRAME, AgentRun, RunRegistry, get_runs
+from backend.app import create_app
+from backend.database import db as _db
+from backend.models.chat import Conversation, Message
+
+
+class TestConfig:
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    TESTING = True
+    LOG_LEVEL = "WARNING"
+
+
+@pytest.fixture()
+def app(tmp_path):
+    """Create a Flask test app with an in-memory database."""
+    with patch("backend.config.get_data_dir", return_value=tmp_path), \
+         patch("backend.app.get_data_dir", return_value=tmp_path), \
+         patch("backend.app._init_telemetry"):
+        application = create_app(config_class=TestConfig)
+    with application.app_context():
+        yield application
+        _db.session.remove()
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+
+def _parse_sse(body):
+    """Parse SSE text into ``[{"id", "event", "data"}]``."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append({
+            "id": int(fields["id"]) if "id" in fields else None,
+            "event": fields["event"],
+            "data": json.loads(fields["data"]),
+        })
+    return events
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Replay buffer
+# ────────────────────────────────────────────────────────────────────
+
+class TestAgentRun:
+
+    def test_events_numbered_and_replayed_after_cursor(self):
+        run = AgentRun(conversation_id=1)
+        for i in range(4):
+            run.emit("text_delta", {"content": str(i)})
+        run.finish()
+        events = _parse_sse("".join(run.stream(last_event_id=2)))
+        assert [(e["id"], e["data"]["content"]) for e in events] == [(3, "2"), (4, "3")]
+        assert list(run.stream(last_event_id=4)) == []
+
+    def test_stream_follows_live_run(self):
+        run = AgentRun(conversation_id=1)
+
+        def produce():
+            for i in range(3):
+                time.sleep(0.05)
+                run.emit("text_delta", {"content": str(i)})
+            run.emit("done", {"content": "012"})
+            run.finish()
+
+        threading.Thread(target=produce).start()
+        events = _parse_sse("".join(run.stream()))
+        assert [e["event"] for e in events] == ["text_delta"] * 3 + ["done"]
+
+    def test_heartbeats_while_quiet(self):
+        run = AgentRun(conversation_id=1)
+
+        def produce():
+            time.sleep(0.3)
+            run.emit("done", {"content": ""})
+            run.finish()
+
+        threading.Thread(target=produce).start()
+        chunks = list(run.stream(heartbeat_seconds=0.05))
+        assert chunks[0] == HEARTBEAT_FRAME
+        assert chunks[-1].startswith("id: 1\nevent: done")
+
+    def test_full_buffer_merges_text_and_keeps_control_events(self):
+        run = AgentRun(conversation_id=1, max_events=3)
+        run.emit("tool_start", {"id": "t1"})
+        for piece in ["a", "b", "c"]:
+            run.emit("text_delta", {"content": piece})
+        run.emit("tool_result", {"id": "t1"})
+        for piece in ["d", "e"]:
+            run.emit("text_delta", {"content": piece})
+        run.emit("done", {"content": "abcde"})
+        run.finish()
+        events = _parse_sse("".join(run.stream()))
+        assert [(e["id"], e["event"], e["data"]) for e in events] == [
+            (1, "tool_start", {"id": "t1"}),
+            (4, "text_delta", {"content": "abc"}),
+            (5, "tool_result", {"id": "t1"}),
+            (7, "text_delta", {"content": "de"}),
+            (8, "done", {"content": "abcde"}),
+        ]
+
+    def test_cursor_inside_merged_text_gets_the_rest(self):
+        run = AgentRun(conversation_id=1, max_events=8)
+        for i in range(1000):
+            run.emit("text_delta", {"content": f"{i} "})
+        assert len(run._events) <= 8
+        run.emit("done", {"content": ""})
+        run.finish()
+        events = _parse_sse("".join(run.stream(last_event_id=500)))
+        assert "".join(e["data"]["content"] for e in events) == "".join(f"{i} " for i in range(500, 1000))
+        assert events[-1] == {"id": 1001, "event": "done", "data": {"content": ""}}
+        assert run.events_after(1000)[0][2] == {"content": ""}
+
+    def test_finished_runs_expire(self):
+        registry = RunRegistry(retention_seconds=0)
+        run = AgentRun(conversation_id=1)
+        registry._runs[run.id] = run
+        assert registry.get(run.id) is run
+        run.finish()
+        time.sleep(0.01)
+        assert registry.get(run.id) is None
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Chat routes
+# ────────────────────────────────────────────────────────────────────
+
+@pytest.fixture()
+def convo(app):
+    conversation = Conversation(title="Runs")
+    _db.session.add(conversation)
+    _db.session.commit()
+    return conversation
+
+
+@pytest.fixture()
+def fake_agent():
+    """Patch the chat route to run a scripted agent; yields a release event."""
+    release = threading.Event()
+
+    def run(self_agent, messages):
+        yield {"event": "text_delta", "data": {"content": "Hello "}}
+        yield {"event": "tool_start", "data": {"id": "t1", "name": "web_search"}}
+        release.wait(5)
+        yield {"event": "tool_result", "data": {"id": "t1", "name": "web_search"}}
+        yield {"event": "text_delta", "data": {"content": "world"}}
+        yield {"event": "done", "data": {"content": "Hello world"}}
+
+    with patch("backend.routes.chat.get_active_mode_llm_config", return_value={
+        "provider": "openai", "api_key": "test-key", "model": "gpt-4",
+    }), patch("backend.routes.chat.get_integration_config", return_value={
+        "search_api_key": "", "rapidapi_key": "",
+    }), patch("backend.routes.chat.create_llm_config"), \
+         patch("backend.routes.chat.get_agent_classes") as mock_classes:
+        mock_agent = type("MockAgent", (), {"run": run})()
+        mock_classes.return_value = (lambda *a, **kw: mock_agent, None, None)
+        yield release
+
+
+def _wait_finished(run):
+    deadline = time.monotonic() + 5
+    while not run.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert run.finished
+
+
+class TestRunRoutes:
+
+    def test_stream_carries_run_id_and_event_ids(self, client, convo, fake_agent):
+        fake_agent.set()
+        resp = client.post(f"/api/chat/conversations/{convo.id}/messages", json={"content": "hi"})
+        run_id = resp.headers["X-Run-Id"]
+        events = _parse_sse(resp.get_data(as_text=True))
+        assert [e["id"] for e in events] == [1, 2, 3, 4, 5]
+        assert events[-1]["event"] == "done"
+
+        replay = client.get(f"/api/chat/runs/{run_id}/events", headers={"Last-Event-ID": "3"})
+        assert [e["id"] for e in _parse_sse(replay.get_data(as_text=True))] == [4, 5]
+        query = client.get(f"/api/chat/runs/{run_id}/events?last_event_id=4")
+        assert [e["event"] for e in _parse_sse(query.get_data(as_text=True))] == ["done"]
+
+    def test_reply_saved_after_disconnect_and_reattach(self, client, convo, fake_agent):
+        resp = client.post(f"/api/chat/conversations/{convo.id}/messages", json={"content": "hi"})
+        run_id = resp.headers["X-Run-Id"]
+        resp.close()  # the client goes away mid-run
+
+        listed = client.get(f"/api/chat/conversations/{convo.id}/runs").get_json()["runs"]
+        assert [(r["run_id"], r["finished"]) for r in listed] == [(run_id, False)]
+
+        fake_agent.set()
+        _wait_finished(get_runs().get(run_id))
+        reply = Message.query.filter_by(conversation_id=convo.id, role="assistant").one()
+        assert reply.content == "Hello world"
+        assert len(json.loads(reply.tool_calls)) == 2
+
+        events = _parse_sse(client.get(f"/api/chat/runs/{run_id}/events",
+                                       headers={"Last-Event-ID": "2"}).get_data(as_text=True))
+        assert [e["event"] for e in events] == ["tool_result", "text_delta", "done"]
+
+    def test_reattach_errors(self, client, convo, fake_agent):
+        fake_agent.set()
+        resp = client.post(f"/api/chat/conversations/{convo.id}/messages", json={"content": "hi"})
+        run_id = resp.headers["X-Run-Id"]
+        resp.get_data()
+        assert client.get("/api/chat/runs/nope/events").status_code == 404
+        bad = client.get(f"/api/chat/runs/{run_id}/events", headers={"Last-Event-ID": "abc"})
+        assert bad.status_code == 400
+        assert client.get("/api/chat/conversations/999/runs").status_code == 404
+
+
+# ────────────────────────────────────────────────────────────────────
+# 3. Cancellation
+# ────────────────────────────────────────────────────────────────────
+
+@pytest.fixture()
+def slow_agent():
+    """Patch the chat route to run an agent that streams until cancelled."""
+    token = CancelToken()
+
+    def run(self_agent, messages):
+        yield {"event": "text_delta", "data": {"content": "Partial answer"}}
+        deadline = time.monotonic() + 5
+        while not token.cancelled and time.monotonic() < deadline:
+            time.sleep(0.01)
+        yield {"event": "cancelled", "data": {"reason": token.reason}}
+
+    with patch("backend.routes.chat.get_active_mode_llm_config", return_value={
+        "provider": "openai", "api_key": "test-key", "model": "gpt-4",
+    }), patch("backend.routes.chat.get_integration_config", return_value={
+        "search_api_key": "", "rapidapi_key": "",
+    }), patch("backend.routes.chat.create_llm_config"), \
+         patch("backend.routes.chat.get_agent_classes") as mock_classes:
+        mock_agent = type("MockAgent", (), {"run": run, "cancel_token": token})()
+        mock_classes.return_value = (lambda *a, **kw: mock_agent, None, None)
+        yield token
+
+
+class TestCancellation:
+
+    def test_cancel_route(self, client, convo, slow_agent):
+        resp = client.post(f"/api/chat/conversations/{convo.id}/messages", json={"content": "hi"})
+        run_id = resp.headers["X-Run-Id"]
+
+        cancelled = client.post(f"/api/chat/runs/{run_id}/cancel")
+        assert cancelled.status_code == 200
+        assert cancelled.get_json()["cancelled"] is True
+        events = _parse_sse(resp.get_data(as_text=True))
+        assert events[-1]["event"] == "cancelled"
+        assert events[-1]["data"] == {"reason": "cancelled by user"}
+
+        reply = Message.query.filter_by(conversation_id=convo.id, role="assistant").one()
+        assert reply.content == "Partial answer"
+        assert client.post(f"/api/chat/runs/{run_id}/cancel").status_code == 409
+        assert client.post("/api/chat/runs/nope/cancel").status_code == 404
+
+    def test_disconnect_cancels_run(self, client, convo, slow_agent, monkeypatch):
+        monkeypatch.setenv("AGENT_STREAMING_DISCONNECT_GRACE_SECONDS", "0")
+        resp = client.post(f"/api/chat/conversations/{convo.id}/messages", json={"content": "hi"})
+        run = get_runs().get(resp.headers["X-Run-Id"])
+        resp.close()
+        _wait_finished(run)
+        assert slow_agent.reason == "client disconnected"
+
+    def test_reattach_within_grace_keeps_run(self):
+        run = AgentRun(conversation_id=1)
+        run.emit("text_delta", {"content": "a"})
+        first = run.stream(heartbeat_seconds=0.05, disconnect_grace_seconds=0.2)
+        next(first)
+        first.close()
+        second = run.stream(heartbeat_seconds=0.05, disconnect_grace_seconds=0.2)
+        next(second)
+        time.sleep(0.4)
+        assert not run.cancel_token.cancelled
+        second.close()
+        time.sleep(0.4)
+        assert run.cancel_token.reason == "client disconnected"
+
+    def test_cancelled_pool_drops_calls_not_started(self, monkeypatch):
+        monkeypatch.setattr(cancellation, "CANCEL_POLL_SECONDS", 0.01)
+        token = CancelToken()
+        submitted = threading.Event()
+        started = []
+
+        def call(i):
+            started.append(i)
+            if i == 0:
+                submitted.wait(5)
+                token.cancel("cancelled by user")
+                time.sleep(0.2)
+
+        with pytest.raises(RunCancelled):
+            with CancellableThreadPool(token, max_workers=1) as pool:
+                futures = [pool.submit(call, i) for i in range(5)]
+                submitted.set()
+                for _ in pool.as_completed(futures):
+                    pass
+        time.sleep(0.3)
+        assert started == [0]
+        assert all(f.cancelled() for f in futures[1:])
+        with pytest.raises(RunCancelled):
+            pool.submit(call, 5)
+
+    def test_cancel_stops_pooled_workflow(self):
+        token = CancelToken()
+        release = threading.Event()
+        workflow = EditCoverLetterWorkflow(
+            outcome_id=1, params={"cover_letter": "Dear Acme"}, tools=None, llm_config=None,
+            event_bus=MagicMock(), cancel_token=token,
+        )
+        module = "backend.agent.micro_agents_v1.workflows.edit_cover_letter"
+
+        finished = []
+
+        def structure(*args):
+            token.cancel("cancelled by user")
+            return {}
+
+        def blocked(*args):
+            release.wait(5)
+            finished.append(args)
+            return {}
+
+        with patch(f"{module}.load_job_context", return_value=({"id": 1, "title": "SWE", "company": "Acme"}, "")), \
+             patch(f"{module}.load_user_context", return_value=""), \
+             patch(f"{module}.build_lm"), \
+             patch(f"{module}.dspy.ChainOfThought") as chain, \
+             patch.object(workflow, "_analyze_structure", side_effect=structure), \
+             patch.object(workflow, "_analyze_content_fit", side_effect=blocked), \
+             patch.object(workflow, "_analyze_tone", side_effect=blocked):
+            with pytest.raises(RunCancelled):
+                workflow.run()
+            # run() returned without waiting for the passes still running
+            assert finished == []
+            release.set()
+        chain.assert_not_called()
+
+
+# ────────────────────────────────────────────────────────────────────
+# 4. Executor
+# ────────────────────────────────────────────────────────────────────
+
+class _Targets:
+    """Run targets that record their start order and block until released."""
+
+    def __init__(self):
+        self.started = []
+        self.releases = {}
+
+    def __call__(self, name):
+        self.releases[name] = threading.Event()
+
+        def target(run):
+            self.started.append(name)
+            self.releases[name].wait(5)
+        return target
+
+
+def _queued_positions(run):
+    return [data["position"] for _, event, data in run.events_after(0) if event == "queued"]
+
+
+class TestExecutor:
+
+    def test_cap_and_fifo_queue(self, app):
+        registry = RunRegistry(max_concurrent=1)
+        targets = _Targets()
+        first = registry.start(1, targets("first"))
+        second = registry.start(2, targets("second"))
+        third = registry.start(3, targets("third"))
+        assert [first.status, second.status, third.status] == ["running", "queued", "queued"]
+        assert registry.stats() == {"active": 1, "queued": 2, "max_concurrent": 1, "retained": 3}
+
+        targets.releases["first"].set()
+        _wait_finished(first)
+        deadline = time.monotonic() + 5
+        while second.status != "running" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _queued_positions(second) == [1]
+        assert _queued_positions(third) == [2, 1]
+        assert third.to_dict()["queue_position"] == 1
+
+        targets.releases["second"].set()
+        targets.releases["third"].set()
+        _wait_finished(third)
+        assert targets.started == ["first", "second", "third"]
+        assert registry.stats()["active"] == 0
+
+    def test_one_run_per_conversation(self, app):
+        registry = RunRegistry(max_concurrent=2)
+        targets = _Targets()
+        first = registry.start(1, targets("first"))
+        same_convo = registry.start(1, targets("same_convo"))
+        other_convo = registry.start(2, targets("other_convo"))
+        assert [first.status, same_convo.status, other_convo.status] == ["running", "queued", "running"]
+
+        targets.releases["first"].set()
+        targets.releases["same_convo"].set()
+        targets.releases["other_convo"].set()
+        _wait_finished(same_convo)
+        assert targets.started.index("same_convo") > targets.started.index("first")
+
+    def test_cancelling_queued_run_drops_it(self, app):
+        registry = RunRegistry(max_concurrent=1)
+        targets = _Targets()
+        first = registry.start(1, targets("first"))
+        queued = registry.start(2, targets("queued"))
+        queued.cancel("cancelled by user")
+        assert queued.finished
+        assert [event for _, event, _ in queued.events_after(0)] == ["queued", "cancelled"]
+        assert registry.stats()["queued"] == 0
+
+        targets.releases["first"].set()
+        _wait_finished(first)
+        assert targets.started == ["first"]
+
+    def test_stats_route(self, client):
+        stats = client.get("/api/chat/runs/stats").get_json()
+        assert stats == {"active": 0, "queued": 0, "max_concurrent": 4, "retained": 0}
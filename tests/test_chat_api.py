@@ -0,0 +1,209 @@
+"""Tests for the chat API beyond streaming error handling.
+
+Covers:
+1. Paged message history (latest page on open, ``before_id``/``limit`` paging)
+2. The conversation list: keyset pages, counts and previews
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from backend.app import create_app
+from backend.database import db as _db
+from backend.models.chat import Conversation, Message
+from backend.models.search_result import SearchResult
+from backend.routes.chat import CONVERSATION_PREVIEW_CHARS
+
+
+class TestConfig:
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    TESTING = True
+    LOG_LEVEL = "WARNING"
+
+
+@pytest.fixture()
+def app(tmp_path):
+    """Create a Flask test app with an in-memory database."""
+    with patch("backend.config.get_data_dir", return_value=tmp_path), \
+         patch("backend.app.get_data_dir", return_value=tmp_path), \
+         patch("backend.app._init_telemetry"):
+        application = create_app(config_class=TestConfig)
+    with application.app_context():
+        yield application
+        _db.session.remove()
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture()
+def long_chat(app):
+    """A conversation with 12 messages: 6 with distinct timestamps, then 6 sharing one."""
+    convo = Conversation(title="Long")
+    _db.session.add(convo)
+    _db.session.flush()
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    for i in range(12):
+        created = base + timedelta(minutes=min(i, 6))
+        _db.session.add(Message(conversation_id=convo.id, role="user" if i % 2 == 0 else "assistant",
+                                content=f"m{i}", created_at=created))
+    _db.session.commit()
+    return convo
+
+
+def _contents(messages):
+    return [m["content"] for m in messages]
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Message paging
+# ────────────────────────────────────────────────────────────────────
+
+class TestMessagePaging:
+
+    def test_open_returns_latest_page_and_count(self, client, long_chat):
+        data = client.get(f"/api/chat/conversations/{long_chat.id}?limit=5").get_json()
+        assert _contents(data["messages"]) == ["m7", "m8", "m9", "m10", "m11"]
+        assert data["message_count"] == 12
+        assert data["has_more"] is True
+        assert data["title"] == "Long"
+
+    def test_walk_back_with_before_id(self, client, long_chat):
+        url = f"/api/chat/conversations/{long_chat.id}"
+        page = client.get(f"{url}?limit=5").get_json()
+        seen = _contents(page["messages"])
+        oldest = page["messages"][0]["id"]
+        while True:
+            page = client.get(f"{url}/messages?before_id={oldest}&limit=5").get_json()
+            seen = _contents(page["messages"]) + seen
+            if not page["has_more"]:
+                break
+            oldest = page["messages"][0]["id"]
+        assert seen == [f"m{i}" for i in range(12)]
+
+    def test_default_page_holds_short_conversations(self, client, long_chat):
+        data = client.get(f"/api/chat/conversations/{long_chat.id}").get_json()
+        assert len(data["messages"]) == 12
+        assert data["has_more"] is False
+
+    def test_server_default_timestamps(self, client, app):
+        convo = Conversation(title="Now")
+        _db.session.add(convo)
+        _db.session.flush()
+        _db.session.add_all([Message(conversation_id=convo.id, role="user", content=f"n{i}") for i in range(4)])
+        _db.session.commit()
+        last = client.get(f"/api/chat/conversations/{convo.id}?limit=2").get_json()["messages"]
+        older = client.get(f"/api/chat/conversations/{convo.id}/messages?before_id={last[0]['id']}").get_json()
+        assert _contents(older["messages"]) + _contents(last) == ["n0", "n1", "n2", "n3"]
+
+    def test_invalid_params(self, client, long_chat):
+        other = Conversation(title="Other")
+        _db.session.add(other)
+        _db.session.commit()
+        msg_id = Message.query.filter_by(conversation_id=long_chat.id).first().id
+        base = "/api/chat/conversations"
+        assert client.get(f"{base}/{other.id}/messages?before_id={msg_id}").status_code == 404
+        assert client.get(f"{base}/{long_chat.id}?limit=0").status_code == 400
+        assert client.get(f"{base}/{long_chat.id}/messages?limit=abc").status_code == 400
+        assert client.get(f"{base}/999/messages").status_code == 404
+
+    def test_send_message_history_excludes_tool_calls(self, client, long_chat):
+        captured = {}
+
+        def run(self_agent, messages):
+            captured["messages"] = messages
+            yield {"event": "done", "data": {"content": ""}}
+
+        with patch("backend.routes.chat.get_active_mode_llm_config", return_value={
+            "provider": "openai", "api_key": "test-key", "model": "gpt-4",
+        }), patch("backend.routes.chat.get_integration_config", return_value={
+            "search_api_key": "", "rapidapi_key": "",
+        }), patch("backend.routes.chat.create_llm_config"), \
+             patch("backend.routes.chat.get_agent_classes") as mock_classes:
+            mock_agent = type("MockAgent", (), {"run": run})()
+            mock_classes.return_value = (lambda *a, **kw: mock_agent, None, None)
+            client.post(f"/api/chat/conversations/{long_chat.id}/messages", json={"content": "next"}).get_data()
+
+        history = captured["messages"]
+        assert len(history) == 13
+        assert {k: history[-1][k] for k in ("role", "content")} == {"role": "user", "content": "next"}
+        assert all(isinstance(m["id"], int) for m in history)
+        assert _contents(history[:12]) == [f"m{i}" for i in range(12)]
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Conversation list
+# ────────────────────────────────────────────────────────────────────
+
+@pytest.fixture()
+def many_chats(app):
+    """25 conversations; every third shares its updated_at with the next one."""
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    convos = []
+    for i in range(25):
+        convo = Conversation(title=f"c{i}", updated_at=base + timedelta(minutes=i - i % 3))
+        _db.session.add(convo)
+        _db.session.flush()
+        for j in range(i % 4):
+            _db.session.add(Message(conversation_id=convo.id, role="user", content=f"c{i} m{j}",
+                                    created_at=base + timedelta(seconds=j)))
+        for j in range(i % 2):
+            _db.session.add(SearchResult(conversation_id=convo.id, company="Acme", title="Eng"))
+        convos.append(convo)
+    _db.session.commit()
+    return convos
+
+
+class TestConversationList:
+
+    def test_unpaginated_list_has_counts_and_previews(self, client, many_chats):
+        resp = client.get("/api/chat/conversations")
+        data = resp.get_json()
+        assert "X-Next-Cursor" not in resp.headers
+        assert len(data) == 25
+        by_title = {c["title"]: c for c in data}
+        assert by_title["c7"]["message_count"] == 3
+        assert by_title["c7"]["last_message"] == "c7 m2"
+        assert by_title["c7"]["search_result_count"] == 1
+        assert by_title["c8"]["message_count"] == 0
+        assert by_title["c8"]["last_message"] is None
+        assert by_title["c8"]["search_result_count"] == 0
+        assert set(data[0]) == {"id", "title", "created_at", "updated_at",
+                                "message_count", "last_message", "search_result_count"}
+
+    def test_pages_cover_list_in_order(self, client, many_chats):
+        expected = client.get("/api/chat/conversations").get_json()
+        seen = []
+        url = "/api/chat/conversations?limit=4"
+        while True:
+            resp = client.get(url)
+            page = resp.get_json()
+            assert len(page) <= 4
+            seen.extend(page)
+            cursor = resp.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            url = f"/api/chat/conversations?limit=4&cursor={cursor}"
+        assert seen == expected
+        assert [c["updated_at"] for c in seen] == sorted((c["updated_at"] for c in seen), reverse=True)
+
+    def test_preview_truncated(self, client, app):
+        convo = Conversation(title="Long message")
+        _db.session.add(convo)
+        _db.session.flush()
+        _db.session.add(Message(conversation_id=convo.id, role="assistant", content="x" * 500))
+        _db.session.commit()
+        data = client.get("/api/chat/conversations").get_json()
+        assert data[0]["last_message"] == "x" * CONVERSATION_PREVIEW_CHARS
+
+    def test_invalid_params(self, client, many_chats):
+        base = "/api/chat/conversations"
+        assert client.get(f"{base}?limit=0").status_code == 400
+        assert client.get(f"{base}?limit=abc").status_code == 400
+        assert client.get(f"{base}?limit=5&cursor=not-a-cursor").status_code == 400
+        assert client.get(f"{base}?cursor=abc").status_code == 400
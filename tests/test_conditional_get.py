@@ -0,0 +1,174 @@
+"""Tests for per-table version counters and conditional GET (ETag / 304).
+
+Covers:
+1. Version bumps on commit (ORM, Core DML, cascades, rollback)
+2. ETag / If-None-Match handling on jobs, chat and job document routes
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from backend.app import create_app
+from backend.database import db as _db
+from backend.models.chat import Conversation, Message
+from backend.models.job import Job
+from backend.models.job_document import JobDocument
+from backend.table_versions import table_version
+
+
+class TestConfig:
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    TESTING = True
+    LOG_LEVEL = "WARNING"
+
+
+@pytest.fixture()
+def app(tmp_path):
+    """Create a Flask test app with an in-memory database."""
+    with patch("backend.config.get_data_dir", return_value=tmp_path), \
+         patch("backend.app.get_data_dir", return_value=tmp_path), \
+         patch("backend.app._init_telemetry"):
+        application = create_app(config_class=TestConfig)
+    with application.app_context():
+        yield application
+        _db.session.remove()
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture()
+def job(app):
+    job = Job(company="Acme", title="Engineer", tags="python")
+    _db.session.add(job)
+    _db.session.commit()
+    return job
+
+
+def _revalidate(client, url):
+    """GET *url*, then GET it again with the returned ETag; return both responses."""
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.headers["ETag"].startswith('W/"')
+    second = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    return first, second
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Version counters
+# ────────────────────────────────────────────────────────────────────
+
+class TestTableVersions:
+
+    def test_commit_bumps_written_tables_only(self, app, job):
+        jobs_v, convos_v = table_version("jobs"), table_version("conversations")
+        job.notes = "updated"
+        _db.session.commit()
+        assert table_version("jobs") == jobs_v + 1
+        assert table_version("conversations") == convos_v
+
+    def test_core_dml_bumps(self, app, job):
+        before = table_version("jobs")
+        _db.session.execute(_db.update(Job).values(status="applied"))
+        _db.session.commit()
+        assert table_version("jobs") == before + 1
+
+    def test_delete_bumps_cascade_targets(self, app, job):
+        _db.session.add(JobDocument(job_id=job.id, doc_type="resume", content="x", version=1))
+        _db.session.commit()
+        docs_v, tags_v = table_version("job_documents"), table_version("job_tags")
+        _db.session.delete(job)
+        _db.session.commit()
+        assert table_version("job_documents") == docs_v + 1
+        assert table_version("job_tags") == tags_v + 1
+
+    def test_rollback_does_not_bump(self, app, job):
+        before = table_version("jobs")
+        job.notes = "discarded"
+        _db.session.flush()
+        _db.session.rollback()
+        _db.session.commit()
+        assert table_version("jobs") == before
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Conditional GET
+# ────────────────────────────────────────────────────────────────────
+
+class TestConditionalGet:
+
+    def test_unchanged_list_returns_304(self, client, job):
+        first, second = _revalidate(client, "/api/jobs?fields=id,company")
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "no-cache"
+
+    def test_304_skips_the_query(self, client, job):
+        etag = client.get("/api/jobs").headers["ETag"]
+        with patch.object(Job, "to_dict") as to_dict:
+            resp = client.get("/api/jobs", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        to_dict.assert_not_called()
+
+    def test_change_invalidates_etag(self, client, job):
+        etag = client.get(f"/api/jobs/{job.id}").headers["ETag"]
+        client.patch(f"/api/jobs/{job.id}", json={"status": "offer"})
+        resp = client.get(f"/api/jobs/{job.id}", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.get_json()["status"] == "offer"
+        assert resp.headers["ETag"] != etag
+
+    def test_unrelated_writes_keep_etag(self, client, job):
+        etag = client.get("/api/jobs/stats").headers["ETag"]
+        client.post("/api/chat/conversations", json={"title": "x"})
+        resp = client.get("/api/jobs/stats", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+    def test_conversation_messages(self, client, app):
+        convo = Conversation(title="Chat")
+        _db.session.add(convo)
+        _db.session.commit()
+        url = f"/api/chat/conversations/{convo.id}"
+        first, second = _revalidate(client, url)
+        assert second.status_code == 304
+
+        _db.session.add(Message(conversation_id=convo.id, role="user", content="hi"))
+        _db.session.commit()
+        third = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+        assert third.status_code == 200
+        assert len(third.get_json()["messages"]) == 1
+
+    def test_job_documents(self, client, job):
+        client.post(f"/api/jobs/{job.id}/documents",
+                    json={"doc_type": "resume", "content": "v1"})
+        url = f"/api/jobs/{job.id}/documents/history?type=resume"
+        first, second = _revalidate(client, url)
+        assert second.status_code == 304
+        client.post(f"/api/jobs/{job.id}/documents",
+                    json={"doc_type": "resume", "content": "v2"})
+        third = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+        assert len(third.get_json()) == 2
+
+    def test_errors_carry_no_etag(self, client, app):
+        resp = client.get("/api/jobs/999")
+        assert resp.status_code == 404
+        assert "ETag" not in resp.headers
+        resp = client.get("/api/jobs?limit=0")
+        assert resp.status_code == 400
+        assert "ETag" not in resp.headers
+
+    def test_etag_not_reused_across_app_instances(self, client, job, tmp_path):
+        etag = client.get("/api/jobs").headers["ETag"]
+        with patch("backend.config.get_data_dir", return_value=tmp_path), \
+             patch("backend.app.get_data_dir", return_value=tmp_path), \
+             patch("backend.app._init_telemetry"):
+            restarted = create_app(config_class=TestConfig)
+        with restarted.app_context():
+            resp = restarted.test_client().get("/api/jobs", headers={"If-None-Match": etag})
+            assert resp.status_code == 200
+            _db.session.remove()
@@ -0,0 +1,200 @@
+"""Tests for the agents' token-budgeted context window.
+
+Covers:
+1. Building the prompt from history, with and without the rolling summary
+2. Truncating and condensing tool results
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from backend.agent import context_window as cw_module
+from backend.agent.context_window import ContextWindow
+from backend.app import create_app
+from backend.database import db as _db
+from backend.llm.llm_factory import LLMConfig
+from backend.models.chat import Conversation, Message
+
+
+class TestConfig:
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    TESTING = True
+    LOG_LEVEL = "WARNING"
+
+
+@pytest.fixture()
+def app(tmp_path):
+    """Create a Flask test app with an in-memory database."""
+    with patch("backend.config.get_data_dir", return_value=tmp_path), \
+         patch("backend.app.get_data_dir", return_value=tmp_path), \
+         patch("backend.app._init_telemetry"):
+        application = create_app(config_class=TestConfig)
+    with application.app_context():
+        yield application
+        _db.session.remove()
+
+
+def _window(**kwargs):
+    settings = {"budget_tokens": 400, "tool_result_max_tokens": 50, "summary_max_tokens": 60}
+    settings.update(kwargs)
+    return ContextWindow(LLMConfig(model="openai/gpt-4o"), **settings)
+
+
+@pytest.fixture()
+def chat(app):
+    """A conversation of 20 alternating turns, each about 40 tokens long."""
+    convo = Conversation(title="Long")
+    _db.session.add(convo)
+    _db.session.flush()
+    for i in range(20):
+        role = "user" if i % 2 == 0 else "assistant"
+        _db.session.add(Message(conversation_id=convo.id, role=role,
+                                content=f"turn {i}: " + "lorem ipsum " * 18))
+    _db.session.commit()
+    return convo
+
+
+def _history(convo_id):
+    rows = Message.query.filter_by(conversation_id=convo_id).order_by(Message.id)
+    return [{"id": m.id, "role": m.role, "content": m.content} for m in rows]
+
+
+def _summary_response(text):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. History and rolling summary
+# ────────────────────────────────────────────────────────────────────
+
+class TestBuild:
+
+    def test_short_history_passes_through(self, app, chat):
+        history = _history(chat.id)[-3:]
+        with patch.object(cw_module.litellm, "completion") as completion:
+            messages = _window(budget_tokens=10_000).build("SYSTEM", history, chat.id)
+        completion.assert_not_called()
+        assert messages[0] == {"role": "system", "content": "SYSTEM"}
+        assert [m["content"] for m in messages[1:]] == [m["content"] for m in history]
+        assert all(set(m) == {"role", "content"} for m in messages)
+
+    def test_old_turns_folded_into_saved_summary(self, app, chat):
+        history = _history(chat.id)
+        window = _window()
+        updated_before = _db.session.get(Conversation, chat.id).updated_at
+        with patch.object(cw_module.litellm, "completion",
+                          return_value=_summary_response("User wants Rust jobs.")) as completion:
+            messages = window.build("SYSTEM", history, chat.id)
+
+        assert completion.call_count == 1
+        transcript = completion.call_args.kwargs["messages"][1]["content"]
+        assert "turn 0:" in transcript
+        assert "<conversation_summary>\nUser wants Rust jobs.\n</conversation_summary>" in messages[0]["content"]
+        assert messages[1]["role"] == "user"
+        assert messages[-1]["content"] == history[-1]["content"]
+        assert window.count(messages) <= window.budget_tokens
+
+        _db.session.expire_all()
+        convo = _db.session.get(Conversation, chat.id)
+        kept_first = next(m for m in history if m["content"] == messages[1]["content"])
+        assert convo.context_summary == "User wants Rust jobs."
+        assert convo.context_summary_through == kept_first["id"] - 1
+        assert convo.updated_at == updated_before
+
+    def test_later_turns_start_from_summary(self, app, chat):
+        window = _window()
+        with patch.object(cw_module.litellm, "completion", return_value=_summary_response("S1")):
+            first = window.build("SYSTEM", _history(chat.id), chat.id)
+        _db.session.add(Message(conversation_id=chat.id, role="assistant", content="short reply"))
+        _db.session.add(Message(conversation_id=chat.id, role="user", content="short question"))
+        _db.session.commit()
+
+        with patch.object(cw_module.litellm, "completion") as completion:
+            second = window.build("SYSTEM", _history(chat.id), chat.id)
+        completion.assert_not_called()
+        assert second[:len(first)] == first
+        assert [m["content"] for m in second[len(first):]] == ["short reply", "short question"]
+
+    def test_summary_cursor_skips_unsaved_turns(self, app, chat):
+        history = _history(chat.id)
+        # A dropped turn that was never saved, right before the kept window
+        history[13]["id"] = None
+        with patch.object(cw_module.litellm, "completion", return_value=_summary_response("S1")):
+            messages = _window().build("SYSTEM", history, chat.id)
+        kept_first = next(i for i, m in enumerate(history) if m["content"] == messages[1]["content"])
+        assert kept_first == 14
+
+        _db.session.expire_all()
+        through = _db.session.get(Conversation, chat.id).context_summary_through
+        assert through == history[12]["id"]
+
+        no_ids = [{**m, "id": None} for m in _history(chat.id)]
+        _db.session.execute(_db.update(Conversation).values(context_summary=None,
+                                                            context_summary_through=None))
+        _db.session.commit()
+        with patch.object(cw_module.litellm, "completion", return_value=_summary_response("S2")):
+            _window().build("SYSTEM", no_ids, chat.id)
+        _db.session.expire_all()
+        assert _db.session.get(Conversation, chat.id).context_summary_through is None
+
+    def test_summary_failure_still_fits(self, app, chat):
+        window = _window()
+        with patch.object(cw_module.litellm, "completion", side_effect=RuntimeError("down")):
+            messages = window.build("SYSTEM", _history(chat.id), chat.id)
+        assert messages[0]["content"] == "SYSTEM"
+        assert window.count(messages) <= window.budget_tokens
+        assert _db.session.get(Conversation, chat.id).context_summary is None
+
+    def test_budget_setting_from_env(self, app, monkeypatch):
+        monkeypatch.setenv("AGENT_CONTEXT_BUDGET_TOKENS", "1234")
+        monkeypatch.setenv("AGENT_CONTEXT_SUMMARY_MAX_TOKENS", "not a number")
+        window = ContextWindow.from_config(LLMConfig(model="openai/gpt-4o"))
+        assert window.budget_tokens == 1234
+        assert window.summary_max_tokens == cw_module.DEFAULT_SUMMARY_MAX_TOKENS
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Tool results
+# ────────────────────────────────────────────────────────────────────
+
+def _tool_turn(call_id, content):
+    return [
+        {"role": "assistant", "content": None, "tool_calls": [
+            {"id": call_id, "type": "function", "function": {"name": "scrape_url", "arguments": "{}"}},
+        ]},
+        {"role": "tool", "tool_call_id": call_id, "content": content},
+    ]
+
+
+class TestToolResults:
+
+    def test_cap_tool_result(self):
+        window = _window()
+        small = json.dumps({"ok": True})
+        assert window.cap_tool_result(small) == small
+        capped = window.cap_tool_result(json.dumps({"text": "word " * 500}))
+        assert "[truncated: result was about" in capped
+        assert window._text_tokens(capped) < 100
+
+    def test_fit_condenses_older_results_first(self):
+        window = _window(budget_tokens=500)
+        bulky = "scraped page text " * 60
+        messages = [{"role": "system", "content": "SYSTEM"}, {"role": "user", "content": "go"}]
+        messages += _tool_turn("a", bulky) + _tool_turn("b", bulky) + _tool_turn("c", bulky)
+        window.fit(messages)
+
+        assert "[condensed:" in messages[3]["content"]
+        assert messages[3]["tool_call_id"] == "a"
+        assert messages[-1]["content"] == bulky
+        assert window.count(messages) <= window.budget_tokens
+
+    def test_fit_leaves_small_prompts_alone(self):
+        window = _window(budget_tokens=10_000)
+        messages = [{"role": "system", "content": "SYSTEM"}] + _tool_turn("a", "x" * 1000)
+        before = [dict(m) for m in messages]
+        window.fit(messages)
+        assert messages == before
@@ -1,7 +1,7 @@
 """Tests for database integrity: FK enforcement, cascade deletes, and migrations.
 
 Covers the fixes from the 'Database Integrity' must-fix todo:
-1. SQLite foreign key enforcement (PRAGMA foreign_keys=ON)
+1. SQLite foreign key enforcement (PRAGMA foreign_keys=ON) and pragma profiles
 2. Cascade delete on SearchResult foreign keys
 3. Cascade delete on Message foreign keys
 4. ORM-level cascade relationships
@@ -15,9 +15,10 @@ from unittest.mock import patch
 import pytest
 
 from backend.app import create_app
-from backend.database import db as _db
+from backend.database import SQLITE_PROFILES, db as _db, resolve_sqlite_pragmas
 from backend.models.chat import Conversation, Message
 from backend.models.job import Job
+from backend.models.job_tag import JobTag
 from backend.models.job_document import JobDocument
 from backend.models.application_todo import ApplicationTodo
 from backend.models.search_result import SearchResult
@@ -67,6 +68,65 @@ class TestForeignKeyEnforcement:
             _db.session.flush()
 
 
+class TestSqlitePragmaProfile:
+    """The configured pragma profile is applied to file-backed connections."""
+
+    def _make_app(self, tmp_path, **config):
+        class FileConfig(TestConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'app.db'}"
+
+        for key, value in config.items():
+            setattr(FileConfig, key, value)
+
+        with patch("backend.config.get_data_dir", return_value=tmp_path), \
+             patch("backend.app.get_data_dir", return_value=tmp_path), \
+             patch("backend.app._init_telemetry"):
+            return create_app(config_class=FileConfig)
+
+    def _pragma(self, name):
+        return _db.session.execute(_db.text(f"PRAGMA {name}")).scalar()
+
+    def test_default_is_performance_profile(self, tmp_path):
+        app = self._make_app(tmp_path)
+        with app.app_context():
+            assert self._pragma("journal_mode") == "wal"
+            assert self._pragma("synchronous") == 1  # NORMAL
+            assert self._pragma("busy_timeout") == 5000
+            assert self._pragma("cache_size") == -32000
+            assert self._pragma("temp_store") == 2  # MEMORY
+            assert self._pragma("foreign_keys") == 1
+
+    def test_default_profile_restores_rollback_journal(self, tmp_path):
+        wal_app = self._make_app(tmp_path)  # leaves the file in WAL mode
+        with wal_app.app_context():
+            _db.engine.dispose()
+        app = self._make_app(tmp_path, SQLITE_PROFILE="default")
+        with app.app_context():
+            assert self._pragma("journal_mode") == "delete"
+            assert self._pragma("synchronous") == 2  # FULL
+
+    def test_overrides_apply_on_top_of_profile(self, tmp_path):
+        app = self._make_app(tmp_path, SQLITE_PROFILE="wal",
+                             SQLITE_PRAGMAS='{"busy_timeout": 250, "temp_store": "memory"}')
+        with app.app_context():
+            assert self._pragma("busy_timeout") == 250
+            assert self._pragma("temp_store") == 2
+
+    def test_invalid_config_falls_back_to_default_profile(self, tmp_path):
+        app = self._make_app(tmp_path, SQLITE_PROFILE="turbo")
+        with app.app_context():
+            assert self._pragma("journal_mode") == "wal"
+
+    def test_resolve_rejects_unsafe_pragmas(self):
+        with pytest.raises(ValueError):
+            resolve_sqlite_pragmas("wal", {"journal_mode": "WAL; DROP TABLE jobs"})
+        with pytest.raises(ValueError):
+            resolve_sqlite_pragmas("wal", {"key": "secret"})
+        with pytest.raises(ValueError):
+            resolve_sqlite_pragmas("wal", {"cache_size": "lots"})
+        assert resolve_sqlite_pragmas(None) == SQLITE_PROFILES["performance"]
+
+
 # ────────────────────────────────────────────────────────────────────
 # 2. Conversation Cascade Deletes
 # ────────────────────────────────────────────────────────────────────
@@ -408,7 +468,8 @@ class TestMigrationSystem:
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             );
             INSERT INTO conversations (id, title) VALUES (1, 'Test');
-            INSERT INTO jobs (id, company, title) VALUES (1, 'Acme', 'Eng');
+            INSERT INTO jobs (id, company, title, tags)
+                VALUES (1, 'Acme', 'Eng', 'Python, Remote ,python');
             INSERT INTO messages (conversation_id, role, content)
                 VALUES (1, 'user', 'hello');
             INSERT INTO search_results (conversation_id, company, title,
@@ -434,6 +495,8 @@ class TestMigrationSystem:
             assert Job.query.count() == 1
             assert Message.query.count() == 1
             assert SearchResult.query.count() == 1
+            # job_tags backfilled from the free-text column
+            assert sorted(t.tag for t in JobTag.query.all()) == ["python", "remote"]
 
         # Verify FK cascades were applied
         conn = sqlite3.connect(str(db_path))
@@ -0,0 +1,309 @@
+"""Tests for DefaultAgent's ReAct loop.
+
+Covers:
+1. Concurrent execution of read-only tool calls from one LLM response
+2. Ordering of tool results in the message history
+3. Cooperative cancellation
+4. Dispatching read-only tool calls while the response streams
+"""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from flask import has_app_context
+
+from backend.agent.default import agent as agent_module
+from backend.agent.default.agent import DefaultAgent
+from backend.app import create_app
+from backend.database import db as _db
+from backend.llm.llm_factory import LLMConfig
+
+
+class TestConfig:
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    TESTING = True
+    LOG_LEVEL = "WARNING"
+
+
+@pytest.fixture()
+def app(tmp_path):
+    """Create a Flask test app with an in-memory database."""
+    with patch("backend.config.get_data_dir", return_value=tmp_path), \
+         patch("backend.app.get_data_dir", return_value=tmp_path), \
+         patch("backend.app._init_telemetry"):
+        application = create_app(config_class=TestConfig)
+    with application.app_context():
+        yield application
+        _db.session.remove()
+
+
+@pytest.fixture()
+def agent(app):
+    return DefaultAgent(LLMConfig(model="test/model"))
+
+
+def _call(name, call_id=None, **args):
+    return {"id": call_id or f"call_{name}", "name": name, "args": args}
+
+
+class _ToolLog:
+    """Stand-in for AgentTools.execute that records start/end order."""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.events = []
+        self.lock = threading.Lock()
+
+    def __call__(self, name, arguments=None):
+        arguments = arguments or {}
+        label = arguments.get("url") or name
+        with self.lock:
+            self.events.append(("start", label))
+        assert has_app_context()
+        time.sleep(self.delay)
+        with self.lock:
+            self.events.append(("end", label))
+        return {"tool": name, "label": label}
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Concurrent tool execution
+# ────────────────────────────────────────────────────────────────────
+
+class TestParallelToolCalls:
+
+    def test_read_only_calls_overlap(self, agent):
+        log = _ToolLog(delay=0.3)
+        calls = [_call("scrape_url", f"c{i}", url=f"https://example.com/{i}") for i in range(3)]
+        with patch.object(agent.tools, "execute", side_effect=log):
+            results = agent._execute_tool_calls(calls)
+        assert [r["label"] for r in results] == [f"https://example.com/{i}" for i in range(3)]
+        # Every call started before any finished
+        assert [kind for kind, _ in log.events[:3]] == ["start"] * 3
+
+    def test_pool_is_bounded(self, agent):
+        log = _ToolLog(delay=0.05)
+        peak = 0
+        running = 0
+
+        def tracking(name, arguments=None):
+            nonlocal peak, running
+            with log.lock:
+                running += 1
+                peak = max(peak, running)
+            try:
+                return log(name, arguments)
+            finally:
+                with log.lock:
+                    running -= 1
+
+        calls = [_call("web_search", f"c{i}", query=str(i)) for i in range(agent_module.MAX_PARALLEL_TOOLS * 2)]
+        with patch.object(agent.tools, "execute", side_effect=tracking):
+            results = agent._execute_tool_calls(calls)
+        assert len(results) == len(calls)
+        assert peak == agent_module.MAX_PARALLEL_TOOLS
+
+    def test_mutating_calls_are_barriers(self, agent):
+        log = _ToolLog(delay=0.05)
+        calls = [
+            _call("scrape_url", "a", url="a"),
+            _call("scrape_url", "b", url="b"),
+            _call("create_job", "job", company="Acme", title="Eng"),
+            _call("scrape_url", "c", url="c"),
+        ]
+        with patch.object(agent.tools, "execute", side_effect=log):
+            results = agent._execute_tool_calls(calls)
+        assert [r["label"] for r in results] == ["a", "b", "create_job", "c"]
+        job_start = log.events.index(("start", "create_job"))
+        assert {("end", "a"), ("end", "b")} <= set(log.events[:job_start])
+        assert log.events[job_start + 1] == ("end", "create_job")
+        assert log.events.index(("start", "c")) > job_start
+
+    def test_unknown_tools_run_serially(self, agent):
+        assert agent.tools.is_mutating("no_such_tool")
+        assert agent.tools.is_mutating("edit_jobs")
+        assert not agent.tools.is_mutating("scrape_url")
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Message history order
+# ────────────────────────────────────────────────────────────────────
+
+def _chunk(content=None, tool_calls=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def _tool_delta(index, call_id, name, arguments):
+    return SimpleNamespace(
+        index=index, id=call_id,
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments)),
+    )
+
+
+class TestReactLoop:
+
+    def test_tool_messages_keep_call_order(self, agent):
+        first = [_chunk(tool_calls=[
+            _tool_delta(0, "slow", "scrape_url", {"url": "slow"}),
+            _tool_delta(1, "fast", "scrape_url", {"url": "fast"}),
+        ])]
+        second = [_chunk(content="Done.")]
+        seen_messages = []
+
+        def completion(messages, **kwargs):
+            seen_messages.append(list(messages))
+            return iter(first if len(seen_messages) == 1 else second)
+
+        def execute(name, arguments=None):
+            time.sleep(0.2 if arguments["url"] == "slow" else 0)
+            return {"url": arguments["url"]}
+
+        with patch.object(agent_module.litellm, "completion", side_effect=completion), \
+             patch.object(agent.tools, "execute", side_effect=execute), \
+             patch.object(agent_module, "read_profile", return_value=""):
+            text = agent._react_loop([{"role": "user", "content": "scrape both"}])
+
+        assert text == "Done."
+        tool_messages = [m for m in seen_messages[1] if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["slow", "fast"]
+        assert [json.loads(m["content"])["url"] for m in tool_messages] == ["slow", "fast"]
+
+
+# ────────────────────────────────────────────────────────────────────
+# 3. Cancellation
+# ────────────────────────────────────────────────────────────────────
+
+class TestCancellation:
+
+    def test_cancel_while_streaming(self, agent):
+        calls = []
+
+        def completion(messages, **kwargs):
+            calls.append(messages)
+            yield _chunk(content="Hello ")
+            agent.cancel_token.cancel("test")
+            yield _chunk(content="world")
+            yield _chunk(tool_calls=[_tool_delta(0, "c1", "scrape_url", {"url": "x"})])
+
+        with patch.object(agent_module.litellm, "completion", side_effect=completion), \
+             patch.object(agent.tools, "execute") as execute, \
+             patch.object(agent_module, "read_profile", return_value=""):
+            events = list(agent.run([{"role": "user", "content": "hi"}]))
+
+        assert len(calls) == 1
+        execute.assert_not_called()
+        assert events[-1] == {"event": "cancelled", "data": {"reason": "test"}}
+        text = "".join(e["data"]["content"] for e in events if e["event"] == "text_delta")
+        assert text == "Hello "
+        assert "done" not in [e["event"] for e in events]
+
+    def test_cancel_skips_remaining_tool_calls(self, agent):
+        first = [_chunk(tool_calls=[
+            _tool_delta(0, "a", "create_job", {"company": "A"}),
+            _tool_delta(1, "b", "create_job", {"company": "B"}),
+        ])]
+        executed = []
+
+        def execute(name, arguments=None):
+            executed.append(arguments["company"])
+            agent.cancel_token.cancel()
+            return {"ok": True}
+
+        with patch.object(agent_module.litellm, "completion", return_value=iter(first)) as completion, \
+             patch.object(agent.tools, "execute", side_effect=execute), \
+             patch.object(agent_module, "read_profile", return_value=""):
+            events = list(agent.run([{"role": "user", "content": "add both"}]))
+
+        assert executed == ["A"]
+        assert completion.call_count == 1
+        assert events[-1]["event"] == "cancelled"
+
+
+# ────────────────────────────────────────────────────────────────────
+# 4. Streaming dispatch
+# ────────────────────────────────────────────────────────────────────
+
+def _fragment(index, call_id=None, name=None, arguments=""):
+    return SimpleNamespace(index=index, id=call_id, function=SimpleNamespace(name=name, arguments=arguments))
+
+
+class TestStreamingDispatch:
+
+    def _run(self, agent, first, execute):
+        seen_messages = []
+
+        def completion(messages, **kwargs):
+            seen_messages.append(list(messages))
+            return first() if len(seen_messages) == 1 else iter([_chunk(content="Done.")])
+
+        with patch.object(agent_module.litellm, "completion", side_effect=completion), \
+             patch.object(agent.tools, "execute", side_effect=execute), \
+             patch.object(agent_module, "read_profile", return_value=""):
+            agent._react_loop([{"role": "user", "content": "go"}])
+        return seen_messages[1]
+
+    def test_read_only_call_starts_before_stream_ends(self, agent):
+        started = threading.Event()
+        stream_ended = []
+
+        def first():
+            yield _chunk(tool_calls=[_fragment(0, "c1", "scrape_url", '{"url": ')])
+            yield _chunk(tool_calls=[_fragment(0, arguments='"x"}')])
+            # The call was dispatched as soon as its arguments were complete
+            assert started.wait(5)
+            yield _chunk(tool_calls=[_tool_delta(1, "c2", "scrape_url", {"url": "y"})])
+            stream_ended.append(True)
+
+        def execute(name, arguments=None):
+            if arguments["url"] == "x":
+                assert not stream_ended
+                started.set()
+            return {"url": arguments["url"]}
+
+        messages = self._run(agent, first, execute)
+        assert messages[-3]["tool_calls"] == [
+            {"id": "c1", "type": "function", "function": {"name": "scrape_url", "arguments": '{"url": "x"}'}},
+            {"id": "c2", "type": "function", "function": {"name": "scrape_url", "arguments": '{"url": "y"}'}},
+        ]
+        assert [(m["tool_call_id"], json.loads(m["content"])) for m in messages[-2:]] == [
+            ("c1", {"url": "x"}), ("c2", {"url": "y"}),
+        ]
+
+    def test_mutating_calls_wait_for_the_stream(self, agent):
+        stream_ended = []
+        executed = []
+
+        def first():
+            yield _chunk(tool_calls=[_tool_delta(0, "job", "create_job", {"company": "A"})])
+            yield _chunk(tool_calls=[_tool_delta(1, "c1", "scrape_url", {"url": "x"})])
+            time.sleep(0.1)
+            stream_ended.append(True)
+
+        def execute(name, arguments=None):
+            executed.append((name, bool(stream_ended)))
+            return {"ok": True}
+
+        messages = self._run(agent, first, execute)
+        assert executed == [("create_job", True), ("scrape_url", True)]
+        assert [m["tool_call_id"] for m in messages if m["role"] == "tool"] == ["job", "c1"]
+
+    def test_each_call_executes_once(self, agent):
+        calls = []
+
+        def first():
+            yield _chunk(tool_calls=[_tool_delta(0, "c1", "scrape_url", {"url": "x"})])
+            yield _chunk(content="Scraping.")
+
+        def execute(name, arguments=None):
+            calls.append(arguments["url"])
+            return {"url": arguments["url"]}
+
+        messages = self._run(agent, first, execute)
+        assert calls == ["x"]
+        assert messages[-2]["content"] == "Scraping."
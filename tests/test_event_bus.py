@@ -0,0 +1,128 @@
+"""Tests for text_delta coalescing in the agent event bus.
+
+Covers:
+1. Merging deltas by size and age, and flushing when the producer goes idle
+2. Ordering with other events, close(), and the disabled setting
+3. The consumer sleeping until woken
+"""
+
+import threading
+import time
+
+from backend.agent.event_bus import EventBus
+
+
+def _drain(bus):
+    return [(e["event"], e["data"]) for e in bus.drain_blocking()]
+
+
+def _deltas(*pieces):
+    return [("text_delta", {"content": p}) for p in pieces]
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Merging
+# ────────────────────────────────────────────────────────────────────
+
+class TestCoalescing:
+
+    def test_burst_merged_into_one_delta(self):
+        bus = EventBus(coalesce_ms=1000, coalesce_bytes=1024)
+        for piece in ["Hel", "lo ", "wor", "ld"]:
+            bus.emit("text_delta", {"content": piece})
+        bus.close()
+        assert _drain(bus) == _deltas("Hello world")
+
+    def test_byte_threshold_flushes(self):
+        bus = EventBus(coalesce_ms=1000, coalesce_bytes=4)
+        for piece in ["ab", "cd", "ef", "g"]:
+            bus.emit("text_delta", {"content": piece})
+        bus.close()
+        assert _drain(bus) == _deltas("abcd", "efg")
+
+    def test_held_text_flushed_when_producer_idles(self):
+        bus = EventBus(coalesce_ms=20, coalesce_bytes=1024)
+        received = []
+
+        def consume():
+            for event in bus.drain_blocking():
+                received.append((time.monotonic(), event["data"]["content"]))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        bus.emit("text_delta", {"content": "early"})
+        time.sleep(0.3)
+        sent_late = time.monotonic()
+        bus.emit("text_delta", {"content": "late"})
+        bus.close()
+        consumer.join(5)
+
+        assert [content for _, content in received] == ["early", "late"]
+        assert received[0][0] < sent_late
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Ordering and settings
+# ────────────────────────────────────────────────────────────────────
+
+class TestOrdering:
+
+    def test_text_flushed_before_other_events(self):
+        bus = EventBus(coalesce_ms=1000, coalesce_bytes=1024)
+        bus.emit("text_delta", {"content": "Let me "})
+        bus.emit("text_delta", {"content": "search."})
+        bus.emit("tool_start", {"id": "t1", "name": "web_search"})
+        bus.emit("text_delta", {"content": "Found it."})
+        bus.emit("done", {"content": "Let me search.Found it."})
+        bus.close()
+        assert _drain(bus) == [
+            ("text_delta", {"content": "Let me search."}),
+            ("tool_start", {"id": "t1", "name": "web_search"}),
+            ("text_delta", {"content": "Found it."}),
+            ("done", {"content": "Let me search.Found it."}),
+        ]
+
+    def test_deltas_with_extra_keys_pass_through(self):
+        bus = EventBus(coalesce_ms=1000, coalesce_bytes=1024)
+        bus.emit("text_delta", {"content": "a"})
+        bus.emit("text_delta", {"content": "b", "replace": True})
+        bus.close()
+        assert _drain(bus) == [
+            ("text_delta", {"content": "a"}),
+            ("text_delta", {"content": "b", "replace": True}),
+        ]
+
+    def test_zero_disables_coalescing(self):
+        bus = EventBus(coalesce_ms=0, coalesce_bytes=1024)
+        for piece in ["a", "b", "c"]:
+            bus.emit("text_delta", {"content": piece})
+        bus.close()
+        assert _drain(bus) == _deltas("a", "b", "c")
+
+    def test_settings_from_env(self, monkeypatch):
+        monkeypatch.setenv("AGENT_STREAMING_COALESCE_MS", "0")
+        bus = EventBus()
+        bus.emit("text_delta", {"content": "a"})
+        bus.emit("text_delta", {"content": "b"})
+        bus.close()
+        assert _drain(bus) == _deltas("a", "b")
+
+
+# ────────────────────────────────────────────────────────────────────
+# 3. Waking the consumer
+# ────────────────────────────────────────────────────────────────────
+
+class TestWakeups:
+
+    def test_consumer_sleeps_until_woken(self):
+        bus = EventBus(coalesce_ms=0, coalesce_bytes=0)
+        received = []
+        consumer = threading.Thread(target=lambda: received.extend(_drain(bus)))
+        consumer.start()
+        time.sleep(0.1)
+        assert consumer.is_alive() and received == []
+        bus.emit("tool_start", {"id": "t1"})
+        bus.close()
+        bus.emit("text_delta", {"content": "ignored after close"})
+        consumer.join(5)
+        assert received == [("tool_start", {"id": "t1"})]
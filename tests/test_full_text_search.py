@@ -0,0 +1,174 @@
+"""Tests for SQLite FTS5 full-text search.
+
+Covers:
+1. FTS index tables and sync triggers created by migration
+2. GET /api/search ranking, snippets and input handling
+3. Agent tools backed by the index (list_jobs, list_search_results, search_saved_data)
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from backend.agent.tools import AgentTools
+from backend.app import create_app
+from backend.database import db as _db
+from backend.models.chat import Conversation, Message
+from backend.models.job import Job
+from backend.models.job_document import JobDocument
+from backend.models.search_result import SearchResult
+from backend.search import match_all_terms, match_phrase
+
+
+class TestConfig:
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    TESTING = True
+    LOG_LEVEL = "WARNING"
+
+
+@pytest.fixture()
+def app(tmp_path):
+    """Create a Flask test app with an in-memory database."""
+    with patch("backend.config.get_data_dir", return_value=tmp_path), \
+         patch("backend.app.get_data_dir", return_value=tmp_path), \
+         patch("backend.app._init_telemetry"):
+        application = create_app(config_class=TestConfig)
+    with application.app_context():
+        yield application
+        _db.session.remove()
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture()
+def seeded(app):
+    jobs = [
+        Job(company="Acme Robotics", title="Platform Engineer",
+            url="https://boards.greenhouse.io/acme/jobs/1",
+            requirements="Kubernetes\nTerraform"),
+        Job(company="Globex", title="Data Scientist",
+            notes="Recruiter mentioned Kubernetes exposure is a plus"),
+        Job(company="Initech", title="Kubernetes Engineer"),
+    ]
+    _db.session.add_all(jobs)
+    convo = Conversation(title="Search")
+    _db.session.add(convo)
+    _db.session.flush()
+    _db.session.add_all([
+        Message(conversation_id=convo.id, role="user", content="find remote rust roles"),
+        SearchResult(conversation_id=convo.id, company="Hooli", title="Rust Developer",
+                     description="Async Rust services", job_fit=4),
+        JobDocument(job_id=jobs[0].id, doc_type="cover_letter",
+                    content="I am excited about robotics", version=1),
+    ])
+    _db.session.commit()
+    return {"jobs": jobs, "convo": convo}
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Index maintenance
+# ────────────────────────────────────────────────────────────────────
+
+class TestIndexSync:
+
+    def _fts_ids(self, expr):
+        rows = _db.session.execute(
+            _db.text("SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH :e"), {"e": expr},
+        ).all()
+        return {r[0] for r in rows}
+
+    def test_fts_tables_created(self, app):
+        tables = set(_db.inspect(_db.engine).get_table_names())
+        for name in ("jobs_fts", "search_results_fts", "messages_fts", "job_documents_fts"):
+            assert name in tables
+
+    def test_insert_update_delete_tracked(self, app, seeded):
+        job = seeded["jobs"][1]
+        assert job.id in self._fts_ids('"globex"')
+
+        job.company = "Umbrella"
+        _db.session.commit()
+        assert job.id not in self._fts_ids('"globex"')
+        assert job.id in self._fts_ids('"umbrella"')
+
+        _db.session.delete(job)
+        _db.session.commit()
+        assert self._fts_ids('"umbrella"') == set()
+
+    def test_cascade_delete_removes_index_rows(self, app, seeded):
+        _db.session.execute(_db.text("DELETE FROM conversations"))
+        _db.session.commit()
+        count = _db.session.execute(
+            _db.text("SELECT count(*) FROM messages_fts WHERE messages_fts MATCH 'rust'")
+        ).scalar()
+        assert count == 0
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. /api/search
+# ────────────────────────────────────────────────────────────────────
+
+class TestSearchEndpoint:
+
+    def test_ranks_title_matches_first(self, client, seeded):
+        body = client.get("/api/search?q=kubernetes&scope=jobs").get_json()
+        hits = body["results"]["jobs"]
+        assert [h["company"] for h in hits][0] == "Initech"
+        assert len(hits) == 3
+        assert all("<mark>" in h["snippet"] for h in hits)
+
+    def test_searches_all_scopes_by_default(self, client, seeded):
+        results = client.get("/api/search?q=rust").get_json()["results"]
+        assert set(results) == {"jobs", "search_results", "messages", "job_documents"}
+        assert len(results["search_results"]) == 1
+        assert len(results["messages"]) == 1
+
+    def test_prefix_matching(self, client, seeded):
+        results = client.get("/api/search?q=robot&scope=job_documents").get_json()["results"]
+        assert len(results["job_documents"]) == 1
+
+    def test_fts_syntax_in_query_is_harmless(self, client, seeded):
+        resp = client.get('/api/search?q=" OR NEAR( kubernetes *')
+        assert resp.status_code == 200
+
+    def test_validation(self, client, seeded):
+        assert client.get("/api/search").status_code == 400
+        assert client.get("/api/search?q=x&scope=users").status_code == 400
+        assert client.get("/api/search?q=x&limit=0").status_code == 400
+
+
+# ────────────────────────────────────────────────────────────────────
+# 3. Agent tools
+# ────────────────────────────────────────────────────────────────────
+
+class TestAgentTools:
+
+    def test_match_builders_quote_tokens(self):
+        assert match_all_terms('a "b"') == '"a"* "b"*'
+        assert match_all_terms("!!!") is None
+        assert match_phrase("greenhouse.io/acm", "url") == 'url : "greenhouse io acm" *'
+
+    def test_list_jobs_query_searches_long_text(self, app, seeded):
+        result = AgentTools().execute("list_jobs", {"query": "terraform"})
+        assert [j["company"] for j in result["jobs"]] == ["Acme Robotics"]
+
+    def test_list_jobs_column_filters(self, app, seeded):
+        tools = AgentTools()
+        assert tools.execute("list_jobs", {"company": "acme"})["count"] == 1
+        assert tools.execute("list_jobs", {"url": "greenhouse.io/acme"})["count"] == 1
+        assert tools.execute("list_jobs", {"title": "engineer"})["count"] == 2
+        assert tools.execute("list_jobs", {"company": "nomatch"})["count"] == 0
+
+    def test_list_search_results_query(self, app, seeded):
+        tools = AgentTools(conversation_id=seeded["convo"].id)
+        assert tools.execute("list_search_results", {"query": "async"})["count"] == 1
+        assert tools.execute("list_search_results", {"query": "python"})["count"] == 0
+
+    def test_search_saved_data(self, app, seeded):
+        result = AgentTools().execute("search_saved_data", {"query": "rust", "scopes": ["messages"]})
+        assert result["count"] == 1
+        assert "error" in AgentTools().execute("search_saved_data", {"query": "x", "scopes": ["bad"]})
@@ -0,0 +1,138 @@
+"""Tests for the shared, pooled HTTP client.
+
+Covers:
+1. Connection reuse per host and the per-host connection cap
+2. Retrying 5xx responses, default timeouts and session eviction
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from backend import http_client
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits += 1
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            status = server.statuses.pop(0) if server.statuses else 200
+        time.sleep(server.delay)
+        body = b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with server.lock:
+            server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = server.hits = server.active = server.peak = 0
+    server.statuses = []
+    server.delay = 0
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions(tmp_path):
+    """Keep config.json out of the real data dir and start with no pooled sessions."""
+    with patch("backend.config_manager.get_data_dir", return_value=tmp_path):
+        http_client.close_all()
+        yield
+        http_client.close_all()
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Pooling
+# ────────────────────────────────────────────────────────────────────
+
+class TestPooling:
+
+    def test_requests_reuse_one_connection(self, stub):
+        for _ in range(5):
+            assert http_client.get(f"{stub.url}/x").status_code == 200
+        assert stub.hits == 5
+        assert stub.connections == 1
+
+    def test_one_session_per_host(self, stub):
+        assert http_client.session_for(f"{stub.url}/a") is http_client.session_for(f"{stub.url}/b?q=1")
+        assert http_client.session_for(f"{stub.url}/a") is not http_client.session_for("http://other.example/")
+
+    def test_connections_capped_per_host(self, stub, monkeypatch):
+        monkeypatch.setenv("HTTP_POOL_MAXSIZE", "2")
+        stub.delay = 0.1
+        threads = [threading.Thread(target=http_client.get, args=(f"{stub.url}/x",)) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert stub.hits == 6
+        assert stub.peak == 2
+        assert stub.connections == 2
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Retries and timeouts
+# ────────────────────────────────────────────────────────────────────
+
+class TestRetries:
+
+    def test_5xx_retried(self, stub):
+        stub.statuses = [503, 502]
+        assert http_client.get(f"{stub.url}/x").status_code == 200
+        assert stub.hits == 3
+
+    def test_last_5xx_returned_when_retries_run_out(self, stub, monkeypatch):
+        monkeypatch.setenv("HTTP_MAX_RETRIES", "1")
+        stub.statuses = [503, 503, 503]
+        assert http_client.get(f"{stub.url}/x").status_code == 503
+        assert stub.hits == 2
+
+    def test_other_errors_not_retried(self, stub):
+        stub.statuses = [429, 404]
+        assert http_client.get(f"{stub.url}/x").status_code == 429
+        assert http_client.get(f"{stub.url}/x").status_code == 404
+        assert stub.hits == 2
+
+    def test_default_timeout(self, stub):
+        with patch("requests.Session.request") as session_request:
+            http_client.get(f"{stub.url}/x")
+            http_client.get(f"{stub.url}/x", timeout=3)
+        assert session_request.call_args_list[0].kwargs["timeout"] == http_client.default_timeout()
+        assert session_request.call_args_list[1].kwargs["timeout"] == 3
+
+    def test_least_recently_used_session_evicted(self, monkeypatch):
+        monkeypatch.setattr(http_client, "MAX_HOST_SESSIONS", 2)
+        first = http_client.session_for("http://a.example/")
+        http_client.session_for("http://b.example/")
+        http_client.session_for("http://a.example/")
+        http_client.session_for("http://c.example/")
+        assert http_client.session_for("http://a.example/") is first
+        assert set(http_client._sessions) == {"http://a.example", "http://c.example"}
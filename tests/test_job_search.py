@@ -0,0 +1,257 @@
+"""Tests for the job_search tool's provider fan-out and rate limiting.
+
+Covers:
+1. The per-host token bucket and Retry-After parsing
+2. Retrying a 429 after the host's Retry-After pause
+3. Querying providers concurrently and merging by the deadline
+4. The persistent response cache: normalized keys, bypass, TTL and LRU eviction
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend import response_cache
+from backend.agent.tools import AgentTools
+from backend.agent.tools import job_search as job_search_module
+from backend.agent.tools._rate_limit import TokenBucket, retry_after_seconds
+
+
+@pytest.fixture(autouse=True)
+def fresh_buckets(tmp_path):
+    """Keep config.json and the response cache out of the real data dir and
+    start each test with new buckets."""
+    with patch("backend.config_manager.get_data_dir", return_value=tmp_path), \
+         patch("backend.response_cache.get_data_dir", return_value=tmp_path):
+        job_search_module._RATE_LIMITER.reset()
+        yield
+        job_search_module._RATE_LIMITER.reset()
+
+
+@pytest.fixture()
+def tools():
+    return AgentTools(rapidapi_key="test-key")
+
+
+def _job(title, company="Acme", source="jsearch"):
+    return {"title": title, "company": company, "location": None, "url": f"https://example.com/{title}",
+            "description": "", "salary_min": None, "salary_max": None, "remote": None,
+            "employment_type": None, "posted_date": None, "source": source}
+
+
+def _response(status, headers=None, payload=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = headers or {}
+    resp.json.return_value = payload or {}
+    return resp
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Token bucket
+# ────────────────────────────────────────────────────────────────────
+
+class TestTokenBucket:
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        started = time.monotonic()
+        for _ in range(4):
+            assert bucket.acquire()
+        # Two tokens up front, then one every 0.1s
+        assert 0.15 < time.monotonic() - started < 0.5
+
+    def test_shared_across_threads(self):
+        bucket = TokenBucket(rate=20, burst=1)
+        started = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert time.monotonic() - started >= 0.18
+
+    def test_pause_and_deadline(self):
+        bucket = TokenBucket(rate=0, burst=1)
+        assert bucket.acquire()
+        bucket.pause(0.2)
+        assert not bucket.acquire(deadline=time.monotonic() + 0.05)
+        started = time.monotonic()
+        assert bucket.acquire(deadline=time.monotonic() + 1)
+        assert time.monotonic() - started >= 0.1
+
+    def test_retry_after_parsing(self):
+        assert retry_after_seconds("3") == 3
+        assert retry_after_seconds("1000") == 60
+        assert retry_after_seconds(None) is None
+        assert retry_after_seconds("soon") is None
+        when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        assert 25 < retry_after_seconds(when) <= 30
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Retry-After on 429
+# ────────────────────────────────────────────────────────────────────
+
+class TestRetryAfter:
+
+    def test_429_waits_for_retry_after(self):
+        responses = [_response(429, {"Retry-After": "0.3"}), _response(200, payload={"data": []})]
+        with patch.object(job_search_module.http_client, "get", side_effect=responses) as get:
+            started = time.monotonic()
+            job_search_module._rapidapi_request("https://h.example/x", "k", "h.example", {})
+            elapsed = time.monotonic() - started
+        assert get.call_count == 2
+        assert elapsed >= 0.3
+
+    def test_pause_applies_to_other_threads(self):
+        bucket = job_search_module._RATE_LIMITER.bucket("h.example")
+        bucket.pause(0.3)
+        with patch.object(job_search_module.http_client, "get", return_value=_response(200)):
+            started = time.monotonic()
+            job_search_module._rapidapi_request("https://h.example/x", "k", "h.example", {})
+        assert time.monotonic() - started >= 0.25
+
+    def test_gives_up_at_deadline(self):
+        job_search_module._RATE_LIMITER.bucket("h.example").pause(5)
+        with patch.object(job_search_module.http_client, "get") as get:
+            with pytest.raises(job_search_module.requests.exceptions.Timeout):
+                job_search_module._rapidapi_request("https://h.example/x", "k", "h.example", {},
+                                                    deadline=time.monotonic() + 0.1)
+        get.assert_not_called()
+
+
+# ────────────────────────────────────────────────────────────────────
+# 3. Provider fan-out
+# ────────────────────────────────────────────────────────────────────
+
+def _provider(delay, results=None, error=None):
+    def search(self, **kwargs):
+        time.sleep(delay)
+        if error:
+            raise error
+        return results or []
+    return search
+
+
+class TestFanOut:
+
+    def test_providers_queried_concurrently(self, tools):
+        with patch.object(AgentTools, "_search_jsearch", _provider(0.3, [_job("a")])), \
+             patch.object(AgentTools, "_search_active_jobs_db", _provider(0.3, [_job("b", source="activejobs")])), \
+             patch.object(AgentTools, "_search_linkedin_jobs", _provider(0.1, [_job("c", source="linkedin")])):
+            started = time.monotonic()
+            result = tools.job_search(query="engineer")
+            elapsed = time.monotonic() - started
+        assert elapsed < 0.6
+        # Merged in provider order, not completion order
+        assert [r["title"] for r in result["results"]] == ["a", "b", "c"]
+        assert result["provider"] == "jsearch,activejobs,linkedin"
+        assert "warnings" not in result
+
+    def test_deadline_returns_what_arrived(self, tools, monkeypatch):
+        monkeypatch.setenv("INTEGRATIONS_JOB_SEARCH_DEADLINE_SECONDS", "1")
+        with patch.object(AgentTools, "_search_jsearch", _provider(0, [_job("a")])), \
+             patch.object(AgentTools, "_search_active_jobs_db", _provider(2)), \
+             patch.object(AgentTools, "_search_linkedin_jobs", _provider(0, error=RuntimeError("boom"))):
+            started = time.monotonic()
+            result = tools.job_search(query="engineer")
+            elapsed = time.monotonic() - started
+        assert elapsed < 2
+        assert [r["title"] for r in result["results"]] == ["a"]
+        assert result["provider"] == "jsearch"
+        assert result["warnings"] == ["Active Jobs DB timed out after 1s", "LinkedIn Jobs failed: boom"]
+
+    def test_deadline_passed_to_providers(self, tools):
+        seen = {}
+
+        def search(self, **kwargs):
+            seen.update(kwargs)
+            return []
+
+        with patch.object(AgentTools, "_search_jsearch", search):
+            before = time.monotonic()
+            tools.job_search(query="engineer", provider="jsearch")
+        assert before < seen["deadline"] <= time.monotonic() + job_search_module.DEFAULT_DEADLINE_SECONDS
+
+
+# ────────────────────────────────────────────────────────────────────
+# 4. Response cache
+# ────────────────────────────────────────────────────────────────────
+
+_JSEARCH_PAYLOAD = {"data": [{"job_title": "Engineer", "employer_name": "Acme",
+                              "job_apply_link": "https://example.com/1"}]}
+
+
+class TestResponseCache:
+
+    def test_key_normalization(self):
+        key = response_cache.cache_key("jsearch", {"query": "Data  Engineer", "remote": None, "page": 1})
+        assert key == response_cache.cache_key("jsearch", {"page": 1, "query": " data engineer"})
+        assert key != response_cache.cache_key("linkedin", {"page": 1, "query": "data engineer"})
+        assert key != response_cache.cache_key("jsearch", {"page": 2, "query": "data engineer"})
+
+    def test_repeat_search_served_from_cache(self, tools):
+        before = job_search_module._CACHE.stats()
+        with patch.object(job_search_module.http_client, "get",
+                          return_value=_response(200, payload=_JSEARCH_PAYLOAD)) as get:
+            first = tools._search_jsearch("Engineer", location="Berlin")
+            second = tools._search_jsearch(" engineer ", location="berlin")
+        assert get.call_count == 1
+        assert first == second and first[0]["title"] == "Engineer"
+        after = job_search_module._CACHE.stats()
+        assert after["hits"] - before["hits"] == 1
+        assert after["misses"] - before["misses"] == 1
+        assert after["entries"] == 1
+        assert response_cache.stats()["job_search"]["hits"] == after["hits"]
+
+    def test_bypass_cache_refreshes(self, tools):
+        stale = {"data": []}
+        with patch.object(job_search_module.http_client, "get",
+                          side_effect=[_response(200, payload=stale),
+                                       _response(200, payload=_JSEARCH_PAYLOAD)]) as get:
+            assert tools._search_jsearch("engineer") == []
+            fresh = tools._search_jsearch("engineer", bypass_cache=True)
+            assert tools._search_jsearch("engineer") == fresh
+        assert get.call_count == 2
+        assert fresh[0]["title"] == "Engineer"
+
+    def test_error_messages_not_cached(self, tools):
+        error = {"message": "You are not subscribed to this API."}
+        with patch.object(job_search_module.http_client, "get",
+                          return_value=_response(200, payload=error)) as get:
+            for _ in range(2):
+                with pytest.raises(RuntimeError):
+                    tools._search_linkedin_jobs("engineer")
+        assert get.call_count == 2
+
+    def test_ttl_per_provider(self, tools, monkeypatch):
+        monkeypatch.setenv("INTEGRATIONS_JOB_SEARCH_CACHE_TTL_SECONDS_JSEARCH", "0")
+        with patch.object(job_search_module.http_client, "get",
+                          return_value=_response(200, payload=_JSEARCH_PAYLOAD)) as get:
+            tools._search_jsearch("engineer")
+            tools._search_jsearch("engineer")
+        assert get.call_count == 2
+
+        cache = response_cache.ResponseCache("ttl-test", "test.cache", 1)
+        cache.set("k", {"v": 1}, ttl_seconds=0.05)
+        assert cache.get("k") == {"v": 1}
+        time.sleep(0.1)
+        assert cache.get("k") is None
+
+    def test_lru_eviction_at_size_cap(self):
+        cache = response_cache.ResponseCache("lru-test", "test.cache", 1)
+        blob = "x" * 400_000
+        cache.set("a", blob, 60)
+        cache.set("b", blob, 60)
+        assert cache.get("a") == blob  # a is now more recently used than b
+        cache.set("c", blob, 60)
+        assert cache.get("b") is None
+        assert cache.get("a") == blob and cache.get("c") == blob
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2 and stats["size_bytes"] <= stats["max_bytes"]
@@ -0,0 +1,591 @@
+"""Tests for the jobs listing API beyond basic CRUD.
+
+Covers:
+1. Keyset (cursor) pagination on GET /api/jobs
+2. Server-side filtering and sorting
+3. ``fields=`` projection
+4. Streaming bulk import (POST /api/jobs/bulk) and export (GET /api/jobs/export)
+5. Normalized tags: sync, tag filters and facet counts
+6. GET /api/jobs/stats aggregates and cache invalidation
+7. Transactional batch update/delete (PATCH/DELETE /api/jobs/batch, edit_jobs/remove_jobs)
+8. Which jobs the edit_job workflow targets
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend import job_stats
+from backend.app import create_app
+from backend.database import db as _db
+from backend.agent.micro_agents_v1.workflows.edit_job import EditJobWorkflow, JobFieldUpdate
+from backend.agent.micro_agents_v1.workflows.resolvers import ResolvedJob
+from backend.agent.tools import AgentTools
+from backend.models.chat import Conversation
+from backend.models.job import Job
+from backend.models.job_tag import JobTag
+from backend.models.search_result import SearchResult
+from backend.routes import jobs as jobs_routes
+
+
+class TestConfig:
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    TESTING = True
+    LOG_LEVEL = "WARNING"
+
+
+@pytest.fixture()
+def app(tmp_path):
+    """Create a Flask test app with an in-memory database."""
+    with patch("backend.config.get_data_dir", return_value=tmp_path), \
+         patch("backend.app.get_data_dir", return_value=tmp_path), \
+         patch("backend.app._init_telemetry"):
+        application = create_app(config_class=TestConfig)
+    with application.app_context():
+        yield application
+        _db.session.remove()
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture()
+def seeded(app):
+    """Create 25 jobs with distinct created_at values and varied attributes."""
+    base = datetime(2026, 1, 1)
+    statuses = ["saved", "applied", "interviewing", "offer", "rejected"]
+    for i in range(25):
+        _db.session.add(Job(
+            company=f"Company {i}",
+            title=f"Engineer {i}",
+            status=statuses[i % 5],
+            remote_type="remote" if i % 2 else "onsite",
+            salary_min=100_000 + i * 1_000,
+            salary_max=120_000 + i * 1_000,
+            job_fit=i % 6,
+            source="LinkedIn" if i % 3 == 0 else "Indeed",
+            created_at=base + timedelta(days=i),
+        ))
+    _db.session.commit()
+
+
+def _walk(client, query):
+    """Follow X-Next-Cursor until exhausted, returning all pages."""
+    pages = []
+    url = f"/api/jobs?{query}"
+    for _ in range(100):
+        resp = client.get(url)
+        assert resp.status_code == 200, resp.get_json()
+        pages.append(resp.get_json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+        url = f"/api/jobs?{query}&cursor={cursor}"
+    raise AssertionError(f"cursor never ran out: {[[j['id'] for j in p] for p in pages[:3]]}")
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Pagination
+# ────────────────────────────────────────────────────────────────────
+
+class TestPagination:
+
+    def test_unpaginated_returns_everything(self, client, seeded):
+        resp = client.get("/api/jobs")
+        assert resp.status_code == 200
+        assert len(resp.get_json()) == 25
+        assert "X-Next-Cursor" not in resp.headers
+
+    def test_pages_cover_all_rows_without_duplicates(self, client, seeded):
+        pages = _walk(client, "limit=10")
+        assert [len(p) for p in pages] == [10, 10, 5]
+        ids = [j["id"] for p in pages for j in p]
+        assert len(set(ids)) == 25
+
+    def test_pages_are_newest_first(self, client, seeded):
+        pages = _walk(client, "limit=7")
+        created = [j["created_at"] for p in pages for j in p]
+        assert created == sorted(created, reverse=True)
+
+    def test_ties_on_sort_column_are_broken_by_id(self, client, app):
+        stamp = datetime(2026, 3, 1)
+        for i in range(5):
+            _db.session.add(Job(company="Same", title=str(i), created_at=stamp))
+        _db.session.commit()
+        pages = _walk(client, "limit=2")
+        ids = [j["id"] for p in pages for j in p]
+        assert ids == sorted(ids, reverse=True)
+        assert len(ids) == 5
+
+    def test_ties_on_server_default_timestamps(self, client, app):
+        for i in range(5):
+            _db.session.add(Job(company="Same", title=str(i)))
+        _db.session.commit()
+        # CURRENT_TIMESTAMP stores second precision, unlike Python datetimes
+        _db.session.execute(_db.text("UPDATE jobs SET created_at = '2026-03-01 09:30:00'"))
+        _db.session.commit()
+        for query in ("limit=2", "limit=2&order=asc"):
+            pages = _walk(client, query)
+            ids = [j["id"] for p in pages for j in p]
+            assert sorted(ids) == [1, 2, 3, 4, 5], query
+            assert [len(p) for p in pages] == [2, 2, 1], query
+
+    def test_cursor_for_other_sort_rejected(self, client, seeded):
+        cursor = client.get("/api/jobs?limit=5").headers["X-Next-Cursor"]
+        resp = client.get(f"/api/jobs?limit=5&order=asc&cursor={cursor}")
+        assert resp.status_code == 400
+
+    def test_malformed_cursor_rejected(self, client, seeded):
+        resp = client.get("/api/jobs?limit=5&cursor=not-a-cursor")
+        assert resp.status_code == 400
+        assert "cursor" in resp.get_json()["error"]
+
+    def test_limit_bounds(self, client, seeded):
+        assert client.get("/api/jobs?limit=0").status_code == 400
+        assert client.get("/api/jobs?limit=10000").status_code == 400
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Filtering and sorting
+# ────────────────────────────────────────────────────────────────────
+
+class TestFilteringAndSorting:
+
+    def test_filter_by_status_list(self, client, seeded):
+        jobs = client.get("/api/jobs?status=offer,rejected").get_json()
+        assert len(jobs) == 10
+        assert {j["status"] for j in jobs} == {"offer", "rejected"}
+
+    def test_filter_by_remote_type_and_source(self, client, seeded):
+        jobs = client.get("/api/jobs?remote_type=remote&source=linkedin").get_json()
+        assert jobs
+        assert all(j["remote_type"] == "remote" and j["source"] == "LinkedIn" for j in jobs)
+
+    def test_salary_range_overlap(self, client, seeded):
+        # Ranges run 100k-120k up to 124k-144k
+        jobs = client.get("/api/jobs?min_salary=140000").get_json()
+        assert len(jobs) == 5
+        assert all(j["salary_max"] >= 140_000 for j in jobs)
+        jobs = client.get("/api/jobs?min_salary=125000&max_salary=130000").get_json()
+        assert len(jobs) == 20
+
+    def test_inverted_salary_range_rejected(self, client, seeded):
+        resp = client.get("/api/jobs?min_salary=150000&max_salary=100000")
+        assert resp.status_code == 400
+
+    def test_fit_range(self, client, seeded):
+        jobs = client.get("/api/jobs?min_fit=4&max_fit=5").get_json()
+        assert jobs and all(4 <= j["job_fit"] <= 5 for j in jobs)
+
+    def test_invalid_filter_values(self, client, seeded):
+        assert client.get("/api/jobs?status=bogus").status_code == 400
+        assert client.get("/api/jobs?min_fit=9").status_code == 400
+        assert client.get("/api/jobs?sort=notes").status_code == 400
+
+    def test_sort_by_status_paginates_consistently(self, client, seeded):
+        pages = _walk(client, "sort=status&order=asc&limit=4")
+        rows = [j for p in pages for j in p]
+        assert len(rows) == 25
+        keys = [(j["status"], j["id"]) for j in rows]
+        assert keys == sorted(keys)
+
+    def test_filters_combine_with_pagination(self, client, seeded):
+        pages = _walk(client, "status=saved,applied&limit=3")
+        rows = [j for p in pages for j in p]
+        assert len(rows) == 10
+
+
+# ────────────────────────────────────────────────────────────────────
+# 3. Projection
+# ────────────────────────────────────────────────────────────────────
+
+class TestProjection:
+
+    def test_only_requested_fields_returned(self, client, seeded):
+        jobs = client.get("/api/jobs?fields=company,status").get_json()
+        assert len(jobs) == 25
+        assert set(jobs[0]) == {"company", "status"}
+
+    def test_projection_matches_to_dict_formatting(self, client, seeded):
+        full = client.get("/api/jobs").get_json()
+        projected = client.get("/api/jobs?fields=id,created_at,applied_date").get_json()
+        for f, p in zip(full, projected):
+            assert p == {k: f[k] for k in ("id", "created_at", "applied_date")}
+
+    def test_projection_with_cursor(self, client, seeded):
+        pages = _walk(client, "fields=title&limit=10")
+        assert sum(len(p) for p in pages) == 25
+        assert all(set(j) == {"title"} for p in pages for j in p)
+
+    def test_unknown_field_rejected(self, client, seeded):
+        resp = client.get("/api/jobs?fields=company,password")
+        assert resp.status_code == 400
+        assert "password" in resp.get_json()["error"]
+
+
+# ────────────────────────────────────────────────────────────────────
+# 4. Bulk import / export
+# ────────────────────────────────────────────────────────────────────
+
+def _ndjson(*rows):
+    return "".join(json.dumps(r) + "\n" for r in rows)
+
+
+class TestBulkImport:
+
+    def test_ndjson_import(self, client, app):
+        body = _ndjson(
+            {"company": "A", "title": "One", "status": "applied", "applied_date": "2026-02-03"},
+            {"company": "B", "title": "Two", "salary_min": 90000, "salary_max": 110000},
+        )
+        resp = client.post("/api/jobs/bulk", data=body, content_type="application/x-ndjson")
+        assert resp.status_code == 200
+        assert resp.get_json() == {"inserted": 2, "failed": 0, "errors": []}
+        jobs = {j.company: j for j in Job.query.all()}
+        assert jobs["A"].status == "applied"
+        assert jobs["A"].applied_date.isoformat() == "2026-02-03"
+        assert jobs["B"].status == "saved"
+        assert jobs["B"].created_at is not None
+
+    def test_csv_import_treats_empty_cells_as_null(self, client, app):
+        body = "company,title,job_fit,remote_type,notes\nAcme,Engineer,4,remote,\nGlobex,Analyst,,,\n"
+        resp = client.post("/api/jobs/bulk", data=body, content_type="text/csv")
+        assert resp.get_json()["inserted"] == 2
+        globex = Job.query.filter_by(company="Globex").one()
+        assert globex.job_fit is None and globex.remote_type is None and globex.notes is None
+        assert Job.query.filter_by(company="Acme").one().job_fit == 4
+
+    def test_invalid_rows_reported_and_skipped(self, client, app):
+        body = (
+            _ndjson({"company": "Good", "title": "Row"})
+            + "{not json\n"
+            + "\n"
+            + _ndjson([1, 2], {"company": "X"}, {"company": "Y", "title": "Z", "job_fit": 9},
+                      {"company": "D", "title": "Date", "applied_date": "03/02/2026"})
+        )
+        result = client.post("/api/jobs/bulk", data=body).get_json()
+        assert result["inserted"] == 1
+        assert result["failed"] == 5
+        by_row = {e["row"]: e["errors"] for e in result["errors"]}
+        assert set(by_row) == {2, 4, 5, 6, 7}
+        assert by_row[5] == ["title is required"]
+        assert "job_fit" in by_row[6][0]
+        assert "applied_date" in by_row[7][0]
+
+    def test_rows_committed_in_chunks(self, client, app):
+        rows = [{"company": f"C{i}", "title": "T"} for i in range(12)]
+        with patch.object(jobs_routes, "BULK_CHUNK_SIZE", 5), \
+             patch.object(_db.session, "commit", wraps=_db.session.commit) as commit:
+            result = client.post("/api/jobs/bulk", data=_ndjson(*rows)).get_json()
+        assert result["inserted"] == 12
+        assert commit.call_count == 3
+        assert Job.query.count() == 12
+
+    def test_unknown_format_rejected(self, client, app):
+        assert client.post("/api/jobs/bulk?format=xml", data="").status_code == 400
+
+    def test_undecodable_body_rejected(self, client, app):
+        resp = client.post("/api/jobs/bulk", data=b"\xff\xfe\xfa\n", content_type="application/x-ndjson")
+        assert resp.status_code == 400
+        assert resp.get_json()["inserted"] == 0
+
+
+class TestExport:
+
+    def test_ndjson_matches_listing(self, client, seeded):
+        resp = client.get("/api/jobs/export")
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/x-ndjson"
+        assert resp.is_streamed
+        rows = [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+        assert rows == client.get("/api/jobs").get_json()
+
+    def test_filters_and_fields(self, client, seeded):
+        text = client.get("/api/jobs/export?status=offer&fields=id,status").get_data(as_text=True)
+        rows = [json.loads(line) for line in text.splitlines()]
+        assert len(rows) == 5
+        assert all(r.keys() == {"id", "status"} and r["status"] == "offer" for r in rows)
+
+    def test_csv_export(self, client, seeded):
+        resp = client.get("/api/jobs/export?format=csv&fields=company,applied_date,job_fit")
+        assert resp.mimetype == "text/csv"
+        assert "jobs.csv" in resp.headers["Content-Disposition"]
+        rows = list(csv.DictReader(io.StringIO(resp.get_data(as_text=True))))
+        assert len(rows) == 25
+        assert rows[0] == {"company": "Company 24", "applied_date": "", "job_fit": "0"}
+
+    def test_csv_round_trip(self, client, seeded):
+        exported = client.get("/api/jobs/export?format=csv").get_data()
+        result = client.post("/api/jobs/bulk", data=exported, content_type="text/csv").get_json()
+        assert result == {"inserted": 25, "failed": 0, "errors": []}
+        assert Job.query.filter_by(company="Company 7").count() == 2
+
+    def test_invalid_params_rejected(self, client, seeded):
+        assert client.get("/api/jobs/export?format=xlsx").status_code == 400
+        assert client.get("/api/jobs/export?fields=password").status_code == 400
+
+
+# ────────────────────────────────────────────────────────────────────
+# 5. Tags
+# ────────────────────────────────────────────────────────────────────
+
+def _tags_of(job_id):
+    return sorted(t.tag for t in JobTag.query.filter_by(job_id=job_id))
+
+
+@pytest.fixture()
+def tagged(client):
+    ids = {}
+    for company, tags in (("A", "Python, Remote"), ("B", "python,startup"),
+                          ("C", "Go, remote, Startup"), ("D", None)):
+        resp = client.post("/api/jobs", json={"company": company, "title": "Eng", "tags": tags})
+        ids[company] = resp.get_json()["id"]
+    return ids
+
+
+class TestTags:
+
+    def test_tag_rows_follow_tags_column(self, client, tagged):
+        assert _tags_of(tagged["A"]) == ["python", "remote"]
+        client.patch(f"/api/jobs/{tagged['A']}", json={"tags": "remote,  Series  B,REMOTE"})
+        assert _tags_of(tagged["A"]) == ["remote", "series b"]
+        client.patch(f"/api/jobs/{tagged['A']}", json={"tags": ""})
+        assert _tags_of(tagged["A"]) == []
+
+    def test_tag_rows_deleted_with_job(self, client, tagged):
+        client.delete(f"/api/jobs/{tagged['C']}")
+        assert _tags_of(tagged["C"]) == []
+
+    def test_filter_requires_all_tags(self, client, tagged):
+        jobs = client.get("/api/jobs?tag=python").get_json()
+        assert {j["company"] for j in jobs} == {"A", "B"}
+        jobs = client.get("/api/jobs?tag=Remote,startup").get_json()
+        assert [j["company"] for j in jobs] == ["C"]
+
+    def test_facet_counts(self, client, tagged):
+        facets = client.get("/api/jobs/tags").get_json()
+        assert facets == [
+            {"tag": "python", "count": 2},
+            {"tag": "remote", "count": 2},
+            {"tag": "startup", "count": 2},
+            {"tag": "go", "count": 1},
+        ]
+
+    def test_facets_drill_down_with_filters(self, client, tagged):
+        client.patch(f"/api/jobs/{tagged['B']}", json={"status": "applied"})
+        by_tag = {f["tag"]: f["count"] for f in client.get("/api/jobs/tags?tag=python").get_json()}
+        assert by_tag == {"python": 2, "remote": 1, "startup": 1}
+        by_tag = {f["tag"]: f["count"] for f in client.get("/api/jobs/tags?status=applied").get_json()}
+        assert by_tag == {"python": 1, "startup": 1}
+
+    def test_bulk_import_indexes_tags(self, client, app):
+        body = _ndjson({"company": "X", "title": "T", "tags": "ML, python"},
+                       {"company": "Y", "title": "T"})
+        client.post("/api/jobs/bulk", data=body)
+        job = Job.query.filter_by(company="X").one()
+        assert _tags_of(job.id) == ["ml", "python"]
+
+    def test_list_jobs_tool_tag_filter(self, app, tagged):
+        result = AgentTools().execute("list_jobs", {"tags": "startup, go"})
+        assert [j["company"] for j in result["jobs"]] == ["C"]
+
+
+# ────────────────────────────────────────────────────────────────────
+# 6. Stats
+# ────────────────────────────────────────────────────────────────────
+
+class TestStats:
+
+    def test_aggregates(self, client, seeded):
+        stats = client.get("/api/jobs/stats").get_json()
+        assert stats["total"] == 25
+        assert stats["status"] == {s: 5 for s in ("saved", "applied", "interviewing", "offer", "rejected")}
+        assert stats["job_fit"] == {"0": 5, "1": 4, "2": 4, "3": 4, "4": 4, "5": 4, "unrated": 0}
+        # Midpoints run 110k-134k
+        assert stats["salary"]["count"] == 25
+        assert [(b["min"], b["count"]) for b in stats["salary"]["buckets"]] == [(100_000, 15), (125_000, 10)]
+        assert stats["created_by_month"] == [{"month": "2026-01", "count": 25}]
+        assert stats["applied_by_month"] == []
+
+    def test_one_sided_salary_and_applied_dates(self, client, app):
+        client.post("/api/jobs", json={"company": "A", "title": "T", "salary_min": 60_000,
+                                       "applied_date": "2026-03-04"})
+        client.post("/api/jobs", json={"company": "B", "title": "T"})
+        stats = client.get("/api/jobs/stats").get_json()
+        assert stats["salary"]["buckets"] == [{"min": 50_000, "max": 75_000, "count": 1}]
+        assert stats["applied_by_month"] == [{"month": "2026-03", "count": 1}]
+        assert stats["job_fit"]["unrated"] == 2
+
+    def test_cached_until_a_job_changes(self, client, seeded):
+        with patch.object(job_stats, "compute_job_stats", wraps=job_stats.compute_job_stats) as compute:
+            client.get("/api/jobs/stats")
+            client.get("/api/jobs/stats")
+            assert compute.call_count == 1
+
+            # Commits that don't touch jobs keep the cache
+            client.post("/api/chat/conversations", json={"title": "x"})
+            client.get("/api/jobs/stats")
+            assert compute.call_count == 1
+
+            job_id = client.get("/api/jobs?limit=1").get_json()[0]["id"]
+            client.patch(f"/api/jobs/{job_id}", json={"status": "offer"})
+            stats = client.get("/api/jobs/stats").get_json()
+            assert compute.call_count == 2
+            assert stats["status"]["offer"] == 6
+
+    def test_bulk_import_and_delete_invalidate(self, client, seeded):
+        client.get("/api/jobs/stats")
+        client.post("/api/jobs/bulk", data=_ndjson({"company": "N", "title": "T"}))
+        assert client.get("/api/jobs/stats").get_json()["total"] == 26
+        job_id = client.get("/api/jobs?limit=1").get_json()[0]["id"]
+        client.delete(f"/api/jobs/{job_id}")
+        assert client.get("/api/jobs/stats").get_json()["total"] == 25
+
+    def test_rolled_back_writes_keep_cache(self, client, seeded):
+        client.get("/api/jobs/stats")
+        _db.session.add(Job(company="Tmp", title="T"))
+        _db.session.flush()
+        _db.session.rollback()
+        with patch.object(job_stats, "compute_job_stats") as compute:
+            assert client.get("/api/jobs/stats").get_json()["total"] == 25
+            compute.assert_not_called()
+
+
+# ────────────────────────────────────────────────────────────────────
+# 7. Batch update / delete
+# ────────────────────────────────────────────────────────────────────
+
+def _ids(client, n):
+    return [j["id"] for j in client.get(f"/api/jobs?limit={n}&sort=id&order=asc").get_json()]
+
+
+class TestBatch:
+
+    def test_batch_update(self, client, seeded):
+        a, b, c = _ids(client, 3)
+        resp = client.patch("/api/jobs/batch", json={"updates": [
+            {"id": b, "status": "offer", "tags": "Remote, Go"},
+            {"id": a, "applied_date": "2026-03-01", "notes": "called"},
+        ]})
+        assert resp.status_code == 200
+        jobs = resp.get_json()["jobs"]
+        assert [j["id"] for j in jobs] == [b, a]
+        assert jobs[0]["status"] == "offer"
+        assert jobs[1]["applied_date"] == "2026-03-01"
+        assert {r.tag for r in JobTag.query.filter_by(job_id=b)} == {"remote", "go"}
+        assert client.get(f"/api/jobs/{c}").get_json()["notes"] is None
+
+    def test_batch_update_is_all_or_nothing(self, client, seeded):
+        a, b = _ids(client, 2)
+        resp = client.patch("/api/jobs/batch", json={"updates": [
+            {"id": a, "status": "offer"},
+            {"id": b, "status": "bogus", "company": ""},
+            {"id": a, "notes": "dup"},
+        ]})
+        assert resp.status_code == 400
+        errors = resp.get_json()["errors"]
+        assert [(e["index"], e["id"]) for e in errors] == [(1, b), (2, a)]
+        assert "company cannot be empty" in errors[0]["errors"]
+        assert client.get(f"/api/jobs/{a}").get_json()["status"] != "offer"
+
+        resp = client.patch("/api/jobs/batch", json={"updates": [
+            {"id": a, "status": "offer"}, {"id": 999999, "status": "offer"},
+        ]})
+        assert resp.status_code == 404
+        assert resp.get_json()["missing"] == [999999]
+        assert client.get(f"/api/jobs/{a}").get_json()["status"] != "offer"
+
+    def test_batch_delete(self, client, seeded):
+        a, b, c = _ids(client, 3)
+        convo = Conversation(title="x")
+        _db.session.add(convo)
+        _db.session.flush()
+        result = SearchResult(conversation_id=convo.id, company="C", title="T",
+                              tracker_job_id=a, added_to_tracker=True)
+        _db.session.add(result)
+        _db.session.commit()
+        client.post(f"/api/jobs/{a}/todos", json={"title": "Send CV"})
+
+        resp = client.delete("/api/jobs/batch", json={"ids": [a, b]})
+        assert resp.status_code == 200
+        assert resp.get_json() == {"deleted": [a, b]}
+        assert client.get(f"/api/jobs/{a}").status_code == 404
+        assert client.get(f"/api/jobs/{c}").status_code == 200
+        _db.session.refresh(result)
+        assert result.tracker_job_id is None and result.added_to_tracker is False
+
+    def test_batch_delete_rejects_unknown_ids(self, client, seeded):
+        a = _ids(client, 1)[0]
+        resp = client.delete("/api/jobs/batch", json={"ids": [a, 999999]})
+        assert resp.status_code == 404
+        assert client.get(f"/api/jobs/{a}").status_code == 200
+        assert client.delete("/api/jobs/batch", json={"ids": []}).status_code == 400
+        assert client.delete("/api/jobs/batch", json={"ids": [a, a]}).status_code == 400
+
+    def test_edit_jobs_and_remove_jobs_tools(self, client, seeded):
+        a, b = _ids(client, 2)
+        tools = AgentTools()
+        result = tools.execute("edit_jobs", {"job_ids": [a, b], "status": "applied"})
+        assert result["count"] == 2 and result["updated_fields"] == ["status"]
+        assert {j["status"] for j in result["jobs"]} == {"applied"}
+
+        assert "error" in tools.execute("edit_jobs", {"job_ids": [a], "status": "nope"})
+        assert "error" in tools.execute("remove_jobs", {"job_ids": [a, 999999]})
+        assert client.get(f"/api/jobs/{a}").status_code == 200
+
+        result = tools.execute("remove_jobs", {"job_ids": [a, b]})
+        assert [d["id"] for d in result["deleted"]] == [a, b]
+        assert client.get("/api/jobs/stats").get_json()["total"] == 23
+
+
+# ────────────────────────────────────────────────────────────────────
+# 8. edit_job targets
+# ────────────────────────────────────────────────────────────────────
+
+class TestEditJobTargets:
+
+    JOBS = [{"id": 1, "company": "Acme", "title": "SWE"},
+            {"id": 2, "company": "Acme", "title": "SRE"},
+            {"id": 3, "company": "Globex", "title": "PM"}]
+
+    def _run(self, message, resolved_ids, target_job_ids, params=None):
+        """Run edit_job with a stubbed resolver and extractor; return the edit_jobs job_ids."""
+        tools = MagicMock()
+        tools.execute.side_effect = lambda name, args: (
+            {"jobs": self.JOBS} if name == "list_jobs" else {"jobs": [{"id": i} for i in args["job_ids"]]}
+        )
+        resolved = [ResolvedJob(job_id=i, confidence=0.9 - n / 10, reason="") for n, i in enumerate(resolved_ids)]
+        extracted = SimpleNamespace(
+            updates=[JobFieldUpdate(field="status", value="rejected")], target_job_ids=target_job_ids,
+        )
+        module = "backend.agent.micro_agents_v1.workflows.edit_job"
+        with patch(f"{module}.JobResolver") as resolver, \
+             patch(f"{module}.build_lm"), \
+             patch(f"{module}.dspy.ChainOfThought", return_value=MagicMock(return_value=extracted)):
+            resolver.return_value.resolve.return_value = resolved
+            result = EditJobWorkflow(outcome_id=1, params={"user_message": message, **(params or {})},
+                                     tools=tools, llm_config=None, event_bus=MagicMock()).run()
+        assert result.success
+        return tools.execute.call_args_list[-1].args[1]["job_ids"]
+
+    def test_plural_words_in_a_single_job_request(self):
+        message = "Mark the Acme job rejected, I applied to all their positions and each interview went well"
+        assert self._run(message, [1, 2], [1]) == [1]
+
+    def test_several_jobs_named_without_plural_words(self):
+        assert self._run("Update the Acme one and the Globex one", [1, 3], [3, 1]) == [1, 3]
+
+    def test_targets_outside_the_matches_fall_back_to_top_match(self):
+        assert self._run("Reject the Acme job", [2, 1], []) == [2]
+        assert self._run("Reject the Acme job", [2, 1], [99]) == [2]
+
+    def test_explicit_job_ids(self):
+        assert self._run("Reject these", [], [], params={"job_ids": [3, 2]}) == [3, 2]
@@ -0,0 +1,128 @@
+"""Tests for opt-in provider prompt caching and its telemetry.
+
+Covers:
+1. Per-provider completion kwargs from ``prompt_cache_kwargs``
+2. Cached/uncached prompt tokens in the telemetry ``llm_calls`` table
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from litellm import ModelResponse, Usage
+
+from backend.agent.micro_agents_v1.workflows._dspy_utils import build_lm
+from backend.config_manager import get_prompt_caching_enabled
+from backend.llm.llm_factory import LLMConfig, create_llm_config, prompt_cache_kwargs
+from backend.telemetry import litellm_hook
+from backend.telemetry.collector import TelemetryCollector
+from backend.telemetry.schema import SCHEMA_VERSION, init_db
+
+SYSTEM_MARKER = {"location": "message", "role": "system"}
+LAST_MESSAGE_MARKER = {"location": "message", "index": -1}
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Completion kwargs
+# ────────────────────────────────────────────────────────────────────
+
+class TestPromptCacheKwargs:
+
+    def test_disabled_by_default(self):
+        config = create_llm_config("anthropic", "key")
+        assert config.provider == "anthropic"
+        assert prompt_cache_kwargs(config, stream=True, rolling=True) == {}
+
+    def test_anthropic_markers(self):
+        config = create_llm_config("anthropic", "key", prompt_caching=True)
+        assert prompt_cache_kwargs(config) == {"cache_control_injection_points": [SYSTEM_MARKER]}
+        rolling = prompt_cache_kwargs(config, stream=True, rolling=True)
+        assert rolling == {"cache_control_injection_points": [SYSTEM_MARKER, LAST_MESSAGE_MARKER]}
+
+    @pytest.mark.parametrize("provider, stream_kwargs", [
+        ("openai", {"stream_options": {"include_usage": True}}),
+        ("gemini", {}),
+    ])
+    def test_automatic_providers_get_no_markers(self, provider, stream_kwargs):
+        config = create_llm_config(provider, "key", prompt_caching=True)
+        assert prompt_cache_kwargs(config, rolling=True) == {}
+        assert prompt_cache_kwargs(config, stream=True) == stream_kwargs
+
+    def test_unsupported_providers(self):
+        assert prompt_cache_kwargs(create_llm_config("ollama", "", prompt_caching=True), stream=True) == {}
+        assert prompt_cache_kwargs(LLMConfig(model="test/model", prompt_caching=True)) == {}
+
+    def test_dspy_lm_carries_markers(self):
+        lm = build_lm(create_llm_config("anthropic", "key", prompt_caching=True))
+        assert lm.kwargs["cache_control_injection_points"] == [SYSTEM_MARKER]
+
+    @pytest.mark.parametrize("value, expected", [("true", True), ("0", False), ("off", False)])
+    def test_env_flag(self, monkeypatch, value, expected):
+        monkeypatch.setenv("LLM_PROMPT_CACHING", value)
+        assert get_prompt_caching_enabled() is expected
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Telemetry
+# ────────────────────────────────────────────────────────────────────
+
+@pytest.fixture()
+def collector(tmp_path):
+    instance = TelemetryCollector(tmp_path / "telemetry.db")
+    with patch.object(litellm_hook, "get_collector", return_value=instance):
+        yield instance
+    instance.shutdown()
+
+
+def _log_call(usage):
+    response = ModelResponse(model="claude", usage=usage)
+    start = datetime(2026, 1, 1)
+    litellm_hook.TelemetryLiteLLMCallback().log_success_event(
+        {"model": "anthropic/claude"}, response, start, start + timedelta(milliseconds=40),
+    )
+
+
+def _llm_call_rows(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "telemetry.db"))
+    try:
+        return conn.execute(
+            "SELECT tokens_in, tokens_in_cached, tokens_in_uncached FROM llm_calls ORDER BY rowid"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+class TestCachedTokenTelemetry:
+
+    def test_cached_and_uncached_recorded(self, tmp_path, collector):
+        _log_call(Usage(prompt_tokens=1500, completion_tokens=20, total_tokens=1520,
+                        prompt_tokens_details={"cached_tokens": 1024}))
+        _log_call(Usage(prompt_tokens=1500, completion_tokens=20, total_tokens=1520,
+                        cache_read_input_tokens=0, cache_creation_input_tokens=1400))
+        _log_call(Usage(prompt_tokens=300, completion_tokens=20, total_tokens=320))
+        collector.shutdown()
+        assert _llm_call_rows(tmp_path) == [(1500, 1024, 476), (1500, 0, 1500), (300, None, None)]
+
+    def test_v1_database_migrated(self, tmp_path):
+        conn = sqlite3.connect(str(tmp_path / "telemetry.db"))
+        conn.executescript("""
+            CREATE TABLE _meta (key TEXT PRIMARY KEY, value TEXT);
+            INSERT INTO _meta VALUES ('schema_version', '1');
+            CREATE TABLE llm_calls (
+                id TEXT PRIMARY KEY, run_id TEXT, module_trace_id TEXT, model TEXT,
+                tokens_in INTEGER, tokens_out INTEGER, latency_ms INTEGER,
+                cost_usd REAL, called_at TEXT NOT NULL
+            );
+            INSERT INTO llm_calls (id, tokens_in, called_at) VALUES ('old', 10, '2026-01-01');
+        """)
+        conn.close()
+
+        conn = init_db(tmp_path / "telemetry.db")
+        try:
+            version = conn.execute("SELECT value FROM _meta WHERE key = 'schema_version'").fetchone()[0]
+            row = conn.execute("SELECT tokens_in, tokens_in_cached FROM llm_calls").fetchone()
+        finally:
+            conn.close()
+        assert int(version) == SCHEMA_VERSION
+        assert tuple(row) == (10, None)
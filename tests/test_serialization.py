@@ -0,0 +1,138 @@
+"""Tests for the column-tuple serialization path used by list endpoints.
+
+Every test compares the fast output byte-for-byte with what the ORM path
+(``jsonify([obj.to_dict() ...])``) produces for the same rows.
+"""
+
+import json
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from backend import serialization
+from backend.app import create_app
+from backend.database import db as _db
+from backend.models.chat import Conversation, Message
+from backend.models.job import Job
+from backend.models.search_result import SearchResult
+
+
+class TestConfig:
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    TESTING = True
+    LOG_LEVEL = "WARNING"
+
+
+@pytest.fixture()
+def app(tmp_path):
+    """Create a Flask test app with an in-memory database."""
+    with patch("backend.config.get_data_dir", return_value=tmp_path), \
+         patch("backend.app.get_data_dir", return_value=tmp_path), \
+         patch("backend.app._init_telemetry"):
+        application = create_app(config_class=TestConfig)
+    with application.app_context():
+        yield application
+        _db.session.remove()
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+
+# Values that trip up naive encoders
+TRICKY_TEXT = 'Café — 東京 😀 "quoted" \\ back\x7f  </script>'
+TRICKY_TOOL_CALLS = [
+    {"name": "search", "args": {"z": 1, "a": [1e-05, 2.5e-07, 0.1, 1e16, 100.0]},
+     "result": {"note": TRICKY_TEXT, "big": 2**70, "nan": float("nan")}},
+    {"name": "plain", "args": {"q": "remote rust"}},
+]
+
+
+@pytest.fixture()
+def seeded(app):
+    _db.session.add_all([
+        Job(company=TRICKY_TEXT, title="Eng", applied_date=date(2026, 2, 3),
+            created_at=datetime(2026, 1, 1, 12, 0, 0, 0),
+            updated_at=datetime(2026, 1, 1, 12, 0, 0, 123400)),
+        Job(company="Plain", title="Dev", salary_min=1, job_fit=0),  # server-default timestamps
+    ])
+    convo = Conversation(title="Chat")
+    _db.session.add(convo)
+    _db.session.flush()
+    _db.session.add_all([
+        Message(conversation_id=convo.id, role="user", content=TRICKY_TEXT),
+        Message(conversation_id=convo.id, role="assistant", content="",
+                tool_calls=json.dumps(TRICKY_TOOL_CALLS)),
+        Message(conversation_id=convo.id, role="assistant", content="ok",
+                tool_calls=json.dumps([{"name": "x", "args": {"n": 3}}])),
+        SearchResult(conversation_id=convo.id, company="Hooli", title=TRICKY_TEXT,
+                     job_fit=5, added_to_tracker=True),
+        SearchResult(conversation_id=convo.id, company="Initech", title="Dev"),
+    ])
+    _db.session.commit()
+    _db.session.expire_all()
+    return convo
+
+
+def _orm_bytes(app, payload):
+    return app.json.response(payload).get_data()
+
+
+class TestByteIdentical:
+
+    def test_job_listing(self, app, client, seeded):
+        fast = client.get("/api/jobs").get_data()
+        jobs = Job.query.order_by(Job.created_at.desc(), Job.id.desc()).all()
+        assert fast == _orm_bytes(app, [j.to_dict() for j in jobs])
+
+    def test_job_projection(self, app, client, seeded):
+        fast = client.get("/api/jobs?fields=company,applied_date,updated_at").get_data()
+        jobs = Job.query.order_by(Job.created_at.desc(), Job.id.desc()).all()
+        expected = [{k: j.to_dict()[k] for k in ("company", "applied_date", "updated_at")} for j in jobs]
+        assert fast == _orm_bytes(app, expected)
+
+    def test_conversation_messages(self, app, client, seeded):
+        fast = client.get(f"/api/chat/conversations/{seeded.id}").get_data()
+        convo = _db.session.get(Conversation, seeded.id)
+        expected = {**convo.to_dict(include_messages=True), "message_count": 3, "has_more": False}
+        assert fast == _orm_bytes(app, expected)
+
+    def test_search_results(self, app, client, seeded):
+        fast = client.get(f"/api/chat/conversations/{seeded.id}/search-results").get_data()
+        results = (SearchResult.query.filter_by(conversation_id=seeded.id)
+                   .order_by(SearchResult.job_fit.desc(), SearchResult.created_at).all())
+        assert fast == _orm_bytes(app, [r.to_dict() for r in results])
+
+    def test_stdlib_fallback_matches(self, app, client, seeded):
+        fast = client.get(f"/api/chat/conversations/{seeded.id}").get_data()
+        with patch.object(serialization, "orjson", None):
+            assert client.get(f"/api/chat/conversations/{seeded.id}").get_data() == fast
+
+    def test_custom_provider_settings_respected(self, app, client, seeded):
+        app.json.compact = False
+        try:
+            body = client.get("/api/jobs").get_data(as_text=True)
+        finally:
+            app.json.compact = None
+        assert body.startswith("[\n  {")
+
+
+class TestFormatters:
+
+    @pytest.mark.parametrize("value", [
+        datetime(2026, 1, 2, 3, 4, 5),
+        datetime(2026, 1, 2, 3, 4, 5, 600),
+        datetime(2026, 12, 31, 23, 59, 59, 999999),
+    ])
+    def test_timestamp_matches_isoformat(self, value):
+        stored = value.strftime("%Y-%m-%d %H:%M:%S.%f")
+        assert serialization._utc_timestamp(stored) == value.isoformat() + "+00:00"
+        assert serialization._utc_timestamp(stored[:19]) == value.replace(microsecond=0).isoformat() + "+00:00"
+
+    def test_dumps_escapes_like_ensure_ascii(self):
+        payload = {"b": TRICKY_TEXT, "a": ["\U0001f600", "\x7f", None, True]}
+        expected = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        assert serialization.dumps(payload) == expected.encode()
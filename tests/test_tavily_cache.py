@@ -0,0 +1,260 @@
+"""Tests for the Tavily client registry and response cache.
+
+Covers:
+1. One client per API key, and URL normalization for cache keys
+2. Cached search and research, and cancelling a research wait
+3. Cached, batched extracts and origin revalidation of stale pages
+4. The scrape_urls tool: chunked requests and per-URL failures
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.agent.cancellation import CancelToken, RunCancelled
+from backend.agent.tools import AgentTools
+from backend.agent.tools import _tavily
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path):
+    """Keep config.json and the response cache out of the real data dir."""
+    with patch("backend.config_manager.get_data_dir", return_value=tmp_path), \
+         patch("backend.response_cache.get_data_dir", return_value=tmp_path):
+        yield
+
+
+@pytest.fixture()
+def client():
+    client = MagicMock()
+    with patch.object(_tavily, "tavily_client", return_value=client):
+        yield client
+
+
+@pytest.fixture()
+def tools():
+    return AgentTools(search_api_key="tvly-test")
+
+
+def _page(url, content="text"):
+    return {"url": url, "raw_content": content}
+
+
+def _origin(status, headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = headers or {}
+    return resp
+
+
+# ────────────────────────────────────────────────────────────────────
+# 1. Clients and keys
+# ────────────────────────────────────────────────────────────────────
+
+class TestClientsAndKeys:
+
+    def test_one_client_per_key(self):
+        assert _tavily.tavily_client("tvly-a") is _tavily.tavily_client("tvly-a")
+        assert _tavily.tavily_client("tvly-a") is not _tavily.tavily_client("tvly-b")
+
+    def test_normalize_url(self):
+        assert _tavily.normalize_url("HTTPS://Jobs.Example.com:443/Careers/?utm_source=x&b=2&a=1#apply") \
+            == "https://jobs.example.com/Careers?a=1&b=2"
+        assert _tavily.normalize_url("http://example.com") == "http://example.com/"
+        assert _tavily.normalize_url("http://example.com:8080/x/") == "http://example.com:8080/x"
+
+
+# ────────────────────────────────────────────────────────────────────
+# 2. Search and research
+# ────────────────────────────────────────────────────────────────────
+
+class TestSearchAndResearch:
+
+    def test_repeat_search_served_from_cache(self, tools, client):
+        client.search.return_value = {"answer": "42", "results": [{"title": "t", "url": "https://a.example"}]}
+        first = tools.web_search("Acme  engineering culture")
+        second = tools.web_search("acme engineering culture")
+        assert first == second and first["answer"] == "42"
+        assert client.search.call_count == 1
+        tools.web_search("acme engineering culture", num_results=8)
+        assert client.search.call_count == 2
+
+    def test_research_cached(self, tools, client):
+        client.research.return_value = {"response": "report", "sources": []}
+        tools.web_research("Acme funding history")
+        assert tools.web_research("Acme funding history")["report"] == "report"
+        assert client.research.call_count == 1
+
+    def test_research_waits_for_report(self, tools, client, monkeypatch):
+        monkeypatch.setattr(_tavily, "RESEARCH_POLL_SECONDS", 0)
+        client.research.return_value = {"request_id": "r1", "status": "pending"}
+        client.get_research.side_effect = [
+            {"request_id": "r1", "status": "in_progress"},
+            {"request_id": "r1", "status": "completed", "response": "report", "sources": []},
+        ]
+        assert tools.web_research("Acme layoffs")["report"] == "report"
+        assert tools.web_research("Acme layoffs")["report"] == "report"
+        assert client.research.call_count == 1
+        assert client.get_research.call_count == 2
+
+    def test_unfinished_research_not_cached(self, tools, client, monkeypatch):
+        monkeypatch.setattr(_tavily, "RESEARCH_POLL_SECONDS", 0)
+        client.research.return_value = {"request_id": "r1", "status": "pending"}
+        client.get_research.return_value = {"request_id": "r1", "status": "failed", "error": "boom"}
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="boom"):
+                _tavily.cached_research("k", "Acme layoffs", "mini")
+        assert client.research.call_count == 2
+
+        monkeypatch.setenv("INTEGRATIONS_TAVILY_RESEARCH_TIMEOUT_SECONDS", "0")
+        with pytest.raises(TimeoutError):
+            _tavily.cached_research("k", "Acme layoffs", "mini")
+
+    def test_cancel_interrupts_research_wait(self, client):
+        token = CancelToken()
+        tools = AgentTools(search_api_key="tvly-test", cancel_token=token)
+        client.research.return_value = {"request_id": "r1", "status": "pending"}
+        client.get_research.return_value = {"request_id": "r1", "status": "in_progress"}
+        threading.Timer(0.1, token.cancel, args=("cancelled by user",)).start()
+        assert tools.execute("web_research", {"query": "Acme layoffs"}) == {"error": "Cancelled: cancelled by user"}
+        assert client.get_research.call_count == 0
+        with pytest.raises(RunCancelled):
+            _tavily.cached_research("k", "Acme layoffs", "mini", cancel_token=token)
+
+
+# ────────────────────────────────────────────────────────────────────
+# 3. Extract
+# ────────────────────────────────────────────────────────────────────
+
+class TestExtract:
+
+    def test_only_misses_are_extracted(self, client):
+        client.extract.return_value = {"results": [_page("https://a.example/job")]}
+        _tavily.cached_extract("k", ["https://a.example/job"])
+        client.extract.return_value = {
+            "results": [_page("https://b.example/job")],
+            "failed_results": [{"url": "https://c.example/job", "error": "blocked"}],
+        }
+        results, failures = _tavily.cached_extract(
+            "k", ["https://a.example/job/", "https://b.example/job", "https://c.example/job"])
+        assert client.extract.call_args.kwargs["urls"] == ["https://b.example/job", "https://c.example/job"]
+        assert set(results) == {"https://a.example/job/", "https://b.example/job"}
+        assert failures == {"https://c.example/job": "blocked"}
+
+    def test_query_is_part_of_the_key(self, client):
+        client.extract.return_value = {"results": [_page("https://a.example/job")]}
+        _tavily.cached_extract("k", ["https://a.example/job"])
+        _tavily.cached_extract("k", ["https://a.example/job"], query="salary")
+        _tavily.cached_extract("k", ["https://a.example/job"], query="  Salary ")
+        assert client.extract.call_count == 2
+
+    def test_scrape_url_uses_cache(self, tools, client):
+        client.extract.return_value = {"results": [_page("https://a.example/job", "hello")]}
+        assert tools.scrape_url("https://a.example/job") == {"content": "hello", "url": "https://a.example/job"}
+        assert tools.scrape_url("https://a.example/job")["content"] == "hello"
+        assert client.extract.call_count == 1
+
+    def _stale_page(self, client, monkeypatch, urls=("https://a.example/job",)):
+        monkeypatch.setenv("INTEGRATIONS_TAVILY_CACHE_TTL_SECONDS_EXTRACT", "1")
+        client.extract.return_value = {"results": [_page(u, "old") for u in urls]}
+        _tavily.cached_extract("k", list(urls))
+        time.sleep(1.1)
+        client.extract.side_effect = lambda urls, **kw: {"results": [_page(u, "new") for u in urls]}
+
+    def test_unchanged_page_revalidates(self, client, monkeypatch):
+        self._stale_page(client, monkeypatch)
+        with patch.object(_tavily.http_client, "get", return_value=_origin(304)) as get:
+            results, _ = _tavily.cached_extract("k", ["https://a.example/job"])
+        assert "If-Modified-Since" in get.call_args.kwargs["headers"]
+        assert results["https://a.example/job"]["raw_content"] == "old"
+        assert client.extract.call_count == 1
+        assert _tavily._CACHE.stats()["revalidations"] >= 1
+
+    def test_changed_page_extracted_again(self, client, monkeypatch):
+        self._stale_page(client, monkeypatch)
+        with patch.object(_tavily.http_client, "get", return_value=_origin(200)):
+            results, _ = _tavily.cached_extract("k", ["https://a.example/job"])
+        assert results["https://a.example/job"]["raw_content"] == "new"
+        assert client.extract.call_count == 2
+
+    def test_stale_pages_revalidated_concurrently(self, client, monkeypatch):
+        urls = [f"https://example.com/job/{i}" for i in range(3)]
+        self._stale_page(client, monkeypatch, urls)
+        # Sequential checks would break the barrier and re-extract every page
+        barrier = threading.Barrier(len(urls), timeout=5)
+
+        def origin(url, **kwargs):
+            barrier.wait()
+            return _origin(304)
+
+        with patch.object(_tavily.http_client, "get", side_effect=origin):
+            results, _ = _tavily.cached_extract("k", urls)
+        assert {r["raw_content"] for r in results.values()} == {"old"}
+        assert client.extract.call_count == 1
+
+    def test_slow_origins_abandoned_at_deadline(self, client, monkeypatch):
+        urls = ["https://a.example/job", "https://b.example/job"]
+        self._stale_page(client, monkeypatch, urls)
+        monkeypatch.setattr(_tavily, "REVALIDATE_DEADLINE_SECONDS", 0.1)
+        release = threading.Event()
+
+        def origin(url, **kwargs):
+            if url.startswith("https://b."):
+                release.wait(5)
+            return _origin(304)
+
+        with patch.object(_tavily.http_client, "get", side_effect=origin):
+            results, _ = _tavily.cached_extract("k", urls)
+        release.set()
+        assert results["https://a.example/job"]["raw_content"] == "old"
+        assert results["https://b.example/job"]["raw_content"] == "new"
+        assert client.extract.call_args.kwargs["urls"] == ["https://b.example/job"]
+
+
+# ────────────────────────────────────────────────────────────────────
+# 4. scrape_urls
+# ────────────────────────────────────────────────────────────────────
+
+def _extract_echo(urls, **kwargs):
+    """Fake extract: every URL succeeds except those containing 'bad'."""
+    return {
+        "results": [_page(u, f"content of {u}") for u in urls if "bad" not in u],
+        "failed_results": [{"url": u, "error": "blocked"} for u in urls if "bad" in u],
+    }
+
+
+class TestScrapeUrls:
+
+    def test_chunked_to_request_limit(self, tools, client):
+        client.extract.side_effect = _extract_echo
+        urls = [f"https://example.com/job/{i}" for i in range(_tavily.MAX_EXTRACT_URLS + 5)]
+        result = tools.scrape_urls(urls)
+        assert [len(c.kwargs["urls"]) for c in client.extract.call_args_list] == [_tavily.MAX_EXTRACT_URLS, 5]
+        assert list(result["results"]) == urls
+        assert result["results"][urls[0]]["content"] == f"content of {urls[0]}"
+        assert result["failed"] == {}
+
+    def test_per_url_failures(self, tools, client):
+        client.extract.side_effect = _extract_echo
+        result = tools.scrape_urls(["https://example.com/good", "https://example.com/bad", "https://example.com/good"])
+        assert client.extract.call_count == 1
+        assert list(result["results"]) == ["https://example.com/good"]
+        assert result["failed"] == {"https://example.com/bad": "blocked"}
+
+    def test_failed_request_fails_only_its_chunk(self, tools, client):
+        calls = []
+
+        def extract(urls, **kwargs):
+            calls.append(urls)
+            if len(calls) == 1:
+                raise RuntimeError("quota exceeded")
+            return _extract_echo(urls)
+
+        client.extract.side_effect = extract
+        urls = [f"https://example.com/job/{i}" for i in range(_tavily.MAX_EXTRACT_URLS + 1)]
+        result = tools.scrape_urls(urls)
+        assert list(result["results"]) == urls[-1:]
+        assert len(result["failed"]) == _tavily.MAX_EXTRACT_URLS
+        assert set(result["failed"].values()) == {"quota exceeded"}